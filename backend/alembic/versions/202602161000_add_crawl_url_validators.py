@@ -0,0 +1,80 @@
+"""add crawl url validators for conditional recrawls
+
+Revision ID: add_crawl_url_validators
+Revises: 9d2a6c01f3e7
+Create Date: 2026-02-16 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic
+revision = "add_crawl_url_validators"
+down_revision = "9d2a6c01f3e7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawl_url_validators",
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("last_modified", sa.String(), nullable=True),
+        sa.Column(
+            "links",
+            JSONB,
+            nullable=True,
+            comment="[rule_index, url] pairs followed from this page, replayed on 304",
+        ),
+        sa.Column("tenant_id", sa.UUID(), nullable=False),
+        sa.Column("website_id", sa.UUID(), nullable=False),
+        sa.Column("info_blob_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["website_id"], ["websites.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["info_blob_id"], ["info_blobs.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("info_blob_id"),
+    )
+    op.create_index(
+        "ix_crawl_url_validators_website_id",
+        "crawl_url_validators",
+        ["website_id"],
+    )
+
+    op.add_column(
+        "crawl_runs",
+        sa.Column(
+            "pages_unchanged",
+            sa.Integer(),
+            nullable=True,
+            comment="Pages and files kept as-is because they were not modified",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("crawl_runs", "pages_unchanged")
+    op.drop_index(
+        "ix_crawl_url_validators_website_id", table_name="crawl_url_validators"
+    )
+    op.drop_table("crawl_url_validators")
@@ -0,0 +1,32 @@
+"""add last_successful_crawl_at to websites for incremental sitemap crawls
+
+Revision ID: add_website_last_successful_crawl
+Revises: add_crawl_url_validators
+Create Date: 2026-02-17 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "add_website_last_successful_crawl"
+down_revision = "add_crawl_url_validators"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "websites",
+        sa.Column(
+            "last_successful_crawl_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=True,
+            comment="Start of the last complete, failure-free crawl (sitemap lastmod cutoff)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("websites", "last_successful_crawl_at")
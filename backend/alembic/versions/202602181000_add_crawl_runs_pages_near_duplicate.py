@@ -0,0 +1,32 @@
+"""add pages_near_duplicate to crawl_runs
+
+Revision ID: add_crawl_runs_near_duplicate
+Revises: add_website_last_successful_crawl
+Create Date: 2026-02-18 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "add_crawl_runs_near_duplicate"
+down_revision = "add_website_last_successful_crawl"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "crawl_runs",
+        sa.Column(
+            "pages_near_duplicate",
+            sa.Integer(),
+            nullable=True,
+            comment="Pages dropped as near-duplicates of another page in the same crawl",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("crawl_runs", "pages_near_duplicate")
@@ -0,0 +1,32 @@
+"""add content_simhash to info_blobs
+
+Revision ID: add_info_blobs_content_simhash
+Revises: add_crawl_runs_near_duplicate
+Create Date: 2026-02-19 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "add_info_blobs_content_simhash"
+down_revision = "add_crawl_runs_near_duplicate"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "info_blobs",
+        sa.Column(
+            "content_simhash",
+            sa.LargeBinary(length=8),
+            nullable=True,
+            comment="64-bit SimHash of page content for near-duplicate detection",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("info_blobs", "content_simhash")
@@ -0,0 +1,66 @@
+"""add transcript_cache table
+
+Revision ID: add_transcript_cache
+Revises: add_info_blobs_content_simhash
+Create Date: 2026-02-20 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "add_transcript_cache"
+down_revision = "add_info_blobs_content_simhash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "transcript_cache",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("checksum", sa.String(), nullable=False),
+        sa.Column("transcript", sa.Text(), nullable=False),
+        sa.Column(
+            "tenant_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "transcription_model_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("transcription_models.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "checksum",
+            "transcription_model_id",
+            name="uq_transcript_cache_tenant_checksum_model",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("transcript_cache")
@@ -0,0 +1,39 @@
+"""add blob_key to files
+
+Revision ID: add_files_blob_key
+Revises: add_transcript_cache
+Create Date: 2026-02-21 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "add_files_blob_key"
+down_revision = "add_transcript_cache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing Files.blob values are moved to the blob store by the
+    # migrate_file_blobs worker job, not here, to keep the migration fast
+    op.add_column(
+        "files",
+        sa.Column(
+            "blob_key",
+            sa.String(),
+            nullable=True,
+            comment="SHA-256 key of the content in the blob store",
+        ),
+    )
+    op.create_index("ix_files_blob_key", "files", ["blob_key"])
+
+
+def downgrade() -> None:
+    # Rows whose bytes were moved to the blob store keep only blob_key; move
+    # them back before downgrading or their content becomes unreachable
+    op.drop_index("ix_files_blob_key", table_name="files")
+    op.drop_column("files", "blob_key")
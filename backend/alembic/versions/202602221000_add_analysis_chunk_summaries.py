@@ -0,0 +1,88 @@
+"""add analysis_chunk_summaries table
+
+Revision ID: add_analysis_chunk_summaries
+Revises: add_files_blob_key
+Create Date: 2026-02-22 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "add_analysis_chunk_summaries"
+down_revision = "add_files_blob_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_chunk_summaries",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("cache_key", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column(
+            "tenant_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "assistant_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("assistants.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "group_chat_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("group_chats.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "completion_model_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("completion_models.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "tenant_id",
+            "cache_key",
+            name="uq_analysis_chunk_summaries_tenant_cache_key",
+        ),
+    )
+    # Stale summaries are pruned by last use
+    op.create_index(
+        "ix_analysis_chunk_summaries_updated_at",
+        "analysis_chunk_summaries",
+        ["updated_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_analysis_chunk_summaries_updated_at",
+        table_name="analysis_chunk_summaries",
+    )
+    op.drop_table("analysis_chunk_summaries")
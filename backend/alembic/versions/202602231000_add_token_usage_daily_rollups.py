@@ -0,0 +1,103 @@
+"""add token usage daily rollups
+
+Revision ID: add_token_usage_daily_rollups
+Revises: add_analysis_chunk_summaries
+Create Date: 2026-02-23 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "add_token_usage_daily_rollups"
+down_revision = "add_analysis_chunk_summaries"
+branch_labels = None
+depends_on = None
+
+
+def _base_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    # The rollups are filled by the rollup_token_usage worker job, which
+    # backfills history a batch of days at a time; until a day is covered the
+    # usage analyzers read it from questions and app_runs as before
+    op.create_table(
+        "token_usage_daily_rollups",
+        *_base_columns(),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("input_tokens", sa.BigInteger(), nullable=False),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False),
+        sa.Column("request_count", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "tenant_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "user_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "completion_model_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("completion_models.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_token_usage_daily_rollups_tenant_day",
+        "token_usage_daily_rollups",
+        ["tenant_id", "day"],
+    )
+    op.create_index(
+        "ix_token_usage_daily_rollups_day",
+        "token_usage_daily_rollups",
+        ["day"],
+    )
+
+    op.create_table(
+        "token_usage_rollup_state",
+        *_base_columns(),
+        sa.Column("covered_from", sa.Date(), nullable=False),
+        sa.Column("refreshed_through", sa.Date(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("token_usage_rollup_state")
+    op.drop_index(
+        "ix_token_usage_daily_rollups_day", table_name="token_usage_daily_rollups"
+    )
+    op.drop_index(
+        "ix_token_usage_daily_rollups_tenant_day",
+        table_name="token_usage_daily_rollups",
+    )
+    op.drop_table("token_usage_daily_rollups")
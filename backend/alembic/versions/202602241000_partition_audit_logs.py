@@ -0,0 +1,164 @@
+"""partition audit logs by month
+
+Revision ID: partition_audit_logs
+Revises: add_token_usage_daily_rollups
+Create Date: 2026-02-24 10:00:00.000000
+
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "partition_audit_logs"
+down_revision = "add_token_usage_daily_rollups"
+branch_labels = None
+depends_on = None
+
+# Must match audit_log_partition_months_ahead's default; the maintenance job
+# keeps creating partitions from here on
+MONTHS_AHEAD = 3
+
+
+def _next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _index_definitions(table: str) -> list[tuple[str, str]]:
+    rows = op.get_bind().execute(
+        sa.text(
+            """
+            SELECT indexname, indexdef FROM pg_indexes
+            WHERE schemaname = current_schema()
+                AND tablename = :table
+                AND indexname <> :pkey
+            """
+        ),
+        {"table": table, "pkey": f"{table}_pkey"},
+    )
+    return [(row.indexname, row.indexdef) for row in rows]
+
+
+def _move_to_renamed_table(old_name: str) -> list[str]:
+    """Rename audit_logs and free its index names for the replacement table.
+
+    Returns the definitions of the dropped indexes.
+    """
+    indexes = _index_definitions("audit_logs")
+
+    op.execute(f"ALTER TABLE audit_logs RENAME TO {old_name}")
+    op.execute(
+        f"ALTER TABLE {old_name} RENAME CONSTRAINT audit_logs_pkey TO {old_name}_pkey"
+    )
+    for name, _ in indexes:
+        op.execute(f"DROP INDEX {name}")
+
+    return [definition for _, definition in indexes]
+
+
+def _add_foreign_keys():
+    op.create_foreign_key(
+        "audit_logs_tenant_id_fkey",
+        "audit_logs",
+        "tenants",
+        ["tenant_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_foreign_key(
+        "audit_logs_actor_id_fkey",
+        "audit_logs",
+        "users",
+        ["actor_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+
+def upgrade() -> None:
+    # Monthly partitions let retention drop whole months of logs instead of
+    # deleting them row by row. The primary key has to include the partition
+    # key; nothing references audit_logs, so that is safe.
+    index_definitions = _move_to_renamed_table("audit_logs_unpartitioned")
+
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            LIKE audit_logs_unpartitioned INCLUDING DEFAULTS
+        ) PARTITION BY RANGE ("timestamp")
+        """
+    )
+    op.execute('ALTER TABLE audit_logs ADD PRIMARY KEY (id, "timestamp")')
+    _add_foreign_keys()
+
+    bounds = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                'SELECT min("timestamp"), max("timestamp") FROM audit_logs_unpartitioned'
+            )
+        )
+        .one()
+    )
+    today = datetime.now(timezone.utc).date()
+    last_month = today.replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last_month = _next_month(last_month)
+
+    month = (
+        bounds[0].astimezone(timezone.utc).date().replace(day=1)
+        if bounds[0] is not None
+        else today.replace(day=1)
+    )
+    if bounds[1] is not None:
+        last_month = max(
+            last_month, bounds[1].astimezone(timezone.utc).date().replace(day=1)
+        )
+
+    while month <= last_month:
+        end = _next_month(month)
+        op.execute(
+            f"CREATE TABLE audit_logs_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{end.isoformat()} 00:00:00+00')"
+        )
+        month = end
+
+    # Catches rows outside the monthly partitions, such as logs back-dated past
+    # the oldest month; ensure_partitions moves them out when it adds a month
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned")
+
+    # Indexes are built once the rows are in place, which is much faster than
+    # maintaining them during the copy
+    for definition in index_definitions:
+        op.execute(definition)
+
+    op.drop_table("audit_logs_unpartitioned")
+
+
+def downgrade() -> None:
+    index_definitions = _move_to_renamed_table("audit_logs_partitioned")
+
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            LIKE audit_logs_partitioned INCLUDING DEFAULTS
+        )
+        """
+    )
+    op.execute("ALTER TABLE audit_logs ADD PRIMARY KEY (id)")
+    _add_foreign_keys()
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+
+    for definition in index_definitions:
+        op.execute(definition)
+
+    # Dropping the parent drops its partitions
+    op.execute("DROP TABLE audit_logs_partitioned")
@@ -0,0 +1,67 @@
+"""add offsets and token counts to info_blob_chunks
+
+Revision ID: add_info_blob_chunk_offsets
+Revises: partition_audit_logs
+Create Date: 2026-02-25 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = "add_info_blob_chunk_offsets"
+down_revision = "partition_audit_logs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable, chunks ingested before this revision have no offsets and are
+    # merged and counted the old way until they are re-ingested
+    op.add_column(
+        "info_blob_chunks",
+        sa.Column(
+            "start_offset",
+            sa.Integer(),
+            nullable=True,
+            comment="Character offset of the chunk's first character in the info blob text",
+        ),
+    )
+    op.add_column(
+        "info_blob_chunks",
+        sa.Column(
+            "end_offset",
+            sa.Integer(),
+            nullable=True,
+            comment="Character offset just past the chunk's last character",
+        ),
+    )
+    op.add_column(
+        "info_blob_chunks",
+        sa.Column(
+            "token_count",
+            sa.Integer(),
+            nullable=True,
+            comment="Number of tokens in the chunk when it was chunked",
+        ),
+    )
+
+    # Neighbor lookups by (info_blob_id, chunk_no)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_info_blob_chunks_info_blob_id_chunk_no "
+            "ON info_blob_chunks (info_blob_id, chunk_no)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_info_blob_chunks_info_blob_id_chunk_no"
+        )
+
+    op.drop_column("info_blob_chunks", "token_count")
+    op.drop_column("info_blob_chunks", "end_offset")
+    op.drop_column("info_blob_chunks", "start_offset")
@@ -0,0 +1,111 @@
+"""add embedding_migrations table and info_blob_chunks.shadow_embedding
+
+Revision ID: add_embedding_migrations
+Revises: add_info_blob_chunk_offsets
+Create Date: 2026-02-26 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "add_embedding_migrations"
+down_revision = "add_info_blob_chunk_offsets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Written by re-embedding jobs and swapped into embedding when one is done;
+    # null for every chunk outside a running job
+    op.add_column(
+        "info_blob_chunks",
+        sa.Column(
+            "shadow_embedding",
+            Vector(),
+            nullable=True,
+            comment="Embedding with the model a re-embedding job is moving to",
+        ),
+    )
+
+    op.create_table(
+        "embedding_migrations",
+        sa.Column(
+            "id",
+            UUID(as_uuid=True),
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("chunks_total", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("chunks_done", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            "tenant_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "user_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "embedding_model_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("embedding_models.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "group_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("groups.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "website_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("websites.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "integration_knowledge_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("integration_knowledge.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+    )
+    # The worker resumes unfinished migrations
+    op.create_index(
+        "ix_embedding_migrations_status",
+        "embedding_migrations",
+        ["status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_embedding_migrations_status",
+        table_name="embedding_migrations",
+    )
+    op.drop_table("embedding_migrations")
+    op.drop_column("info_blob_chunks", "shadow_embedding")
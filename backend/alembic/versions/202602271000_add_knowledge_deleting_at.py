@@ -0,0 +1,43 @@
+"""add deleting_at to websites and groups
+
+Revision ID: add_knowledge_deleting_at
+Revises: add_embedding_migrations
+Create Date: 2026-02-27 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = "add_knowledge_deleting_at"
+down_revision = "add_embedding_migrations"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("websites", "groups"):
+        op.add_column(
+            table,
+            sa.Column(
+                "deleting_at",
+                sa.TIMESTAMP(timezone=True),
+                nullable=True,
+                comment="Set when the worker is deleting the contents in batches",
+            ),
+        )
+        # The worker looks up the few rows being deleted
+        op.create_index(
+            f"ix_{table}_deleting_at",
+            table,
+            ["deleting_at"],
+            postgresql_where=sa.text("deleting_at IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    for table in ("websites", "groups"):
+        op.drop_index(f"ix_{table}_deleting_at", table_name=table)
+        op.drop_column(table, "deleting_at")
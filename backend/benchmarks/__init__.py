@@ -0,0 +1,5 @@
+"""Performance benchmarks for the ask, ingestion, crawl and audit paths.
+
+The benchmarks run the application code against a real Postgres, with the
+model providers replaced by a local OpenAI-compatible fake. See README.md.
+"""
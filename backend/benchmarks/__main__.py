@@ -0,0 +1,181 @@
+"""Command line entry point, see benchmarks/README.md.
+
+python -m benchmarks run --scenario ask --scale 10k --output results/run.json
+python -m benchmarks compare results/before.json results/after.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks import fake_provider, fixture_site
+from benchmarks.environment import prepare
+from benchmarks.results import (
+    compare,
+    format_comparison,
+    new_result,
+    read_result,
+    write_result,
+)
+from benchmarks.scenarios import ask, audit, crawl, ingest
+from benchmarks.seed import SCALES, seed_collection
+from benchmarks.servers import serve
+from intric.database.database import sessionmanager
+from intric.main.aiohttp_client import aiohttp_client
+from intric.main.config import get_settings
+from intric.main.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCENARIOS = ("ask", "ingest", "crawl", "audit")
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmarks and write a JSON result")
+    run.add_argument(
+        "--scenario",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run, repeatable (default: all)",
+    )
+    run.add_argument(
+        "--scale",
+        action="append",
+        choices=SCALES,
+        help="Seeded collection size for the ask scenario, repeatable (default: 10k)",
+    )
+    run.add_argument("--output", type=Path, required=True)
+    run.add_argument(
+        "--allow-any-database",
+        action="store_true",
+        help="Run even if POSTGRES_DB does not look like a benchmark database",
+    )
+
+    provider = run.add_argument_group("fake provider")
+    provider.add_argument("--latency", type=float, default=0.2)
+    provider.add_argument("--tokens-per-second", type=float, default=50.0)
+    provider.add_argument("--completion-tokens", type=int, default=200)
+    provider.add_argument("--dimensions", type=int, default=1536)
+    provider.add_argument("--embedding-latency", type=float, default=0.05)
+
+    load = run.add_argument_group("load")
+    load.add_argument("--concurrency", type=int, default=10)
+    load.add_argument("--ask-requests", type=int, default=200)
+    load.add_argument("--ingest-documents", type=int, default=200)
+    load.add_argument("--ingest-paragraphs", type=int, default=20)
+    load.add_argument("--crawl-pages", type=int, default=200)
+    load.add_argument("--crawl-batch-size", type=int, default=50)
+    load.add_argument("--audit-inserts", type=int, default=5000)
+    load.add_argument("--query-repeats", type=int, default=20)
+
+    compare_parser = commands.add_parser("compare", help="Compare two JSON results")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    settings = get_settings()
+    scenarios = args.scenario or list(SCENARIOS)
+    scales = args.scale or ["10k"]
+
+    provider_config = fake_provider.FakeProviderConfig(
+        latency_seconds=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        completion_tokens=args.completion_tokens,
+        dimensions=args.dimensions,
+        embedding_latency_seconds=args.embedding_latency,
+    )
+    config = {
+        key: str(value) if isinstance(value, Path) else value
+        for key, value in vars(args).items()
+        if key != "command"
+    }
+    config["provider"] = asdict(provider_config)
+    result = new_result(config)
+
+    aiohttp_client.start()
+    try:
+        async with serve(fake_provider.create_app(provider_config)) as provider_url:
+            env = await prepare(settings, provider_url, provider_config.dimensions)
+
+            if "ask" in scenarios:
+                result["scenarios"]["ask"] = {}
+                for scale in scales:
+                    collection_id = await seed_collection(env, scale)
+                    logger.info(f"Running ask against {scale} chunks")
+                    result["scenarios"]["ask"][scale] = await ask.run(
+                        env,
+                        collection_id,
+                        requests=args.ask_requests,
+                        concurrency=args.concurrency,
+                    )
+
+            if "ingest" in scenarios:
+                logger.info("Running ingest")
+                result["scenarios"]["ingest"] = await ingest.run(
+                    env,
+                    documents=args.ingest_documents,
+                    concurrency=args.concurrency,
+                    paragraphs=args.ingest_paragraphs,
+                )
+
+            if "crawl" in scenarios:
+                logger.info("Running crawl")
+                site = fixture_site.create_app(pages=args.crawl_pages)
+                async with serve(site) as site_url:
+                    result["scenarios"]["crawl"] = await crawl.run(
+                        env,
+                        site_url,
+                        pages=args.crawl_pages,
+                        batch_size=args.crawl_batch_size,
+                    )
+
+            if "audit" in scenarios:
+                logger.info("Running audit")
+                result["scenarios"]["audit"] = await audit.run(
+                    env,
+                    inserts=args.audit_inserts,
+                    concurrency=args.concurrency,
+                    query_repeats=args.query_repeats,
+                )
+    finally:
+        await sessionmanager.close()
+        await aiohttp_client.stop()
+
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare(read_result(args.baseline), read_result(args.current))
+        print(format_comparison(rows))
+        return 0
+
+    # The run migrates the database and leaves seeded data behind
+    database = get_settings().postgres_db
+    if "bench" not in database and not args.allow_any_database:
+        print(
+            f"Refusing to run against database {database!r}. Point POSTGRES_DB at a "
+            "dedicated benchmark database or pass --allow-any-database.",
+            file=sys.stderr,
+        )
+        return 2
+
+    result = asyncio.run(_run(args))
+    write_result(result, args.output)
+    print(json.dumps(result["scenarios"], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""The database state the benchmarks run against.
+
+A dedicated tenant owns a model provider that points at the fake provider, a
+completion model and an embedding model on it, and the synthetic
+collections. Everything is looked up by name and reused across runs; only
+the provider endpoint changes, since the fake listens on a new port each run.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator
+from uuid import UUID
+
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from dependency_injector import providers
+
+from intric.database.database import sessionmanager
+from intric.database.tables.ai_models_table import CompletionModels, EmbeddingModels
+from intric.database.tables.model_providers_table import ModelProviders
+from intric.database.tables.tenant_table import Tenants
+from intric.database.tables.users_table import Users
+from intric.main.config import Settings
+from intric.main.container.container import Container
+from intric.main.container.container_overrides import override_user
+from intric.settings.encryption_service import EncryptionService
+
+TENANT_NAME = "benchmark"
+USER_EMAIL = "benchmark@example.com"
+PROVIDER_NAME = "Benchmark fake provider"
+COMPLETION_MODEL_NAME = "bench-chat"
+EMBEDDING_MODEL_NAME = "bench-embed"
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class BenchmarkEnvironment:
+    tenant_id: UUID
+    user_id: UUID
+    provider_id: UUID
+    completion_model_id: UUID
+    embedding_model_id: UUID
+    dimensions: int
+
+
+def migrate(settings: Settings):
+    config = Config(str(_BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    config.set_main_option("sqlalchemy.url", settings.sync_database_url)
+    command.upgrade(config, "head")
+
+
+async def _one_or_create(session, table, lookup: dict, values: dict):
+    row = await session.scalar(sa.select(table).filter_by(**lookup))
+    if row is None:
+        row = table(**lookup, **values)
+        session.add(row)
+        await session.flush()
+    return row
+
+
+async def prepare(
+    settings: Settings, provider_url: str, dimensions: int
+) -> BenchmarkEnvironment:
+    """Migrate the database and point the benchmark tenant at the fake provider."""
+    await asyncio.to_thread(migrate, settings)
+    sessionmanager.init(settings.database_url)
+
+    api_key = "benchmark"
+    encryption_service = EncryptionService(settings.encryption_key)
+    if encryption_service.is_active():
+        api_key = encryption_service.encrypt(api_key)
+    credentials = {"api_key": api_key, "endpoint": f"{provider_url}/v1"}
+
+    async with sessionmanager.session() as session, session.begin():
+        tenant = await _one_or_create(
+            session,
+            Tenants,
+            {"name": TENANT_NAME},
+            {"quota_limit": 10**15, "state": "active"},
+        )
+        user = await _one_or_create(
+            session,
+            Users,
+            {"email": USER_EMAIL, "tenant_id": tenant.id},
+            {"username": "benchmark", "state": "active", "used_tokens": 0},
+        )
+        provider = await _one_or_create(
+            session,
+            ModelProviders,
+            {"name": PROVIDER_NAME, "tenant_id": tenant.id},
+            {"provider_type": "openai", "credentials": credentials, "config": {}},
+        )
+        provider.credentials = credentials
+        provider.is_active = True
+
+        completion_model = await _one_or_create(
+            session,
+            CompletionModels,
+            {"name": COMPLETION_MODEL_NAME, "tenant_id": tenant.id},
+            {
+                "provider_id": provider.id,
+                "nickname": "Benchmark chat",
+                "family": "openai",
+                "token_limit": 128_000,
+                "stability": "stable",
+                "hosting": "swe",
+                "open_source": False,
+                "org": "OpenAI",
+            },
+        )
+        embedding_model = await _one_or_create(
+            session,
+            EmbeddingModels,
+            {"name": EMBEDDING_MODEL_NAME, "tenant_id": tenant.id},
+            {
+                "provider_id": provider.id,
+                "family": "openai",
+                "dimensions": dimensions,
+                "max_input": 8191,
+                "max_batch_size": 32,
+                "stability": "stable",
+                "hosting": "swe",
+                "open_source": False,
+                "org": "OpenAI",
+            },
+        )
+        embedding_model.dimensions = dimensions
+
+        return BenchmarkEnvironment(
+            tenant_id=tenant.id,
+            user_id=user.id,
+            provider_id=provider.id,
+            completion_model_id=completion_model.id,
+            embedding_model_id=embedding_model.id,
+            dimensions=dimensions,
+        )
+
+
+@asynccontextmanager
+async def user_container(env: BenchmarkEnvironment) -> AsyncIterator[Container]:
+    """A container acting as the benchmark user, in its own transaction."""
+    async with sessionmanager.session() as session, session.begin():
+        container = Container(session=providers.Object(session))
+        user = await container.user_repo().get_user_by_id(id=env.user_id)
+        override_user(container=container, user=user)
+
+        yield container
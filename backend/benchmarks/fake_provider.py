@@ -0,0 +1,172 @@
+"""A local OpenAI-compatible stand-in for the model providers.
+
+It answers chat completions (streaming and not), embeddings and transcriptions
+with synthetic output, so a benchmark measures our own code paths rather than
+a remote provider. Latency, token rate and embedding dimensions are
+configurable; embeddings are deterministic per input text, so repeated runs
+search the same vectors.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import time
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+_WORDS = (
+    "the municipality council reviewed the proposal for the new library and "
+    "agreed to extend the opening hours during the summer period"
+).split()
+
+
+@dataclass
+class FakeProviderConfig:
+    # Delay before the first token or the embedding response
+    latency_seconds: float = 0.2
+    # Rate at which completion tokens are produced after the first one
+    tokens_per_second: float = 50.0
+    completion_tokens: int = 200
+    dimensions: int = 1536
+    embedding_latency_seconds: float = 0.05
+    transcription_latency_seconds: float = 0.5
+
+
+def fake_embedding(text: str, dimensions: int) -> list[float]:
+    """A unit vector derived from the text, the same on every call."""
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+    vector = np.random.default_rng(seed).standard_normal(dimensions)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def _count_tokens(text: str) -> int:
+    # Close enough for usage reporting, the benchmarks never rely on it
+    return max(1, len(text) // 4)
+
+
+def _prompt_text(messages: list[dict]) -> str:
+    parts = []
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            content = " ".join(part.get("text", "") for part in content)
+        parts.append(content)
+    return " ".join(parts)
+
+
+def create_app(config: FakeProviderConfig) -> FastAPI:
+    app = FastAPI()
+
+    def _usage(prompt_tokens: int) -> dict:
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": config.completion_tokens,
+            "total_tokens": prompt_tokens + config.completion_tokens,
+        }
+
+    def _token(i: int) -> str:
+        return _WORDS[i % len(_WORDS)] + " "
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": []}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "fake")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        prompt_tokens = _count_tokens(_prompt_text(body.get("messages", [])))
+        token_delay = 1 / config.tokens_per_second
+
+        if not body.get("stream"):
+            await asyncio.sleep(
+                config.latency_seconds + (config.completion_tokens - 1) * token_delay
+            )
+            text = "".join(_token(i) for i in range(config.completion_tokens))
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text.strip()},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": _usage(prompt_tokens),
+            }
+
+        def _chunk(delta: dict, finish_reason: str | None = None, **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+                **extra,
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def _stream():
+            await asyncio.sleep(config.latency_seconds)
+            yield _chunk({"role": "assistant", "content": _token(0)})
+            for i in range(1, config.completion_tokens):
+                await asyncio.sleep(token_delay)
+                yield _chunk({"content": _token(i)})
+            yield _chunk({}, "stop", usage=_usage(prompt_tokens))
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(_stream(), media_type="text/event-stream")
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        inputs = body["input"]
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = body.get("dimensions") or config.dimensions
+
+        await asyncio.sleep(config.embedding_latency_seconds)
+
+        data = []
+        for i, text in enumerate(inputs):
+            vector = fake_embedding(text, dimensions)
+            if body.get("encoding_format") == "base64":
+                vector = base64.b64encode(
+                    np.asarray(vector, dtype="<f4").tobytes()
+                ).decode()
+            data.append({"object": "embedding", "index": i, "embedding": vector})
+
+        prompt_tokens = sum(_count_tokens(text) for text in inputs)
+        return {
+            "object": "list",
+            "data": data,
+            "model": body.get("model", "fake"),
+            "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+        }
+
+    @app.post("/v1/audio/transcriptions")
+    async def transcriptions(request: Request):
+        form = await request.form()
+        audio = form.get("file")
+        size = len(await audio.read()) if audio is not None else 0
+
+        await asyncio.sleep(config.transcription_latency_seconds)
+
+        text = f"Transcript of {size} bytes of audio. " + " ".join(_WORDS)
+        if form.get("response_format") == "text":
+            return PlainTextResponse(text)
+        return {"text": text}
+
+    return app
@@ -0,0 +1,67 @@
+"""A generated website for the crawl benchmark.
+
+Every page links to a handful of others so a crawl from the start page
+reaches all of them, and a sitemap lists them for sitemap crawls. Page text
+is derived from the page number, so two runs crawl identical content.
+"""
+
+import random
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
+
+_VOCABULARY = (
+    "council school library permit budget housing traffic water parking park "
+    "election service application fee tax meeting citizen office report plan "
+    "energy waste road culture health care elderly youth sport museum harbour"
+).split()
+
+
+def page_text(page_no: int, paragraphs: int) -> list[str]:
+    rng = random.Random(page_no)
+    return [
+        " ".join(
+            rng.choice(_VOCABULARY) for _ in range(rng.randint(60, 120))
+        ).capitalize()
+        + "."
+        for _ in range(paragraphs)
+    ]
+
+
+def create_app(pages: int, paragraphs: int = 8, links_per_page: int = 5) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/robots.txt", response_class=PlainTextResponse)
+    async def robots():
+        return "User-agent: *\nAllow: /\n"
+
+    @app.get("/sitemap.xml")
+    async def sitemap(request: Request):
+        base = str(request.base_url).rstrip("/")
+        urls = "".join(f"<url><loc>{base}/pages/{i}</loc></url>" for i in range(pages))
+        return Response(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>',
+            media_type="application/xml",
+        )
+
+    @app.get("/", response_class=HTMLResponse)
+    async def index():
+        return await page(0)
+
+    @app.get("/pages/{page_no}", response_class=HTMLResponse)
+    async def page(page_no: int):
+        if not 0 <= page_no < pages:
+            return HTMLResponse("Not found", status_code=404)
+
+        links = "".join(
+            f'<li><a href="/pages/{(page_no + step) % pages}">Page {(page_no + step) % pages}</a></li>'
+            for step in range(1, links_per_page + 1)
+        )
+        body = "".join(f"<p>{text}</p>" for text in page_text(page_no, paragraphs))
+        return (
+            f"<html><head><title>Page {page_no}</title></head>"
+            f"<body><h1>Page {page_no}</h1>{body}<ul>{links}</ul></body></html>"
+        )
+
+    return app
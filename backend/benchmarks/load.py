@@ -0,0 +1,46 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from intric.main.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class LoadResult(Generic[T]):
+    results: list[T] = field(default_factory=list)
+    errors: int = 0
+    wall_seconds: float = 0.0
+
+
+async def run_load(
+    operation: Callable[[int], Awaitable[T]],
+    *,
+    requests: int,
+    concurrency: int,
+) -> LoadResult[T]:
+    """Run operation(i) for i in range(requests), at most concurrency at a time.
+
+    Failures are counted and logged rather than raised, so one bad request
+    does not throw away the measurements of the others.
+    """
+    load = LoadResult()
+    counter = iter(range(requests))
+
+    async def _worker():
+        for i in counter:
+            try:
+                load.results.append(await operation(i))
+            except Exception:
+                load.errors += 1
+                logger.exception(f"Benchmark request {i} failed")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    load.wall_seconds = time.perf_counter() - start
+
+    return load
@@ -0,0 +1,96 @@
+"""Benchmark result files.
+
+A run writes one JSON document: when and where it ran, the configuration it
+ran with, and a nested dict of measurements per scenario. Two documents are
+compared by flattening the measurements to dotted keys.
+"""
+
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+
+SCHEMA_VERSION = 1
+
+
+def _git_sha() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def new_result(config: dict) -> dict:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_sha": _git_sha(),
+        "host": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "config": config,
+        "scenarios": {},
+    }
+
+
+def write_result(result: dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n")
+
+
+def read_result(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def flatten(measurements: dict, prefix: str = "") -> dict[str, float]:
+    """The numeric leaves of a nested dict, keyed by their dotted path."""
+    flat = {}
+    for key, value in measurements.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            flat.update(flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(
+    baseline: dict, current: dict
+) -> list[tuple[str, float | None, float | None, float | None]]:
+    """(metric, baseline, current, relative change) for every metric in either run."""
+    before = flatten(baseline["scenarios"])
+    after = flatten(current["scenarios"])
+
+    rows = []
+    for metric in sorted(before.keys() | after.keys()):
+        old = before.get(metric)
+        new = after.get(metric)
+        change = (new - old) / old if old and new is not None else None
+        rows.append((metric, old, new, change))
+
+    return rows
+
+
+def format_comparison(
+    rows: list[tuple[str, float | None, float | None, float | None]],
+) -> str:
+    def _number(value: float | None) -> str:
+        return "-" if value is None else f"{value:.4g}"
+
+    width = max((len(metric) for metric, *_ in rows), default=6)
+    lines = [f"{'metric':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}"]
+    for metric, old, new, change in rows:
+        change_text = "-" if change is None else f"{change:+.1%}"
+        lines.append(
+            f"{metric:<{width}}  {_number(old):>10}  {_number(new):>10}  {change_text:>8}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,103 @@
+"""Ask throughput and time to first token.
+
+Each request does what an assistant ask does with the model: embed the
+question, search the seeded collection, build the context and call the
+completion model. Time to first token is measured from the start of the
+request, so it includes the retrieval in front of the provider call.
+"""
+
+import random
+import time
+from types import SimpleNamespace
+from uuid import UUID
+
+from benchmarks.environment import BenchmarkEnvironment, user_container
+from benchmarks.load import run_load
+from benchmarks.stats import rate, summarize
+
+_TOPICS = (
+    "parking permits",
+    "school placement",
+    "building permits",
+    "waste collection",
+    "elderly care",
+    "library opening hours",
+    "snow clearing",
+    "property tax",
+)
+
+
+def _question(i: int) -> str:
+    rng = random.Random(i)
+    return f"What are the rules for {rng.choice(_TOPICS)} in district {rng.randint(1, 40)}?"
+
+
+async def _ask(
+    env: BenchmarkEnvironment, collection_id: UUID, i: int, stream: bool
+) -> dict:
+    start = time.perf_counter()
+    timings = {}
+
+    async with user_container(env) as container:
+        embedding_model = await container.embedding_model_repo2().one(
+            env.embedding_model_id
+        )
+        completion_model = await container.completion_model_repo2().one(
+            env.completion_model_id
+        )
+
+        question = _question(i)
+        # semantic_search only reads the ids of the collections
+        chunks = await container.datastore().semantic_search(
+            question,
+            embedding_model,
+            collections=[SimpleNamespace(id=collection_id)],
+        )
+        timings["retrieval"] = time.perf_counter() - start
+
+        response = await container.completion_service().get_response(
+            model=completion_model,
+            text_input=question,
+            info_blob_chunks=chunks,
+            stream=stream,
+        )
+        if stream:
+            async for _ in response.completion:
+                timings.setdefault("ttft", time.perf_counter() - start)
+
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+async def run(
+    env: BenchmarkEnvironment,
+    collection_id: UUID,
+    *,
+    requests: int,
+    concurrency: int,
+) -> dict:
+    results = {}
+    for stream in (False, True):
+        load = await run_load(
+            lambda i: _ask(env, collection_id, i, stream),
+            requests=requests,
+            concurrency=concurrency,
+        )
+
+        mode = {
+            "requests": requests,
+            "concurrency": concurrency,
+            "errors": load.errors,
+            "wall_seconds": load.wall_seconds,
+            "requests_per_second": rate(len(load.results), load.wall_seconds),
+            "retrieval_seconds": summarize([r["retrieval"] for r in load.results]),
+            "total_seconds": summarize([r["total"] for r in load.results]),
+        }
+        if stream:
+            mode["ttft_seconds"] = summarize(
+                [r["ttft"] for r in load.results if "ttft" in r]
+            )
+
+        results["streaming" if stream else "non_streaming"] = mode
+
+    return results
@@ -0,0 +1,125 @@
+"""Audit insert rate and dashboard query latency.
+
+Audit entries are written one per transaction, as request handlers do. The
+entries are kept, so the admin dashboard queries measured afterwards run
+against the audit volume of every earlier run too; the result records that
+volume next to the latencies.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from benchmarks.environment import BenchmarkEnvironment
+from benchmarks.load import run_load
+from benchmarks.stats import rate, summarize
+from intric.audit.domain.action_types import ActionType
+from intric.audit.domain.actor_types import ActorType
+from intric.audit.domain.audit_log import AuditLog
+from intric.audit.domain.entity_types import EntityType
+from intric.audit.domain.outcome import Outcome
+from intric.audit.infrastructure.audit_log_repo_impl import AuditLogRepositoryImpl
+from intric.database.database import sessionmanager
+from intric.token_usage.infrastructure.token_usage_analyzer import TokenUsageAnalyzer
+from intric.token_usage.infrastructure.user_token_usage_analyzer import (
+    UserTokenUsageAnalyzer,
+)
+
+
+async def _insert(env: BenchmarkEnvironment, i: int) -> float:
+    audit_log = AuditLog(
+        id=uuid4(),
+        tenant_id=env.tenant_id,
+        actor_id=env.user_id,
+        actor_type=ActorType.USER,
+        action=ActionType.ASSISTANT_CREATED,
+        entity_type=EntityType.ASSISTANT,
+        entity_id=uuid4(),
+        timestamp=datetime.now(timezone.utc),
+        description=f"Created benchmark assistant {i}",
+        metadata={
+            "actor": {"id": str(env.user_id)},
+            "target": {"name": f"Assistant {i}"},
+        },
+        outcome=Outcome.SUCCESS,
+    )
+
+    start = time.perf_counter()
+    async with sessionmanager.session() as session, session.begin():
+        await AuditLogRepositoryImpl(session).create(audit_log)
+    return time.perf_counter() - start
+
+
+async def _time_query(query, repeats: int) -> dict:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        async with sessionmanager.session() as session:
+            await query(session)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def run(
+    env: BenchmarkEnvironment,
+    *,
+    inserts: int,
+    concurrency: int,
+    query_repeats: int,
+) -> dict:
+    load = await run_load(
+        lambda i: _insert(env, i), requests=inserts, concurrency=concurrency
+    )
+
+    now = datetime.now(timezone.utc)
+    month_ago = now - timedelta(days=30)
+
+    async with sessionmanager.session() as session:
+        audit_logs = await AuditLogRepositoryImpl(session).count_logs(
+            tenant_id=env.tenant_id
+        )
+
+    queries = {
+        "audit_logs_first_page": lambda session: AuditLogRepositoryImpl(
+            session
+        ).get_logs(tenant_id=env.tenant_id, page=1, page_size=100),
+        "audit_logs_last_30_days": lambda session: AuditLogRepositoryImpl(
+            session
+        ).get_logs(
+            tenant_id=env.tenant_id,
+            from_date=month_ago,
+            to_date=now,
+            page=1,
+            page_size=100,
+        ),
+        "audit_logs_search": lambda session: AuditLogRepositoryImpl(session).get_logs(
+            tenant_id=env.tenant_id,
+            search="benchmark assistant 42",
+            page=1,
+            page_size=100,
+        ),
+        "token_usage_by_model": lambda session: TokenUsageAnalyzer(
+            session
+        ).get_model_token_usage(
+            tenant_id=env.tenant_id, start_date=month_ago, end_date=now
+        ),
+        "token_usage_by_user": lambda session: UserTokenUsageAnalyzer(
+            session
+        ).get_user_token_usage(
+            tenant_id=env.tenant_id, start_date=month_ago, end_date=now
+        ),
+    }
+
+    return {
+        "inserts": inserts,
+        "concurrency": concurrency,
+        "errors": load.errors,
+        "wall_seconds": load.wall_seconds,
+        "inserts_per_second": rate(len(load.results), load.wall_seconds),
+        "insert_seconds": summarize(load.results),
+        "tenant_audit_logs": audit_logs,
+        "dashboard_query_seconds": {
+            name: await _time_query(query, query_repeats)
+            for name, query in queries.items()
+        },
+    }
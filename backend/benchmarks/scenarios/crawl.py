@@ -0,0 +1,134 @@
+"""Crawl to persist throughput against the local fixture site.
+
+The site is crawled with the production crawler, then the pages are
+persisted in batches through persist_batch, the same two-phase path the
+crawl task uses. The scratch website and its pages are removed afterwards.
+"""
+
+import time
+
+import crochet
+import sqlalchemy as sa
+
+from benchmarks.environment import BenchmarkEnvironment, user_container
+from benchmarks.stats import rate, summarize
+from intric.ai_models.model_enums import ModelFamily
+from intric.crawler.crawler import Crawler
+from intric.database.database import sessionmanager
+from intric.database.tables.ai_models_table import EmbeddingModels
+from intric.database.tables.model_providers_table import ModelProviders
+from intric.database.tables.websites_table import Websites
+from intric.websites.domain.crawl_run import CrawlType
+from intric.websites.domain.website import UpdateInterval
+from intric.worker.crawl.persistence import persist_batch
+from intric.worker.crawl_context import CrawlContext, EmbeddingModelSpec
+
+
+async def _embedding_model_spec(env: BenchmarkEnvironment) -> EmbeddingModelSpec:
+    async with sessionmanager.session() as session:
+        model = await session.get(EmbeddingModels, env.embedding_model_id)
+        provider = await session.get(ModelProviders, env.provider_id)
+
+        return EmbeddingModelSpec(
+            id=model.id,
+            name=model.name,
+            litellm_model_name=model.litellm_model_name,
+            family=ModelFamily(model.family),
+            max_input=model.max_input,
+            max_batch_size=model.max_batch_size,
+            dimensions=model.dimensions,
+            open_source=model.open_source,
+            provider_id=provider.id,
+            provider_type=provider.provider_type,
+            provider_credentials=provider.credentials,
+            provider_config=provider.config,
+        )
+
+
+async def run(
+    env: BenchmarkEnvironment, site_url: str, *, pages: int, batch_size: int
+) -> dict:
+    crochet.setup()
+
+    async with sessionmanager.session() as session, session.begin():
+        website = Websites(
+            name="Benchmark fixture site",
+            url=site_url,
+            download_files=False,
+            crawl_type=CrawlType.CRAWL,
+            update_interval=UpdateInterval.NEVER.value,
+            size=0,
+            tenant_id=env.tenant_id,
+            user_id=env.user_id,
+            embedding_model_id=env.embedding_model_id,
+        )
+        session.add(website)
+        await session.flush()
+        website_id = website.id
+
+    embedding_model = await _embedding_model_spec(env)
+    ctx = CrawlContext(
+        website_id=website_id,
+        tenant_id=env.tenant_id,
+        tenant_slug=None,
+        user_id=env.user_id,
+        embedding_model_id=embedding_model.id,
+        embedding_model_name=embedding_model.name,
+        embedding_model_open_source=embedding_model.open_source,
+        embedding_model_family=embedding_model.family.value,
+        embedding_model_dimensions=embedding_model.dimensions,
+        batch_size=batch_size,
+    )
+
+    persisted = failed = 0
+    batch_seconds = []
+    try:
+        start = time.perf_counter()
+        async with Crawler().crawl(url=site_url, crawl_type=CrawlType.CRAWL) as crawl:
+            crawl_seconds = time.perf_counter() - start
+
+            async with user_container(env) as container:
+
+                async def _flush(buffer: list[dict]):
+                    nonlocal persisted, failed
+                    batch_start = time.perf_counter()
+                    success_count, failed_count, *_ = await persist_batch(
+                        page_buffer=buffer,
+                        ctx=ctx,
+                        embedding_model=embedding_model,
+                        container=container,
+                    )
+                    batch_seconds.append(time.perf_counter() - batch_start)
+                    persisted += success_count
+                    failed += failed_count
+
+                buffer = []
+                async for page in crawl.pages:
+                    buffer.append(
+                        {"url": page.url, "content": page.content, "simhash": None}
+                    )
+                    if len(buffer) >= batch_size:
+                        await _flush(buffer)
+                        buffer = []
+                if buffer:
+                    await _flush(buffer)
+
+        total_seconds = time.perf_counter() - start
+    finally:
+        async with sessionmanager.session() as session, session.begin():
+            await session.execute(sa.delete(Websites).where(Websites.id == website_id))
+
+    persist_seconds = sum(batch_seconds)
+    return {
+        "site_pages": pages,
+        "batch_size": batch_size,
+        "pages_persisted": persisted,
+        "pages_failed": failed,
+        "crawl_seconds": crawl_seconds,
+        "persist_seconds": persist_seconds,
+        "total_seconds": total_seconds,
+        "crawl_pages_per_second": rate(persisted + failed, crawl_seconds),
+        "persist_pages_per_second": rate(persisted, persist_seconds),
+        "end_to_end_pages_per_second": rate(persisted, total_seconds),
+        "batch_seconds": summarize(batch_seconds),
+    }
@@ -0,0 +1,97 @@
+"""Ingestion throughput through Datastore.add.
+
+Documents go through the same steps as an uploaded text: the info blob is
+stored, then chunked, embedded by the fake provider and written as chunks.
+The documents land in a scratch collection that is removed afterwards.
+"""
+
+import time
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from benchmarks.environment import BenchmarkEnvironment, user_container
+from benchmarks.fixture_site import page_text
+from benchmarks.load import run_load
+from benchmarks.stats import rate, summarize
+from intric.database.database import sessionmanager
+from intric.database.tables.collections_table import CollectionsTable
+from intric.database.tables.info_blob_chunk_table import InfoBlobChunks
+from intric.database.tables.info_blobs_table import InfoBlobs
+from intric.info_blobs.info_blob import InfoBlobAdd
+
+
+async def _ingest(
+    env: BenchmarkEnvironment, collection_id: UUID, i: int, paragraphs: int
+) -> float:
+    text = "\n\n".join(page_text(i, paragraphs))
+    start = time.perf_counter()
+
+    async with user_container(env) as container:
+        embedding_model = await container.embedding_model_repo2().one(
+            env.embedding_model_id
+        )
+        info_blob = await container.info_blob_repo().add(
+            InfoBlobAdd(
+                text=text,
+                title=f"Ingested document {i}",
+                size=len(text),
+                user_id=env.user_id,
+                tenant_id=env.tenant_id,
+                group_id=collection_id,
+            )
+        )
+        await container.datastore().add(info_blob, embedding_model)
+
+    return time.perf_counter() - start
+
+
+async def run(
+    env: BenchmarkEnvironment,
+    *,
+    documents: int,
+    concurrency: int,
+    paragraphs: int,
+) -> dict:
+    async with sessionmanager.session() as session, session.begin():
+        collection = CollectionsTable(
+            name=f"Benchmark ingest {int(time.time())}",
+            size=0,
+            user_id=env.user_id,
+            tenant_id=env.tenant_id,
+            embedding_model_id=env.embedding_model_id,
+        )
+        session.add(collection)
+        await session.flush()
+        collection_id = collection.id
+
+    try:
+        load = await run_load(
+            lambda i: _ingest(env, collection_id, i, paragraphs),
+            requests=documents,
+            concurrency=concurrency,
+        )
+
+        async with sessionmanager.session() as session:
+            chunks = await session.scalar(
+                sa.select(sa.func.count())
+                .select_from(InfoBlobChunks)
+                .join(InfoBlobs, InfoBlobChunks.info_blob_id == InfoBlobs.id)
+                .where(InfoBlobs.group_id == collection_id)
+            )
+    finally:
+        async with sessionmanager.session() as session, session.begin():
+            await session.execute(
+                sa.delete(CollectionsTable).where(CollectionsTable.id == collection_id)
+            )
+
+    return {
+        "documents": documents,
+        "concurrency": concurrency,
+        "errors": load.errors,
+        "chunks": chunks,
+        "wall_seconds": load.wall_seconds,
+        "documents_per_second": rate(len(load.results), load.wall_seconds),
+        "chunks_per_second": rate(chunks, load.wall_seconds),
+        "document_seconds": summarize(load.results),
+    }
@@ -0,0 +1,144 @@
+"""Synthetic collections for the search-heavy benchmarks.
+
+Chunks are generated inside Postgres with generate_series and random
+vectors, which is far faster than going through the embedding path and is
+good enough for measuring search: the query vectors from the fake provider
+are unit vectors from the same kind of distribution. A seeded collection is
+reused by later runs as long as it holds the expected number of chunks.
+"""
+
+import time
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from benchmarks.environment import BenchmarkEnvironment
+from intric.database.database import sessionmanager
+from intric.database.tables.collections_table import CollectionsTable
+from intric.database.tables.info_blob_chunk_table import InfoBlobChunks
+from intric.database.tables.info_blobs_table import InfoBlobs
+from intric.main.logging import get_logger
+
+logger = get_logger(__name__)
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+CHUNKS_PER_DOCUMENT = 20
+DOCUMENTS_PER_BATCH = 250
+
+_INSERT_BLOBS = sa.text(
+    """
+    INSERT INTO info_blobs (text, title, size, user_id, tenant_id, group_id, embedding_model_id)
+    SELECT 'Synthetic document ' || d, 'Benchmark document ' || d, 16000,
+           :user_id, :tenant_id, :group_id, :embedding_model_id
+    FROM generate_series(:first, :last) AS d
+    RETURNING id
+    """
+)
+
+# The subquery references the outer row, so Postgres draws a new vector for
+# every chunk instead of evaluating it once
+_INSERT_CHUNKS = sa.text(
+    """
+    INSERT INTO info_blob_chunks (text, chunk_no, size, embedding, info_blob_id, tenant_id)
+    SELECT 'Synthetic chunk ' || c || ' of ' || b.title, c, 800,
+           (SELECT array_agg(random() - 0.5 + 0 * c) FROM generate_series(1, :dimensions))::vector,
+           b.id, :tenant_id
+    FROM info_blobs AS b CROSS JOIN generate_series(0, :chunks_per_document - 1) AS c
+    WHERE b.id = ANY(:blob_ids)
+    """
+).bindparams(sa.bindparam("blob_ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+def _collection_name(scale: str) -> str:
+    return f"Benchmark {scale}"
+
+
+async def _chunk_count(session, collection_id: UUID) -> int:
+    return await session.scalar(
+        sa.select(sa.func.count())
+        .select_from(InfoBlobChunks)
+        .join(InfoBlobs, InfoBlobChunks.info_blob_id == InfoBlobs.id)
+        .where(InfoBlobs.group_id == collection_id)
+    )
+
+
+async def seed_collection(env: BenchmarkEnvironment, scale: str) -> UUID:
+    """The id of a collection holding SCALES[scale] chunks, seeding it if needed."""
+    target_chunks = SCALES[scale]
+    name = _collection_name(scale)
+
+    async with sessionmanager.session() as session, session.begin():
+        collection = await session.scalar(
+            sa.select(CollectionsTable).where(
+                CollectionsTable.tenant_id == env.tenant_id,
+                CollectionsTable.name == name,
+            )
+        )
+        if collection is not None:
+            if await _chunk_count(session, collection.id) == target_chunks:
+                logger.info(f"Reusing seeded collection {name}")
+                return collection.id
+
+            # A partial seed from an interrupted run, start over
+            await session.execute(
+                sa.delete(CollectionsTable).where(CollectionsTable.id == collection.id)
+            )
+
+        collection = CollectionsTable(
+            name=name,
+            size=0,
+            user_id=env.user_id,
+            tenant_id=env.tenant_id,
+            embedding_model_id=env.embedding_model_id,
+        )
+        session.add(collection)
+        await session.flush()
+        collection_id = collection.id
+
+    documents = target_chunks // CHUNKS_PER_DOCUMENT
+    start = time.perf_counter()
+    for first in range(0, documents, DOCUMENTS_PER_BATCH):
+        last = min(first + DOCUMENTS_PER_BATCH, documents) - 1
+
+        # One transaction per batch keeps the WAL and lock footprint bounded
+        async with sessionmanager.session() as session, session.begin():
+            blob_ids = (
+                await session.scalars(
+                    _INSERT_BLOBS,
+                    {
+                        "first": first,
+                        "last": last,
+                        "user_id": env.user_id,
+                        "tenant_id": env.tenant_id,
+                        "group_id": collection_id,
+                        "embedding_model_id": env.embedding_model_id,
+                    },
+                )
+            ).all()
+            await session.execute(
+                _INSERT_CHUNKS,
+                {
+                    "blob_ids": blob_ids,
+                    "tenant_id": env.tenant_id,
+                    "dimensions": env.dimensions,
+                    "chunks_per_document": CHUNKS_PER_DOCUMENT,
+                },
+            )
+
+        logger.info(
+            f"Seeded {(last + 1) * CHUNKS_PER_DOCUMENT}/{target_chunks} chunks into {name} "
+            f"({time.perf_counter() - start:.0f}s)"
+        )
+
+    async with sessionmanager.session() as session, session.begin():
+        await session.execute(sa.text("ANALYZE info_blob_chunks"))
+        await session.execute(
+            sa.update(CollectionsTable)
+            .where(CollectionsTable.id == collection_id)
+            .values(size=documents * 16000)
+        )
+
+    return collection_id
@@ -0,0 +1,36 @@
+import asyncio
+import socket
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import uvicorn
+from fastapi import FastAPI
+
+
+@asynccontextmanager
+async def serve(app: FastAPI, host: str = "127.0.0.1") -> AsyncIterator[str]:
+    """Run the app on a free local port for the duration of the block.
+
+    Yields the base URL. The server shares the benchmark's event loop, which
+    is fine for the fakes since they only sleep and format responses.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind((host, 0))
+    port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, log_level="warning", access_log=False, lifespan="off")
+    )
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+    try:
+        while not server.started:
+            if task.done():
+                # Surfaces the startup error
+                await task
+            await asyncio.sleep(0.01)
+
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        await task
+        sock.close()
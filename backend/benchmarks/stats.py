@@ -0,0 +1,32 @@
+import math
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """The p-th percentile (0-100) of a non-empty sorted list, interpolated."""
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    weight = rank - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize(samples: list[float]) -> dict:
+    """Count, mean and the usual percentiles of a list of latencies in seconds."""
+    values = sorted(samples)
+    if not values:
+        return {"count": 0}
+
+    return {
+        "count": len(values),
+        "mean": sum(values) / len(values),
+        "min": values[0],
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": values[-1],
+    }
+
+
+def rate(count: int, seconds: float) -> float | None:
+    return count / seconds if seconds > 0 else None
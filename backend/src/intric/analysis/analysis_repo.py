@@ -6,9 +6,13 @@ from typing import NamedTuple
 from uuid import UUID
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from intric.database.tables.analysis_chunk_summaries_table import (
+    AnalysisChunkSummaries,
+)
 from intric.database.tables.assistant_table import Assistants
 from intric.database.tables.group_chats_table import GroupChatsTable
 from intric.database.tables.info_blobs_table import InfoBlobs
@@ -62,6 +66,14 @@ class QuestionTextRow(NamedTuple):
     session_id: UUID
 
 
+class ChunkSummaryRow(NamedTuple):
+    """Cached map-phase summary of one chunk of a day's questions."""
+
+    cache_key: str
+    day: datetime.date
+    summary: str
+
+
 class AssistantInsightQuestionRow(NamedTuple):
     """Lightweight admin insights question-history row."""
 
@@ -885,3 +897,60 @@ class AnalysisRepository:
 
         result = await self.session.scalar(stmt)
         return result or 0
+
+    async def get_chunk_summaries(
+        self, *, tenant_id: UUID, cache_keys: list[str]
+    ) -> dict[str, str]:
+        """Return cached chunk summaries by key, marking them as used."""
+        if not cache_keys:
+            return {}
+
+        stmt = (
+            sa.update(AnalysisChunkSummaries)
+            .where(AnalysisChunkSummaries.tenant_id == tenant_id)
+            .where(AnalysisChunkSummaries.cache_key.in_(cache_keys))
+            .values(updated_at=sa.func.now())
+            .returning(AnalysisChunkSummaries.cache_key, AnalysisChunkSummaries.summary)
+        )
+        result = await self.session.execute(stmt)
+        return {row.cache_key: row.summary for row in result}
+
+    async def add_chunk_summaries(
+        self,
+        *,
+        tenant_id: UUID,
+        assistant_id: UUID | None,
+        group_chat_id: UUID | None,
+        completion_model_id: UUID,
+        summaries: list[ChunkSummaryRow],
+    ) -> None:
+        if not summaries:
+            return
+
+        stmt = insert(AnalysisChunkSummaries).values(
+            [
+                dict(
+                    tenant_id=tenant_id,
+                    assistant_id=assistant_id,
+                    group_chat_id=group_chat_id,
+                    completion_model_id=completion_model_id,
+                    cache_key=summary.cache_key,
+                    day=summary.day,
+                    summary=summary.summary,
+                )
+                for summary in summaries
+            ]
+        )
+        stmt = stmt.on_conflict_do_nothing(
+            constraint="uq_analysis_chunk_summaries_tenant_cache_key"
+        )
+        await self.session.execute(stmt)
+
+    async def delete_chunk_summaries_unused_since(
+        self, cutoff: datetime.datetime
+    ) -> int:
+        stmt = sa.delete(AnalysisChunkSummaries).where(
+            AnalysisChunkSummaries.updated_at < cutoff
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
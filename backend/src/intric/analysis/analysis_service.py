@@ -1,5 +1,6 @@
 # MIT License
 import asyncio
+import hashlib
 from collections import Counter
 from datetime import date, datetime, timedelta, timezone
 from time import perf_counter
@@ -12,8 +13,13 @@ from intric.analysis.analysis import (
     ConversationInsightResponse,
     Counts,
 )
-from intric.analysis.analysis_repo import AnalysisRepository
+from intric.analysis.analysis_repo import (
+    AnalysisRepository,
+    ChunkSummaryRow,
+    QuestionTextRow,
+)
 from intric.assistants.assistant_service import AssistantService
+from intric.completion_models.infrastructure.admission import CompletionPriority
 from intric.completion_models.infrastructure.completion_service import CompletionService
 from intric.completion_models.infrastructure.static_prompts import ANALYSIS_PROMPT
 from intric.group_chat.application.group_chat_service import GroupChatService
@@ -42,10 +48,11 @@ MAP_CHUNK_MAX_CHARS = 8_000
 _CHUNK_CONCURRENCY = 4
 _CHUNK_TIMEOUT_SECONDS = 60
 
+# Chunk summaries are cached and reused across insight questions and time
+# windows, so this prompt must not depend on either
 CHUNK_SUMMARY_PROMPT = """You are summarizing assistant usage analytics.
 
-Time window: last {days} days.
-Chunk {chunk_index} of {chunk_total}.
+These questions were asked on {day}.
 
 Summarize recurring topics, intent clusters, and notable phrasing from these user questions.
 Keep the summary concise and factual.
@@ -168,22 +175,51 @@ class AnalysisService:
 
         return chunks
 
+    def _build_daily_chunks(
+        self, rows: list[QuestionTextRow]
+    ) -> list[tuple[date, list[str]]]:
+        """Chunk questions per day, so a day's chunks are the same whatever the window."""
+        questions_by_day: dict[date, list[str]] = {}
+        for row in rows:
+            normalized = self._normalize_question_text(row.question)
+            if normalized:
+                day = row.created_at.date()
+                questions_by_day.setdefault(day, []).append(normalized)
+
+        return [
+            (day, chunk)
+            for day in sorted(questions_by_day)
+            for chunk in self._build_question_chunks(
+                self._deduplicate_questions(questions_by_day[day])
+            )
+        ]
+
+    @staticmethod
+    def _chunk_cache_key(
+        *, scope_id: UUID, completion_model_id: UUID, day: date, chunk: list[str]
+    ) -> str:
+        digest = hashlib.sha256()
+        for part in (str(scope_id), str(completion_model_id), day.isoformat()):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(CHUNK_SUMMARY_PROMPT.encode())
+        for question in chunk:
+            digest.update(b"\0")
+            digest.update(question.encode())
+        return digest.hexdigest()
+
     async def _summarize_single_chunk(
         self,
         *,
         sem: asyncio.Semaphore,
         model,
         chunk: list[str],
-        index: int,
-        total: int,
-        days: int,
+        day: date,
     ) -> str:
         async with sem:
             chunk_questions = "\n".join(f'- "{item}"' for item in chunk)
             prompt = CHUNK_SUMMARY_PROMPT.format(
-                days=days,
-                chunk_index=index,
-                chunk_total=total,
+                day=day.isoformat(),
                 questions=chunk_questions,
             )
             summary_response = await asyncio.wait_for(
@@ -192,6 +228,7 @@ class AnalysisService:
                     completion_service=self.completion_service,
                     prompt=prompt,
                     stream=False,
+                    priority=CompletionPriority.BACKGROUND,
                 ),
                 timeout=_CHUNK_TIMEOUT_SECONDS,
             )
@@ -201,38 +238,77 @@ class AnalysisService:
         self,
         *,
         model,
-        questions: list[str],
-        days: int,
-    ) -> list[str]:
-        chunks = self._build_question_chunks(questions)
-        sem = asyncio.Semaphore(_CHUNK_CONCURRENCY)
+        rows: list[QuestionTextRow],
+        assistant_id: UUID | None = None,
+        group_chat_id: UUID | None = None,
+    ) -> tuple[list[tuple[date, str]], int]:
+        """Map phase: summarize each day's chunks, reusing cached summaries.
+
+        Returns the summaries in day order and the number of chunks that had
+        to be summarized by the model.
+        """
+        completion_model_id = model.completion_model.id
+        chunks = [
+            (
+                self._chunk_cache_key(
+                    scope_id=assistant_id or group_chat_id,
+                    completion_model_id=completion_model_id,
+                    day=day,
+                    chunk=chunk,
+                ),
+                day,
+                chunk,
+            )
+            for day, chunk in self._build_daily_chunks(rows)
+        ]
+        cached = await self.repo.get_chunk_summaries(
+            tenant_id=self.user.tenant_id,
+            cache_keys=[key for key, _, _ in chunks],
+        )
+        missing = [(key, day, chunk) for key, day, chunk in chunks if key not in cached]
 
+        sem = asyncio.Semaphore(_CHUNK_CONCURRENCY)
         results = await asyncio.gather(
             *(
-                self._summarize_single_chunk(
-                    sem=sem,
-                    model=model,
-                    chunk=chunk,
-                    index=i,
-                    total=len(chunks),
-                    days=days,
-                )
-                for i, chunk in enumerate(chunks, start=1)
+                self._summarize_single_chunk(sem=sem, model=model, chunk=chunk, day=day)
+                for _, day, chunk in missing
             ),
             return_exceptions=True,
         )
 
-        summaries: list[str] = []
-        for i, result in enumerate(results):
+        new_summaries: list[ChunkSummaryRow] = []
+        for (key, day, _), result in zip(missing, results):
             if isinstance(result, BaseException):
                 logger.warning(
                     "analysis_chunk_failed",
-                    extra={"chunk_index": i + 1, "error": str(result)},
+                    extra={"day": day.isoformat(), "error": str(result)},
                 )
             elif result:
-                summaries.append(result)
+                new_summaries.append(
+                    ChunkSummaryRow(cache_key=key, day=day, summary=result)
+                )
 
-        return summaries
+        await self.repo.add_chunk_summaries(
+            tenant_id=self.user.tenant_id,
+            assistant_id=assistant_id,
+            group_chat_id=group_chat_id,
+            completion_model_id=completion_model_id,
+            summaries=new_summaries,
+        )
+        logger.info(
+            "analysis_chunk_cache",
+            extra={
+                "chunk_count": len(chunks),
+                "cached_count": len(chunks) - len(missing),
+                "summarized_count": len(new_summaries),
+            },
+        )
+
+        summaries = dict(cached)
+        summaries.update((row.cache_key, row.summary) for row in new_summaries)
+        return [
+            (day, summaries[key]) for key, day, _ in chunks if summaries.get(key)
+        ], len(missing)
 
     async def _answer_with_adaptive_budget(
         self,
@@ -241,8 +317,10 @@ class AnalysisService:
         question: str,
         from_date: datetime,
         to_date: datetime,
-        question_texts: list[str],
+        question_rows: list[QuestionTextRow],
         stream: bool,
+        assistant_id: UUID | None = None,
+        group_chat_id: UUID | None = None,
     ):
         from intric.ai_models.completion_models.completion_model import (
             Completion,
@@ -251,7 +329,9 @@ class AnalysisService:
 
         started = perf_counter()
         cleaned_questions = [
-            self._normalize_question_text(item) for item in question_texts if item and item.strip()
+            self._normalize_question_text(row.question)
+            for row in question_rows
+            if row.question and row.question.strip()
         ]
 
         if not cleaned_questions:
@@ -316,22 +396,23 @@ class AnalysisService:
             )
             return result
 
-        chunks = self._build_question_chunks(deduped_questions)
-        summaries = await self._summarize_question_chunks(
+        summaries, summarized_count = await self._summarize_question_chunks(
             model=model,
-            questions=deduped_questions,
-            days=days,
+            rows=question_rows,
+            assistant_id=assistant_id,
+            group_chat_id=group_chat_id,
         )
 
-        if not summaries:
-            summaries = [
-                "Unable to summarize questions due to processing errors. "
+        if summaries:
+            summaries_text = "\n\n".join(
+                f"Summary {idx + 1} ({day.isoformat()}):\n{summary}"
+                for idx, (day, summary) in enumerate(summaries)
+            )
+        else:
+            summaries_text = (
+                "Summary 1:\nUnable to summarize questions due to processing errors. "
                 "Please try again or narrow the timeframe."
-            ]
-
-        summaries_text = "\n\n".join(
-            f"Summary {idx + 1}:\n{summary}" for idx, summary in enumerate(summaries)
-        )
+            )
         reduce_prompt = REDUCE_SUMMARY_PROMPT.format(days=days, summaries=summaries_text)
 
         result = await model.get_response(
@@ -346,15 +427,15 @@ class AnalysisService:
                 "mode": "map_reduce",
                 "question_count": len(cleaned_questions),
                 "unique_count": len(deduped_questions),
-                "chunk_count": len(chunks),
-                "llm_calls": len(chunks) + 1,
+                "chunk_count": len(summaries),
+                "llm_calls": summarized_count + 1,
                 "prompt_chars": len(reduce_prompt),
                 "duration_ms": round((perf_counter() - started) * 1000, 2),
             },
         )
         return result
 
-    async def _get_question_texts_for_unified_analysis(
+    async def _get_question_rows_for_unified_analysis(
         self,
         *,
         assistant_id: UUID | None,
@@ -362,7 +443,7 @@ class AnalysisService:
         from_date: datetime,
         to_date: datetime,
         include_followup: bool,
-    ) -> tuple[object, list[str]]:
+    ) -> tuple[object, list[QuestionTextRow]]:
         if assistant_id:
             await self._check_insight_access(assistant_id=assistant_id)
             assistant, _ = await self.assistant_service.get_assistant(assistant_id)
@@ -373,7 +454,7 @@ class AnalysisService:
                 include_followups=include_followup,
                 tenant_id=self.user.tenant_id,
             )
-            return assistant, [row.question for row in rows]
+            return assistant, rows
 
         await self._check_insight_access(group_chat_id=group_chat_id)
         space = await self.space_service.get_space_by_group_chat(group_chat_id=group_chat_id)
@@ -392,7 +473,7 @@ class AnalysisService:
             include_followups=include_followup,
             tenant_id=self.user.tenant_id,
         )
-        return model_to_use, [row.question for row in rows]
+        return model_to_use, rows
 
     async def should_queue_unified_analysis_job(
         self,
@@ -676,8 +757,9 @@ class AnalysisService:
             question=question,
             from_date=from_date,
             to_date=to_date,
-            question_texts=[row.question for row in rows],
+            question_rows=rows,
             stream=stream,
+            assistant_id=assistant_id,
         )
 
     async def unified_ask_question_on_questions(
@@ -719,7 +801,7 @@ class AnalysisService:
             )
 
         started = perf_counter()
-        model_to_use, question_texts = await self._get_question_texts_for_unified_analysis(
+        model_to_use, question_rows = await self._get_question_rows_for_unified_analysis(
             assistant_id=assistant_id,
             group_chat_id=group_chat_id,
             from_date=from_date,
@@ -731,8 +813,10 @@ class AnalysisService:
             question=question,
             from_date=from_date,
             to_date=to_date,
-            question_texts=question_texts,
+            question_rows=question_rows,
             stream=stream,
+            assistant_id=assistant_id,
+            group_chat_id=group_chat_id,
         )
         logger.info(
             "analysis_ask_completed",
@@ -741,7 +825,7 @@ class AnalysisService:
                 "tenant_id": str(self.user.tenant_id),
                 "assistant_id": str(assistant_id) if assistant_id else None,
                 "group_chat_id": str(group_chat_id) if group_chat_id else None,
-                "question_count": len(question_texts),
+                "question_count": len(question_rows),
                 "stream": stream,
             },
         )
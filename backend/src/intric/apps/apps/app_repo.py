@@ -7,8 +7,13 @@ from sqlalchemy.orm import selectinload
 from intric.apps.apps.api.app_models import InputField
 from intric.apps.apps.app import App
 from intric.apps.apps.app_factory import AppFactory
+from intric.completion_models.infrastructure.usage_counters import (
+    APPS,
+    CompletionModelUsageCounters,
+)
 from intric.database.database import AsyncSession
 from intric.database.tables.app_table import Apps, AppsFiles, AppsPrompts, InputFields
+from intric.events.model_events import ModelUsageChanged
 from intric.files.file_models import FileInfo
 from intric.prompts.prompt import Prompt
 from intric.prompts.prompt_repo import PromptRepository
@@ -29,6 +34,7 @@ class AppRepository:
         self.factory = factory
         self.prompt_repo = prompt_repo
         self.transcription_model_repo = transcription_model_repo
+        self.usage_counters = CompletionModelUsageCounters(session)
 
     def _options(self):
         return [
@@ -156,6 +162,10 @@ class AppRepository:
         await self._set_input_fields(entry_in_db, app.input_fields)
         await self._set_attachments(entry_in_db, app.attachments)
 
+        await self.usage_counters.apply(
+            ModelUsageChanged(counter=APPS, new_model_id=completion_model_id)
+        )
+
         return self.factory.create_app_from_db(
             entry_in_db, prompt=app.prompt, transcription_model=app.transcription_model
         )
@@ -192,6 +202,9 @@ class AppRepository:
             None if app.transcription_model is None else app.transcription_model.id
         )
         completion_model_id = app.completion_model.id if app.completion_model else None
+        previous_model_id = await self.session.scalar(
+            sa.select(Apps.completion_model_id).where(Apps.id == app.id)
+        )
 
         stmt = (
             sa.update(Apps)
@@ -214,6 +227,14 @@ class AppRepository:
 
         entry_in_db = await self._get_record_with_options(stmt)
 
+        await self.usage_counters.apply(
+            ModelUsageChanged(
+                counter=APPS,
+                old_model_id=previous_model_id,
+                new_model_id=completion_model_id,
+            )
+        )
+
         if app.prompt is not None:
             await self._set_prompt(entry_in_db, app.prompt)
 
@@ -225,8 +246,12 @@ class AppRepository:
         )
 
     async def delete(self, id: UUID):
-        stmt = sa.delete(Apps).where(Apps.id == id)
-        await self.session.execute(stmt)
+        stmt = sa.delete(Apps).where(Apps.id == id).returning(Apps.completion_model_id)
+        model_ids = await self.session.scalars(stmt)
+
+        await self.usage_counters.apply(
+            *[ModelUsageChanged(counter=APPS, old_model_id=model_id) for model_id in model_ids]
+        )
 
     async def get_by_space(self, space_id: UUID):
         stmt = sa.select(Apps).where(Apps.space_id == space_id).order_by(Apps.created_at)
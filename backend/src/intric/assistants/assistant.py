@@ -9,6 +9,7 @@ from intric.ai_models.completion_models.completion_model import (
 from intric.assistants.api.assistant_models import AssistantType
 from intric.base.base_entity import Entity
 from intric.completion_models.domain.completion_model import CompletionModel
+from intric.completion_models.infrastructure.admission import CompletionPriority
 from intric.completion_models.infrastructure.completion_service import CompletionService
 from intric.files.file_models import File, FileInfo, FileType
 from intric.files.text import TextMimeTypes
@@ -299,6 +300,7 @@ class Assistant(Entity):
         stream: bool = False,
         extended_logging: bool = False,
         prompt: str | None = None,
+        priority: Optional[CompletionPriority] = None,
     ):
         if self.completion_model is None:
             raise NoModelSelectedException()
@@ -314,6 +316,7 @@ class Assistant(Entity):
             stream=stream,
             extended_logging=extended_logging,
             model_kwargs=model_kwargs,
+            priority=priority,
         )
 
     async def ask(
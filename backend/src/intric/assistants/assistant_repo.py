@@ -7,6 +7,10 @@ from sqlalchemy.orm import selectinload
 
 from intric.assistants.assistant import Assistant
 from intric.assistants.assistant_factory import AssistantFactory
+from intric.completion_models.infrastructure.usage_counters import (
+    ASSISTANTS,
+    CompletionModelUsageCounters,
+)
 from intric.database.database import AsyncSession
 from intric.database.tables.assistant_table import (
     AssistantIntegrationKnowledge,
@@ -29,6 +33,7 @@ from intric.database.tables.integration_table import (
 from intric.database.tables.prompts_table import Prompts, PromptsAssistants
 from intric.database.tables.users_table import Users
 from intric.database.tables.websites_table import CrawlRuns, Websites
+from intric.events.model_events import ModelUsageChanged
 from intric.files.file_models import FileInfo
 from intric.prompts.prompt import Prompt
 
@@ -53,6 +58,7 @@ class AssistantRepository:
         self.factory = factory
         self.completion_model_repo = completion_model_repo
         self.user = user
+        self.usage_counters = CompletionModelUsageCounters(session)
 
     @staticmethod
     def _options():
@@ -345,6 +351,13 @@ class AssistantRepository:
         if assistant.prompt:
             await self._add_prompt(assistant_id=entry_in_db.id, prompt=assistant.prompt)
 
+        await self.usage_counters.apply(
+            ModelUsageChanged(
+                counter=ASSISTANTS,
+                new_model_id=completion_model_id if assistant.space_id else None,
+            )
+        )
+
     async def get_for_user(self, user_id: UUID, search_query: str = None):
         query = (
             sa.select(Assistants)
@@ -399,6 +412,14 @@ class AssistantRepository:
         completion_model_id = (
             assistant.completion_model.id if assistant.completion_model is not None else None
         )
+        previous = (
+            await self.session.execute(
+                sa.select(Assistants.completion_model_id, Assistants.space_id).where(
+                    Assistants.id == assistant.id
+                )
+            )
+        ).one_or_none()
+
         query = (
             sa.update(Assistants)
             .values(
@@ -420,6 +441,19 @@ class AssistantRepository:
         )
         entry_in_db = await self.session.scalar(query)
 
+        # Only assistants in a space count towards their model's usage
+        await self.usage_counters.apply(
+            ModelUsageChanged(
+                counter=ASSISTANTS,
+                old_model_id=(
+                    previous.completion_model_id
+                    if previous is not None and previous.space_id
+                    else None
+                ),
+                new_model_id=completion_model_id if assistant.space_id else None,
+            )
+        )
+
         # assign groups and websites
         await self._set_collections(entry_in_db, assistant.collections)
         await self._set_websites(entry_in_db, assistant.websites)
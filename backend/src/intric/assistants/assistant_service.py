@@ -654,13 +654,15 @@ class AssistantService:
         files = await self.file_service.get_files_by_ids(file_ids=file_ids)
 
         if session_id is not None:
+            # Only the turns that can fit in the model's context are loaded
+            max_tokens = assistant_to_ask.completion_model.token_limit
             if group_chat_id is not None:
-                session = await self.session_service.get_session_by_uuid(
-                    id=session_id, group_chat_id=group_chat_id
+                session = await self.session_service.get_session_for_chat(
+                    id=session_id, max_tokens=max_tokens, group_chat_id=group_chat_id
                 )
             else:
-                session = await self.session_service.get_session_by_uuid(
-                    id=session_id, assistant_id=assistant_id
+                session = await self.session_service.get_session_for_chat(
+                    id=session_id, max_tokens=max_tokens, assistant_id=assistant_id
                 )
         else:
             # Set the name as the question or the filenames
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Optional
 
 from intric.files.file_models import FileType
 from intric.info_blobs.info_blob import InfoBlobInDBWithScore
+from intric.main.config import get_settings
 from intric.services.service import DatastoreResult
 
 if TYPE_CHECKING:
@@ -61,6 +62,7 @@ class ReferencesService:
                 collections=collections,
                 websites=websites,
                 integration_knowledge_list=integration_knowledge_list,
+                neighbor_chunks=get_settings().context_neighbor_chunks,
                 **search_params,
             )
 
@@ -0,0 +1,212 @@
+"""Monthly range partitions of the audit log table."""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from intric.main.logging import get_logger
+
+logger = get_logger(__name__)
+
+PARENT_TABLE = "audit_logs"
+
+# Holds rows outside every monthly partition, e.g. logs back-dated past the
+# oldest month, so such inserts and updates do not fail
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+# Tenants without a retention policy get one with this default on first purge
+DEFAULT_RETENTION_DAYS = 365
+
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+@dataclass(frozen=True)
+class AuditLogPartition:
+    month: date
+
+    @property
+    def name(self) -> str:
+        return f"{PARENT_TABLE}_y{self.month.year:04d}m{self.month.month:02d}"
+
+    @property
+    def start(self) -> datetime:
+        return datetime.combine(self.month, time.min, tzinfo=timezone.utc)
+
+    @property
+    def end(self) -> datetime:
+        return datetime.combine(next_month(self.month), time.min, tzinfo=timezone.utc)
+
+    @classmethod
+    def from_name(cls, name: str) -> Optional["AuditLogPartition"]:
+        match = _PARTITION_NAME.match(name)
+        if match is None:
+            return None
+        return cls(month=date(int(match.group(1)), int(match.group(2)), 1))
+
+
+class AuditLogPartitionManager:
+    """Creates upcoming audit log partitions and drops expired ones.
+
+    A partition holds every tenant's logs for one month, so it is dropped only
+    once it is past the retention period of each tenant with logs in it. The
+    per-tenant purge then only has to delete rows from the partitions around
+    each tenant's own cutoff.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_partitions(self) -> list[AuditLogPartition]:
+        result = await self.session.execute(
+            sa.text(
+                """
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+                WHERE parent.relname = :parent
+                """
+            ),
+            {"parent": PARENT_TABLE},
+        )
+        partitions = [AuditLogPartition.from_name(name) for name in result.scalars()]
+        return sorted(
+            (partition for partition in partitions if partition is not None),
+            key=lambda partition: partition.month,
+        )
+
+    async def ensure_partitions(
+        self, months_ahead: int, today: Optional[date] = None
+    ) -> list[str]:
+        """Create the partitions for this month and the next months_ahead.
+
+        Returns the names of the partitions created.
+        """
+        existing = {partition.month for partition in await self.list_partitions()}
+
+        month = month_start(today or datetime.now(timezone.utc).date())
+        created = []
+        for _ in range(months_ahead + 1):
+            if month not in existing:
+                partition = AuditLogPartition(month=month)
+                await self._create_partition(partition)
+                created.append(partition.name)
+            month = next_month(month)
+
+        if created:
+            logger.info("Created audit log partitions", extra={"partitions": created})
+
+        return created
+
+    async def _create_partition(self, partition: AuditLogPartition):
+        bounds = (
+            f"FOR VALUES FROM ('{partition.start.isoformat()}') "
+            f"TO ('{partition.end.isoformat()}')"
+        )
+        in_default = await self.session.scalar(
+            sa.text(
+                f"""
+                SELECT EXISTS (
+                    SELECT 1 FROM {DEFAULT_PARTITION}
+                    WHERE "timestamp" >= :start AND "timestamp" < :end
+                )
+                """
+            ),
+            {"start": partition.start, "end": partition.end},
+        )
+
+        if not in_default:
+            await self.session.execute(
+                sa.text(
+                    f"CREATE TABLE IF NOT EXISTS {partition.name} "
+                    f"PARTITION OF {PARENT_TABLE} {bounds}"
+                )
+            )
+            return
+
+        # Postgres refuses a partition whose rows are in the default
+        # partition, so they are moved into the new table before attaching it
+        await self.session.execute(
+            sa.text(
+                f"CREATE TABLE {partition.name} "
+                f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        await self.session.execute(
+            sa.text(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE "timestamp" >= :start AND "timestamp" < :end
+                    RETURNING *
+                )
+                INSERT INTO {partition.name} SELECT * FROM moved
+                """
+            ),
+            {"start": partition.start, "end": partition.end},
+        )
+        await self.session.execute(
+            sa.text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {partition.name} {bounds}"
+            )
+        )
+
+    async def drop_expired_partitions(
+        self, now: Optional[datetime] = None
+    ) -> list[str]:
+        """Drop the partitions past every contained tenant's retention period.
+
+        Returns the names of the partitions dropped.
+        """
+        now = now or datetime.now(timezone.utc)
+        current_month = month_start(now.date())
+
+        dropped = []
+        for partition in await self.list_partitions():
+            if partition.month >= current_month:
+                break
+
+            retention_days = await self._longest_retention_days(partition)
+            if retention_days is not None and (
+                partition.end > now - timedelta(days=retention_days)
+            ):
+                continue
+
+            await self.session.execute(
+                sa.text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}")
+            )
+            await self.session.execute(sa.text(f"DROP TABLE {partition.name}"))
+            dropped.append(partition.name)
+
+        if dropped:
+            logger.info("Dropped audit log partitions", extra={"partitions": dropped})
+
+        return dropped
+
+    async def _longest_retention_days(
+        self, partition: AuditLogPartition
+    ) -> Optional[int]:
+        """The longest retention of the tenants in a partition; None if empty."""
+        return await self.session.scalar(
+            sa.text(
+                f"""
+                SELECT max(coalesce(policies.retention_days, :default_days))
+                FROM (SELECT DISTINCT tenant_id FROM {partition.name}) tenants
+                LEFT JOIN audit_retention_policies policies
+                    ON policies.tenant_id = tenants.tenant_id
+                """
+            ),
+            {"default_days": DEFAULT_RETENTION_DAYS},
+        )
@@ -322,6 +322,9 @@ class AuditLogRepositoryImpl(AuditLogRepository):
         that require true deletion after the retention period expires.
 
         Uses batch deletion to prevent transaction timeouts on large datasets.
+        Months past every tenant's retention are dropped as whole partitions by
+        AuditLogPartitionManager, so this only scans the partitions older than
+        the cutoff that are still kept for other tenants.
         """
         # Use DB time (sa.func.now()) for consistency with all deletion logic
         # make_interval signature: (years, months, weeks, days, hours, mins, secs)
@@ -21,6 +21,12 @@ class ExportJobManager:
     Key pattern: audit_export:{tenant_id}:{job_id}
     TTL: 24 hours (configurable via export_max_age_hours)
 
+    Indexes (written in the same MULTI/EXEC as the job record):
+    - audit_export_index:{tenant_id}:active - sorted set of non-terminal
+      job ids scored by expires_at, for O(log n) concurrency checks
+    - audit_export_index:expiry - sorted set of "{tenant_id}:{job_id}"
+      scored by expires_at, for cleanup without SCAN
+
     Provides atomic operations for:
     - Job creation and tracking
     - Progress updates
@@ -29,6 +35,7 @@ class ExportJobManager:
     """
 
     KEY_PREFIX = "audit_export"
+    INDEX_PREFIX = "audit_export_index"
 
     def __init__(self, redis: aioredis.Redis):
         self.redis = redis
@@ -38,14 +45,38 @@ class ExportJobManager:
         """Generate Redis key for a job."""
         return f"{self.KEY_PREFIX}:{tenant_id}:{job_id}"
 
-    def _tenant_jobs_pattern(self, tenant_id: UUID) -> str:
-        """Generate pattern to match all jobs for a tenant."""
-        return f"{self.KEY_PREFIX}:{tenant_id}:*"
+    def _active_jobs_key(self, tenant_id: UUID) -> str:
+        """Generate Redis key for a tenant's active job index."""
+        return f"{self.INDEX_PREFIX}:{tenant_id}:active"
+
+    def _expiry_index_key(self) -> str:
+        """Generate Redis key for the cross-tenant expiry index."""
+        return f"{self.INDEX_PREFIX}:expiry"
 
     def _calculate_ttl_seconds(self) -> int:
         """Calculate TTL in seconds from config."""
         return self._settings.export_max_age_hours * 3600
 
+    async def _save_job(self, job: ExportJob) -> None:
+        """Store the job record and update both indexes atomically."""
+        key = self._job_key(job.tenant_id, job.job_id)
+        active_key = self._active_jobs_key(job.tenant_id)
+        ttl = self._calculate_ttl_seconds()
+        expires_at = job.expires_at.timestamp()
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.setex(key, ttl, orjson.dumps(job.to_redis_dict()))
+        if job.is_terminal():
+            pipe.zrem(active_key, str(job.job_id))
+        else:
+            pipe.zadd(active_key, {str(job.job_id): expires_at})
+            # Index of an idle tenant disappears with its last job
+            pipe.expire(active_key, ttl)
+        pipe.zadd(
+            self._expiry_index_key(), {f"{job.tenant_id}:{job.job_id}": expires_at}
+        )
+        await pipe.execute()
+
     async def create_job(
         self,
         job_id: UUID,
@@ -74,14 +105,7 @@ class ExportJobManager:
             expires_at=expires_at,
         )
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         logger.info(
             "Created export job",
@@ -150,14 +174,7 @@ class ExportJobManager:
             job.status = ExportJobStatus.PROCESSING
             job.started_at = datetime.now(timezone.utc)
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         return job
 
@@ -182,14 +199,7 @@ class ExportJobManager:
         job.status = ExportJobStatus.PROCESSING
         job.started_at = datetime.now(timezone.utc)
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         logger.info(
             "Export job started processing",
@@ -233,14 +243,7 @@ class ExportJobManager:
         job.file_size_bytes = file_size_bytes
         job.completed_at = datetime.now(timezone.utc)
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         logger.info(
             "Export job completed",
@@ -279,14 +282,7 @@ class ExportJobManager:
         job.error_message = error_message
         job.completed_at = datetime.now(timezone.utc)
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         logger.error(
             "Export job failed",
@@ -325,14 +321,7 @@ class ExportJobManager:
 
         job.cancelled = True
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         logger.info(
             "Export job cancellation requested",
@@ -365,14 +354,7 @@ class ExportJobManager:
         job.status = ExportJobStatus.CANCELLED
         job.completed_at = datetime.now(timezone.utc)
 
-        key = self._job_key(tenant_id, job_id)
-        ttl = self._calculate_ttl_seconds()
-
-        await self.redis.setex(
-            key,
-            ttl,
-            orjson.dumps(job.to_redis_dict()),
-        )
+        await self._save_job(job)
 
         logger.info(
             "Export job cancelled",
@@ -409,7 +391,9 @@ class ExportJobManager:
     async def count_active_jobs(self, tenant_id: UUID) -> int:
         """Count active (non-terminal) export jobs for a tenant.
 
-        Used for concurrency limiting.
+        Used for concurrency limiting. Reads only the tenant's active index;
+        entries past expires_at (e.g. a worker died mid-export) are pruned
+        first so they stop counting once the job record would have expired.
 
         Args:
             tenant_id: Tenant ID
@@ -417,31 +401,18 @@ class ExportJobManager:
         Returns:
             Number of pending or processing jobs
         """
-        pattern = self._tenant_jobs_pattern(tenant_id)
-        cursor = 0
-        active_count = 0
-
-        while True:
-            cursor, keys = await self.redis.scan(
-                cursor=cursor,
-                match=pattern,
-                count=100,
-            )
-
-            for key in keys:
-                data = await self.redis.get(key)
-                if data:
-                    job = ExportJob.from_redis_dict(orjson.loads(data))
-                    if not job.is_terminal():
-                        active_count += 1
-
-            if cursor == 0:
-                break
+        active_key = self._active_jobs_key(tenant_id)
+        now = datetime.now(timezone.utc).timestamp()
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zremrangebyscore(active_key, "-inf", now)
+        pipe.zcard(active_key)
+        _, active_count = await pipe.execute()
 
         return active_count
 
     async def delete_job(self, tenant_id: UUID, job_id: UUID) -> bool:
-        """Delete a job from Redis.
+        """Delete a job and its index entries from Redis.
 
         Used during cleanup of old jobs.
 
@@ -453,37 +424,47 @@ class ExportJobManager:
             True if job was deleted, False if not found
         """
         key = self._job_key(tenant_id, job_id)
-        result = await self.redis.delete(key)
-        return result > 0
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.zrem(self._active_jobs_key(tenant_id), str(job_id))
+        pipe.zrem(self._expiry_index_key(), f"{tenant_id}:{job_id}")
+        deleted, _, _ = await pipe.execute()
+
+        return deleted > 0
 
     async def get_expired_jobs(self) -> list[ExportJob]:
         """Get all expired jobs across all tenants.
 
-        Used by the cleanup cron job.
+        Used by the cleanup cron job. Range-reads the expiry index and fetches
+        the matching records with a single MGET. Index entries whose record
+        already expired via TTL are dropped here; their files are removed by
+        the cleanup job's orphaned-file sweep.
 
         Returns:
             List of expired ExportJob instances
         """
-        pattern = f"{self.KEY_PREFIX}:*"
-        cursor = 0
-        expired_jobs = []
-        now = datetime.now(timezone.utc)
+        index_key = self._expiry_index_key()
+        now = datetime.now(timezone.utc).timestamp()
+
+        members = await self.redis.zrangebyscore(index_key, "-inf", now)
+        if not members:
+            return []
 
-        while True:
-            cursor, keys = await self.redis.scan(
-                cursor=cursor,
-                match=pattern,
-                count=100,
-            )
-
-            for key in keys:
-                data = await self.redis.get(key)
-                if data:
-                    job = ExportJob.from_redis_dict(orjson.loads(data))
-                    if job.expires_at <= now:
-                        expired_jobs.append(job)
-
-            if cursor == 0:
-                break
+        members = [m.decode() if isinstance(m, bytes) else m for m in members]
+        records = await self.redis.mget(
+            [f"{self.KEY_PREFIX}:{member}" for member in members]
+        )
+
+        expired_jobs = []
+        missing = []
+        for member, data in zip(members, records):
+            if data:
+                expired_jobs.append(ExportJob.from_redis_dict(orjson.loads(data)))
+            else:
+                missing.append(member)
+
+        if missing:
+            await self.redis.zrem(index_key, *missing)
 
         return expired_jobs
@@ -1,5 +1,4 @@
 """Minimal adapter for tenant models using LiteLLM."""
-import base64
 import json
 import re
 import uuid
@@ -23,9 +22,13 @@ from intric.completion_models.infrastructure.adapters.base_adapter import (
     CompletionModelAdapter,
 )
 from intric.files.file_models import File
+from intric.files.image_cache import encoded_image_cache
 from intric.logging.logging import LoggingDetails
 from intric.main.exceptions import APIKeyNotConfiguredException, OpenAIException
 from intric.main.logging import get_logger
+from intric.model_providers.infrastructure.provider_client_registry import (
+    provider_client_registry,
+)
 from intric.model_providers.infrastructure.tenant_model_credential_resolver import (
     TenantModelCredentialResolver,
 )
@@ -95,12 +98,13 @@ class TenantModelAdapter(CompletionModelAdapter):
         if "api_key" in safe_params:
             key = safe_params["api_key"]
             safe_params["api_key"] = f"...{key[-4:]}" if len(key) > 4 else "***"
+        safe_params.pop("shared_session", None)
         return safe_params
 
     def _get_dropped_params(self, litellm_kwargs: dict) -> set:
         """Get which params will be dropped by LiteLLM for this model."""
         # Params that are not model params (credentials, config)
-        non_model_params = {"api_key", "api_base", "api_version", "api_type", "organization", "deployment_name"}
+        non_model_params = {"api_key", "api_base", "api_version", "api_type", "organization", "deployment_name", "shared_session"}
 
         try:
             # Get supported params for this model
@@ -156,7 +160,7 @@ class TenantModelAdapter(CompletionModelAdapter):
         Returns:
             dict: Image content in OpenAI format
         """
-        image_data = base64.b64encode(file.blob).decode("utf-8")
+        image_data = encoded_image_cache.encode(file)
         return {
             "type": "image_url",
             "image_url": {"url": f"data:{file.mimetype};base64,{image_data}"},
@@ -303,6 +307,13 @@ class TenantModelAdapter(CompletionModelAdapter):
         if endpoint:
             kwargs["api_base"] = endpoint
 
+        # Reuse the keep-alive connections to this endpoint
+        shared_session = provider_client_registry.session(
+            self.credential_resolver.provider_id, endpoint, self.provider_type
+        )
+        if shared_session is not None:
+            kwargs["shared_session"] = shared_session
+
         # Inject additional config fields (e.g., api_version for Azure)
         config_fields = ["api_version", "api_type", "organization"]
         for field in config_fields:
@@ -0,0 +1,384 @@
+"""Fair admission of completion requests.
+
+Completions run against per-tenant and per-provider budgets: a number of
+concurrent requests and a number of prompt tokens per minute. The budgets are
+shared by all API and worker processes through counters in Redis, taken and
+given back atomically by Lua scripts.
+
+Within a process, requests that cannot be admitted right away wait in a
+weighted fair queue. Interactive requests go before background ones, and
+among equal priorities the tenant that has had the fewest tokens admitted
+goes first, so a tenant with a large batch of requests cannot starve the
+others. A waiter whose tenant is at its limit does not hold up other tenants.
+Background requests may only take part of a provider's concurrency, leaving
+room for chat.
+
+When Redis is unavailable, requests are admitted without budgets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID, uuid4
+
+from intric.main.exceptions import CompletionCapacityException
+from intric.main.logging import get_logger
+from intric.observability.metrics import (
+    COMPLETION_ADMISSION_TIMEOUTS,
+    COMPLETION_ADMISSION_WAIT_SECONDS,
+    COMPLETION_ADMISSION_WAITING,
+)
+from intric.worker.redis.lua_scripts import LuaScripts
+
+if TYPE_CHECKING:
+    import redis.asyncio as aioredis
+
+    from intric.main.config import Settings
+
+logger = get_logger(__name__)
+
+ADMITTED = 0
+TENANT_CONCURRENCY = 1
+PROVIDER_CONCURRENCY = 2
+TENANT_TOKENS = 3
+PROVIDER_TOKENS = 4
+
+
+class CompletionPriority(str, Enum):
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+_PRIORITY_ORDER = {CompletionPriority.INTERACTIVE: 0, CompletionPriority.BACKGROUND: 1}
+
+# Completions of this process without an explicit priority. The worker runs
+# app runs and insight analyses, so it sets this to background.
+_default_priority = CompletionPriority.INTERACTIVE
+
+
+def set_default_priority(priority: CompletionPriority):
+    global _default_priority
+    _default_priority = priority
+
+
+def get_default_priority() -> CompletionPriority:
+    return _default_priority
+
+
+@dataclass(frozen=True)
+class AdmissionLimits:
+    """Budgets of one tenant on one provider (0 = no limit)."""
+
+    tenant_concurrency: int = 0
+    provider_concurrency: int = 0
+    tenant_tokens_per_minute: int = 0
+    provider_tokens_per_minute: int = 0
+    background_share: float = 0.5
+
+    @classmethod
+    def from_settings(
+        cls, settings: "Settings", provider_config: Optional[dict] = None
+    ) -> "AdmissionLimits":
+        provider_config = provider_config or {}
+        return cls(
+            tenant_concurrency=settings.completion_tenant_concurrency_limit,
+            provider_concurrency=int(
+                provider_config.get(
+                    "max_concurrent_completions",
+                    settings.completion_provider_concurrency_limit,
+                )
+            ),
+            tenant_tokens_per_minute=settings.completion_tenant_tokens_per_minute,
+            provider_tokens_per_minute=int(
+                provider_config.get(
+                    "completion_tokens_per_minute",
+                    settings.completion_provider_tokens_per_minute,
+                )
+            ),
+            background_share=settings.completion_background_share,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            (
+                self.tenant_concurrency,
+                self.provider_concurrency,
+                self.tenant_tokens_per_minute,
+                self.provider_tokens_per_minute,
+            )
+        )
+
+    def provider_concurrency_for(self, priority: CompletionPriority) -> int:
+        if priority == CompletionPriority.BACKGROUND and self.provider_concurrency > 0:
+            return max(1, int(self.provider_concurrency * self.background_share))
+        return self.provider_concurrency
+
+
+@dataclass
+class AdmissionTicket:
+    tenant_id: UUID
+    provider_id: UUID
+    priority: CompletionPriority
+    # False when admitted without taking a slot, nothing to give back
+    budgeted: bool
+    released: bool = False
+    id: str = field(default_factory=lambda: uuid4().hex)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    tenant_id: UUID
+    provider_id: UUID
+    priority: CompletionPriority
+    tokens: int
+    limits: AdmissionLimits
+    start_tag: float
+    finish_tag: float
+    future: asyncio.Future = field(repr=False)
+    ticket_id: str = field(default_factory=lambda: uuid4().hex)
+
+    @property
+    def order(self) -> tuple[int, float]:
+        return _PRIORITY_ORDER[self.priority], self.finish_tag
+
+
+class CompletionAdmission:
+    def __init__(
+        self,
+        redis: "aioredis.Redis",
+        *,
+        slot_ttl_seconds: int = 900,
+        poll_interval_seconds: float = 0.05,
+    ):
+        self.redis = redis
+        self.slot_ttl_seconds = slot_ttl_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+
+        self._waiters: list[_Waiter] = []
+        # Start-time fair queueing: a tenant's requests are tagged with the
+        # tokens it has queued so far, and the lowest tag is admitted first
+        self._virtual_time = 0.0
+        self._finish_tags: dict[UUID, float] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    def _bind_loop(self):
+        # The scheduler's primitives belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._dispatcher = None
+            self._waiters.clear()
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _try_acquire(
+        self,
+        tenant_id: UUID,
+        provider_id: UUID,
+        priority: CompletionPriority,
+        tokens: int,
+        limits: AdmissionLimits,
+        ticket_id: str,
+    ) -> int:
+        return await LuaScripts.acquire_completion_budget(
+            self.redis,
+            tenant_id,
+            provider_id,
+            minute=int(time.time() // 60),
+            tenant_limit=limits.tenant_concurrency,
+            provider_limit=limits.provider_concurrency_for(priority),
+            tenant_tokens_per_minute=limits.tenant_tokens_per_minute,
+            provider_tokens_per_minute=limits.provider_tokens_per_minute,
+            tokens=tokens,
+            ttl_seconds=self.slot_ttl_seconds,
+            ticket_id=ticket_id,
+        )
+
+    async def acquire(
+        self,
+        *,
+        tenant_id: UUID,
+        provider_id: UUID,
+        tokens: int,
+        limits: AdmissionLimits,
+        priority: CompletionPriority,
+        timeout_seconds: float,
+    ) -> AdmissionTicket:
+        """Wait until the request fits its budgets, and take a slot.
+
+        Raises CompletionCapacityException if that takes longer than
+        timeout_seconds.
+        """
+        if not limits.enabled:
+            return AdmissionTicket(tenant_id, provider_id, priority, budgeted=False)
+
+        self._bind_loop()
+        start = time.perf_counter()
+
+        # Nobody is waiting in this process, so there is no one to be fair to
+        if not self._waiters:
+            ticket_id = uuid4().hex
+            try:
+                result = await self._try_acquire(
+                    tenant_id, provider_id, priority, tokens, limits, ticket_id
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Completion admission unavailable, admitting without budgets",
+                    extra={"error": str(exc)},
+                )
+                return AdmissionTicket(tenant_id, provider_id, priority, budgeted=False)
+
+            if result == ADMITTED:
+                COMPLETION_ADMISSION_WAIT_SECONDS.labels(
+                    priority=priority.value
+                ).observe(time.perf_counter() - start)
+                return AdmissionTicket(
+                    tenant_id, provider_id, priority, budgeted=True, id=ticket_id
+                )
+
+        start_tag = max(self._virtual_time, self._finish_tags.get(tenant_id, 0.0))
+        waiter = _Waiter(
+            tenant_id=tenant_id,
+            provider_id=provider_id,
+            priority=priority,
+            tokens=tokens,
+            limits=limits,
+            start_tag=start_tag,
+            finish_tag=start_tag + max(tokens, 1),
+            future=self._loop.create_future(),
+        )
+        self._finish_tags[tenant_id] = waiter.finish_tag
+        self._waiters.append(waiter)
+        COMPLETION_ADMISSION_WAITING.labels(priority=priority.value).inc()
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        self._wake()
+
+        try:
+            ticket = await asyncio.wait_for(
+                asyncio.shield(waiter.future), timeout=timeout_seconds
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the wait ended
+                ticket = waiter.future.result()
+                if isinstance(exc, asyncio.CancelledError):
+                    await self.release(ticket)
+                    raise
+            else:
+                waiter.future.cancel()
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+                COMPLETION_ADMISSION_TIMEOUTS.labels(priority=priority.value).inc()
+                raise CompletionCapacityException(
+                    "The model is busy, please try again in a moment."
+                ) from exc
+        finally:
+            COMPLETION_ADMISSION_WAITING.labels(priority=priority.value).dec()
+
+        COMPLETION_ADMISSION_WAIT_SECONDS.labels(priority=priority.value).observe(
+            time.perf_counter() - start
+        )
+        return ticket
+
+    async def release(self, ticket: AdmissionTicket):
+        if ticket.released or not ticket.budgeted:
+            return
+        ticket.released = True
+
+        try:
+            await LuaScripts.release_completion_budget(
+                self.redis, ticket.tenant_id, ticket.provider_id, ticket.id
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to release completion slot, it expires on its own",
+                extra={"tenant_id": ticket.tenant_id, "error": str(exc)},
+            )
+
+        self._wake()
+
+    async def _dispatch(self):
+        while self._waiters:
+            self._wakeup.clear()
+            await self._admit_waiters()
+
+            if self._waiters:
+                # Slots are also given back by other processes, which cannot
+                # wake this one
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _admit_waiters(self):
+        blocked_tenants: set[UUID] = set()
+        blocked_providers: set[tuple[UUID, CompletionPriority]] = set()
+
+        for waiter in sorted(self._waiters, key=lambda waiter: waiter.order):
+            if waiter.future.done():
+                continue
+            if waiter.tenant_id in blocked_tenants:
+                continue
+            if (waiter.provider_id, waiter.priority) in blocked_providers:
+                continue
+
+            try:
+                result = await self._try_acquire(
+                    waiter.tenant_id,
+                    waiter.provider_id,
+                    waiter.priority,
+                    waiter.tokens,
+                    waiter.limits,
+                    waiter.ticket_id,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "Completion admission unavailable, admitting without budgets",
+                    extra={"error": str(exc)},
+                )
+                result, budgeted = ADMITTED, False
+            else:
+                budgeted = True
+
+            if result == ADMITTED:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                self._virtual_time = max(self._virtual_time, waiter.start_tag)
+                ticket = AdmissionTicket(
+                    waiter.tenant_id,
+                    waiter.provider_id,
+                    waiter.priority,
+                    budgeted=budgeted,
+                    id=waiter.ticket_id,
+                )
+                if waiter.future.done():
+                    # Gave up while the slot was being taken
+                    await self.release(ticket)
+                else:
+                    waiter.future.set_result(ticket)
+            elif result in (TENANT_CONCURRENCY, TENANT_TOKENS):
+                blocked_tenants.add(waiter.tenant_id)
+            else:
+                # What blocks interactive requests also blocks background ones
+                blocked_providers.add((waiter.provider_id, waiter.priority))
+                blocked_providers.add(
+                    (waiter.provider_id, CompletionPriority.BACKGROUND)
+                )
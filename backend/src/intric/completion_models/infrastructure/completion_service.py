@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+import weakref
 from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
 from intric.ai_models.completion_models.completion_model import (
@@ -10,7 +13,14 @@ from intric.ai_models.completion_models.completion_model import (
     ModelKwargs,
     ResponseType,
 )
+from intric.completion_models.infrastructure.admission import (
+    AdmissionLimits,
+    CompletionAdmission,
+    CompletionPriority,
+    get_default_priority,
+)
 from intric.completion_models.infrastructure.context_builder import ContextBuilder
+from intric.files.blob_store import load_blobs
 from intric.files.file_models import File
 from intric.info_blobs.info_blob import InfoBlobChunkInDBWithScore
 from intric.main.config import SETTINGS, Settings, get_settings
@@ -18,6 +28,11 @@ from intric.main.exceptions import ProviderInactiveException, ProviderNotFoundEx
 from intric.main.logging import get_logger
 from intric.mcp_servers.infrastructure.proxy import MCPProxySession, MCPProxySessionFactory
 from intric.mcp_servers.infrastructure.tool_approval import get_approval_manager
+from intric.observability.metrics import (
+    CONTEXT_BUILD_SECONDS,
+    LLM_RESPONSE_SECONDS,
+    LLM_TIME_TO_FIRST_TOKEN_SECONDS,
+)
 from intric.sessions.session import SessionInDB
 from intric.vision_models.infrastructure.flux_ai import FluxAdapter
 
@@ -49,12 +64,16 @@ class CompletionService:
         config: Optional[Settings] = None,
         encryption_service: Optional["EncryptionService"] = None,
         session: Optional["AsyncSession"] = None,
+        admission: Optional[CompletionAdmission] = None,
     ):
         self.context_builder = context_builder
         self.tenant = tenant
         self.config = config or SETTINGS
         self.encryption_service = encryption_service
         self.session = session
+        self.admission = admission
+        # Provider config by provider id, loaded with the adapter
+        self._provider_configs: dict = {}
         self._mcp_proxy_factory = MCPProxySessionFactory(
             encryption_service=encryption_service
         )
@@ -115,6 +134,8 @@ class CompletionService:
                 "Please contact your administrator to enable the provider."
             )
 
+        self._provider_configs[provider_db.id] = provider_db.config or {}
+
         # Create credential resolver
         credential_resolver = TenantModelCredentialResolver(
             provider_id=provider_db.id,
@@ -124,14 +145,17 @@ class CompletionService:
             encryption_service=self.encryption_service,
         )
 
+        # Logged on every call: the message is rendered and the ids are
+        # serialized only if the record is written
         logger.info(
-            f"Using TenantModelAdapter for model '{model.name}'",
+            "Using TenantModelAdapter for model '%s'",
+            model.name,
             extra={
-                "model_id": str(model.id) if hasattr(model, 'id') else None,
+                "model_id": getattr(model, "id", None),
                 "model_name": model.name,
-                "provider_id": str(model.provider_id),
+                "provider_id": model.provider_id,
                 "provider_type": provider_db.provider_type,
-                "tenant_id": str(self.tenant.id) if self.tenant else None,
+                "tenant_id": self.tenant.id if self.tenant else None,
             }
         )
 
@@ -197,6 +221,61 @@ class CompletionService:
 
                 yield chunk
 
+    async def _admit(
+        self,
+        model: CompletionModel,
+        tokens: int,
+        priority: CompletionPriority | None,
+    ):
+        """Wait for the tenant's and provider's budgets, when limits are set."""
+        if self.admission is None or self.tenant is None:
+            return None
+
+        limits = AdmissionLimits.from_settings(
+            get_settings(), self._provider_configs.get(model.provider_id)
+        )
+        return await self.admission.acquire(
+            tenant_id=self.tenant.id,
+            provider_id=model.provider_id,
+            tokens=tokens,
+            limits=limits,
+            priority=priority or get_default_priority(),
+            timeout_seconds=get_settings().completion_admission_timeout_seconds,
+        )
+
+    async def _release(self, ticket):
+        if ticket is not None:
+            await self.admission.release(ticket)
+
+    def _cleanup_if_discarded(
+        self,
+        stream: AsyncGenerator,
+        started: list[bool],
+        ticket,
+        mcp_proxy: MCPProxySession | None,
+    ):
+        """Give the slot back if the stream is dropped without being iterated.
+
+        A generator that never started does not run its finally block when
+        it is collected, so the slot would stay taken until it expires.
+        """
+        if ticket is None and mcp_proxy is None:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        async def _cleanup():
+            if mcp_proxy:
+                await mcp_proxy.close()
+            await self._release(ticket)
+
+        def _on_collected():
+            if started[0] or loop.is_closed():
+                return
+            loop.call_soon_threadsafe(loop.create_task, _cleanup())
+
+        weakref.finalize(stream, _on_collected)
+
     async def get_response(
         self,
         model: CompletionModel,
@@ -215,6 +294,7 @@ class CompletionService:
         use_image_generation: bool = False,
         mcp_servers: list["MCPServer"] = [],
         require_tool_approval: bool = False,
+        priority: CompletionPriority | None = None,
     ):
         model_adapter = await self._get_adapter(model)
 
@@ -225,6 +305,7 @@ class CompletionService:
         # And only if feature flag is turned on
         use_image_generation = use_image_generation and stream and get_settings().using_image_generation
 
+        context_build_start = time.perf_counter()
         context = self.context_builder.build_context(
             input_str=text_input,
             max_tokens=max_tokens,
@@ -239,6 +320,18 @@ class CompletionService:
             web_search_results=web_search_results,
         )
 
+        # Image bytes are only read from the blob store for images that made it
+        # into the context
+        await load_blobs(
+            context.images
+            + [
+                image
+                for message in context.messages
+                for image in message.images + message.generated_images
+            ]
+        )
+        CONTEXT_BUILD_SECONDS.observe(time.perf_counter() - context_build_start)
+
         if extended_logging:
             logging_details = model_adapter.get_logging_details(
                 context=context, model_kwargs=model_kwargs
@@ -252,6 +345,16 @@ class CompletionService:
             mcp_proxy = self._mcp_proxy_factory.create(mcp_servers)
             logger.debug(f"[MCP] Proxy created with {mcp_proxy.get_tool_count()} tools from {len(mcp_servers)} server(s)")
 
+        try:
+            ticket = await self._admit(
+                model, tokens=context.token_count, priority=priority
+            )
+        except BaseException:
+            if mcp_proxy:
+                await mcp_proxy.close()
+            raise
+
+        request_start = time.perf_counter()
         if not stream:
             try:
                 completion = await model_adapter.get_response(
@@ -259,22 +362,32 @@ class CompletionService:
                     model_kwargs=model_kwargs,
                     mcp_proxy=mcp_proxy,
                 )
+                LLM_RESPONSE_SECONDS.labels(model=model.name, stream="false").observe(
+                    time.perf_counter() - request_start
+                )
             finally:
                 # Ensure cleanup for non-streaming
                 if mcp_proxy:
                     await mcp_proxy.close()
+                await self._release(ticket)
         else:
             # Two-phase streaming pattern:
             # Phase 1: Create stream connection BEFORE returning (can raise exceptions)
             # This happens eagerly, so exceptions propagate before HTTP response starts
-            stream_obj = await model_adapter.prepare_streaming(
-                context=context,
-                model_kwargs=model_kwargs,
-                mcp_proxy=mcp_proxy,
-            )
+            try:
+                stream_obj = await model_adapter.prepare_streaming(
+                    context=context,
+                    model_kwargs=model_kwargs,
+                    mcp_proxy=mcp_proxy,
+                )
+            except BaseException:
+                await self._release(ticket)
+                raise
 
             # Phase 2: Create generator that iterates the pre-created stream
             # This generator yields error events for mid-stream failures
+            started = [False]
+
             async def streaming_wrapper():
                 """
                 Generator that iterates pre-created stream.
@@ -282,6 +395,8 @@ class CompletionService:
                 the pre-flight checks. Any errors here are mid-stream failures.
                 Proxy cleanup happens after iteration completes.
                 """
+                started[0] = True
+                first_chunk = True
                 try:
                     # Get approval manager if tool approval is required
                     approval_manager = get_approval_manager() if require_tool_approval else None
@@ -293,13 +408,25 @@ class CompletionService:
                         require_tool_approval=require_tool_approval,
                         approval_manager=approval_manager,
                     ):
+                        if first_chunk:
+                            LLM_TIME_TO_FIRST_TOKEN_SECONDS.labels(
+                                model=model.name
+                            ).observe(time.perf_counter() - request_start)
+                            first_chunk = False
                         yield chunk
+
+                    LLM_RESPONSE_SECONDS.labels(model=model.name, stream="true").observe(
+                        time.perf_counter() - request_start
+                    )
                 finally:
                     # Cleanup proxy after streaming completes
                     if mcp_proxy:
                         await mcp_proxy.close()
+                    await self._release(ticket)
 
-            completion = self._handle_tool_call(streaming_wrapper())
+            stream_wrapper = streaming_wrapper()
+            self._cleanup_if_discarded(stream_wrapper, started, ticket, mcp_proxy)
+            completion = self._handle_tool_call(stream_wrapper)
 
         return CompletionModelResponse(
             completion=completion,
@@ -34,14 +34,18 @@ MIN_PERCENTAGE_KNOWLEDGE = (
 _TIKTOKEN_ENCODING = None
 
 
-def count_tokens(text: str):
+def get_token_encoding() -> tiktoken.Encoding:
     global _TIKTOKEN_ENCODING
+    if _TIKTOKEN_ENCODING is None:
+        _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
+    return _TIKTOKEN_ENCODING
+
+
+def count_tokens(text: str):
     # ensure we're always passing a string to the encoder
     if text is None:
         return 0
-    if _TIKTOKEN_ENCODING is None:
-        _TIKTOKEN_ENCODING = tiktoken.get_encoding("cl100k_base")
-    return len(_TIKTOKEN_ENCODING.encode(text))
+    return len(get_token_encoding().encode(text))
 
 
 def _build_files_string(files: list[File]):
@@ -140,10 +144,44 @@ class _Prompt:
                 best = length
                 length += 1
 
+    @staticmethod
+    def _has_offsets(chunks: list["InfoBlobChunkInDBWithScore"]):
+        return all(
+            chunk.start_offset is not None
+            and chunk.end_offset is not None
+            and chunk.end_offset - chunk.start_offset == len(chunk.text)
+            for chunk in chunks
+        )
+
+    @staticmethod
+    def _join_by_offsets(chunks: list["InfoBlobChunkInDBWithScore"]):
+        # Chunks are slices of the same text in order, so each one only adds
+        # what lies past the end of the text covered so far
+        parts = [chunks[0].text]
+        covered_end = chunks[0].end_offset
+
+        for chunk in chunks[1:]:
+            if chunk.end_offset <= covered_end:
+                continue
+
+            if chunk.start_offset < covered_end:
+                parts.append(chunk.text[covered_end - chunk.start_offset :])
+            else:
+                # The whitespace between the chunks is not stored
+                parts.append(f"\n{chunk.text}")
+
+            covered_end = chunk.end_offset
+
+        return "".join(parts)
+
     def _join_overlapping_text(self, chunks: list["InfoBlobChunkInDBWithScore"]):
         if not chunks:
             return ""
 
+        if self._has_offsets(chunks):
+            return self._join_by_offsets(chunks)
+
+        # Chunks stored before offsets were recorded
         result_string = chunks[0].text
 
         for i in range(1, len(chunks)):
@@ -168,7 +206,11 @@ class _Prompt:
         chunks_by_info_blob = {}
         used_tokens = 0
         for chunk in chunks:
-            chunk_tokens = count_tokens(chunk.text)
+            chunk_tokens = (
+                chunk.token_count
+                if chunk.token_count is not None
+                else count_tokens(chunk.text)
+            )
 
             if chunks_by_info_blob.get(chunk.info_blob_id) is None:
                 chunks_by_info_blob[chunk.info_blob_id] = []
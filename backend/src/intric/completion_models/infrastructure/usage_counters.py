@@ -0,0 +1,255 @@
+import hashlib
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+
+from intric.database.tables.ai_models_table import (
+    CompletionModels,
+    CompletionModelUsageStats,
+)
+from intric.database.tables.app_table import Apps
+from intric.database.tables.app_template_table import AppTemplates
+from intric.database.tables.assistant_table import Assistants
+from intric.database.tables.assistant_template_table import AssistantTemplates
+from intric.database.tables.questions_table import Questions
+from intric.database.tables.service_table import Services
+from intric.database.tables.spaces_table import Spaces, SpacesCompletionModels
+from intric.events.model_events import ModelUsageChanged
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+ASSISTANTS = "assistants_count"
+APPS = "apps_count"
+SERVICES = "services_count"
+ASSISTANT_TEMPLATES = "assistant_templates_count"
+APP_TEMPLATES = "app_templates_count"
+SPACES = "spaces_count"
+
+# Counters kept current from events; questions are counted separately since
+# they change on every chat turn
+EVENT_COUNTERS = (
+    ASSISTANTS,
+    APPS,
+    SERVICES,
+    ASSISTANT_TEMPLATES,
+    APP_TEMPLATES,
+    SPACES,
+)
+TOTAL_USAGE_COUNTERS = (ASSISTANTS, APPS, SERVICES)
+
+
+class CompletionModelUsageCounters:
+    """Keeps the completion model usage counters current.
+
+    Writes apply the usage changes they cause in their own transaction. Counter
+    rows are only ever adjusted, never created: a model without a row has not
+    been counted yet, and the drift check picks its tenant up for a full
+    recalculation.
+    """
+
+    def __init__(self, session: "AsyncSession"):
+        self.session = session
+
+    async def apply(self, *events: ModelUsageChanged):
+        deltas: Counter[tuple["UUID", str]] = Counter()
+        for event in events:
+            if event.old_model_id == event.new_model_id:
+                continue
+            if event.old_model_id is not None:
+                deltas[(event.old_model_id, event.counter)] -= 1
+            if event.new_model_id is not None:
+                deltas[(event.new_model_id, event.counter)] += 1
+
+        by_model: dict["UUID", dict[str, int]] = defaultdict(dict)
+        for (model_id, counter), delta in deltas.items():
+            if delta:
+                by_model[model_id][counter] = delta
+
+        # A stable order keeps concurrent writers from deadlocking on the rows
+        for model_id in sorted(by_model, key=str):
+            await self._adjust(model_id, by_model[model_id])
+
+    async def _adjust(self, model_id: "UUID", counter_deltas: dict[str, int]):
+        values = {
+            counter: getattr(CompletionModelUsageStats, counter) + delta
+            for counter, delta in counter_deltas.items()
+        }
+        total_delta = sum(
+            delta
+            for counter, delta in counter_deltas.items()
+            if counter in TOTAL_USAGE_COUNTERS
+        )
+        if total_delta:
+            values["total_usage"] = CompletionModelUsageStats.total_usage + total_delta
+        values["last_updated"] = sa.func.now()
+
+        await self.session.execute(
+            sa.update(CompletionModelUsageStats)
+            .where(CompletionModelUsageStats.model_id == model_id)
+            .values(**values)
+        )
+
+    async def find_drifted_tenants(self) -> list["UUID"]:
+        """Tenants whose stored counters disagree with their source tables.
+
+        Compares one checksum per tenant over the enabled models' counters,
+        computed with a single grouped query per entity type.
+        """
+        source = _checksums(await self._source_counts())
+        stored = _checksums(await self._stored_counts())
+
+        return sorted(
+            (
+                tenant_id
+                for tenant_id in source.keys() | stored.keys()
+                if source.get(tenant_id) != stored.get(tenant_id)
+            ),
+            key=str,
+        )
+
+    async def refresh_questions_counts(self) -> int:
+        """Recount questions per model for all tenants in one statement.
+
+        Returns the number of counter rows that changed.
+        """
+        counts = (
+            sa.select(
+                Questions.tenant_id,
+                Questions.completion_model_id,
+                sa.func.count().label("questions_count"),
+            )
+            .where(Questions.completion_model_id.isnot(None))
+            .group_by(Questions.tenant_id, Questions.completion_model_id)
+            .subquery()
+        )
+        current = (
+            sa.select(
+                CompletionModelUsageStats.id,
+                sa.func.coalesce(counts.c.questions_count, 0).label("questions_count"),
+            )
+            .outerjoin(
+                counts,
+                sa.and_(
+                    counts.c.tenant_id == CompletionModelUsageStats.tenant_id,
+                    counts.c.completion_model_id == CompletionModelUsageStats.model_id,
+                ),
+            )
+            .subquery()
+        )
+        result = await self.session.execute(
+            sa.update(CompletionModelUsageStats)
+            .where(CompletionModelUsageStats.id == current.c.id)
+            .where(
+                CompletionModelUsageStats.questions_count != current.c.questions_count
+            )
+            .values(questions_count=current.c.questions_count)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def _source_counts(self) -> list[tuple]:
+        enabled_models = sa.and_(
+            CompletionModels.tenant_id.isnot(None),
+            CompletionModels.is_enabled == True,  # noqa: E712
+        )
+
+        def via_space(table, counter):
+            return (
+                sa.select(
+                    CompletionModels.tenant_id,
+                    CompletionModels.id,
+                    sa.literal(counter),
+                    sa.func.count(),
+                )
+                .select_from(table)
+                .join(Spaces, table.space_id == Spaces.id)
+                .join(
+                    CompletionModels, table.completion_model_id == CompletionModels.id
+                )
+                .where(Spaces.tenant_id == CompletionModels.tenant_id)
+                .where(enabled_models)
+                .group_by(CompletionModels.tenant_id, CompletionModels.id)
+            )
+
+        def by_model(table, counter, *conditions):
+            return (
+                sa.select(
+                    CompletionModels.tenant_id,
+                    CompletionModels.id,
+                    sa.literal(counter),
+                    sa.func.count(),
+                )
+                .select_from(table)
+                .join(
+                    CompletionModels, table.completion_model_id == CompletionModels.id
+                )
+                .where(enabled_models, *conditions)
+                .group_by(CompletionModels.tenant_id, CompletionModels.id)
+            )
+
+        spaces = (
+            sa.select(
+                CompletionModels.tenant_id,
+                CompletionModels.id,
+                sa.literal(SPACES),
+                sa.func.count(sa.distinct(Spaces.id)),
+            )
+            .select_from(SpacesCompletionModels)
+            .join(Spaces, SpacesCompletionModels.space_id == Spaces.id)
+            .join(
+                CompletionModels,
+                SpacesCompletionModels.completion_model_id == CompletionModels.id,
+            )
+            .where(Spaces.tenant_id == CompletionModels.tenant_id)
+            .where(enabled_models)
+            .group_by(CompletionModels.tenant_id, CompletionModels.id)
+        )
+
+        query = sa.union_all(
+            via_space(Assistants, ASSISTANTS),
+            via_space(Services, SERVICES),
+            by_model(Apps, APPS, Apps.tenant_id == CompletionModels.tenant_id),
+            by_model(AssistantTemplates, ASSISTANT_TEMPLATES),
+            by_model(AppTemplates, APP_TEMPLATES),
+            spaces,
+        )
+        return (await self.session.execute(query)).all()
+
+    async def _stored_counts(self) -> list[tuple]:
+        query = (
+            sa.select(
+                CompletionModelUsageStats.tenant_id,
+                CompletionModelUsageStats.model_id,
+                *[getattr(CompletionModelUsageStats, c) for c in EVENT_COUNTERS],
+            )
+            .join(
+                CompletionModels,
+                CompletionModelUsageStats.model_id == CompletionModels.id,
+            )
+            .where(CompletionModels.tenant_id == CompletionModelUsageStats.tenant_id)
+            .where(CompletionModels.is_enabled == True)  # noqa: E712
+        )
+        rows = (await self.session.execute(query)).all()
+        return [
+            (tenant_id, model_id, counter, count)
+            for tenant_id, model_id, *counts in rows
+            for counter, count in zip(EVENT_COUNTERS, counts)
+        ]
+
+
+def _checksums(counts: list[tuple]) -> dict["UUID", str]:
+    entries: dict["UUID", list[str]] = defaultdict(list)
+    for tenant_id, model_id, counter, count in counts:
+        # Zero counts are left out, so a missing counter row and a row of
+        # zeros agree
+        if count:
+            entries[tenant_id].append(f"{model_id}:{counter}:{count}")
+
+    return {
+        tenant_id: hashlib.sha256("\n".join(sorted(lines)).encode()).hexdigest()
+        for tenant_id, lines in entries.items()
+    }
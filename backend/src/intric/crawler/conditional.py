@@ -0,0 +1,215 @@
+"""Conditional HTTP recrawls using validators from the previous crawl run.
+Each page or file persisted by a crawl stores its HTTP validators (ETag and
+Last-Modified) in the crawl_url_validators table. On the next run they are
+loaded into a ConditionalCrawlState which is handed to the spider, and
+ConditionalRequestMiddleware sends If-None-Match / If-Modified-Since headers
+for those URLs. A 304 response is recorded as "unchanged" so crawl_task can
+keep the existing info blob instead of re-parsing and re-embedding it.
+
+Threading model:
+    The state object is created by the caller and shared with the spider.
+    It is only WRITTEN from Twisted's reactor thread while the crawl runs and
+    only READ by crawl_task after the crawl deferred has completed, so no
+    locking is needed.
+
+SitemapLastmodFilter is the sitemap-crawl counterpart: instead of a
+conditional request it compares each URL's <lastmod> with the start time of
+the last complete crawl and never requests URLs that have not changed.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from scrapy import Request, Spider
+from scrapy.http import Response
+
+logger = logging.getLogger(__name__)
+
+# Request.meta flag for requests that must always be fetched in full
+# (e.g. FilesPipeline downloads, which cannot handle a 304 body)
+SKIP_CONDITIONAL_META_KEY = "skip_conditional"
+
+
+@dataclass(frozen=True)
+class UrlValidator:
+    """HTTP validators stored for a URL persisted by a previous crawl run.
+
+    Attributes:
+        url: Final (post-redirect) URL the validators were received for
+        title: Title of the info blob holding the content (URL for pages,
+            file stem for downloaded files)
+        etag: Value of the ETag response header, sent as If-None-Match
+        last_modified: Value of the Last-Modified header, sent as If-Modified-Since
+        links: (rule_index, url) pairs the CrawlSpider followed from this page.
+            Replayed on 304 so link discovery continues through unchanged pages.
+    """
+
+    url: str
+    title: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    links: Optional[tuple[tuple[int, str], ...]] = None
+
+
+@dataclass
+class ConditionalCrawlState:
+    """Validators going into a crawl and what the crawl observed about them."""
+
+    # Validators from the previous run, keyed by URL
+    validators: dict[str, UrlValidator] = field(default_factory=dict)
+
+    # URLs that answered 304 Not Modified during this run
+    unchanged_urls: set[str] = field(default_factory=set)
+
+    # Fresh (etag, last_modified) received with 200 responses during this run
+    response_validators: dict[str, tuple[Optional[str], Optional[str]]] = field(
+        default_factory=dict
+    )
+
+    # Links followed from each page during this run (CrawlSpider only)
+    page_links: dict[str, list[tuple[int, str]]] = field(default_factory=dict)
+
+    # Stored filename -> source URL for files saved by FileNamePipeline
+    file_urls: dict[str, str] = field(default_factory=dict)
+
+    def unchanged_titles(self) -> set[str]:
+        """Info blob titles whose content was confirmed unchanged by a 304."""
+        return {
+            self.validators[url].title
+            for url in self.unchanged_urls
+            if url in self.validators
+        }
+
+    def build_validator(self, url: str, title: str) -> Optional[UrlValidator]:
+        """Build the validator to persist for a URL fetched during this run.
+
+        Returns None when the server sent no validators and no links were
+        recorded, since there is nothing useful to send on the next run.
+        """
+        etag, last_modified = self.response_validators.get(url, (None, None))
+        links = self.page_links.get(url)
+        if etag is None and last_modified is None:
+            return None
+        return UrlValidator(
+            url=url,
+            title=title,
+            etag=etag,
+            last_modified=last_modified,
+            links=tuple(links) if links is not None else None,
+        )
+
+
+def _header_value(response: Response, name: bytes) -> Optional[str]:
+    value = response.headers.get(name)
+    if not value:
+        return None
+    return value.decode("latin-1")
+
+
+class ConditionalRequestMiddleware:
+    """Scrapy downloader middleware for conditional GETs.
+
+    No-op for spiders without a ``conditional_state`` attribute, so it is
+    safe to enable for every crawl.
+    """
+
+    def process_request(self, request: Request, spider: Spider):
+        state: Optional[ConditionalCrawlState] = getattr(
+            spider, "conditional_state", None
+        )
+        if state is None or request.meta.get(SKIP_CONDITIONAL_META_KEY):
+            return None
+
+        validator = state.validators.get(request.url)
+        if validator is None:
+            return None
+
+        if validator.etag and b"If-None-Match" not in request.headers:
+            request.headers[b"If-None-Match"] = validator.etag
+        if validator.last_modified and b"If-Modified-Since" not in request.headers:
+            request.headers[b"If-Modified-Since"] = validator.last_modified
+        return None
+
+    def process_response(self, request: Request, response: Response, spider: Spider):
+        state: Optional[ConditionalCrawlState] = getattr(
+            spider, "conditional_state", None
+        )
+        if state is None:
+            return response
+
+        if response.status == 304:
+            if request.url in state.validators:
+                state.unchanged_urls.add(request.url)
+            else:
+                # We never sent validators for this URL, so the server is
+                # misbehaving; leave it out so the content is not kept as-is
+                logger.debug(
+                    "Ignoring unsolicited 304 response",
+                    extra={"url": request.url},
+                )
+        elif response.status == 200:
+            etag = _header_value(response, b"ETag")
+            last_modified = _header_value(response, b"Last-Modified")
+            if etag or last_modified:
+                state.response_validators[response.url] = (etag, last_modified)
+
+        return response
+
+
+@dataclass
+class SitemapLastmodFilter:
+    """Incremental sitemap crawl: only fetch URLs modified since the last run.
+
+    Attributes:
+        modified_since: Start time of the last complete, failure-free crawl
+        indexed_urls: Page URLs that currently have an info blob. URLs not in
+            this set are always fetched, whatever their lastmod says.
+        skipped_urls: Filled during the crawl with URLs left out because their
+            lastmod is not newer than modified_since. crawl_task keeps their
+            blobs and excludes them from stale deletion.
+    """
+
+    modified_since: datetime
+    indexed_urls: frozenset[str]
+    skipped_urls: set[str] = field(default_factory=set)
+
+    def should_fetch(self, entry: dict[str, Any]) -> bool:
+        loc = entry.get("loc")
+        if not loc or loc not in self.indexed_urls:
+            return True
+
+        lastmod = _parse_lastmod(entry.get("lastmod"))
+        if lastmod is None:
+            return True
+
+        if isinstance(lastmod, datetime):
+            modified = lastmod > self.modified_since
+        else:
+            # Date-only lastmod: same day as the last crawl may be newer
+            modified = lastmod >= self.modified_since.date()
+
+        if not modified:
+            self.skipped_urls.add(loc)
+        return modified
+
+
+def _parse_lastmod(value: Optional[str]):
+    """Parse a W3C datetime from <lastmod>.
+
+    Returns an aware datetime, a date for date-only values, or None when the
+    value is missing or malformed (the URL is then fetched).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        if len(value) == 10:
+            return datetime.strptime(value, "%Y-%m-%d").date()
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -7,12 +7,19 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import Any, Iterable, Optional
+from typing import Any, AsyncIterator, Iterable, Optional
 
 import crochet
 from scrapy.crawler import CrawlerRunner
 
-from intric.crawler.parse_html import CrawledPage
+from intric.crawler.conditional import (
+    ConditionalCrawlState,
+    ConditionalRequestMiddleware,
+    SitemapLastmodFilter,
+)
+from intric.crawler.near_duplicates import NearDuplicateFilter
+from intric.crawler.parse_html import CrawledPage, RawPage
+from intric.crawler.parse_pool import parse_pages
 from intric.crawler.pipelines import FileNamePipeline
 from intric.crawler.spiders.crawl_spider import CrawlSpider
 from intric.crawler.spiders.sitemap_spider import SitemapSpider
@@ -168,18 +175,28 @@ class Crawl:
     """Result of a web crawl operation.
 
     Attributes:
-        pages: Iterator of crawled pages
+        pages: Async iterator of crawled pages, parsed from the spool as they
+            are consumed (see intric.crawler.parse_pool)
         files: Optional iterator of downloaded files
         is_partial: True if crawl was terminated early (timeout, etc.)
         termination_reason: Why crawl ended ("completed", "timeout", "error")
         pages_count: Number of pages collected (for partial results reporting)
+        conditional_state: Validators sent and 304s observed, when the crawl
+            was run as a conditional recrawl
+        lastmod_filter: Sitemap URLs skipped because their <lastmod> was not
+            newer than the last complete crawl (incremental sitemap crawls)
+        near_duplicate_filter: Pages dropped as near-duplicates of a page
+            kept earlier in the same crawl
     """
 
-    pages: Iterable[CrawledPage]
+    pages: AsyncIterator[CrawledPage]
     files: Optional[Iterable[Path]]
     is_partial: bool = False
     termination_reason: str = "completed"
     pages_count: int = 0
+    conditional_state: Optional[ConditionalCrawlState] = None
+    lastmod_filter: Optional[SitemapLastmodFilter] = None
+    near_duplicate_filter: Optional[NearDuplicateFilter] = None
 
 
 def create_runner(
@@ -200,7 +217,7 @@ def create_runner(
         tenant_crawler_settings: Optional tenant-specific settings from DB
     """
     settings = {
-        "FEEDS": {filepath: {"format": "jsonl", "item_classes": [CrawledPage]}},
+        "FEEDS": {filepath: {"format": "jsonl", "item_classes": [RawPage]}},
         # All settings use get_crawler_setting() for tenant-aware resolution
         "CLOSESPIDER_ITEMCOUNT": get_crawler_setting(
             "closespider_itemcount", tenant_crawler_settings
@@ -221,6 +238,11 @@ def create_runner(
         "DNS_TIMEOUT": get_crawler_setting("dns_timeout", tenant_crawler_settings),
         "RETRY_TIMES": get_crawler_setting("retry_times", tenant_crawler_settings),
         "RETRY_ENABLED": True,
+        # Conditional recrawls: send If-None-Match/If-Modified-Since for URLs
+        # with stored validators and let 304 responses reach the spider.
+        # The middleware is a no-op for spiders without conditional_state.
+        "DOWNLOADER_MIDDLEWARES": {ConditionalRequestMiddleware: 580},
+        "HTTPERROR_ALLOWED_CODES": [304],
     }
 
     if files_dir is not None:
@@ -302,6 +324,7 @@ class Crawler:
         max_length: int,
         heartbeat_callback: Optional[Any] = None,
         heartbeat_interval: float = 60.0,
+        conditional_state: Optional[ConditionalCrawlState] = None,
     ) -> None:
         """Async wrapper with tenant-aware timeout, graceful shutdown, and heartbeat.
 
@@ -316,6 +339,8 @@ class Crawler:
             heartbeat_callback: Optional async callable to invoke periodically during crawl.
                               This keeps the job alive in monitoring systems.
             heartbeat_interval: Seconds between heartbeat calls (default 60s)
+            conditional_state: Optional validators for a conditional recrawl.
+                              Shared with the spider, which records 304s into it.
 
         This fixes the resource leak where crawlers continued running
         in Twisted's reactor after timeout.
@@ -337,6 +362,7 @@ class Crawler:
                 url=url,
                 http_user=http_user,
                 http_pass=http_pass,
+                conditional_state=conditional_state,
             )
 
             try:
@@ -411,6 +437,8 @@ class Crawler:
         max_length: int,
         heartbeat_callback: Optional[Any] = None,
         heartbeat_interval: float = 60.0,
+        conditional_state: Optional[ConditionalCrawlState] = None,
+        lastmod_filter: Optional[SitemapLastmodFilter] = None,
     ) -> None:
         """Async wrapper with tenant-aware timeout, graceful shutdown, and heartbeat for sitemap.
 
@@ -424,6 +452,8 @@ class Crawler:
         Args:
             heartbeat_callback: Optional async callable to invoke periodically during crawl.
             heartbeat_interval: Seconds between heartbeat calls (default 60s)
+            conditional_state: Optional validators for a conditional recrawl
+            lastmod_filter: Optional <lastmod> filter for an incremental crawl
         """
         manager = CrawlManager()
         timed_out = False
@@ -441,6 +471,8 @@ class Crawler:
                 sitemap_url=sitemap_url,
                 http_user=http_user,
                 http_pass=http_pass,
+                conditional_state=conditional_state,
+                lastmod_filter=lastmod_filter,
             )
 
             try:
@@ -535,6 +567,10 @@ class Crawler:
         is_partial = False
         termination_reason = "completed"
         url = kwargs.get("url") or kwargs.get("sitemap_url", "unknown")
+        conditional_state = kwargs.get("conditional_state")
+        lastmod_filter = kwargs.get("lastmod_filter")
+        # Applied while reading the spool, not by the spider
+        near_duplicate_filter = kwargs.pop("near_duplicate_filter", None)
 
         try:
             await func(
@@ -564,7 +600,12 @@ class Crawler:
             except OSError:
                 pages_count = 0
 
-            if pages_count == 0:
+            # Pages confirmed unchanged by a 304 or <lastmod> are results too
+            unchanged_count = (
+                len(conditional_state.unchanged_urls) if conditional_state else 0
+            ) + (len(lastmod_filter.skipped_urls) if lastmod_filter else 0)
+
+            if pages_count == 0 and unchanged_count == 0:
                 # No pages collected before timeout - this is a true failure
                 # Clean up temp files before raising
                 try:
@@ -585,18 +626,32 @@ class Crawler:
         try:
             # Check if file exists and has content
             file_size = os.stat(tmp_file_path).st_size
-            if file_size == 0:
+            # An empty spool is fine when every page answered 304 Not Modified
+            # or was skipped by an incremental sitemap crawl
+            if (
+                file_size == 0
+                and not (conditional_state and conditional_state.unchanged_urls)
+                and not (lastmod_filter and lastmod_filter.skipped_urls)
+            ):
                 raise CrawlerException(f"Crawl failed for {url}: no pages returned")
 
             # Count pages for the result
             with open(tmp_file_path) as f:
                 pages_count = sum(1 for _ in f)
 
-            def _iter_pages():
+            def _iter_raw_pages():
                 with open(tmp_file_path) as f:
                     for line in f:
                         jsonl = json.loads(line)
-                        yield CrawledPage(**jsonl)
+                        yield RawPage(**jsonl)
+
+            async def _iter_pages():
+                async for page in parse_pages(_iter_raw_pages()):
+                    if near_duplicate_filter is not None:
+                        page = near_duplicate_filter.filter_page(page)
+                        if page is None:
+                            continue
+                    yield page
 
             def _iter_files():
                 p = Path(tmp_dir)
@@ -608,6 +663,9 @@ class Crawler:
                 is_partial=is_partial,
                 termination_reason=termination_reason,
                 pages_count=pages_count,
+                conditional_state=conditional_state,
+                lastmod_filter=lastmod_filter,
+                near_duplicate_filter=near_duplicate_filter,
             )
 
         finally:
@@ -632,6 +690,9 @@ class Crawler:
         tenant_crawler_settings: dict[str, Any] | None = None,
         heartbeat_callback: Optional[Any] = None,
         heartbeat_interval: float = 60.0,
+        conditional_state: Optional[ConditionalCrawlState] = None,
+        lastmod_filter: Optional[SitemapLastmodFilter] = None,
+        near_duplicate_filter: Optional[NearDuplicateFilter] = None,
     ):
         """Execute a web crawl with tenant-aware settings.
 
@@ -647,6 +708,18 @@ class Crawler:
                 Called at heartbeat_interval during crawl to maintain liveness.
                 Used to refresh Redis TTLs and DB timestamps during long crawls.
             heartbeat_interval: Seconds between heartbeat calls (default: 60)
+            conditional_state: Validators from the previous crawl run (optional).
+                When provided, URLs with stored validators are requested
+                conditionally and 304 responses are recorded on the state
+                instead of producing pages. Read it back from Crawl after the
+                crawl completes.
+            lastmod_filter: Incremental filter for SITEMAP crawls (optional).
+                Sitemap URLs whose <lastmod> is not newer than the filter's
+                cutoff are not requested and are recorded as skipped instead.
+                Ignored for CRAWL type, since crawled links carry no lastmod.
+            near_duplicate_filter: Drops pages that are near-duplicates of a
+                page kept earlier in this crawl (optional). Read the dropped
+                URLs back from Crawl after the crawl completes.
 
         Note:
             crawl_max_length is now tenant-aware. The timeout is resolved at runtime
@@ -666,6 +739,8 @@ class Crawler:
                 http_user=http_user,
                 http_pass=http_pass,
                 tenant_crawler_settings=tenant_crawler_settings,
+                conditional_state=conditional_state,
+                near_duplicate_filter=near_duplicate_filter,
             ) as crawl_result:
                 yield crawl_result
 
@@ -679,6 +754,9 @@ class Crawler:
                 http_user=http_user,
                 http_pass=http_pass,
                 tenant_crawler_settings=tenant_crawler_settings,
+                conditional_state=conditional_state,
+                lastmod_filter=lastmod_filter,
+                near_duplicate_filter=near_duplicate_filter,
             ) as crawl_result:
                 yield crawl_result
 
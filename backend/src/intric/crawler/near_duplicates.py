@@ -0,0 +1,198 @@
+"""Near-duplicate page detection within a single crawl.
+
+Print views, language/query-string variants and paginated copies of the same
+page differ only in a few characters, so exact content hashes do not catch
+them. Each page gets a 64-bit SimHash over word shingles; pages whose
+fingerprint is within MAX_HAMMING_DISTANCE bits of a page already kept in
+this crawl are dropped as the spool is read, before they are embedded.
+
+Pages not parsed in this run (304 Not Modified, skipped on <lastmod>) are
+seeded from the fingerprint stored on their info blob, so a variant fetched
+alongside an unchanged canonical page is still recognised on recrawls.
+
+Which page of a cluster is kept does not depend on response order: the most
+canonical URL (no query string, then shortest, then lexicographic) wins. If
+a later page is more canonical than the kept one, it replaces it and the
+earlier page is reported as the duplicate, so its blob is removed as stale.
+
+Lookups use the classic band index: the fingerprint is split into
+HAMMING_BANDS bands of 16 bits. Two fingerprints within 3 bits of each other
+must agree exactly on at least one of 4 bands, so only pages sharing a band
+value are compared.
+
+Threading model:
+    Only used on the worker's event loop, from the Crawl.pages iterator that
+    crawl_task consumes after the crawl has completed.
+"""
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from intric.crawler.parse_html import CrawledPage
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+HAMMING_BANDS = 4
+MAX_HAMMING_DISTANCE = 3  # Must stay below HAMMING_BANDS for the band index
+SHINGLE_SIZE = 3
+
+# Below this many words a page is too short for SimHash to be meaningful,
+# and short stubs that look alike (e.g. contact cards) are usually distinct
+MIN_WORDS = 50
+
+_BAND_BITS = FINGERPRINT_BITS // HAMMING_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_BIT_WEIGHTS = np.uint64(1) << np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash of the word shingles in text.
+
+    Returns None when the text has fewer than MIN_WORDS words.
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    shingles = {
+        " ".join(words[i : i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+    hashes = np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little"
+            )
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+    # (shingles x 64) bit matrix; a bit is set in the fingerprint when more
+    # than half of the shingles have it set
+    bits = (hashes[:, None] & _BIT_WEIGHTS) != 0
+    majority = bits.sum(axis=0) * 2 > len(shingles)
+    return int(_BIT_WEIGHTS[majority].sum())
+
+
+def _bands(fingerprint: int) -> list[tuple[int, int]]:
+    return [
+        (band, (fingerprint >> (band * _BAND_BITS)) & _BAND_MASK)
+        for band in range(HAMMING_BANDS)
+    ]
+
+
+def canonical_key(url: str) -> tuple[bool, int, str]:
+    """Sort key for picking the canonical URL of a cluster; smallest wins."""
+    return (bool(urlsplit(url).query), len(url), url)
+
+
+def simhash_to_bytes(fingerprint: int) -> bytes:
+    """Encode a fingerprint for InfoBlobs.content_simhash."""
+    return fingerprint.to_bytes(FINGERPRINT_BITS // 8, "big")
+
+
+def simhash_from_bytes(value: bytes) -> int:
+    return int.from_bytes(value, "big")
+
+
+@dataclass
+class NearDuplicateFilter:
+    """Drops pages that are near-duplicates of another page in the crawl.
+
+    The most canonical URL of each cluster is kept (see canonical_key).
+    """
+
+    # Dropped URL -> URL of the page it duplicates
+    duplicates: dict[str, str] = field(default_factory=dict)
+
+    # Kept URL -> fingerprint, for pages long enough to fingerprint
+    fingerprints: dict[str, int] = field(default_factory=dict)
+
+    _index: dict[tuple[int, int], list[str]] = field(
+        default_factory=lambda: defaultdict(list), repr=False
+    )
+
+    def seed(self, url: str, fingerprint: int) -> None:
+        """Register a page kept without being parsed in this run."""
+        if url not in self.fingerprints and url not in self.duplicates:
+            self._keep(url, fingerprint)
+
+    def find_duplicate(self, url: str, content: str) -> Optional[str]:
+        """Return the URL of the kept page this one duplicates, or None.
+
+        None means the page is kept. If it displaced a less canonical page,
+        that page is recorded in duplicates.
+        """
+        fingerprint = simhash(content)
+        if fingerprint is None:
+            return None
+
+        match = self._find_match(url, fingerprint)
+        if match is None:
+            self._keep(url, fingerprint)
+            return None
+
+        if canonical_key(url) < canonical_key(match):
+            self._replace(match, url, fingerprint)
+            return None
+
+        self.duplicates[url] = match
+        return match
+
+    def filter_page(self, page: Optional[CrawledPage]) -> Optional[CrawledPage]:
+        """Pass the page through unless it is a near-duplicate."""
+        if page is None:
+            return None
+
+        original_url = self.find_duplicate(page.url, page.content)
+        if original_url is not None:
+            logger.debug(
+                "Dropping near-duplicate page",
+                extra={"url": page.url, "duplicate_of": original_url},
+            )
+            return None
+        return page
+
+    def _find_match(self, url: str, fingerprint: int) -> Optional[str]:
+        for key in _bands(fingerprint):
+            for other_url in self._index.get(key, ()):
+                other_fingerprint = self.fingerprints[other_url]
+                distance = (fingerprint ^ other_fingerprint).bit_count()
+                if distance <= MAX_HAMMING_DISTANCE and other_url != url:
+                    return other_url
+        return None
+
+    def _keep(self, url: str, fingerprint: int) -> None:
+        self._forget(url)
+        self.fingerprints[url] = fingerprint
+        for key in _bands(fingerprint):
+            self._index[key].append(url)
+
+    def _forget(self, url: str) -> None:
+        fingerprint = self.fingerprints.pop(url, None)
+        if fingerprint is not None:
+            for key in _bands(fingerprint):
+                self._index[key].remove(url)
+
+    def _replace(self, old_url: str, new_url: str, fingerprint: int) -> None:
+        logger.debug(
+            "Replacing kept page with more canonical near-duplicate",
+            extra={"url": new_url, "replaces": old_url},
+        )
+        self._forget(old_url)
+        for dropped, kept in self.duplicates.items():
+            if kept == old_url:
+                self.duplicates[dropped] = new_url
+        self.duplicates[old_url] = new_url
+        self._keep(new_url, fingerprint)
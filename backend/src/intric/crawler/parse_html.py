@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 import logging
 import mimetypes
+import re
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
@@ -11,6 +12,19 @@ from intric.files.text import TextMimeTypes
 
 logger = logging.getLogger(__name__)
 
+# Never content
+_NON_CONTENT_TAGS = ["script", "style", "noscript", "template", "svg", "iframe"]
+# Site chrome; header/footer/aside only outside <main>/<article>, where they
+# usually hold the article title, byline or a callout
+_CHROME_TAGS = ["nav", "header", "footer", "aside"]
+_CHROME_ROLES = {"navigation", "banner", "contentinfo", "complementary", "search"}
+_CHROME_ID_CLASS_RE = re.compile(
+    r"(^|[-_\s])(cookie|consent|gdpr|breadcrumbs?|skip-?link)([-_\s]|$)", re.I
+)
+# If extraction leaves less text than this, the page is mostly "chrome"
+# (e.g. a landing page) and the full page is used instead
+_MIN_MAIN_CONTENT_CHARS = 200
+
 
 @dataclass
 class CrawledPage:
@@ -19,33 +33,124 @@ class CrawledPage:
     content: str
 
 
-def parse_response(response: Response):
+@dataclass
+class RawPage:
+    """Unparsed page as spooled by the spiders, parsed later by parse_page.
+
+    body is the decoded response text; no HTML parsing has been done yet.
+    """
+
+    url: str
+    body: str
+    content_type: str
+
+
+def spool_response(response: Response):
+    """Scrapy callback: spool the page body without parsing it.
+
+    Runs on the reactor thread shared by every crawl in the worker, so it
+    must stay cheap. The CPU-heavy HTML -> markdown conversion happens in
+    parse_page, off the reactor (see intric.crawler.parse_pool).
+    """
+    # Guard: 304 Not Modified from a conditional recrawl has no body;
+    # ConditionalRequestMiddleware already recorded the URL as unchanged
+    if response.status == 304:
+        return None
+
     # Guard: Skip non-text responses (images, PDFs, binary data)
     # Scrapy callbacks that return None are silently ignored
     if not isinstance(response, TextResponse):
         return None
 
-    # Handle JSON responses (e.g., API endpoints)
     content_type = response.headers.get(b"Content-Type", b"").decode("utf-8").lower()
-    if "application/json" in content_type:
+    return RawPage(url=response.url, body=response.text, content_type=content_type)
+
+
+def parse_page(raw_page: RawPage) -> CrawledPage:
+    """Convert a spooled page to markdown.
+
+    Pure function of its input so it can run in a worker process.
+    """
+    # Handle JSON responses (e.g., API endpoints)
+    if "application/json" in raw_page.content_type:
         # For JSON responses, use the body as-is with URL as title
-        return CrawledPage(url=response.url, title=response.url, content=response.text)
+        return CrawledPage(url=raw_page.url, title=raw_page.url, content=raw_page.body)
 
     # Handle HTML responses
-    soup = BeautifulSoup(response.body, "lxml")
+    soup = BeautifulSoup(raw_page.body, "lxml")
+    # str(): a NavigableString keeps a reference to the whole tree
+    title = str(soup.title.string) if soup.title and soup.title.string else None
 
     # Replace relative links with absolute
     for url in soup.find_all("a", href=True):
-        url["href"] = urljoin(response.url, url["href"])
-
-    content = html2text(str(soup))
-    title = response.css("title::text").get()
-    url = response.url
-
-    return CrawledPage(url=url, title=title, content=content)
+        url["href"] = urljoin(raw_page.url, url["href"])
+
+    content = html2text(str(_extract_main_content(soup)))
+
+    return CrawledPage(url=raw_page.url, title=title, content=content)
+
+
+def _is_chrome(tag) -> bool:
+    if tag.get("role") in _CHROME_ROLES:
+        return True
+    if tag.name in _CHROME_TAGS:
+        return tag.name == "nav" or tag.find_parent(["main", "article"]) is None
+    id_and_classes = " ".join([tag.get("id") or "", *(tag.get("class") or [])])
+    return bool(id_and_classes.strip()) and bool(
+        _CHROME_ID_CLASS_RE.search(id_and_classes)
+    )
+
+
+def _extract_main_content(soup: BeautifulSoup):
+    """Strip navigation, banners and footers so only the page's own content is embedded.
+
+    Returns the <main> element (or role="main", or the only <article>) when
+    there is one, otherwise the document without its chrome. Returns the
+    document untouched when too little text would be left.
+    """
+    for tag in soup.find_all(_NON_CONTENT_TAGS):
+        tag.decompose()
+
+    # Outermost chrome elements only; find_all yields parents before children
+    chrome = []
+    chrome_ids = set()
+    for tag in soup.find_all(True):
+        if _is_chrome(tag) and not any(id(p) in chrome_ids for p in tag.parents):
+            chrome.append(tag)
+            chrome_ids.add(id(tag))
+
+    articles = soup.find_all("article")
+    root = (
+        soup.find("main")
+        or soup.find(attrs={"role": "main"})
+        or (articles[0] if len(articles) == 1 else None)
+        or soup
+    )
+    if any(id(p) in chrome_ids for p in root.parents) or id(root) in chrome_ids:
+        root = soup
+
+    root_text_length = len(root.get_text(" ", strip=True))
+    chrome_in_root = [
+        tag for tag in chrome if root is soup or any(p is root for p in tag.parents)
+    ]
+    main_text_length = root_text_length - sum(
+        len(tag.get_text(" ", strip=True)) for tag in chrome_in_root
+    )
+    if main_text_length < min(
+        _MIN_MAIN_CONTENT_CHARS, len(soup.get_text(" ", strip=True))
+    ):
+        return soup
+
+    for tag in chrome_in_root:
+        tag.decompose()
+    return root
 
 
 def parse_file(response: Response):
+    # Unchanged since the previous crawl - don't hand it to FilesPipeline
+    if response.status == 304:
+        return None
+
     content_type_header = response.headers.get(b"Content-Type")
     content_type = ""
     if content_type_header:
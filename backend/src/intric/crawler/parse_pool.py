@@ -0,0 +1,138 @@
+"""Parse spooled pages outside the Twisted reactor thread.
+
+Scrapy callbacks run on the single crochet reactor thread shared by every
+crawl in the worker process, so the spiders only spool raw HTML
+(spool_response) and the BeautifulSoup/html2text work happens here, when
+crawl_task reads the spool.
+
+Pages are parsed in a process pool so CPU-heavy pages neither hold the GIL
+the reactor needs nor block the worker's event loop. Results are yielded in
+spool order with a bounded number of pages in flight, so memory stays flat
+for large crawls.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, Iterable, Optional
+
+from intric.crawler.parse_html import CrawledPage, RawPage, parse_page
+from intric.main.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# PARSE POOL: Module-level, shared by all crawl tasks in this worker process
+#
+# Created lazily so the worker count comes from settings. None when
+# crawl_parse_workers is 0, in which case pages are parsed in the default
+# thread executor instead (still off the reactor and the event loop).
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# Pages submitted ahead of the one being consumed, per worker process
+_IN_FLIGHT_PER_WORKER = 4
+
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Get or create the module-level parse pool.
+
+    Uses the spawn start method: the worker process runs the crochet reactor
+    thread and an event loop, neither of which is safe to fork.
+    """
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        workers = get_settings().crawl_parse_workers
+        if workers <= 0:
+            return None
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info("Created crawl parse pool", extra={"workers": workers})
+    return _PARSE_POOL
+
+
+def _reset_parse_pool() -> None:
+    """Drop a broken pool so the next page gets a fresh one."""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        # No cancel_futures: other crawls may still be awaiting this pool,
+        # and a broken pool already fails their futures with BrokenProcessPool
+        _PARSE_POOL.shutdown(wait=False)
+        _PARSE_POOL = None
+
+
+async def parse_pages(raw_pages: Iterable[RawPage]) -> AsyncIterator[CrawledPage]:
+    """Parse spooled pages off the event loop, yielding them in spool order.
+
+    A page that fails to parse is logged and skipped, like an exception in a
+    Scrapy callback. If a pool process dies, the affected pages are parsed
+    in a thread instead and a new pool is created for the rest.
+    """
+    loop = asyncio.get_running_loop()
+    pool: Optional[Executor] = _get_parse_pool()
+    max_in_flight = _IN_FLIGHT_PER_WORKER * max(get_settings().crawl_parse_workers, 1)
+
+    pending: deque[tuple[RawPage, asyncio.Future]] = deque()
+    raw_iter = iter(raw_pages)
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                raw_page = next(raw_iter, None)
+                if raw_page is None:
+                    exhausted = True
+                    break
+                try:
+                    future = loop.run_in_executor(pool, parse_page, raw_page)
+                except (BrokenProcessPool, RuntimeError):
+                    # Pool broke or another crawl replaced it since we fetched it
+                    if pool is _PARSE_POOL:
+                        _reset_parse_pool()
+                    pool = _get_parse_pool()
+                    future = loop.run_in_executor(pool, parse_page, raw_page)
+                pending.append((raw_page, future))
+
+            if not pending:
+                return
+
+            raw_page, future = pending.popleft()
+            try:
+                page = await future
+            except BrokenProcessPool:
+                logger.warning(
+                    "Crawl parse pool broke, parsing page in a thread",
+                    extra={"url": raw_page.url},
+                )
+                if pool is _PARSE_POOL:
+                    _reset_parse_pool()
+                pool = _get_parse_pool()
+                page = await _parse_in_thread(raw_page)
+            except Exception as exc:
+                logger.warning(
+                    "Failed to parse crawled page",
+                    extra={"url": raw_page.url, "error": str(exc)},
+                )
+                continue
+
+            if page is not None:
+                yield page
+    finally:
+        # Consumer stopped early (preemption, heartbeat failure): drop the
+        # pages still queued for this crawl
+        for _, future in pending:
+            future.cancel()
+
+
+async def _parse_in_thread(raw_page: RawPage) -> Optional[CrawledPage]:
+    try:
+        return await asyncio.to_thread(parse_page, raw_page)
+    except Exception as exc:
+        logger.warning(
+            "Failed to parse crawled page",
+            extra={"url": raw_page.url, "error": str(exc)},
+        )
+        return None
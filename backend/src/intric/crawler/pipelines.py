@@ -8,6 +8,8 @@ import scrapy
 import scrapy.http
 from scrapy.pipelines.files import FilesPipeline
 
+from intric.crawler.conditional import SKIP_CONDITIONAL_META_KEY
+
 # Maximum filename length in bytes (ext4 limit is 255, leave room for safety)
 MAX_FILENAME_BYTES = 200
 
@@ -67,6 +69,13 @@ def _truncate_filename(filename: str, max_bytes: int = MAX_FILENAME_BYTES) -> st
 
 
 class FileNamePipeline(FilesPipeline):
+    def get_media_requests(self, item, info):
+        # The rule callback already fetched this URL (conditionally), so the
+        # pipeline's own download must always get the full body
+        for request in super().get_media_requests(item, info):
+            request.meta[SKIP_CONDITIONAL_META_KEY] = True
+            yield request
+
     def file_path(
         self,
         request: scrapy.Request,
@@ -93,4 +102,13 @@ class FileNamePipeline(FilesPipeline):
             url_hash = hashlib.md5(request.url.encode("utf-8")).hexdigest()[:8]
             filename = f"unnamed_{url_hash}"
 
-        return _truncate_filename(filename)
+        filename = _truncate_filename(filename)
+
+        # Remember which URL each stored file came from so its validators
+        # can be persisted under the file's info blob
+        spider = getattr(info, "spider", None)
+        conditional_state = getattr(spider, "conditional_state", None)
+        if conditional_state is not None:
+            conditional_state.file_urls[filename] = request.url
+
+        return filename
@@ -1,11 +1,14 @@
+from typing import Optional
 from urllib.parse import urlparse
 
 import scrapy
 from scrapy.http import Response
+from scrapy.link import Link
 from scrapy.linkextractors import LinkExtractor
 from scrapy.spiders import Rule
 
-from intric.crawler.parse_html import parse_file, parse_response
+from intric.crawler.conditional import ConditionalCrawlState
+from intric.crawler.parse_html import parse_file, spool_response
 
 
 class CrawlSpider(scrapy.spiders.CrawlSpider):
@@ -16,6 +19,7 @@ class CrawlSpider(scrapy.spiders.CrawlSpider):
         url: str,
         http_user: str = None,
         http_pass: str = None,
+        conditional_state: Optional[ConditionalCrawlState] = None,
         *args,
         **kwargs,
     ):
@@ -23,11 +27,12 @@ class CrawlSpider(scrapy.spiders.CrawlSpider):
 
         self.allowed_domains = [parsed_uri.netloc]
         self.start_urls = [url]
+        self.conditional_state = conditional_state
 
         self.rules = [
             Rule(
                 LinkExtractor(allow=url),
-                callback=parse_response,
+                callback=spool_response,
                 follow=True,
             ),
             Rule(LinkExtractor(deny_extensions=[]), callback=parse_file),
@@ -42,4 +47,34 @@ class CrawlSpider(scrapy.spiders.CrawlSpider):
         super().__init__(*args, **kwargs)
 
     def parse_start_url(self, response: Response):
-        return parse_response(response)
+        return spool_response(response)
+
+    def _requests_to_follow(self, response: Response):
+        """Follow links, replaying stored ones when a page answered 304.
+
+        A 304 has no body to extract links from, so without the replay every
+        page only reachable through an unchanged page would look stale.
+        Links followed from 200 responses are recorded so they can be stored
+        with the page's validators for the next run.
+        """
+        state = self.conditional_state
+        if state is None:
+            yield from super()._requests_to_follow(response)
+            return
+
+        if response.status == 304:
+            validator = state.validators.get(response.url)
+            for rule_index, link_url in (validator.links if validator else None) or ():
+                if rule_index >= len(self._rules):
+                    continue
+                request = self._build_request(rule_index, Link(link_url))
+                request = self._rules[rule_index].process_request(request, response)
+                if request is not None:
+                    yield request
+            return
+
+        followed = state.page_links.setdefault(response.url, [])
+        for request in super()._requests_to_follow(response):
+            if request is not None:
+                followed.append((request.meta["rule"], request.url))
+            yield request
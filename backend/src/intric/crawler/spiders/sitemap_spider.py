@@ -1,9 +1,11 @@
+from typing import Optional
 from urllib.parse import urlparse
 
 import scrapy
 from scrapy.http import Response
 
-from intric.crawler.parse_html import parse_response
+from intric.crawler.conditional import ConditionalCrawlState, SitemapLastmodFilter
+from intric.crawler.parse_html import spool_response
 
 
 class SitemapSpider(scrapy.spiders.SitemapSpider):
@@ -14,10 +16,14 @@ class SitemapSpider(scrapy.spiders.SitemapSpider):
         sitemap_url: str,
         http_user: str = None,
         http_pass: str = None,
+        conditional_state: Optional[ConditionalCrawlState] = None,
+        lastmod_filter: Optional[SitemapLastmodFilter] = None,
         *args,
         **kwargs,
     ):
         self.sitemap_urls = [sitemap_url]
+        self.conditional_state = conditional_state
+        self.lastmod_filter = lastmod_filter
 
         # Set up basic authentication if provided
         if http_user and http_pass:
@@ -29,4 +35,18 @@ class SitemapSpider(scrapy.spiders.SitemapSpider):
         super().__init__(*args, **kwargs)
 
     def parse(self, response: Response):
-        return parse_response(response)
+        return spool_response(response)
+
+    def sitemap_filter(self, entries):
+        """Skip urlset entries whose <lastmod> predates the last full crawl.
+
+        Sitemap index entries are never filtered: a sub-sitemap with an old
+        lastmod still lists URLs that must be reported as unchanged.
+        """
+        if self.lastmod_filter is None or getattr(entries, "type", None) != "urlset":
+            yield from entries
+            return
+
+        for entry in entries:
+            if self.lastmod_filter.should_fetch(entry):
+                yield entry
@@ -1,4 +1,5 @@
 import contextlib
+import time
 from typing import AsyncIterator
 
 from sqlalchemy.ext.asyncio import (
@@ -9,8 +10,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.inspection import inspect
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from intric.main.logging import get_logger
+from intric.observability.metrics import DB_POOL_CHECKOUT_SECONDS
 
 logger = get_logger(__name__)
 
@@ -34,6 +37,17 @@ class SafeAsyncSession(AsyncSession):
         )
 
 
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Records how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+
+
 class DatabaseSessionManager:
     def __init__(self):
         self._engine: AsyncEngine | None = None
@@ -45,7 +59,9 @@ class DatabaseSessionManager:
             logger.debug("Database already initialized, skipping reinitialization")
             return
 
-        self._engine = create_async_engine(host, pool_size=20, max_overflow=10)
+        self._engine = create_async_engine(
+            host, poolclass=TimedQueuePool, pool_size=20, max_overflow=10
+        )
         self._sessionmaker = async_sessionmaker(
             autocommit=False,
             bind=self._engine,
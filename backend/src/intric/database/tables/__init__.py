@@ -2,6 +2,7 @@
 
 import intric.database.tables.ai_models_table
 import intric.database.tables.allowed_origins_table
+import intric.database.tables.analysis_chunk_summaries_table
 import intric.database.tables.api_keys_table
 import intric.database.tables.audit_action_config_table
 import intric.database.tables.audit_category_config_table
@@ -13,6 +14,7 @@ import intric.database.tables.assistant_table
 import intric.database.tables.assistant_template_table
 import intric.database.tables.collections_table
 import intric.database.tables.completion_model_migration_history_table
+import intric.database.tables.embedding_migrations_table
 import intric.database.tables.feature_flag_table
 import intric.database.tables.files_table
 import intric.database.tables.group_chats_table
@@ -33,6 +35,8 @@ import intric.database.tables.settings_table
 import intric.database.tables.sync_log_table
 import intric.database.tables.spaces_table
 import intric.database.tables.tenant_table
+import intric.database.tables.token_usage_rollups_table
+import intric.database.tables.transcript_cache_table
 import intric.database.tables.user_groups_table
 import intric.database.tables.users_table
 import intric.database.tables.web_search_results_table
@@ -0,0 +1,41 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from intric.database.tables.ai_models_table import CompletionModels
+from intric.database.tables.assistant_table import Assistants
+from intric.database.tables.base_class import BasePublic
+from intric.database.tables.group_chats_table import GroupChatsTable
+from intric.database.tables.tenant_table import Tenants
+
+
+class AnalysisChunkSummaries(BasePublic):
+    """Map-phase summaries of one day's questions, reused across insight questions."""
+
+    # Hash of the assistant/group chat, model and the chunk's question texts
+    cache_key: Mapped[str] = mapped_column()
+    day: Mapped[date] = mapped_column()
+    summary: Mapped[str] = mapped_column(Text)
+
+    # Foreign keys
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey(Tenants.id, ondelete="CASCADE"))
+    assistant_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(Assistants.id, ondelete="CASCADE")
+    )
+    group_chat_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(GroupChatsTable.id, ondelete="CASCADE")
+    )
+    completion_model_id: Mapped[UUID] = mapped_column(
+        ForeignKey(CompletionModels.id, ondelete="CASCADE")
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "cache_key",
+            name="uq_analysis_chunk_summaries_tenant_cache_key",
+        ),
+    )
@@ -33,8 +33,10 @@ class AuditLog(BasePublic):
     entity_id = Column(UUID(as_uuid=True), nullable=False)
 
     # WHEN: Temporal Information
+    # Part of the primary key since the table is partitioned by month on it
     timestamp = Column(
         TIMESTAMP(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default="NOW()",
     )
@@ -74,4 +76,6 @@ class AuditLog(BasePublic):
             "timestamp",
             postgresql_where=(Column("deleted_at").is_(None)),
         ),
+        # Partitions are created ahead by AuditLogPartitionManager
+        {"postgresql_partition_by": "RANGE (timestamp)"},
     )
@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import TIMESTAMP, ForeignKey, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from intric.database.tables.ai_models_table import EmbeddingModels
+from intric.database.tables.base_class import BasePublic
+from intric.database.tables.collections_table import CollectionsTable
+from intric.database.tables.integration_table import IntegrationKnowledge
+from intric.database.tables.tenant_table import Tenants
+from intric.database.tables.users_table import Users
+from intric.database.tables.websites_table import Websites
+
+
+class EmbeddingMigrations(BasePublic):
+    """Re-embedding of one knowledge source's chunks with another model."""
+
+    status: Mapped[str] = mapped_column()
+    chunks_total: Mapped[int] = mapped_column(server_default="0")
+    # Chunks written to shadow_embedding so far, committed with each batch
+    chunks_done: Mapped[int] = mapped_column(server_default="0")
+    # Last failure; runs that fail on a transient error are resumed
+    error: Mapped[Optional[str]] = mapped_column(Text)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True))
+
+    # Foreign keys
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey(Tenants.id, ondelete="CASCADE"))
+    user_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(Users.id, ondelete="SET NULL")
+    )
+    # The model the source moves to
+    embedding_model_id: Mapped[UUID] = mapped_column(
+        ForeignKey(EmbeddingModels.id, ondelete="CASCADE")
+    )
+    # Exactly one source is set
+    group_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(CollectionsTable.id, ondelete="CASCADE")
+    )
+    website_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(Websites.id, ondelete="CASCADE")
+    )
+    integration_knowledge_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(IntegrationKnowledge.id, ondelete="CASCADE")
+    )
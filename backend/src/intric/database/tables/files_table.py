@@ -14,7 +14,9 @@ from intric.files.file_models import FileType
 class Files(BasePublic):
     name: Mapped[str] = mapped_column()
     text: Mapped[Optional[str]] = mapped_column(Text)
-    blob: Mapped[Optional[bytes]] = mapped_column(BYTEA)
+    blob: Mapped[Optional[bytes]] = mapped_column(BYTEA)  # Legacy, see blob_key
+    # Key into the blob store (SHA-256 of the content); replaces blob
+    blob_key: Mapped[Optional[str]] = mapped_column(index=True)
     checksum: Mapped[str] = mapped_column(index=True)
     size: Mapped[int] = mapped_column()
     mimetype: Mapped[Optional[str]] = mapped_column()
@@ -1,7 +1,8 @@
+from typing import Optional
 from uuid import UUID
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from intric.database.tables.base_class import BasePublic
@@ -14,6 +15,15 @@ class InfoBlobChunks(BasePublic):
     chunk_no: Mapped[int] = mapped_column()
     size: Mapped[int] = mapped_column()
     embedding: Mapped[list[float]] = mapped_column(Vector)
+    # Written by a re-embedding job and swapped into embedding when it is done
+    shadow_embedding: Mapped[Optional[list[float]]] = mapped_column(
+        Vector, deferred=True
+    )
+    # Where the chunk sits in the info blob text, and its size in tokens.
+    # Null for chunks stored before these were recorded.
+    start_offset: Mapped[Optional[int]] = mapped_column()
+    end_offset: Mapped[Optional[int]] = mapped_column()
+    token_count: Mapped[Optional[int]] = mapped_column()
 
     # Foreign keys
     info_blob_id: Mapped[UUID] = mapped_column(
@@ -22,3 +32,7 @@ class InfoBlobChunks(BasePublic):
     tenant_id: Mapped[UUID] = mapped_column(
         ForeignKey(Tenants.id, ondelete="CASCADE"), index=True
     )
+
+    __table_args__ = (
+        Index("ix_info_blob_chunks_info_blob_id_chunk_no", "info_blob_id", "chunk_no"),
+    )
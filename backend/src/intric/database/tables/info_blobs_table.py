@@ -22,6 +22,10 @@ class InfoBlobs(BasePublic):
         LargeBinary(length=32),
         comment="SHA-256 hash of normalized content for change detection",
     )
+    content_simhash: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary(length=8),
+        comment="64-bit SimHash of page content for near-duplicate detection",
+    )
 
     # Foreign keys
     user_id: Mapped[UUID] = mapped_column(
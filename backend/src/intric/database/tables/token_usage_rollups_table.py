@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from intric.database.tables.ai_models_table import CompletionModels
+from intric.database.tables.base_class import BasePublic
+from intric.database.tables.tenant_table import Tenants
+from intric.database.tables.users_table import Users
+
+
+class TokenUsageDailyRollups(BasePublic):
+    """Token usage per tenant, UTC day, user, model and source (question or app run)."""
+
+    day: Mapped[date] = mapped_column()
+    source: Mapped[str] = mapped_column()
+    input_tokens: Mapped[int] = mapped_column(BigInteger)
+    output_tokens: Mapped[int] = mapped_column(BigInteger)
+    request_count: Mapped[int] = mapped_column(BigInteger)
+
+    # Foreign keys
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey(Tenants.id, ondelete="CASCADE"))
+    user_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(Users.id, ondelete="SET NULL")
+    )
+    completion_model_id: Mapped[Optional[UUID]] = mapped_column(
+        ForeignKey(CompletionModels.id, ondelete="SET NULL")
+    )
+
+    __table_args__ = (
+        Index("ix_token_usage_daily_rollups_tenant_day", "tenant_id", "day"),
+        Index("ix_token_usage_daily_rollups_day", "day"),
+    )
+
+
+class TokenUsageRollupState(BasePublic):
+    """Single row recording which days the rollups cover.
+
+    Days in [covered_from, refreshed_through) are final; refreshed_through is
+    still being recomputed as late writes (e.g. finishing app runs) land.
+    """
+
+    covered_from: Mapped[date] = mapped_column()
+    refreshed_through: Mapped[date] = mapped_column()
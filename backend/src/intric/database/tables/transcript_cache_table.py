@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from intric.database.tables.ai_models_table import TranscriptionModels
+from intric.database.tables.base_class import BasePublic
+from intric.database.tables.tenant_table import Tenants
+
+
+class TranscriptCache(BasePublic):
+    """Transcripts keyed by audio checksum and model, so re-uploads are not re-transcribed."""
+
+    checksum: Mapped[str] = mapped_column()
+    transcript: Mapped[str] = mapped_column(Text)
+
+    # Foreign keys
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey(Tenants.id, ondelete="CASCADE"))
+    transcription_model_id: Mapped[UUID] = mapped_column(
+        ForeignKey(TranscriptionModels.id, ondelete="CASCADE")
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id",
+            "checksum",
+            "transcription_model_id",
+            name="uq_transcript_cache_tenant_checksum_model",
+        ),
+    )
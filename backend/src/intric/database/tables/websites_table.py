@@ -21,6 +21,12 @@ class CrawlRuns(BasePublic):
     files_downloaded: Mapped[Optional[int]] = mapped_column()
     pages_failed: Mapped[Optional[int]] = mapped_column()
     files_failed: Mapped[Optional[int]] = mapped_column()
+    pages_unchanged: Mapped[Optional[int]] = mapped_column(
+        comment="Pages and files kept as-is because they were not modified",
+    )
+    pages_near_duplicate: Mapped[Optional[int]] = mapped_column(
+        comment="Pages dropped as near-duplicates of another page in the same crawl",
+    )
     failure_summary: Mapped[Optional[dict]] = mapped_column(
         JSONB,
         nullable=True,
@@ -40,6 +46,32 @@ class CrawlRuns(BasePublic):
     job: Mapped[Jobs] = relationship()
 
 
+class CrawlUrlValidators(BasePublic):
+    """HTTP validators for a crawled URL, used for conditional recrawls.
+
+    One row per info blob; deleted together with the blob so validators are
+    never sent for content we no longer have.
+    """
+
+    url: Mapped[str] = mapped_column()
+    etag: Mapped[Optional[str]] = mapped_column(nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(nullable=True)
+    links: Mapped[Optional[list]] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="[rule_index, url] pairs followed from this page, replayed on 304",
+    )
+
+    # Foreign keys
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey(Tenants.id, ondelete="CASCADE"))
+    website_id: Mapped[UUID] = mapped_column(
+        ForeignKey("websites.id", ondelete="CASCADE"), index=True
+    )
+    info_blob_id: Mapped[UUID] = mapped_column(
+        ForeignKey("info_blobs.id", ondelete="CASCADE"), unique=True
+    )
+
+
 class Websites(BasePublic):
     name: Mapped[Optional[str]] = mapped_column()
     url: Mapped[str] = mapped_column()
@@ -50,6 +82,11 @@ class Websites(BasePublic):
     last_crawled_at: Mapped[Optional[datetime]] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
+    last_successful_crawl_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+        comment="Start of the last complete, failure-free crawl (sitemap lastmod cutoff)",
+    )
 
     # HTTP Basic Auth fields (all nullable - feature is optional)
     http_auth_username: Mapped[Optional[str]] = mapped_column(
@@ -73,6 +110,11 @@ class Websites(BasePublic):
         nullable=True,
         comment="Timestamp when website should be retried after failures",
     )
+    deleting_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+        comment="Set when the worker is deleting the contents in batches",
+    )
 
     # Foreign keys
     tenant_id: Mapped[UUID] = mapped_column(ForeignKey(Tenants.id, ondelete="CASCADE"))
@@ -0,0 +1,116 @@
+from typing import TYPE_CHECKING, Optional
+
+from intric.database.tables.embedding_migrations_table import EmbeddingMigrations
+from intric.embedding_models.infrastructure.reembedding import (
+    get_migration,
+    get_source_embedding_model_id,
+    get_source_space_id,
+    has_stale_info_blobs,
+    is_searched_with_other_models,
+    start_embedding_migration,
+)
+from intric.jobs.job_manager import job_manager
+from intric.jobs.job_models import Task
+from intric.jobs.task_models import ReembedKnowledgeTask
+from intric.main.exceptions import BadRequestException, NotFoundException
+from intric.roles.permissions import Permission, validate_permissions
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from intric.database.database import AsyncSession
+    from intric.embedding_models.domain.embedding_model_repo import (
+        EmbeddingModelRepository,
+    )
+    from intric.spaces.space_repo import SpaceRepository
+    from intric.users.user import UserInDB
+
+
+class EmbeddingMigrationService:
+    """Moves knowledge sources to another embedding model in the background."""
+
+    def __init__(
+        self,
+        user: "UserInDB",
+        session: "AsyncSession",
+        embedding_model_repo: "EmbeddingModelRepository",
+        space_repo: "SpaceRepository",
+    ):
+        self.user = user
+        self.session = session
+        self.embedding_model_repo = embedding_model_repo
+        self.space_repo = space_repo
+
+    @validate_permissions(Permission.ADMIN)
+    async def start_migration(
+        self,
+        embedding_model_id: "UUID",
+        *,
+        group_id: Optional["UUID"] = None,
+        website_id: Optional["UUID"] = None,
+        integration_knowledge_id: Optional["UUID"] = None,
+    ) -> EmbeddingMigrations:
+        embedding_model = await self.embedding_model_repo.one(
+            model_id=embedding_model_id
+        )
+        if not embedding_model.can_access:
+            raise BadRequestException(
+                f"Embedding model {embedding_model.name} is not available"
+            )
+
+        migration = EmbeddingMigrations(
+            tenant_id=self.user.tenant_id,
+            user_id=self.user.id,
+            embedding_model_id=embedding_model.id,
+            group_id=group_id,
+            website_id=website_id,
+            integration_knowledge_id=integration_knowledge_id,
+        )
+        exists, current_model_id = await get_source_embedding_model_id(
+            self.session, migration
+        )
+        if not exists:
+            raise NotFoundException("Knowledge source not found")
+        # A migration to the source's own model repairs info blobs left on
+        # the old one by a previous migration
+        if current_model_id == embedding_model.id and not await has_stale_info_blobs(
+            self.session, migration
+        ):
+            raise BadRequestException(
+                f"The knowledge source already uses {embedding_model.name}"
+            )
+
+        space_id = await get_source_space_id(self.session, migration)
+        if space_id is not None:
+            space = await self.space_repo.one(space_id)
+            if not space.is_embedding_model_in_space(embedding_model.id):
+                raise BadRequestException(
+                    f"Embedding model {embedding_model.name} is not enabled "
+                    "in the knowledge source's space"
+                )
+
+        if await is_searched_with_other_models(self.session, migration):
+            raise BadRequestException(
+                "The knowledge source is used by an assistant or service together "
+                f"with knowledge not on {embedding_model.name}; migrate that "
+                "knowledge first or remove it from the assistant or service"
+            )
+
+        migration = await start_embedding_migration(self.session, migration)
+        await job_manager.enqueue(
+            Task.REEMBED_KNOWLEDGE,
+            migration.id,
+            ReembedKnowledgeTask(user_id=self.user.id, migration_id=migration.id),
+        )
+
+        return migration
+
+    @validate_permissions(Permission.ADMIN)
+    async def get_migration(self, migration_id: "UUID") -> EmbeddingMigrations:
+        migration = await get_migration(
+            self.session, migration_id, tenant_id=self.user.tenant_id
+        )
+        if migration is None:
+            raise NotFoundException("Embedding migration not found")
+
+        return migration
@@ -15,9 +15,17 @@ from intric.files.chunk_embedding_list import ChunkEmbeddingList
 from intric.main.config import get_settings
 from intric.main.exceptions import BadRequestException, OpenAIException
 from intric.main.logging import get_logger
+from intric.model_providers.infrastructure.provider_client_registry import (
+    provider_client_registry,
+)
 from intric.model_providers.infrastructure.tenant_model_credential_resolver import (
     TenantModelCredentialResolver,
 )
+from intric.observability.metrics import (
+    EMBEDDING_BATCH_SECONDS,
+    EMBEDDING_BATCHES,
+    observe_seconds,
+)
 
 if TYPE_CHECKING:
     from intric.embedding_models.infrastructure.create_embeddings_service import (
@@ -36,6 +44,7 @@ class LiteLLMEmbeddingAdapter(EmbeddingModelAdapter):
         if "api_key" in safe_params:
             key = safe_params["api_key"]
             safe_params["api_key"] = f"...{key[-4:]}" if len(key) > 4 else "***"
+        safe_params.pop("shared_session", None)
         return safe_params
 
     def __init__(
@@ -77,7 +86,9 @@ class LiteLLMEmbeddingAdapter(EmbeddingModelAdapter):
                 texts_for_chunks = [chunk.text for chunk in chunked_chunks]
                 logger.debug("[LiteLLM] %s: No prefix applied (family=%s)", self.model.name, self.model.family)
 
-            embeddings_for_chunks = await self._get_embeddings(texts=texts_for_chunks)
+            with observe_seconds(EMBEDDING_BATCH_SECONDS.labels(model=self.model.name)):
+                embeddings_for_chunks = await self._get_embeddings(texts=texts_for_chunks)
+            EMBEDDING_BATCHES.labels(model=self.model.name).inc()
             chunk_embedding_list.add(chunked_chunks, embeddings_for_chunks)
 
         return chunk_embedding_list
@@ -146,6 +157,13 @@ class LiteLLMEmbeddingAdapter(EmbeddingModelAdapter):
                     params['api_base'] = endpoint
                     logger.debug(f"[LiteLLM] {self.litellm_model}: Injecting endpoint for {provider}: {endpoint}")
 
+                # Reuse the keep-alive connections to this endpoint
+                shared_session = provider_client_registry.session(
+                    self.credential_resolver.provider_id, endpoint, provider
+                )
+                if shared_session is not None:
+                    params["shared_session"] = shared_session
+
                 # Inject api_version for Azure embeddings
                 if provider == "azure":
                     api_version = self.credential_resolver.get_credential_field(
@@ -138,15 +138,18 @@ class CreateEmbeddingsService:
             litellm_model_name = f"{provider_db.provider_type}/{model.name}"
             provider_type = provider_db.provider_type
 
+        # Logged on every call: the message is rendered and the ids are
+        # serialized only if the record is written
         logger.info(
-            f"Using LiteLLMEmbeddingAdapter for model '{model.name}'",
+            "Using LiteLLMEmbeddingAdapter for model '%s'",
+            model.name,
             extra={
-                "model_id": str(model.id) if hasattr(model, 'id') else None,
+                "model_id": getattr(model, "id", None),
                 "model_name": model.name,
-                "provider_id": str(model.provider_id),
+                "provider_id": model.provider_id,
                 "provider_type": provider_type,
                 "litellm_model_name": litellm_model_name,
-                "tenant_id": str(self.tenant.id) if self.tenant else None,
+                "tenant_id": self.tenant.id if self.tenant else None,
             }
         )
 
@@ -1,10 +1,6 @@
-import time
 from typing import TYPE_CHECKING, Optional
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from pydantic_settings import BaseSettings
-
-from intric.completion_models.infrastructure.context_builder import count_tokens
+from intric.embedding_models.infrastructure.text_chunker import chunk_text
 from intric.files.chunk_embedding_list import ChunkEmbeddingList
 from intric.info_blobs.info_blob import (
     InfoBlobChunk,
@@ -17,6 +13,11 @@ from intric.integration.domain.entities.integration_knowledge import (
     IntegrationKnowledge,
 )
 from intric.main.logging import get_logger
+from intric.observability.metrics import (
+    QUERY_EMBEDDING_SECONDS,
+    VECTOR_SEARCH_SECONDS,
+    observe_seconds,
+)
 from intric.users.user import UserInDB
 
 if TYPE_CHECKING:
@@ -30,14 +31,6 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-class ChunkSettings(BaseSettings):
-    chunk_size: int = 200
-    chunk_overlap: int = 40
-
-
-settings = ChunkSettings()
-
-
 def autocut(y_values: list[float], cutoff: int = 2) -> int:
     # Written by GPT-4, fact-checked by GPT-4
 
@@ -84,21 +77,17 @@ class Datastore:
         self.create_embeddings_service = create_embeddings_service
 
     def _chunk_text(self, info_blob: InfoBlobInDB):
-        splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap,
-            length_function=count_tokens,
-        )
-
         info_blob_chunks = [
             InfoBlobChunk(
                 chunk_no=i,
-                text=chunk.strip(),
+                text=chunk.text,
                 info_blob_id=info_blob.id,
                 tenant_id=self.user.tenant_id,
+                start_offset=chunk.start,
+                end_offset=chunk.end,
+                token_count=chunk.token_count,
             )
-            for i, chunk in enumerate(splitter.split_text(info_blob.text))
-            if chunk.strip()
+            for i, chunk in enumerate(chunk_text(info_blob.text))
         ]
 
         return info_blob_chunks
@@ -113,14 +102,14 @@ class Datastore:
             )
 
             if len(chunks) >= batch_size:
-                logger.debug(f"Adding {len(chunks)} chunks to datastore.")
+                logger.debug("Adding %d chunks to datastore.", len(chunks))
                 await self.chunk_repo.add(chunks)
 
                 chunks.clear()
 
         # Last batch
         if chunks:
-            logger.debug(f"Last batch. Adding {len(chunks)} chunks to datastore.")
+            logger.debug("Last batch. Adding %d chunks to datastore.", len(chunks))
             await self.chunk_repo.add(chunks)
 
     async def add(self, info_blob: InfoBlobInDB, embedding_model: "EmbeddingModel"):
@@ -131,12 +120,12 @@ class Datastore:
             logger.warning(f"Info Blob {info_blob.id} did not yield any chunks after splitting.")
             return
 
-        logger.debug(f"Embedding {len(info_blob_chunks)} info-blob chunks.")
+        logger.debug("Embedding %d info-blob chunks.", len(info_blob_chunks))
         chunk_embedding_list = await self.create_embeddings_service.get_embeddings(
             model=embedding_model, chunks=info_blob_chunks
         )
 
-        logger.debug(f"Adding {len(info_blob_chunks)} info-blob chunks to datastore.")
+        logger.debug("Adding %d info-blob chunks to datastore.", len(info_blob_chunks))
         await self._add(chunk_embedding_list)
 
     async def semantic_search(
@@ -148,34 +137,38 @@ class Datastore:
         integration_knowledge_list: list[IntegrationKnowledge] = [],
         num_chunks: Optional[int] = 30,
         autocut_cutoff: Optional[int] = None,
+        neighbor_chunks: int = 0,
     ) -> list[InfoBlobChunkInDBWithScore]:
         group_ids = [group.id for group in collections]
         website_ids = [website.id for website in websites]
         integration_knowledge_ids = [i.id for i in integration_knowledge_list]
 
-        start = time.time()
-        search_string_embedding = await self.create_embeddings_service.get_embedding_for_query(
-            model=embedding_model, query=search_string
-        )
-        step_1 = time.time()
-        semantic_results = await self.chunk_repo.semantic_search(
-            search_string_embedding,
-            group_ids=group_ids,
-            website_ids=website_ids,
-            integration_knowledge_ids=integration_knowledge_ids,
-            limit=num_chunks,
-        )
-        end = time.time()
-
-        logger.debug(
-            f"Time to get results: Embed step: {step_1 - start},"
-            f" Search step: {end - step_1}, Total: {end - start}"
-        )
+        with observe_seconds(QUERY_EMBEDDING_SECONDS):
+            search_string_embedding = (
+                await self.create_embeddings_service.get_embedding_for_query(
+                    model=embedding_model, query=search_string
+                )
+            )
+        with observe_seconds(VECTOR_SEARCH_SECONDS):
+            semantic_results = await self.chunk_repo.semantic_search(
+                search_string_embedding,
+                group_ids=group_ids,
+                website_ids=website_ids,
+                integration_knowledge_ids=integration_knowledge_ids,
+                limit=num_chunks,
+            )
 
         scores = [res.score for res in semantic_results]
 
         if autocut_cutoff is not None:
             cut_point = autocut(scores, autocut_cutoff)
-            return semantic_results[:cut_point]
+            semantic_results = semantic_results[:cut_point]
+
+        if neighbor_chunks > 0 and semantic_results:
+            # After the hits, so they are the first to go when the context
+            # runs out of room
+            semantic_results = semantic_results + await self.chunk_repo.get_neighbors(
+                semantic_results, radius=neighbor_chunks
+            )
 
         return semantic_results
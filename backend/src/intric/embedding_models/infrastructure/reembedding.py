@@ -0,0 +1,429 @@
+"""Re-embedding a knowledge source's chunks with another embedding model.
+
+A migration re-embeds the stored text of every chunk of one collection,
+website or integration knowledge; nothing is extracted, crawled or chunked
+again. New embeddings are written to info_blob_chunks.shadow_embedding in
+batches, each in its own transaction together with the migration's progress,
+so a run that stops (worker restart, provider outage) loses at most the batch
+in flight and the next run continues with the chunks that still lack a shadow.
+
+Retrieval keeps using embedding, and the source's current model, until every
+chunk has a shadow. flip_embeddings then swaps the shadows in and points the
+source and its info blobs at the new model in one transaction.
+
+Chunks ingested while a migration runs are embedded with the old model and
+picked up by the next batch, and the flip embeds any still missing a shadow
+before it switches. Info blobs committed between that final pass and the flip
+keep the old model as their own embedding_model_id; only chunks of info blobs
+not yet on the migration's model are embedded, so a migration to the model
+the source already uses repairs just those.
+
+An assistant or service embeds a question once and searches all of its
+sources with that vector, so a source is only migrated on its own if every
+source it is searched together with is on the target model already.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from intric.database.tables.ai_models_table import EmbeddingModels
+from intric.database.tables.assistant_table import (
+    AssistantIntegrationKnowledge,
+    AssistantsGroups,
+    AssistantsWebsites,
+)
+from intric.database.tables.collections_table import CollectionsTable
+from intric.database.tables.embedding_migrations_table import EmbeddingMigrations
+from intric.database.tables.info_blob_chunk_table import InfoBlobChunks
+from intric.database.tables.info_blobs_table import InfoBlobs
+from intric.database.tables.integration_table import IntegrationKnowledge
+from intric.database.tables.service_table import ServicesGroups
+from intric.database.tables.websites_table import Websites
+from intric.info_blobs.info_blob import InfoBlobChunk
+from intric.main.logging import get_logger
+from intric.main.models import Status
+
+if TYPE_CHECKING:
+    from intric.database.database import AsyncSession
+    from intric.embedding_models.infrastructure.create_embeddings_service import (
+        CreateEmbeddingsService,
+    )
+
+logger = get_logger(__name__)
+
+UNFINISHED = (Status.QUEUED.value, Status.IN_PROGRESS.value)
+
+# Per owner column, the link tables of assistants and services to each kind
+# of source: (link table, its source column, the source table)
+_SEARCHED_TOGETHER = {
+    "assistant_id": (
+        (AssistantsGroups, AssistantsGroups.group_id, CollectionsTable),
+        (AssistantsWebsites, AssistantsWebsites.website_id, Websites),
+        (
+            AssistantIntegrationKnowledge,
+            AssistantIntegrationKnowledge.integration_knowledge_id,
+            IntegrationKnowledge,
+        ),
+    ),
+    "service_id": ((ServicesGroups, ServicesGroups.group_id, CollectionsTable),),
+}
+
+
+def _source(migration: EmbeddingMigrations):
+    """The source table and the info blob column pointing at the source."""
+    if migration.group_id is not None:
+        return CollectionsTable, InfoBlobs.group_id, migration.group_id
+    if migration.website_id is not None:
+        return Websites, InfoBlobs.website_id, migration.website_id
+    return (
+        IntegrationKnowledge,
+        InfoBlobs.integration_knowledge_id,
+        migration.integration_knowledge_id,
+    )
+
+
+def _chunks_of_source(migration: EmbeddingMigrations):
+    _, info_blob_column, source_id = _source(migration)
+    return InfoBlobChunks.info_blob_id.in_(
+        sa.select(InfoBlobs.id).where(info_blob_column == source_id)
+    )
+
+
+def _chunks_to_embed(migration: EmbeddingMigrations):
+    """Chunks of the source's info blobs not on the migration's model yet."""
+    _, info_blob_column, source_id = _source(migration)
+    return InfoBlobChunks.info_blob_id.in_(
+        sa.select(InfoBlobs.id).where(
+            info_blob_column == source_id,
+            InfoBlobs.embedding_model_id.is_distinct_from(migration.embedding_model_id),
+        )
+    )
+
+
+async def get_source_embedding_model_id(
+    session: "AsyncSession", migration: EmbeddingMigrations
+) -> tuple[bool, Optional[UUID]]:
+    """Whether the migration's source exists in its tenant, and its model."""
+    table, _, source_id = _source(migration)
+    row = (
+        await session.execute(
+            sa.select(table.embedding_model_id).where(
+                table.id == source_id, table.tenant_id == migration.tenant_id
+            )
+        )
+    ).one_or_none()
+
+    if row is None:
+        return False, None
+    return True, row.embedding_model_id
+
+
+async def get_source_space_id(
+    session: "AsyncSession", migration: EmbeddingMigrations
+) -> Optional[UUID]:
+    table, _, source_id = _source(migration)
+    return await session.scalar(sa.select(table.space_id).where(table.id == source_id))
+
+
+async def has_stale_info_blobs(
+    session: "AsyncSession", migration: EmbeddingMigrations
+) -> bool:
+    """Whether info blobs of the source are on another model than the migration's."""
+    _, info_blob_column, source_id = _source(migration)
+    return await session.scalar(
+        sa.select(
+            sa.exists().where(
+                info_blob_column == source_id,
+                InfoBlobs.embedding_model_id.is_distinct_from(
+                    migration.embedding_model_id
+                ),
+            )
+        )
+    )
+
+
+async def is_searched_with_other_models(
+    session: "AsyncSession", migration: EmbeddingMigrations
+) -> bool:
+    """Whether an assistant or service searches the source together with
+    sources on another model than the migration's."""
+    table, _, source_id = _source(migration)
+
+    for owner_column, links in _SEARCHED_TOGETHER.items():
+        owner_ids = [
+            sa.select(getattr(link, owner_column)).where(source_column == source_id)
+            for link, source_column, source_table in links
+            if source_table is table
+        ]
+        if not owner_ids:
+            continue
+
+        for link, source_column, source_table in links:
+            other_model = (
+                sa.select(source_table.id)
+                .join(link, source_column == source_table.id)
+                .where(
+                    getattr(link, owner_column).in_(owner_ids[0]),
+                    source_table.id != source_id,
+                    source_table.embedding_model_id.is_distinct_from(
+                        migration.embedding_model_id
+                    ),
+                )
+            )
+            if await session.scalar(sa.select(other_model.exists())):
+                return True
+
+    return False
+
+
+async def start_embedding_migration(
+    session: "AsyncSession", migration: EmbeddingMigrations
+) -> EmbeddingMigrations:
+    """Add the migration, replacing any unfinished one for the same source."""
+    _, info_blob_column, source_id = _source(migration)
+    # The migration's source columns are named like the info blob's
+    source_column = getattr(EmbeddingMigrations, info_blob_column.key)
+
+    # Waits for a batch of the replaced migration to commit; its next batch
+    # sees the migration failed and stops
+    await session.execute(
+        sa.update(EmbeddingMigrations)
+        .where(
+            source_column == source_id,
+            EmbeddingMigrations.status.in_(UNFINISHED),
+        )
+        .values(
+            status=Status.FAILED.value,
+            error="Replaced by a newer migration",
+            finished_at=datetime.now(timezone.utc),
+        )
+    )
+    await session.execute(
+        sa.update(InfoBlobChunks)
+        .where(
+            _chunks_of_source(migration),
+            InfoBlobChunks.shadow_embedding.is_not(None),
+        )
+        .values(shadow_embedding=None)
+        .execution_options(synchronize_session=False)
+    )
+
+    migration.status = Status.QUEUED.value
+    migration.chunks_done = 0
+    migration.chunks_total = await session.scalar(
+        sa.select(sa.func.count(InfoBlobChunks.id)).where(_chunks_to_embed(migration))
+    )
+    session.add(migration)
+    await session.flush()
+    await session.refresh(migration)
+
+    return migration
+
+
+async def _lock_unfinished(
+    session: "AsyncSession", migration_id: UUID
+) -> Optional[EmbeddingMigrations]:
+    # Runs of the same migration (the enqueued job and the resuming cron)
+    # take turns on this lock instead of racing for the same chunks
+    migration = await session.scalar(
+        sa.select(EmbeddingMigrations)
+        .where(EmbeddingMigrations.id == migration_id)
+        .with_for_update()
+    )
+    if migration is None or migration.status not in UNFINISHED:
+        return None
+    return migration
+
+
+async def reembed_batch(
+    session: "AsyncSession",
+    migration_id: UUID,
+    create_embeddings_service: "CreateEmbeddingsService",
+    batch_size: int,
+) -> Optional[int]:
+    """Embed one batch of chunks into their shadow column.
+
+    Returns the number of chunks embedded, 0 once every chunk has a shadow,
+    and None if the migration is finished or gone.
+    """
+    migration = await _lock_unfinished(session, migration_id)
+    if migration is None:
+        return None
+
+    rows = await _chunks_without_shadow(session, migration, batch_size)
+    if not rows:
+        return 0
+
+    await _embed_into_shadow(session, migration, rows, create_embeddings_service)
+
+    migration.status = Status.IN_PROGRESS.value
+    migration.chunks_done += len(rows)
+    migration.error = None
+
+    return len(rows)
+
+
+async def _chunks_without_shadow(
+    session: "AsyncSession", migration: EmbeddingMigrations, limit: int
+):
+    return (
+        await session.execute(
+            sa.select(
+                InfoBlobChunks.id,
+                InfoBlobChunks.text,
+                InfoBlobChunks.chunk_no,
+                InfoBlobChunks.info_blob_id,
+                InfoBlobChunks.tenant_id,
+            )
+            .where(
+                _chunks_to_embed(migration),
+                InfoBlobChunks.shadow_embedding.is_(None),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+    ).all()
+
+
+async def _embed_into_shadow(
+    session: "AsyncSession",
+    migration: EmbeddingMigrations,
+    rows,
+    create_embeddings_service: "CreateEmbeddingsService",
+):
+    model = await session.get(EmbeddingModels, migration.embedding_model_id)
+    chunks = [
+        InfoBlobChunk(
+            text=row.text,
+            chunk_no=row.chunk_no,
+            info_blob_id=row.info_blob_id,
+            tenant_id=row.tenant_id,
+        )
+        for row in rows
+    ]
+    chunk_embeddings = await create_embeddings_service.get_embeddings(model, chunks)
+
+    # Embeddings come back in the order of the chunks
+    await session.execute(
+        sa.update(InfoBlobChunks),
+        [
+            {"id": row.id, "shadow_embedding": embedding}
+            for row, (_, embedding) in zip(rows, chunk_embeddings)
+        ],
+    )
+
+
+async def flip_embeddings(
+    session: "AsyncSession",
+    migration_id: UUID,
+    create_embeddings_service: "CreateEmbeddingsService",
+    batch_size: int,
+) -> bool:
+    """Switch the source to the new embeddings.
+
+    Chunks still lacking a shadow are embedded first, in this transaction,
+    if they fit in one batch. Returns False if the migration is finished or
+    more chunks lack a shadow, which the next batches embed.
+    """
+    migration = await _lock_unfinished(session, migration_id)
+    if migration is None:
+        return False
+
+    # Rows locked by a batch still in flight are skipped here; that batch
+    # commits before the flip proceeds, since both hold the migration lock
+    missing = await _chunks_without_shadow(session, migration, batch_size + 1)
+    if len(missing) > batch_size:
+        return False
+    if missing:
+        await _embed_into_shadow(session, migration, missing, create_embeddings_service)
+        migration.chunks_done += len(missing)
+
+    table, info_blob_column, source_id = _source(migration)
+
+    await session.execute(
+        sa.update(InfoBlobChunks)
+        .where(
+            _chunks_to_embed(migration),
+            InfoBlobChunks.shadow_embedding.is_not(None),
+        )
+        .values(embedding=InfoBlobChunks.shadow_embedding, shadow_embedding=None)
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(
+        sa.update(InfoBlobs)
+        .where(info_blob_column == source_id)
+        .values(embedding_model_id=migration.embedding_model_id)
+        .execution_options(synchronize_session=False)
+    )
+    await session.execute(
+        sa.update(table)
+        .where(table.id == source_id)
+        .values(embedding_model_id=migration.embedding_model_id)
+        .execution_options(synchronize_session=False)
+    )
+
+    migration.status = Status.COMPLETE.value
+    migration.chunks_total = max(migration.chunks_total, migration.chunks_done)
+    migration.finished_at = datetime.now(timezone.utc)
+    logger.info(
+        "Switched %s to embedding model %s",
+        source_id,
+        migration.embedding_model_id,
+        extra={"migration_id": migration.id, "chunks": migration.chunks_done},
+    )
+
+    return True
+
+
+async def record_migration_error(
+    session: "AsyncSession", migration_id: UUID, error: str, *, final: bool
+):
+    """Note why a run stopped; a final error fails the migration."""
+    values = {"error": error}
+    if final:
+        values.update(
+            status=Status.FAILED.value,
+            finished_at=datetime.now(timezone.utc),
+        )
+
+    await session.execute(
+        sa.update(EmbeddingMigrations)
+        .where(
+            EmbeddingMigrations.id == migration_id,
+            EmbeddingMigrations.status.in_(UNFINISHED),
+        )
+        .values(**values)
+    )
+
+
+async def get_migration(
+    session: "AsyncSession", migration_id: UUID, tenant_id: UUID
+) -> Optional[EmbeddingMigrations]:
+    return await session.scalar(
+        sa.select(EmbeddingMigrations).where(
+            EmbeddingMigrations.id == migration_id,
+            EmbeddingMigrations.tenant_id == tenant_id,
+        )
+    )
+
+
+async def get_resumable_migration_ids(
+    session: "AsyncSession", idle_seconds: float
+) -> list[UUID]:
+    """Unfinished migrations that no run has advanced for idle_seconds."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=idle_seconds)
+    return list(
+        (
+            await session.scalars(
+                sa.select(EmbeddingMigrations.id)
+                .where(
+                    EmbeddingMigrations.status.in_(UNFINISHED),
+                    EmbeddingMigrations.updated_at < cutoff,
+                )
+                .order_by(EmbeddingMigrations.created_at)
+            )
+        ).all()
+    )
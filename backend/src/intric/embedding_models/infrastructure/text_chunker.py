@@ -0,0 +1,239 @@
+"""Splitting document text into chunks for embedding.
+
+The token chunker encodes a document once and cuts token windows of at most
+chunk_size tokens. Each cut is moved to the strongest nearby boundary
+(paragraph, line, sentence, word) using the character offsets of the tokens,
+and consecutive chunks overlap by up to chunk_overlap tokens, starting at the
+strongest boundary in that range. Chunks cut at a paragraph break do not
+overlap, like with the legacy chunker.
+
+The legacy chunker is LangChain's RecursiveCharacterTextSplitter measuring
+length in tokens, which is what every existing collection was chunked with.
+It re-encodes candidate pieces over and over while merging, so it is much
+slower on large documents, but it reproduces the old chunk boundaries exactly.
+"""
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from pydantic_settings import BaseSettings
+
+from intric.completion_models.infrastructure.context_builder import (
+    count_tokens,
+    get_token_encoding,
+)
+
+
+class ChunkingMode(str, Enum):
+    TOKEN = "token"
+    LEGACY = "legacy"
+
+
+class ChunkSettings(BaseSettings):
+    chunk_size: int = 200
+    chunk_overlap: int = 40
+    # Set to legacy to keep chunking new documents exactly like existing ones
+    chunking_mode: ChunkingMode = ChunkingMode.TOKEN
+
+
+chunk_settings = ChunkSettings()
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    text: str
+    # Character offsets of the (stripped) text in the document
+    start: int
+    end: int
+    token_count: int
+
+
+# Boundary strengths, a cut prefers the highest one available
+_NONE, _WORD, _SENTENCE, _LINE, _PARAGRAPH = range(5)
+
+_SEPARATORS = (
+    (_SENTENCE, re.compile(r"(?<=[.!?])[\"'”’)\]]*(\s+)")),
+    (_LINE, re.compile(r"\n\s*")),
+    (_PARAGRAPH, re.compile(r"\n[ \t]*\n\s*")),
+)
+_WHITESPACE = np.array([ord(c) for c in " \t\n\r\f\v\xa0\u2028\u2029"], dtype=np.uint32)
+
+_token_byte_lengths: np.ndarray | None = None
+
+
+def _get_token_byte_lengths() -> np.ndarray:
+    """The length in bytes of every token of the encoding, built once."""
+    global _token_byte_lengths
+    if _token_byte_lengths is None:
+        encoding = get_token_encoding()
+        lengths = np.zeros(encoding.max_token_value + 1, dtype=np.int64)
+        for token in range(encoding.max_token_value + 1):
+            try:
+                lengths[token] = len(encoding.decode_single_token_bytes(token))
+            except KeyError:
+                pass
+        _token_byte_lengths = lengths
+    return _token_byte_lengths
+
+
+def _char_offsets(text: str, data: bytes, tokens: list[int]) -> np.ndarray:
+    """Character offset of the start of every token, and of the end of the text.
+
+    A token that starts inside a multi-byte character is placed after that
+    character, so a cut never splits one.
+    """
+    byte_offsets = np.zeros(len(tokens) + 1, dtype=np.int64)
+    np.cumsum(_get_token_byte_lengths()[tokens], out=byte_offsets[1:])
+
+    # Each character has one byte that is not a UTF-8 continuation byte
+    continuation = (np.frombuffer(data, dtype=np.uint8) & 0xC0) == 0x80
+    continuations_before = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum(continuation, out=continuations_before[1:])
+
+    return byte_offsets - continuations_before[byte_offsets]
+
+
+def _boundary_strengths(text: str, offsets: np.ndarray) -> np.ndarray:
+    """The boundary strength at each offset.
+
+    Every position inside or at either end of a separator gets the strength
+    of that separator, so it does not matter on which side of the whitespace
+    the tokenizer puts it.
+    """
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    space = np.zeros(len(text) + 2, dtype=bool)
+    space[1:-1] = np.isin(codes, _WHITESPACE)
+    # A word boundary has whitespace right before or right after it
+    strengths = np.where(space[offsets] | space[offsets + 1], _WORD, _NONE).astype(
+        np.uint8
+    )
+
+    marks = np.zeros(len(text) + 1, dtype=np.uint8)
+    for strength, pattern in _SEPARATORS:
+        for match in pattern.finditer(text):
+            start, end = match.span(match.lastindex or 0)
+            marks[start : end + 1] = strength
+
+    strengths = np.maximum(strengths, marks[offsets])
+    strengths[0] = strengths[-1] = _PARAGRAPH
+    return strengths
+
+
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _token_chunks(text: str, chunk_size: int, chunk_overlap: int) -> list[TextChunk]:
+    try:
+        data = text.encode()
+    except UnicodeEncodeError:
+        # Lone surrogates, replaced one for one so the offsets still line up
+        text = text.encode(errors="replace").decode()
+        data = text.encode()
+
+    # Special tokens in documents are ordinary text here
+    tokens = get_token_encoding().encode(text, disallowed_special=())
+    offsets = _char_offsets(text, data, tokens)
+    strengths = _boundary_strengths(text, offsets)
+    offsets = offsets.tolist()
+
+    n = len(tokens)
+    chunks = []
+    start = 0
+    while start < n:
+        limit = min(start + chunk_size, n)
+        if limit == n:
+            end = n
+        else:
+            # Cut at the strongest boundary in the back half of the window,
+            # the latest of equally strong ones
+            earliest = start + max(chunk_size // 2, 1)
+            end = limit - int(np.argmax(strengths[earliest : limit + 1][::-1]))
+
+        char_start, char_end = _strip_span(text, offsets[start], offsets[end])
+        if char_start < char_end:
+            chunks.append(
+                TextChunk(
+                    text=text[char_start:char_end],
+                    start=char_start,
+                    end=char_end,
+                    token_count=end - start,
+                )
+            )
+
+        if end == n:
+            break
+
+        # Start the next chunk at the strongest boundary in the overlap, the
+        # earliest of equally strong ones. A chunk cut at a paragraph break
+        # needs no overlap, the next paragraph starts a new thought anyway.
+        earliest = max(start + 1, end - chunk_overlap)
+        if earliest < end and strengths[end] < _PARAGRAPH:
+            start = earliest + int(np.argmax(strengths[earliest:end]))
+        else:
+            start = end
+
+    return chunks
+
+
+def _legacy_chunks(text: str, chunk_size: int, chunk_overlap: int) -> list[TextChunk]:
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=count_tokens,
+    )
+
+    chunks = []
+    search_from = 0
+    for piece in splitter.split_text(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+
+        # The pieces are substrings of the text in order, overlapping
+        start = text.find(piece, search_from)
+        if start == -1:
+            start = text.find(piece)
+        search_from = start + 1
+
+        chunks.append(
+            TextChunk(
+                text=piece,
+                start=start,
+                end=start + len(piece),
+                token_count=count_tokens(piece),
+            )
+        )
+
+    return chunks
+
+
+def chunk_text(
+    text: str,
+    *,
+    chunk_size: int | None = None,
+    chunk_overlap: int | None = None,
+    mode: ChunkingMode | None = None,
+) -> list[TextChunk]:
+    """Split the text into non-empty chunks, with the settings as defaults.
+
+    For the token chunker the token count is the size of the token window
+    the chunk was cut from; stripping whitespace can make the chunk's own
+    encoding a token shorter.
+    """
+    chunk_size = chunk_size or chunk_settings.chunk_size
+    chunk_overlap = (
+        chunk_settings.chunk_overlap if chunk_overlap is None else chunk_overlap
+    )
+    mode = mode or chunk_settings.chunking_mode
+
+    if mode == ChunkingMode.LEGACY:
+        return _legacy_chunks(text, chunk_size, chunk_overlap)
+    return _token_chunks(text, chunk_size, chunk_overlap)
@@ -1,7 +1,8 @@
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 from intric.ai_models.model_enums import (
     ModelFamily,
@@ -10,7 +11,14 @@ from intric.ai_models.model_enums import (
 )
 from intric.ai_models.model_enums import ModelOrg as Orgs
 from intric.embedding_models.domain.embedding_model import EmbeddingModel
-from intric.main.models import NOT_PROVIDED, BaseResponse, ModelId, NotProvided
+from intric.main.models import (
+    NOT_PROVIDED,
+    BaseResponse,
+    InDB,
+    ModelId,
+    NotProvided,
+    Status,
+)
 from intric.security_classifications.presentation.security_classification_models import (
     SecurityClassificationPublic,
 )
@@ -87,3 +95,32 @@ class EmbeddingModelSecurityStatus(EmbeddingModelPublic):
 class EmbeddingModelUpdate(BaseModel):
     is_org_enabled: bool | NotProvided = NOT_PROVIDED
     security_classification: ModelId | None | NotProvided = NOT_PROVIDED
+
+
+class EmbeddingMigrationCreate(BaseModel):
+    """The knowledge source to re-embed; set exactly one."""
+
+    collection_id: Optional[UUID] = None
+    website_id: Optional[UUID] = None
+    integration_knowledge_id: Optional[UUID] = None
+
+    @model_validator(mode="after")
+    def validate_one_source(self) -> "EmbeddingMigrationCreate":
+        sources = [self.collection_id, self.website_id, self.integration_knowledge_id]
+        if sum(source is not None for source in sources) != 1:
+            raise ValueError(
+                "Set exactly one of collection_id, website_id and integration_knowledge_id"
+            )
+        return self
+
+
+class EmbeddingMigrationPublic(InDB):
+    embedding_model_id: UUID
+    collection_id: Optional[UUID] = Field(None, validation_alias="group_id")
+    website_id: Optional[UUID] = None
+    integration_knowledge_id: Optional[UUID] = None
+    status: Status
+    chunks_total: int
+    chunks_done: int
+    error: Optional[str] = None
+    finished_at: Optional[datetime] = None
@@ -3,6 +3,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 
 from intric.embedding_models.presentation.embedding_model_models import (
+    EmbeddingMigrationCreate,
+    EmbeddingMigrationPublic,
     EmbeddingModelPublic,
     EmbeddingModelUpdate,
 )
@@ -111,3 +113,46 @@ async def update_embedding_model(
         )
 
     return EmbeddingModelPublic.from_domain(model)
+
+
+@router.post(
+    "/{id}/migrations/",
+    response_model=EmbeddingMigrationPublic,
+    responses=responses.get_responses([400, 404]),
+)
+async def migrate_knowledge_to_embedding_model(
+    id: UUID,
+    migration: EmbeddingMigrationCreate,
+    container: Container = Depends(get_container(with_user=True)),
+):
+    """Re-embed a collection, website or integration knowledge with this model.
+
+    The stored chunk text is embedded again in the background. Searches keep
+    using the current embeddings until every chunk is done, then switch over
+    at once. Starting a new migration for the same source replaces an
+    unfinished one.
+    """
+    service = container.embedding_migration_service()
+    started = await service.start_migration(
+        embedding_model_id=id,
+        group_id=migration.collection_id,
+        website_id=migration.website_id,
+        integration_knowledge_id=migration.integration_knowledge_id,
+    )
+
+    return EmbeddingMigrationPublic.model_validate(started)
+
+
+@router.get(
+    "/migrations/{migration_id}/",
+    response_model=EmbeddingMigrationPublic,
+    responses=responses.get_responses([404]),
+)
+async def get_embedding_migration(
+    migration_id: UUID,
+    container: Container = Depends(get_container(with_user=True)),
+):
+    service = container.embedding_migration_service()
+    migration = await service.get_migration(migration_id)
+
+    return EmbeddingMigrationPublic.model_validate(migration)
@@ -4,6 +4,7 @@ from .model_events import (
     ModelMigrationCompleted,
     ModelMigrationFailed,
     ModelMigrationStarted,
+    ModelUsageChanged,
     ModelUsageStatsUpdated,
 )
 
@@ -13,6 +14,7 @@ __all__ = [
     "ModelMigrationStarted",
     "ModelMigrationCompleted", 
     "ModelMigrationFailed",
+    "ModelUsageChanged",
     "ModelUsageStatsUpdated",
     "EventPublisher",
     "EventHandler",
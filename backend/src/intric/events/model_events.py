@@ -48,4 +48,15 @@ class ModelUsageStatsUpdated(DomainEvent):
     model_id: Optional[UUID]  # None means all models
     tenant_id: UUID
     update_type: str  # 'incremental' or 'full'
-    timestamp: datetime = field(default_factory=datetime.utcnow)
\ No newline at end of file
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+@dataclass
+class ModelUsageChanged(DomainEvent):
+    """Emitted when an entity starts or stops using a completion model.
+
+    A created entity has no old model, a deleted one no new model; a model
+    switch has both.
+    """
+    counter: str  # Usage stats column, e.g. 'assistants_count'
+    old_model_id: Optional[UUID] = None
+    new_model_id: Optional[UUID] = None
@@ -4,8 +4,9 @@ import asyncio
 import tempfile
 import wave
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import AsyncIterator, Iterator
 
 import audioread
 import numpy as np
@@ -59,6 +60,14 @@ async def to_wav(filepath: str):
         tmp_file.close()
 
 
+@dataclass
+class AudioSegment:
+    index: int
+    path: Path
+    start_seconds: float
+    end_seconds: float
+
+
 class AudioFile:
     def __init__(self, path_to_file: str):
         self.path = Path(path_to_file)
@@ -90,9 +99,9 @@ class AudioFile:
             soundfile.flush()
 
             if frames_in_file > max_size:
-                return temp_file, False
+                return temp_file, frames_in_file, False
 
-        return temp_file, True
+        return temp_file, frames_in_file, True
 
     def _split_file(self, seconds: int):
         max_size = self.info.samplerate * seconds
@@ -100,7 +109,7 @@ class AudioFile:
         gen = self._gen_file()
         done = False
         while not done:
-            file, done = self._write_to_file(gen, max_size)
+            file, _, done = self._write_to_file(gen, max_size)
             temp_files.append(file)
 
         return temp_files
@@ -120,5 +129,48 @@ class AudioFile:
             for f in temp_files:
                 f.close()
 
+    @asynccontextmanager
+    async def astream_segments(self, seconds: int):
+        """Like asplit_file, but encodes one segment at a time as it is consumed.
+
+        Yields an async iterator of AudioSegments, so the caller can start
+        transcribing a segment while the next one is being encoded.
+        """
+        samplerate = self.info.samplerate
+        max_size = samplerate * seconds
+        temp_files = []
+
+        async def segments() -> AsyncIterator[AudioSegment]:
+            gen = self._gen_file()
+            start_frame = 0
+            index = 0
+            done = False
+            while not done:
+                file, frames, done = await asyncio.to_thread(
+                    self._write_to_file, gen, max_size
+                )
+                temp_files.append(file)
+                if frames == 0:
+                    continue
+
+                yield AudioSegment(
+                    index=index,
+                    path=Path(file.name),
+                    start_seconds=start_frame / samplerate,
+                    end_seconds=(start_frame + frames) / samplerate,
+                )
+                start_frame += frames
+                index += 1
+
+            logger.debug("File was split in %s parts", index)
+
+        stream = segments()
+        try:
+            yield stream
+        finally:
+            await stream.aclose()
+            for f in temp_files:
+                f.close()
+
     def delete(self):
         self.path.unlink()
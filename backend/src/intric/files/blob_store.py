@@ -0,0 +1,282 @@
+"""Content-addressed storage for file bytes, outside Postgres.
+
+Blobs are keyed by the SHA-256 of their content, so identical uploads are
+stored once. The Files row only holds the key (blob_key). Uploaded files
+already carry a SHA-256 checksum of the upload, but generated images use MD5
+and image uploads are re-encoded before storage, so the key is always
+computed from the stored bytes.
+
+Blobs are never deleted when a Files row is deleted, because another row may
+reference the same content. sweep_orphaned_blobs removes blobs no row
+references once they are older than a grace period; put() refreshes the
+mtime of an existing blob so a re-upload is never swept mid-request. The
+sweep checks the mtime again as it deletes, since the put() of a row that is
+not committed yet can land after the sweep looked up the references.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional
+
+import aiofiles
+import sqlalchemy as sa
+
+from intric.database.tables.files_table import Files
+from intric.main.config import get_settings
+from intric.main.logging import get_logger
+
+if TYPE_CHECKING:
+    from intric.database.database import AsyncSession
+    from intric.files.file_models import File
+
+logger = get_logger(__name__)
+
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+def blob_key_for(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class BlobNotFoundError(Exception):
+    pass
+
+
+class BlobStore(ABC):
+    @abstractmethod
+    async def put(self, data: bytes) -> str:
+        """Store data and return its key. Storing existing content is a no-op."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    async def size(self, key: str) -> int: ...
+
+    @abstractmethod
+    def stream(
+        self, key: str, start: int = 0, end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """Yield the bytes in [start, end] (inclusive) in chunks."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def delete_if_stale(self, key: str, cutoff: float) -> bool:
+        """Delete the blob unless it was modified after cutoff (unix time),
+        atomically with respect to put(). Returns whether it was deleted."""
+
+    @abstractmethod
+    def iter_keys(self) -> Iterator[tuple[str, float]]:
+        """Yield (key, last modified unix time) for every stored blob."""
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs as files under root, fanned out as ab/cd/abcd...."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        if len(key) != 64 or not all(c in "0123456789abcdef" for c in key):
+            raise ValueError(f"Invalid blob key: {key!r}")
+        return self.root / key[:2] / key[2:4] / key
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        if path.exists():
+            # Refresh mtime so the orphan sweep's grace period restarts
+            try:
+                os.utime(path)
+                return
+            except FileNotFoundError:
+                # Swept in between, store it again
+                pass
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    async def put(self, data: bytes) -> str:
+        key = blob_key_for(data)
+        await asyncio.to_thread(self._write, key, data)
+        return key
+
+    async def get(self, key: str) -> bytes:
+        try:
+            async with aiofiles.open(self._path(key), "rb") as f:
+                return await f.read()
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(key) from e
+
+    async def size(self, key: str) -> int:
+        try:
+            stat = await asyncio.to_thread(os.stat, self._path(key))
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(key) from e
+        return stat.st_size
+
+    async def stream(
+        self, key: str, start: int = 0, end: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        try:
+            f = await aiofiles.open(self._path(key), "rb")
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(key) from e
+
+        try:
+            await f.seek(start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = (
+                    STREAM_CHUNK_SIZE
+                    if remaining is None
+                    else min(STREAM_CHUNK_SIZE, remaining)
+                )
+                chunk = await f.read(size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await f.close()
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, missing_ok=True)
+
+    def _delete_if_stale(self, key: str, cutoff: float) -> bool:
+        path = self._path(key)
+        # Move the blob aside before looking at its mtime. A put() that
+        # touched it before shows in the mtime, one after finds no blob and
+        # writes a new one
+        doomed = path.with_name(f".tmp-delete-{key}")
+        try:
+            os.replace(path, doomed)
+        except FileNotFoundError:
+            return False
+
+        if doomed.stat().st_mtime > cutoff:
+            os.replace(doomed, path)
+            return False
+
+        doomed.unlink()
+        return True
+
+    async def delete_if_stale(self, key: str, cutoff: float) -> bool:
+        return await asyncio.to_thread(self._delete_if_stale, key, cutoff)
+
+    def iter_keys(self) -> Iterator[tuple[str, float]]:
+        if not self.root.exists():
+            return
+        for path in self.root.glob("??/??/*"):
+            if path.name.startswith(".tmp-"):
+                continue
+            try:
+                yield path.name, path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+
+
+@lru_cache
+def get_blob_store() -> BlobStore:
+    settings = get_settings()
+    if settings.blob_store_backend == "local":
+        return LocalBlobStore(settings.blob_store_dir)
+
+    raise ValueError(f"Unsupported blob store backend: {settings.blob_store_backend}")
+
+
+async def load_blobs(
+    files: list["File"], blob_store: Optional[BlobStore] = None
+) -> list["File"]:
+    """Fill in File.blob for files whose bytes live in the blob store."""
+    pending = [file for file in files if file.blob is None and file.blob_key]
+    if not pending:
+        return files
+
+    blob_store = blob_store or get_blob_store()
+    contents = await asyncio.gather(*(blob_store.get(f.blob_key) for f in pending))
+    for file, content in zip(pending, contents):
+        file.blob = content
+    return files
+
+
+async def migrate_inline_blobs(
+    session: "AsyncSession", blob_store: BlobStore, batch_size: int
+) -> int:
+    """Move one batch of Files.blob values into the store. Returns rows moved."""
+    rows = (
+        await session.execute(
+            sa.select(Files.id, Files.blob)
+            .where(Files.blob.is_not(None), Files.blob_key.is_(None))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+    ).all()
+
+    for file_id, blob in rows:
+        key = await blob_store.put(blob)
+        await session.execute(
+            sa.update(Files).where(Files.id == file_id).values(blob_key=key, blob=None)
+        )
+
+    return len(rows)
+
+
+async def sweep_orphaned_blobs(
+    session: "AsyncSession",
+    blob_store: BlobStore,
+    grace_seconds: float,
+    batch_size: int = 500,
+) -> int:
+    """Delete stored blobs that no Files row references. Returns blobs deleted."""
+    cutoff = time.time() - grace_seconds
+    deleted = 0
+
+    async def _sweep(keys: list[str]) -> int:
+        referenced = set(
+            (
+                await session.scalars(
+                    sa.select(Files.blob_key).where(Files.blob_key.in_(keys))
+                )
+            ).all()
+        )
+        orphans = [key for key in keys if key not in referenced]
+        swept = 0
+        for key in orphans:
+            if await blob_store.delete_if_stale(key, cutoff):
+                swept += 1
+        return swept
+
+    # Listing touches every blob on disk; keep it off the event loop
+    stored = await asyncio.to_thread(lambda: list(blob_store.iter_keys()))
+
+    batch: list[str] = []
+    for key, mtime in stored:
+        if mtime > cutoff:
+            continue
+        batch.append(key)
+        if len(batch) >= batch_size:
+            deleted += await _sweep(batch)
+            batch = []
+    if batch:
+        deleted += await _sweep(batch)
+
+    if deleted:
+        logger.info(f"Deleted {deleted} orphaned file blobs")
+    return deleted
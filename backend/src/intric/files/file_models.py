@@ -30,15 +30,22 @@ class FileBase(BaseModel):
 class FileBaseWithContent(FileBase):
     text: Optional[str] = None
     blob: Optional[bytes] = None
+    # Set when the bytes live in the blob store; blob is then only filled in
+    # on demand (see intric.files.blob_store.load_blobs)
+    blob_key: Optional[str] = None
     transcription: Optional[str] = None
 
     @model_validator(mode="after")
     def require_one_of_text_or_image(self) -> "FileBaseWithContent":
-        if self.text is None and self.blob is None:
+        if self.text is None and self.blob is None and self.blob_key is None:
             raise ValueError("One of 'text' or 'blob' is required")
 
         return self
 
+    @property
+    def has_content(self) -> bool:
+        return not (self.text is None and self.blob is None and self.blob_key is None)
+
 
 class FileInfo(InDB, FileBase):
     user_id: UUID
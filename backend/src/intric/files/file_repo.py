@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Optional, cast
 from uuid import UUID
 
 import sqlalchemy as sa
@@ -7,18 +7,34 @@ from sqlalchemy.orm import defer
 from intric.database.database import AsyncSession
 from intric.database.repositories.base import BaseRepositoryDelegate
 from intric.database.tables.files_table import Files
+from intric.files.blob_store import BlobStore, get_blob_store
 from intric.files.file_models import File, FileCreate, FileInfo
 
 
 class FileRepository:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, blob_store: Optional[BlobStore] = None):
         self._delegate = BaseRepositoryDelegate(
             session=session, table=Files, in_db_model=File
         )
         self.session = session
+        self._blob_store = blob_store
+
+    @property
+    def blob_store(self) -> BlobStore:
+        if self._blob_store is None:
+            self._blob_store = get_blob_store()
+        return self._blob_store
 
     async def add(self, file: FileCreate) -> File:
-        return cast(File, await self._delegate.add(file))
+        if file.blob is None:
+            return cast(File, await self._delegate.add(file))
+
+        # Binary content goes to the blob store; the row keeps the key
+        blob_key = await self.blob_store.put(file.blob)
+        return cast(
+            File,
+            await self._delegate.add(file, exclude={"blob"}, blob_key=blob_key),
+        )
 
     async def get_list_by_id_and_user(
         self, ids: list[UUID], user_id: UUID, include_transcription: bool = True
@@ -76,7 +92,9 @@ class FileRepository:
         return cast(File, await self._delegate.delete(id))
 
     async def update(self, file: File) -> File:
-        return cast(File, await self._delegate.update(file))
+        # A blob loaded from the store must not be written back into the row
+        exclude = {"blob"} if file.blob_key else set()
+        return cast(File, await self._delegate.update(file, exclude=exclude))
 
     async def get_file_infos(self, ids: list[UUID]) -> list[FileInfo]:
         stmt = (
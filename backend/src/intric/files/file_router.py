@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, Header, Query, Request, Response, Upload
 from fastapi.responses import StreamingResponse
 
 from intric.authentication.signed_urls import generate_signed_token, verify_signed_token
+from intric.files.blob_store import BlobNotFoundError
 from intric.files.file_models import (
     ContentDisposition,
     FilePublic,
@@ -231,10 +232,11 @@ async def download_file_signed(
     file_repo = container.file_repo()
     file = await file_repo.get_by_id(file_id=payload["file_id"])
 
-    if file.text is None and file.blob is None:
+    if not file.has_content:
         raise NotFoundException("File content not found")
 
     content_bytes = None
+    blob_store = file_repo.blob_store
     response_mimetype = file.mimetype
     response_filename = file.name
 
@@ -248,12 +250,27 @@ async def download_file_signed(
             response_filename = f"{filename_without_ext}.txt"
         else:
             response_filename = f"{file.name}.txt"
+    elif file.blob_key:
+        # Streamed from the blob store below, never fully loaded into memory
+        pass
     elif file.blob:
         content_bytes = file.blob
     else:
         return Response(status_code=404, content="File content not found")
 
-    total_size = len(content_bytes)
+    if content_bytes is not None:
+        total_size = len(content_bytes)
+    else:
+        try:
+            total_size = await blob_store.size(file.blob_key)
+        except BlobNotFoundError:
+            raise NotFoundException("File content not found")
+
+    def body(start: int, end: int):
+        if content_bytes is not None:
+            return io.BytesIO(content_bytes[start : end + 1])
+        return blob_store.stream(file.blob_key, start=start, end=end)
+
     headers = {
         "Content-Disposition": f"{content_disposition.value}; filename=\"{response_filename}\"",
         "Accept-Ranges": "bytes",
@@ -265,45 +282,36 @@ async def download_file_signed(
         if file.file_type != FileType.AUDIO:
             raise BadRequestException("Range is only allowed for audio files")
 
-        try:
-            range_match = re.match(r"bytes=(\d+)-(\d*)", range)
-            if range_match:
-                start = int(range_match.group(1))
-                end = (
-                    int(range_match.group(2))
-                    if range_match.group(2)
-                    else total_size - 1
+        range_match = re.match(r"bytes=(\d+)-(\d*)", range)
+        # If range parsing fails, fall back to full content
+        if range_match:
+            start = int(range_match.group(1))
+            end = int(range_match.group(2)) if range_match.group(2) else total_size - 1
+
+            # Validate range
+            if start >= total_size or end >= total_size or start > end:
+                return Response(
+                    status_code=416,  # Range Not Satisfiable
+                    headers={"Content-Range": f"bytes */{total_size}"},
                 )
 
-                # Validate range
-                if start >= total_size or end >= total_size or start > end:
-                    return Response(
-                        status_code=416,  # Range Not Satisfiable
-                        headers={"Content-Range": f"bytes */{total_size}"},
-                    )
-
-                # Create partial response
-                content = io.BytesIO(content_bytes[start : end + 1])
-
-                headers.update(
-                    {
-                        "Content-Range": f"bytes {start}-{end}/{total_size}",
-                        "Content-Length": str(end - start + 1),
-                    }
-                )
+            headers.update(
+                {
+                    "Content-Range": f"bytes {start}-{end}/{total_size}",
+                    "Content-Length": str(end - start + 1),
+                }
+            )
 
-                return StreamingResponse(
-                    content,
-                    status_code=206,  # Partial Content
-                    media_type=response_mimetype,
-                    headers=headers,
-                )
-        except Exception:
-            # If range parsing fails, fall back to full content
-            pass
+            return StreamingResponse(
+                body(start, end),
+                status_code=206,  # Partial Content
+                media_type=response_mimetype,
+                headers=headers,
+            )
 
     # Return full content if range is not specified or invalid
     headers["Content-Length"] = str(total_size)
-    content = io.BytesIO(content_bytes)
 
-    return StreamingResponse(content, media_type=response_mimetype, headers=headers)
+    return StreamingResponse(
+        body(0, total_size - 1), media_type=response_mimetype, headers=headers
+    )
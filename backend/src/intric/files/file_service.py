@@ -119,7 +119,7 @@ class FileService:
         if file.user_id != self.user.id:
             raise UnauthorizedException()
 
-        if file.text is None and file.blob is None:
+        if not file.has_content:
             raise NotFoundException("File content not found")
 
         return file
@@ -132,7 +132,7 @@ class FileService:
         """
         file = await self.repo.get_by_id(file_id=file_id)
 
-        if file.text is None and file.blob is None:
+        if not file.has_content:
             raise NotFoundException("File content not found")
 
         return file
@@ -0,0 +1,60 @@
+import base64
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from intric.main.config import get_settings
+
+if TYPE_CHECKING:
+    from intric.files.file_models import File
+
+
+def _cache_key(file: "File") -> str:
+    # Stored bytes never change, so the content key (or the id, for files
+    # not yet moved to the blob store) identifies the payload
+    return file.blob_key or str(file.id)
+
+
+class EncodedImageCache:
+    """LRU of base64-encoded image payloads, bounded by their total size.
+
+    Images in a conversation are sent to the model again on every turn, so
+    the encoding is done once per image rather than once per message.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._size = 0
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return get_settings().encoded_image_cache_max_bytes
+
+    def encode(self, file: "File") -> str:
+        key = _cache_key(file)
+        encoded = self._entries.get(key)
+        if encoded is not None:
+            self._entries.move_to_end(key)
+            return encoded
+
+        if file.blob is None:
+            raise ValueError(f"Image {file.id} has no content loaded")
+
+        encoded = base64.b64encode(file.blob).decode("utf-8")
+        if len(encoded) <= self.max_bytes:
+            self._entries[key] = encoded
+            self._size += len(encoded)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+        return encoded
+
+    def clear(self):
+        self._entries.clear()
+        self._size = 0
+
+
+encoded_image_cache = EncodedImageCache()
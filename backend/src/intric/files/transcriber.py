@@ -1,5 +1,6 @@
 # MIT License
 
+import asyncio
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
@@ -9,7 +10,9 @@ import sqlalchemy as sa
 from intric.database.tables.model_providers_table import ModelProviders
 from intric.files import audio
 from intric.files.audio import AudioMimeTypes
+from intric.files.blob_store import load_blobs
 from intric.files.file_models import File
+from intric.files.file_size_service import FileSizeService
 from intric.main.config import SETTINGS, Settings
 from intric.main.exceptions import ProviderInactiveException, ProviderNotFoundException
 from intric.main.logging import get_logger
@@ -23,6 +26,7 @@ from intric.transcription_models.infrastructure.adapters.litellm_transcription i
 if TYPE_CHECKING:
     from intric.database.database import AsyncSession
     from intric.files.file_repo import FileRepository
+    from intric.files.transcript_cache_repo import TranscriptCacheRepository
     from intric.settings.encryption_service import EncryptionService
     from intric.tenants.tenant import TenantInDB
     from intric.transcription_models.domain.transcription_model import (
@@ -40,28 +44,36 @@ class Transcriber:
         config: Optional[Settings] = None,
         encryption_service: Optional["EncryptionService"] = None,
         session: Optional["AsyncSession"] = None,
+        transcript_cache_repo: Optional["TranscriptCacheRepository"] = None,
     ):
         self.file_repo = file_repo
+        self.transcript_cache_repo = transcript_cache_repo
         self.tenant = tenant
         self.config = config or SETTINGS
         self.encryption_service = encryption_service
         self.session = session
 
     async def transcribe(self, file: File, transcription_model: "TranscriptionModel"):
-        if file.blob is None or not AudioMimeTypes.has_value(file.mimetype):
+        if (
+            file.blob is None and file.blob_key is None
+        ) or not AudioMimeTypes.has_value(file.mimetype):
             raise ValueError("File needs to be an audio file")
 
         # If file already has a transcription, return it
         if file.transcription:
             return file.transcription
 
+        await load_blobs([file], self.file_repo.blob_store if self.file_repo else None)
+
         try:
             with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
                 temp_file.write(file.blob)
                 temp_file_path = Path(temp_file.name)
 
             result = await self.transcribe_from_filepath(
-                filepath=temp_file_path, transcription_model=transcription_model
+                filepath=temp_file_path,
+                transcription_model=transcription_model,
+                checksum=file.checksum,
             )
 
             # Store the transcription in the file object
@@ -150,9 +162,48 @@ class Transcriber:
         )
 
     async def transcribe_from_filepath(
-        self, *, filepath: Path, transcription_model: "TranscriptionModel"
+        self,
+        *,
+        filepath: Path,
+        transcription_model: "TranscriptionModel",
+        checksum: Optional[str] = None,
     ):
+        """Transcribe an audio file, reusing the tenant's cached transcript if the
+        same recording (by checksum) was already transcribed with this model."""
+        use_cache = self.transcript_cache_repo is not None and self.tenant is not None
+
+        if use_cache:
+            if checksum is None:
+                checksum = await asyncio.to_thread(
+                    FileSizeService.get_file_checksum, filepath
+                )
+            cached = await self.transcript_cache_repo.get(
+                tenant_id=self.tenant.id,
+                checksum=checksum,
+                transcription_model_id=transcription_model.id,
+            )
+            if cached is not None:
+                logger.info(
+                    "Reusing cached transcript",
+                    extra={
+                        "checksum": checksum,
+                        "model_id": str(transcription_model.id),
+                        "tenant_id": str(self.tenant.id),
+                    },
+                )
+                return cached
+
         adapter = await self._get_adapter(transcription_model)
 
         async with audio.to_wav(filepath) as wav_file:
-            return await adapter.get_text_from_file(wav_file)
+            text = await adapter.get_text_from_file(wav_file)
+
+        if use_cache:
+            await self.transcript_cache_repo.add(
+                tenant_id=self.tenant.id,
+                checksum=checksum,
+                transcription_model_id=transcription_model.id,
+                transcript=text,
+            )
+
+        return text
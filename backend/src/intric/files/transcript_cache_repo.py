@@ -0,0 +1,42 @@
+from typing import Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+
+from intric.database.database import AsyncSession
+from intric.database.tables.transcript_cache_table import TranscriptCache
+
+
+class TranscriptCacheRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(
+        self, tenant_id: UUID, checksum: str, transcription_model_id: UUID
+    ) -> Optional[str]:
+        stmt = sa.select(TranscriptCache.transcript).where(
+            TranscriptCache.tenant_id == tenant_id,
+            TranscriptCache.checksum == checksum,
+            TranscriptCache.transcription_model_id == transcription_model_id,
+        )
+        return await self.session.scalar(stmt)
+
+    async def add(
+        self,
+        tenant_id: UUID,
+        checksum: str,
+        transcription_model_id: UUID,
+        transcript: str,
+    ) -> None:
+        stmt = insert(TranscriptCache).values(
+            tenant_id=tenant_id,
+            checksum=checksum,
+            transcription_model_id=transcription_model_id,
+            transcript=transcript,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_transcript_cache_tenant_checksum_model",
+            set_={"transcript": stmt.excluded.transcript, "updated_at": sa.func.now()},
+        )
+        await self.session.execute(stmt)
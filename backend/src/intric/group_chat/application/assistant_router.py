@@ -0,0 +1,199 @@
+# Copyright (c) 2025 Sundsvalls Kommun
+#
+# Licensed under the MIT License.
+"""Embedding-based assistant routing for group chats.
+
+Scores the question against each assistant's name + description by cosine
+similarity, so most questions are routed without a completion call. When
+the best match is weak or too close to the runner-up the router abstains
+and the caller falls back to the LLM selector.
+
+Assistant profile embeddings are cached per process, keyed by embedding
+model, assistant and a hash of the profile text, so renaming an assistant
+or editing its description re-embeds it on the next question.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from intric.main.config import get_settings
+from intric.main.logging import get_logger
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from intric.embedding_models.domain.embedding_model import EmbeddingModel
+    from intric.embedding_models.infrastructure.create_embeddings_service import (
+        CreateEmbeddingsService,
+    )
+    from intric.group_chat.domain.entities.group_chat import GroupChatAssistant
+
+logger = get_logger(__name__)
+
+# Profile embeddings kept per process (LRU)
+PROFILE_CACHE_SIZE = 1024
+
+
+@dataclass
+class RouterMetrics:
+    """Process-wide routing counters, exposed through the sysadmin API."""
+
+    routed: int = 0
+    fallback_ambiguous: int = 0
+    fallback_error: int = 0
+    profile_cache_hits: int = 0
+    profile_cache_misses: int = 0
+    total_latency_ms: float = 0.0
+    decisions: int = 0
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "routed": self.routed,
+            "fallback_ambiguous": self.fallback_ambiguous,
+            "fallback_error": self.fallback_error,
+            "profile_cache_hits": self.profile_cache_hits,
+            "profile_cache_misses": self.profile_cache_misses,
+            "avg_latency_ms": (
+                self.total_latency_ms / self.decisions if self.decisions else 0.0
+            ),
+        }
+
+
+router_metrics = RouterMetrics()
+
+
+@dataclass
+class RoutingDecision:
+    assistant: Optional["GroupChatAssistant"]
+    scores: list[float] = field(default_factory=list)
+
+    @property
+    def confident(self) -> bool:
+        return self.assistant is not None
+
+
+_profile_cache: "OrderedDict[tuple[UUID, UUID, str], np.ndarray]" = OrderedDict()
+
+
+def assistant_profile(assistant: "GroupChatAssistant") -> str:
+    description = assistant.user_description or assistant.assistant.description or ""
+    return f"{assistant.assistant.name}: {description}".strip()
+
+
+def _normalize(vector) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
+
+
+def clear_profile_cache() -> None:
+    _profile_cache.clear()
+
+
+class AssistantRouter:
+    def __init__(
+        self,
+        create_embeddings_service: "CreateEmbeddingsService",
+        min_similarity: Optional[float] = None,
+        min_margin: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.create_embeddings_service = create_embeddings_service
+        self.min_similarity = (
+            min_similarity
+            if min_similarity is not None
+            else settings.group_chat_router_min_similarity
+        )
+        self.min_margin = (
+            min_margin
+            if min_margin is not None
+            else settings.group_chat_router_min_margin
+        )
+
+    async def _profile_embeddings(
+        self,
+        assistants: list["GroupChatAssistant"],
+        embedding_model: "EmbeddingModel",
+    ) -> np.ndarray:
+        keys = []
+        for assistant in assistants:
+            profile_hash = hashlib.sha1(
+                assistant_profile(assistant).encode()
+            ).hexdigest()
+            keys.append((embedding_model.id, assistant.assistant.id, profile_hash))
+
+        missing = [
+            (key, assistant)
+            for key, assistant in zip(keys, assistants)
+            if key not in _profile_cache
+        ]
+        router_metrics.profile_cache_hits += len(assistants) - len(missing)
+        router_metrics.profile_cache_misses += len(missing)
+
+        if missing:
+            vectors = await asyncio.gather(
+                *(
+                    self.create_embeddings_service.get_embedding_for_query(
+                        model=embedding_model, query=assistant_profile(assistant)
+                    )
+                    for _, assistant in missing
+                )
+            )
+            for (key, _), vector in zip(missing, vectors):
+                _profile_cache[key] = _normalize(vector)
+                while len(_profile_cache) > PROFILE_CACHE_SIZE:
+                    _profile_cache.popitem(last=False)
+
+        for key in keys:
+            _profile_cache.move_to_end(key)
+        return np.stack([_profile_cache[key] for key in keys])
+
+    async def route(
+        self,
+        question: str,
+        assistants: list["GroupChatAssistant"],
+        embedding_model: "EmbeddingModel",
+    ) -> RoutingDecision:
+        """Pick an assistant by similarity, or abstain when the scores are ambiguous.
+
+        Embedding failures are logged and reported as an abstention so the
+        caller can fall back to the LLM selector.
+        """
+        start = time.perf_counter()
+        try:
+            profiles, question_vector = await asyncio.gather(
+                self._profile_embeddings(assistants, embedding_model),
+                self.create_embeddings_service.get_embedding_for_query(
+                    model=embedding_model, query=question
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"Group chat router could not embed, falling back: {e}")
+            router_metrics.fallback_error += 1
+            return RoutingDecision(assistant=None)
+        finally:
+            router_metrics.decisions += 1
+            router_metrics.total_latency_ms += (time.perf_counter() - start) * 1000
+
+        scores = profiles @ _normalize(question_vector)
+        ranked = np.argsort(scores)[::-1]
+        top = float(scores[ranked[0]])
+        runner_up = float(scores[ranked[1]]) if len(ranked) > 1 else -1.0
+
+        if top < self.min_similarity or top - runner_up < self.min_margin:
+            router_metrics.fallback_ambiguous += 1
+            logger.debug(
+                f"Group chat router abstained (top={top:.3f}, runner_up={runner_up:.3f})"
+            )
+            return RoutingDecision(assistant=None, scores=scores.tolist())
+
+        router_metrics.routed += 1
+        return RoutingDecision(
+            assistant=assistants[int(ranked[0])], scores=scores.tolist()
+        )
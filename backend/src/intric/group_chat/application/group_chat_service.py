@@ -9,11 +9,13 @@ from typing import TYPE_CHECKING, Optional, Union
 from intric.ai_models.completion_models.completion_model import Completion, ResponseType
 from intric.assistants.api.assistant_models import AssistantResponse
 from intric.completion_models.infrastructure.context_builder import count_tokens
+from intric.group_chat.application.assistant_router import AssistantRouter
 from intric.group_chat.domain.entities.group_chat import (
     GroupChat,
     GroupChatAssistant,
     GroupChatAssistantData,
 )
+from intric.main.config import get_settings
 from intric.main.exceptions import BadRequestException, UnauthorizedException
 from intric.main.models import NOT_PROVIDED, NotProvided
 from intric.questions.question import ToolAssistant, UseTools
@@ -27,6 +29,10 @@ if TYPE_CHECKING:
     from intric.completion_models.infrastructure.completion_service import (
         CompletionService,
     )
+    from intric.embedding_models.domain.embedding_model import EmbeddingModel
+    from intric.embedding_models.infrastructure.create_embeddings_service import (
+        CreateEmbeddingsService,
+    )
     from intric.sessions.session import SessionInDB
     from intric.sessions.session_service import SessionService
     from intric.spaces.space_repo import SpaceRepository
@@ -51,6 +57,7 @@ class GroupChatService:
         assistant_service: "AssistantService",
         session_service: "SessionService",
         completion_service: "CompletionService",
+        create_embeddings_service: Optional["CreateEmbeddingsService"] = None,
     ):
         self.user = user
         self.space_service = space_service
@@ -59,6 +66,11 @@ class GroupChatService:
         self.assistant_service = assistant_service
         self.session_service = session_service
         self.completion_service = completion_service
+        self.assistant_router = (
+            AssistantRouter(create_embeddings_service)
+            if create_embeddings_service is not None
+            else None
+        )
 
     async def create_group_chat(self, space_id: "UUID", name: str) -> "GroupChat":
         space = await self.space_service.get_space(id=space_id)
@@ -146,6 +158,10 @@ class GroupChatService:
         self,
         group_chat_id: "UUID",
     ) -> "GroupChat":
+        _, group_chat = await self._get_space_and_group_chat(group_chat_id=group_chat_id)
+        return group_chat
+
+    async def _get_space_and_group_chat(self, group_chat_id: "UUID"):
         space = await self.space_service.get_space_by_group_chat(group_chat_id=group_chat_id)
         actor = self.actor_manager.get_space_actor_from_space(space)
         group_chat = space.get_group_chat(group_chat_id=group_chat_id)
@@ -155,7 +171,7 @@ class GroupChatService:
 
         group_chat.permissions = actor.get_group_chat_permissions(group_chat=group_chat)
 
-        return group_chat
+        return space, group_chat
 
     async def _find_suitable_completion_model(self, assistants: list[GroupChatAssistant]):
         """Return the completion model of the first assistant in the list"""
@@ -222,8 +238,13 @@ class GroupChatService:
         question: str,
         assistants: list[GroupChatAssistant],
         session: Optional["SessionInDB"] = None,
+        embedding_model: Optional["EmbeddingModel"] = None,
     ) -> GroupChatAssistantSelectionResult:
-        """Select the most appropriate assistant using a completion model to analyze the question"""
+        """Select the most appropriate assistant for the question.
+
+        Tries the embedding router first and only asks the completion model
+        when the router cannot tell the assistants apart.
+        """
 
         # if no assistants, no need for completion model
         if not assistants:
@@ -236,6 +257,21 @@ class GroupChatService:
                 assistant_selector_tokens=0,
             )
 
+        if (
+            self.assistant_router is not None
+            and embedding_model is not None
+            and get_settings().group_chat_embedding_router
+        ):
+            decision = await self.assistant_router.route(
+                question=question, assistants=assistants, embedding_model=embedding_model
+            )
+            if decision.confident:
+                return GroupChatAssistantSelectionResult(
+                    assistant=decision.assistant,
+                    response_str="",
+                    assistant_selector_tokens=0,
+                )
+
         completion_model = await self._find_suitable_completion_model(assistants)
 
         # create the prompt for assistant selection
@@ -268,6 +304,13 @@ class GroupChatService:
                 assistant_selector_tokens=assistant_selector_tokens,
             )
 
+    def _router_embedding_model(self, space) -> Optional["EmbeddingModel"]:
+        """Embedding model for routing; None (LLM selector only) if the space has none."""
+        try:
+            return space.get_default_embedding_model()
+        except BadRequestException:
+            return None
+
     async def _handle_response(
         self,
         response: str,
@@ -349,7 +392,7 @@ class GroupChatService:
         the question will be directed to the specified assistant. Otherwise, the most
         appropriate assistant will be selected based on the question.
         """
-        group_chat = await self.get_group_chat(group_chat_id=group_chat_id)
+        space, group_chat = await self._get_space_and_group_chat(group_chat_id=group_chat_id)
         response_from_selector = None
         if not group_chat.assistants:
             raise BadRequestException("No assistants in the group chat")
@@ -362,7 +405,13 @@ class GroupChatService:
             )
             session_id = session.id
         else:
-            session = await self.session_service.get_session_by_uuid(id=session_id)
+            session = await self.session_service.get_session_for_chat(
+                id=session_id,
+                max_tokens=max(
+                    assistant.assistant.completion_model.token_limit
+                    for assistant in group_chat.assistants
+                ),
+            )
 
         selection_result = None
         if tool_assistant_id is not None:
@@ -383,7 +432,10 @@ class GroupChatService:
             # select the best assistant based on the question using the completion model
             # including conversation history
             selection_result = await self._select_assistant_with_completion_model(
-                question, group_chat.assistants, session
+                question,
+                group_chat.assistants,
+                session,
+                embedding_model=self._router_embedding_model(space),
             )
             response_from_selector = selection_result.response_str
             if selection_result.assistant:
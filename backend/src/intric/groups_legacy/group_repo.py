@@ -68,9 +68,26 @@ class GroupRepository:
 
         return await self.session.scalar(stmt)
 
-    async def delete_group_by_id(self, group_id: UUID) -> int:
+    async def mark_group_deleting(self, group_id: UUID) -> int:
+        """Detach the group from its spaces, assistants and services and mark it deleting.
+
+        Its info blobs and chunks are deleted by the worker (see
+        info_blobs/knowledge_deletion.py).
+        """
+        await self.session.execute(
+            sa.delete(GroupsSpaces).where(GroupsSpaces.collection_id == group_id)
+        )
+        await self.session.execute(
+            sa.delete(AssistantsGroups).where(AssistantsGroups.group_id == group_id)
+        )
+        await self.session.execute(
+            sa.delete(ServicesGroups).where(ServicesGroups.group_id == group_id)
+        )
+
         result = await self.session.execute(
-            sa.delete(CollectionsTable).where(CollectionsTable.id == group_id)
+            sa.update(CollectionsTable)
+            .where(CollectionsTable.id == group_id)
+            .values(space_id=None, deleting_at=sa.func.now())
         )
         return result.rowcount
 
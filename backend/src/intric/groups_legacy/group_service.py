@@ -12,6 +12,9 @@ from intric.groups_legacy.api.group_models import (
 )
 from intric.groups_legacy.group_repo import GroupRepository
 from intric.info_blobs.info_blob_repo import InfoBlobRepository
+from intric.jobs.job_manager import job_manager
+from intric.jobs.job_models import Task
+from intric.jobs.task_models import KnowledgeTask
 from intric.main.exceptions import BadRequestException, UnauthorizedException
 from intric.roles.permissions import Permission, validate_permissions
 from intric.spaces.space_service import SpaceService
@@ -186,9 +189,15 @@ class GroupService:
 
         count = await self.get_count_for_group(group)
 
-        group_in_db = await self.repo.delete_group_by_id(group.id)
+        # Detaches and hides the collection; the worker deletes its contents in batches
+        await self.repo.mark_group_deleting(group.id)
+        await job_manager.enqueue(
+            Task.DELETE_KNOWLEDGE,
+            group.id,
+            KnowledgeTask(user_id=self.user.id, group_id=group.id),
+        )
 
-        return group_in_db, count
+        return group, count
 
     async def get_count_for_group(self, group: Group):
         return await self.info_blob_repo.get_count_of_group(group.id)
@@ -117,6 +117,9 @@ class InfoBlobChunk(BaseModel):
     chunk_no: int
     info_blob_id: UUID
     tenant_id: UUID
+    start_offset: Optional[int] = None
+    end_offset: Optional[int] = None
+    token_count: Optional[int] = None
 
 
 class InfoBlobChunkWithEmbedding(InfoBlobChunk):
@@ -105,7 +105,7 @@ class InfoBlobChunkRepo:
 
         chunks_with_score = [
             InfoBlobChunkInDBWithScore(
-                **chunk[0].to_dict(exclude="embedding"),
+                **chunk[0].to_dict(exclude=("embedding", "shadow_embedding")),
                 score=1 - chunk[1],
                 info_blob_title=chunk[2],
             )
@@ -114,6 +114,50 @@ class InfoBlobChunkRepo:
 
         return chunks_with_score
 
+    async def get_neighbors(
+        self, chunks: list[InfoBlobChunkInDBWithScore], radius: int
+    ) -> list[InfoBlobChunkInDBWithScore]:
+        """The chunks up to radius positions before and after the given ones.
+
+        Chunks already given are left out. A neighbor gets the score of the
+        first given chunk it neighbors, and they are returned in that order.
+        """
+        given = {(chunk.info_blob_id, chunk.chunk_no) for chunk in chunks}
+        wanted = {}
+        for chunk in chunks:
+            for distance in range(1, radius + 1):
+                for chunk_no in (chunk.chunk_no - distance, chunk.chunk_no + distance):
+                    key = (chunk.info_blob_id, chunk_no)
+                    if chunk_no >= 0 and key not in given and key not in wanted:
+                        wanted[key] = chunk
+
+        if not wanted:
+            return []
+
+        # One lookup on the (info_blob_id, chunk_no) index
+        stmt = (
+            sa.select(InfoBlobChunks, InfoBlobs.title)
+            .join(InfoBlobs)
+            .options(defer(InfoBlobChunks.embedding))
+            .where(
+                sa.tuple_(InfoBlobChunks.info_blob_id, InfoBlobChunks.chunk_no).in_(
+                    list(wanted)
+                )
+            )
+        )
+        rows = await self.session.execute(stmt)
+        found = {(row[0].info_blob_id, row[0].chunk_no): row for row in rows}
+
+        return [
+            InfoBlobChunkInDBWithScore(
+                **found[key][0].to_dict(exclude=("embedding", "shadow_embedding")),
+                score=hit.score,
+                info_blob_title=found[key][1],
+            )
+            for key, hit in wanted.items()
+            if key in found
+        ]
+
     async def keyword_search(
         self,
         search_string: str,
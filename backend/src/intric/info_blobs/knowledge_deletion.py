@@ -0,0 +1,160 @@
+"""Background deletion of websites and collections.
+
+Deleting a source with hundreds of thousands of chunks in one statement, by
+cascading from the source row, holds locks and a connection for minutes. The
+API instead detaches the source from its spaces, assistants and services and
+sets its deleting_at, which hides it at once. The worker then deletes its
+chunks, then its info blobs, then the source row, in bounded batches that
+each commit on their own. Every batch subtracts what it freed from the info
+blobs' and the source's size, so usage reflects what is left.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from intric.database.tables.collections_table import CollectionsTable
+from intric.database.tables.info_blob_chunk_table import InfoBlobChunks
+from intric.database.tables.info_blobs_table import InfoBlobs
+from intric.database.tables.websites_table import Websites
+
+if TYPE_CHECKING:
+    from intric.database.database import AsyncSession
+
+
+@dataclass
+class DeletionBatch:
+    chunks: int = 0
+    info_blobs: int = 0
+    # The source row is gone
+    done: bool = False
+
+
+def _source(website_id: Optional[UUID], group_id: Optional[UUID]):
+    if website_id is not None:
+        return Websites, InfoBlobs.website_id, website_id
+    return CollectionsTable, InfoBlobs.group_id, group_id
+
+
+async def _shrink(session: "AsyncSession", table, source_id: UUID, freed: int):
+    # Also bumps updated_at, which tells the resuming cron the deletion is alive
+    await session.execute(
+        sa.update(table)
+        .where(table.id == source_id)
+        .values(size=sa.func.greatest(table.size - freed, 0))
+    )
+
+
+async def delete_source_batch(
+    session: "AsyncSession",
+    *,
+    website_id: Optional[UUID] = None,
+    group_id: Optional[UUID] = None,
+    batch_size: int,
+) -> Optional[DeletionBatch]:
+    """Delete the next batch of a source marked deleting.
+
+    Returns None if the source is gone or not marked deleting.
+    """
+    table, info_blob_column, source_id = _source(website_id, group_id)
+
+    marked = await session.scalar(
+        sa.select(table.id).where(table.id == source_id, table.deleting_at.is_not(None))
+    )
+    if marked is None:
+        return None
+
+    info_blob_ids = sa.select(InfoBlobs.id).where(info_blob_column == source_id)
+
+    # Chunks first, so that no statement cascades into more than a batch
+    chunk_ids = (
+        sa.select(InfoBlobChunks.id)
+        .where(InfoBlobChunks.info_blob_id.in_(info_blob_ids))
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    deleted_chunks = (
+        await session.execute(
+            sa.delete(InfoBlobChunks)
+            .where(InfoBlobChunks.id.in_(chunk_ids))
+            .returning(InfoBlobChunks.info_blob_id, InfoBlobChunks.size)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+
+    if deleted_chunks:
+        freed: dict[UUID, int] = defaultdict(int)
+        for info_blob_id, size in deleted_chunks:
+            freed[info_blob_id] += size
+
+        info_blobs = InfoBlobs.__table__
+        await session.execute(
+            info_blobs.update()
+            .where(info_blobs.c.id == sa.bindparam("info_blob_id"))
+            .values(
+                size=sa.func.greatest(info_blobs.c.size - sa.bindparam("freed"), 0)
+            ),
+            [
+                {"info_blob_id": info_blob_id, "freed": size}
+                for info_blob_id, size in freed.items()
+            ],
+        )
+        await _shrink(session, table, source_id, sum(freed.values()))
+
+        return DeletionBatch(chunks=len(deleted_chunks))
+
+    deleted_sizes = (
+        await session.scalars(
+            sa.delete(InfoBlobs)
+            .where(
+                InfoBlobs.id.in_(
+                    info_blob_ids.limit(batch_size).with_for_update(skip_locked=True)
+                )
+            )
+            .returning(InfoBlobs.size)
+            .execution_options(synchronize_session=False)
+        )
+    ).all()
+
+    if deleted_sizes:
+        await _shrink(
+            session, table, source_id, sum(size or 0 for size in deleted_sizes)
+        )
+
+        return DeletionBatch(info_blobs=len(deleted_sizes))
+
+    # Info blobs locked by another run (or an unfinished crawl) are left to it
+    if await session.scalar(sa.select(info_blob_ids.exists())):
+        await _shrink(session, table, source_id, 0)
+        return DeletionBatch()
+
+    await session.execute(sa.delete(table).where(table.id == source_id))
+
+    return DeletionBatch(done=True)
+
+
+async def get_stalled_deletions(
+    session: "AsyncSession", idle_seconds: float
+) -> list[tuple[Optional[UUID], Optional[UUID]]]:
+    """(website_id, group_id) of sources marked deleting that no run advanced lately."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=idle_seconds)
+
+    website_ids = await session.scalars(
+        sa.select(Websites.id).where(
+            Websites.deleting_at.is_not(None), Websites.updated_at < cutoff
+        )
+    )
+    group_ids = await session.scalars(
+        sa.select(CollectionsTable.id).where(
+            CollectionsTable.deleting_at.is_not(None),
+            CollectionsTable.updated_at < cutoff,
+        )
+    )
+
+    return [(website_id, None) for website_id in website_ids] + [
+        (None, group_id) for group_id in group_ids
+    ]
@@ -50,3 +50,7 @@ class AnalyzeConversationInsightsTask(TaskParams):
     include_followups: bool = False
     assistant_id: UUID | None = None
     group_chat_id: UUID | None = None
+
+
+class ReembedKnowledgeTask(TaskParams):
+    migration_id: UUID
@@ -189,6 +189,14 @@ class Settings(BaseSettings):
     crawl_feeder_interval_seconds: int = 10  # How often feeder checks for work
     crawl_feeder_batch_size: int = 10  # Max jobs to enqueue per cycle per tenant
 
+    # Crawl scheduler (spreads scheduled crawls over the day)
+    crawl_scheduler_min_per_tick: int = 20  # Crawls released per hourly tick at least
+    crawl_scheduler_capacity_headroom: float = (
+        1.5  # Release up to this times the crawls finished per hour over the last day
+    )
+    crawl_quiet_hours_start: int = 0  # UTC hour quiet hours start (= end: none)
+    crawl_quiet_hours_end: int = 0  # UTC hour quiet hours end, exclusive
+
     # Orphaned crawl run cleanup (prevents "Crawl already in progress" blocking)
     orphan_crawl_run_timeout_hours: int = (
         12  # Must be > crawl_max_length (10h) to avoid killing valid long crawls
@@ -260,6 +268,15 @@ class Settings(BaseSettings):
     # Temporary directory for file uploads
     upload_tmp_dir: Path = Path("/tmp")
 
+    # File bytes (images, audio) are stored outside Postgres, keyed by content
+    # hash. blob_store_dir must be persistent and shared by API and worker
+    blob_store_backend: str = "local"
+    blob_store_dir: Path = Path("data/blobs")
+    blob_store_migration_batch_size: int = 200  # Files.blob rows moved per batch
+    blob_store_orphan_grace_hours: int = 1  # Unreferenced blobs kept this long
+    # Base64 payloads of chat images are cached per process, up to this size
+    encoded_image_cache_max_bytes: int = 64 * 1024 * 1024
+
     # Azure models
     using_azure_models: bool = False
     azure_api_key: Optional[str] = None
@@ -275,6 +292,82 @@ class Settings(BaseSettings):
     # Controls parallelism during page batch persistence to avoid overwhelming embedding APIs
     crawl_embedding_concurrency: int = 3
 
+    # Worker processes converting crawled HTML to markdown, shared by all crawls
+    # in the worker process. 0 parses in a thread instead (no extra processes)
+    crawl_parse_workers: int = 2
+
+    # MCP connections are pooled per process and reused across chat requests,
+    # keyed by tenant + server. Idle connections are closed after the timeout
+    mcp_pool_max_connections_per_server: int = 4
+    mcp_pool_idle_timeout_seconds: int = 300
+    mcp_pool_health_check_interval_seconds: int = 60  # Ping before reusing
+    mcp_tool_cache_ttl_seconds: int = 300  # Cached tools/list responses
+
+    # Completion and embedding calls share keep-alive HTTP connections per
+    # process, keyed by provider + endpoint, instead of LiteLLM's own clients
+    provider_http_pool_enabled: bool = True
+    provider_http_pool_size: int = 100  # Open connections per endpoint
+    provider_http_keepalive_seconds: int = 60  # Idle connections are closed after
+
+    # Re-embedding a knowledge source with another model embeds this many
+    # chunks per batch, pausing between batches to stay under provider rate
+    # limits. Runs idle this long (worker restart, provider errors) are resumed
+    reembedding_batch_size: int = 128
+    reembedding_batch_pause_seconds: float = 1.0
+    reembedding_resume_after_seconds: int = 300
+
+    # Deleted websites and collections are hidden at once and their chunks and
+    # info blobs deleted by the worker in batches of this many rows, pausing
+    # between batches to spare the database and its replicas. Deletions idle
+    # this long (worker restart) are resumed
+    knowledge_deletion_batch_size: int = 2000
+    knowledge_deletion_batch_pause_seconds: float = 0.2
+    knowledge_deletion_resume_after_seconds: int = 300
+
+    # Group chats route questions by embedding similarity to assistant
+    # descriptions; the LLM selector is only used when the match is ambiguous
+    group_chat_embedding_router: bool = True
+    group_chat_router_min_similarity: float = 0.25
+    group_chat_router_min_margin: float = 0.05
+
+    # Audio is transcribed in 5-minute segments; this many run concurrently
+    transcription_max_concurrent_segments: int = 4
+
+    # Insight map-phase summaries are cached per day of questions and pruned
+    # once unused for this many days
+    analysis_chunk_summary_retention_days: int = 30
+
+    # Usage dashboards read daily token usage rollups kept current by a worker
+    # job; history is rolled up this many days per run until fully covered
+    token_usage_rollup_backfill_days_per_run: int = 31
+
+    # Audit logs are partitioned by month; partitions are created this many
+    # months ahead so inserts never lack one
+    audit_log_partition_months_ahead: int = 3
+
+    # Prometheus metrics: the API serves them at /metrics to the super API key,
+    # the worker from its own HTTP server on this internal port (0 disables it)
+    metrics_enabled: bool = True
+    worker_metrics_port: int = 9091
+
+    # Completions wait for a slot while their tenant or provider is at a limit,
+    # admitted fairly across tenants and chat before background jobs (0 = no
+    # limit). A provider's config can set max_concurrent_completions and
+    # completion_tokens_per_minute for itself.
+    completion_tenant_concurrency_limit: int = 0
+    completion_provider_concurrency_limit: int = 0
+    completion_tenant_tokens_per_minute: int = 0
+    completion_provider_tokens_per_minute: int = 0
+    # Share of a provider's concurrency that background jobs may take
+    completion_background_share: float = 0.5
+    completion_admission_timeout_seconds: int = 60
+    # Slots of processes that die mid-completion expire after this long
+    completion_admission_slot_ttl_seconds: int = 900
+
+    # Assistant knowledge retrieval adds this many chunks on each side of every
+    # hit, so answers see the text around it (0 disables)
+    context_neighbor_chunks: int = 0
+
     # Security
     api_prefix: str
     api_key_length: int
@@ -59,6 +59,7 @@ from intric.completion_models.domain import CompletionModelRepository
 from intric.completion_models.domain.completion_model_service import (
     CompletionModelService,
 )
+from intric.completion_models.infrastructure.admission import CompletionAdmission
 from intric.completion_models.infrastructure.completion_service import CompletionService
 from intric.completion_models.infrastructure.context_builder import ContextBuilder
 from intric.completion_models.presentation import CompletionModelAssembler
@@ -68,6 +69,9 @@ from intric.data_retention.infrastructure.data_retention_service import (
     DataRetentionService,
 )
 from intric.database.database import AsyncSession
+from intric.embedding_models.application.embedding_migration_service import (
+    EmbeddingMigrationService,
+)
 from intric.embedding_models.application.embedding_model_crud_service import (
     EmbeddingModelCRUDService,
 )
@@ -83,6 +87,7 @@ from intric.files.file_size_service import FileSizeService
 from intric.files.image import ImageExtractor
 from intric.files.text import TextExtractor
 from intric.files.transcriber import Transcriber
+from intric.files.transcript_cache_repo import TranscriptCacheRepository
 from intric.group_chat.application.group_chat_service import GroupChatService
 from intric.group_chat.presentation.assemblers.group_chat_assembler import (
     GroupChatAssembler,
@@ -333,7 +338,7 @@ from intric.worker.tenant_concurrency import TenantConcurrencyLimiter
 from intric.workflows.step_repo import StepRepository
 from intric.main.config import get_settings
 from intric.main.logging import get_logger
-from intric.redis.connection import build_redis_pool_kwargs
+from intric.redis.connection import InstrumentedRedis, build_redis_pool_kwargs
 
 _logger = get_logger(__name__)
 
@@ -343,7 +348,14 @@ def _create_redis_client() -> aioredis.Redis:
     url = f"redis://{settings.redis_host}:{settings.redis_port}"
     kwargs = build_redis_pool_kwargs(settings, decode_responses=False)
 
-    return aioredis.Redis.from_url(url, **kwargs)
+    return InstrumentedRedis.from_url(url, **kwargs)
+
+
+def _build_completion_admission(redis_client: aioredis.Redis) -> CompletionAdmission:
+    return CompletionAdmission(
+        redis_client,
+        slot_ttl_seconds=get_settings().completion_admission_slot_ttl_seconds,
+    )
 
 
 def _build_tenant_limiter(redis_client: aioredis.Redis) -> TenantConcurrencyLimiter:
@@ -454,6 +466,10 @@ class Container(containers.DeclarativeContainer):
     tenant_concurrency_limiter = providers.Factory(
         _build_tenant_limiter, redis_client=redis_client
     )
+    # One per process, it holds the queue of completions waiting for a slot
+    completion_admission = providers.Singleton(
+        _build_completion_admission, redis_client=redis_client
+    )
 
     # Factories
     prompt_factory = providers.Factory(PromptFactory)
@@ -649,6 +665,9 @@ class Container(containers.DeclarativeContainer):
     session_repo = providers.Factory(SessionRepository, session=session)
     question_repo = providers.Factory(QuestionRepository, session=session)
     file_repo = providers.Factory(FileRepository, session=session)
+    transcript_cache_repo = providers.Factory(
+        TranscriptCacheRepository, session=session
+    )
     crawl_run_repo = providers.Factory(CrawlRunRepository, session=session)
 
     storage_repo = providers.Factory(
@@ -723,6 +742,7 @@ class Container(containers.DeclarativeContainer):
         config=config,
         encryption_service=encryption_service,
         session=session,
+        admission=completion_admission,
     )
 
     # Datastore
@@ -773,6 +793,13 @@ class Container(containers.DeclarativeContainer):
         embedding_model_repo=embedding_model_repo2,
         security_classification_repo=security_classification_repo,
     )
+    embedding_migration_service = providers.Factory(
+        EmbeddingMigrationService,
+        user=user,
+        session=session,
+        embedding_model_repo=embedding_model_repo2,
+        space_repo=space_repo,
+    )
     completion_model_service = providers.Factory(
         CompletionModelService,
         completion_model_repo=completion_model_repo2,
@@ -1029,6 +1056,7 @@ class Container(containers.DeclarativeContainer):
         assistant_service=assistant_service,
         session_service=session_service,
         completion_service=completion_service,
+        create_embeddings_service=create_embeddings_service,
     )
     app_template_service = providers.Factory(
         AppTemplateService,
@@ -1318,6 +1346,7 @@ class Container(containers.DeclarativeContainer):
         config=config,
         encryption_service=encryption_service,
         session=session,
+        transcript_cache_repo=transcript_cache_repo,
     )
     crawler = providers.Factory(Crawler)
 
@@ -44,6 +44,7 @@ class ErrorCodes(int, Enum):
     # Provider errors
     PROVIDER_INACTIVE = 9031
     PROVIDER_NOT_FOUND = 9032
+    COMPLETION_CAPACITY = 9033
 
 
 class NotFoundException(Exception):
@@ -203,6 +204,12 @@ class ProviderNotFoundException(Exception):
     pass
 
 
+class CompletionCapacityException(Exception):
+    """Raised when a completion waited too long for its tenant's or provider's budget."""
+
+    pass
+
+
 # Map exceptions to response codes
 # Set message to None to use the internal message
 # Set error codes in the range 9000 - 9999
@@ -258,4 +265,5 @@ EXCEPTION_MAP = {
     # Provider errors - use None to pass through the exception's own message
     ProviderInactiveException: (503, None, ErrorCodes.PROVIDER_INACTIVE),
     ProviderNotFoundException: (404, None, ErrorCodes.PROVIDER_NOT_FOUND),
+    CompletionCapacityException: (429, None, ErrorCodes.COMPLETION_CAPACITY),
 }
@@ -1,9 +1,14 @@
+import atexit
+import copy
 import json
 import logging
 import os
+import queue
 import sys
+import threading
 from datetime import datetime, timezone
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
 from intric.main.config import get_loglevel
 from intric.main.request_context import get_request_context
@@ -11,6 +16,19 @@ from intric.main.request_context import get_request_context
 
 JSON_LOGS_ENABLED = os.getenv("JSON_LOGS", "true").lower() in {"1", "true", "yes", "on"}
 
+# Records are formatted and written by a background thread, so logging never
+# blocks the event loop on stdout. Records are dropped, and counted, when the
+# queue is full.
+LOG_QUEUE_ENABLED = os.getenv("LOG_QUEUE", "true").lower() in {"1", "true", "yes", "on"}
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# At most this many INFO and DEBUG records per call site and interval, the
+# rest are dropped and counted (0 disables)
+LOG_RATE_LIMIT = int(os.getenv("LOG_RATE_LIMIT", "20"))
+LOG_RATE_LIMIT_INTERVAL_SECONDS = float(
+    os.getenv("LOG_RATE_LIMIT_INTERVAL_SECONDS", "1")
+)
+
 
 class ContextJSONFormatter(logging.Formatter):
     """Serialize log records with request context into JSON."""
@@ -47,6 +65,17 @@ class ContextJSONFormatter(logging.Formatter):
         "status_code",
     )
 
+    @staticmethod
+    def _resolve(value: Any) -> Any:
+        # Extra values can be zero-argument callables, only called for records
+        # that are actually written
+        if not callable(value):
+            return value
+        try:
+            return value()
+        except Exception as exc:
+            return f"<failed to compute: {exc!r}>"
+
     def format(
         self, record: logging.LogRecord
     ) -> str:  # pragma: no cover - formatting logic
@@ -59,8 +88,12 @@ class ContextJSONFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
 
-        # Attach request context values (correlation, tenant, etc.)
-        for key, value in get_request_context().items():
+        # Attach request context values (correlation, tenant, etc.), as
+        # captured when the record was queued if it was
+        request_context = getattr(record, "_request_context", None)
+        if request_context is None:
+            request_context = get_request_context()
+        for key, value in request_context.items():
             if value is not None and key not in log:
                 log[key] = value
 
@@ -68,6 +101,7 @@ class ContextJSONFormatter(logging.Formatter):
         for key, value in record.__dict__.items():
             if key in self.RESERVED_ATTRS or key.startswith("_"):
                 continue
+            value = self._resolve(value)
             if value is None:
                 continue
             log.setdefault(key, value)
@@ -108,6 +142,115 @@ for logger_name in sqlalchemy_loggers:
     sa_logger.propagate = False  # Don't propagate to root logger
 
 
+class RateLimitFilter(logging.Filter):
+    """Let through at most `limit` records per call site and interval.
+
+    Only records below WARNING are limited. The first record let through
+    from a call site after some were dropped carries their number as
+    `suppressed`.
+    """
+
+    def __init__(self, limit: int, interval_seconds: float):
+        super().__init__()
+        self.limit = limit
+        self.interval_seconds = interval_seconds
+        # (path, line) -> [window start, records let through, records dropped]
+        self._windows: dict[tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit <= 0 or record.levelno >= logging.WARNING:
+            return True
+
+        site = (record.pathname, record.lineno)
+        with self._lock:
+            window = self._windows.get(site)
+            if window is None or record.created - window[0] >= self.interval_seconds:
+                if window is not None and window[2]:
+                    record.suppressed = window[2]
+                window = self._windows[site] = [record.created, 0, 0]
+
+            if window[1] >= self.limit:
+                window[2] += 1
+                return False
+
+            window[1] += 1
+            return True
+
+
+class _LogQueue:
+    """The queue shared by all loggers and the thread writing it to stdout.
+
+    Started on first use, and again in a forked child, which does not
+    inherit the thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: Optional[queue.Queue] = None
+        self._listener: Optional[QueueListener] = None
+        self.dropped = 0
+
+    def _start(self):
+        handler = logging.StreamHandler(sys.stdout)
+        if JSON_LOGS_ENABLED:
+            handler.setFormatter(ContextJSONFormatter())
+        else:
+            handler.setFormatter(logging.Formatter(SimpleLogger.FORMAT_STRING))
+
+        self._queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._listener = QueueListener(self._queue, handler)
+        self._listener.start()
+        self._pid = os.getpid()
+        self.dropped = 0
+
+    def put(self, record: logging.LogRecord):
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._start()
+
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self):
+        """Write out the queued records, at exit."""
+        if self._pid != os.getpid():
+            return
+        try:
+            self._listener.stop()
+        except queue.Full:
+            # No room for the stop sentinel, the remaining records are lost
+            pass
+
+
+_log_queue = _LogQueue()
+atexit.register(_log_queue.stop)
+
+
+class _ContextQueueHandler(QueueHandler):
+    def __init__(self):
+        super().__init__(queue=None)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only the message is rendered here, the record is formatted on the
+        # writer thread. That thread does not see this task's context
+        # variables, so the request context goes along with the record.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._request_context = get_request_context()
+        if _log_queue.dropped:
+            record.dropped_log_records, _log_queue.dropped = _log_queue.dropped, 0
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        _log_queue.put(record)
+
+
 # noqa Copied from https://dev.to/taikedz/simple-python-logging-and-a-digression-on-dependencies-trust-and-copypasting-code-229o
 class SimpleLogger(logging.Logger):
     FORMAT_STRING = "%(asctime)s | %(levelname)s | %(name)s : %(message)s"
@@ -123,6 +266,7 @@ class SimpleLogger(logging.Logger):
         level=logging.WARNING,
         console=True,
         files=None,
+        rate_limit: Optional[int] = None,
     ):
         logging.Logger.__init__(self, name, level)
         formatter_obj: logging.Formatter
@@ -136,19 +280,30 @@ class SimpleLogger(logging.Logger):
         elif isinstance(files, str):
             files = [files]
 
+        if rate_limit is None:
+            rate_limit = LOG_RATE_LIMIT
+        rate_limit_filter = RateLimitFilter(rate_limit, LOG_RATE_LIMIT_INTERVAL_SECONDS)
+
         def _add_stream(handler: logging.Handler, **kwargs):
             handler = handler(**kwargs)
             handler.setLevel(level)
             handler.setFormatter(formatter_obj)
+            handler.addFilter(rate_limit_filter)
             self.addHandler(handler)
 
-        if console is True:
+        if console is True and LOG_QUEUE_ENABLED and fmt_string == self.FORMAT_STRING:
+            _add_stream(_ContextQueueHandler)
+        elif console is True:
             _add_stream(logging.StreamHandler, stream=sys.stdout)
 
         for filepath in files:
             _add_stream(logging.FileHandler, filename=filepath)
 
 
-def get_logger(module_name: str):
+def get_logger(module_name: str, rate_limit: Optional[int] = None):
+    """A logger for the module.
+
+    rate_limit overrides LOG_RATE_LIMIT for the module's call sites.
+    """
     # If we don't add a handler manually one will be created for us
-    return SimpleLogger(name=module_name, level=get_loglevel())
+    return SimpleLogger(name=module_name, level=get_loglevel(), rate_limit=rate_limit)
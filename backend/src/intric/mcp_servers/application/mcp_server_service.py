@@ -8,6 +8,9 @@ from intric.mcp_servers.infrastructure.client.mcp_client import (
     MCPClient,
     MCPClientError,
 )
+from intric.mcp_servers.infrastructure.client.mcp_connection_pool import (
+    mcp_connection_pool,
+)
 from intric.roles.permissions import Permission, validate_permissions
 
 if TYPE_CHECKING:
@@ -353,6 +356,8 @@ class MCPServerService:
                 synced_tools.append(synced_tool)
 
             logger.info(f"Synced {len(synced_tools)} tools for {mcp_server.name}")
+            # Chat requests may hold a cached listing from before the sync
+            mcp_connection_pool.invalidate_tools(mcp_server.id)
             return synced_tools, ConnectionResult(
                 success=True, tools_discovered=len(synced_tools)
             )
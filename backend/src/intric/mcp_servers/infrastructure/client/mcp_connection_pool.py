@@ -0,0 +1,346 @@
+"""Process-wide pool of MCP client connections, reused across chat requests.
+
+Opening an MCP connection costs an HTTP round trip plus the initialize
+handshake, which MCPProxySession used to pay on every request that called a
+tool. Connections are now leased from this pool and returned when the
+request ends.
+
+Pool keys are (tenant_id, server_id, URL + credentials fingerprint), so
+tenants never share a connection and a credential change opens fresh
+connections while the old ones age out.
+
+Task ownership:
+    The MCP client library runs each connection inside anyio task groups,
+    which must be exited by the task that entered them. Each pooled
+    connection therefore gets its own long-lived runner task that connects,
+    waits for the close signal and disconnects. Requests only send calls
+    over the session, which is safe from any task.
+
+Also caches tools/list responses per pool key for mcp_tool_cache_ttl_seconds.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from intric.main.config import get_settings
+from intric.main.logging import get_logger
+from intric.mcp_servers.domain.entities.mcp_server import MCPServer
+from intric.mcp_servers.infrastructure.client.mcp_client import (
+    MCPClient,
+    MCPClientError,
+)
+
+logger = get_logger(__name__)
+
+# Seconds a health-check ping may take before the connection is dropped
+PING_TIMEOUT_SECONDS = 5
+
+# Seconds to wait for a runner task to disconnect on close
+CLOSE_TIMEOUT_SECONDS = 5
+
+PoolKey = tuple[UUID, UUID, str]
+
+
+def pool_key(server: MCPServer, auth_credentials: dict[str, str] | None) -> PoolKey:
+    """Key connections by tenant, server and the exact URL + credentials used."""
+    fingerprint = hashlib.sha256(
+        json.dumps(
+            [server.http_url, server.http_auth_type, auth_credentials or {}],
+            sort_keys=True,
+        ).encode("utf-8")
+    ).hexdigest()
+    return (server.tenant_id, server.id, fingerprint)
+
+
+class PooledMCPConnection:
+    """One MCP connection owned by a dedicated runner task."""
+
+    def __init__(self, key: PoolKey, client: MCPClient):
+        self.key = key
+        self.client = client
+        self.in_use = 0
+        self.broken = False
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: BaseException | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def server_name(self) -> str:
+        return self.client.mcp_server.name
+
+    async def open(self) -> None:
+        self._task = asyncio.create_task(
+            self._run(), name=f"mcp-connection-{self.server_name}"
+        )
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            await self.client.connect()
+        except BaseException as e:
+            self._error = e
+            self._ready.set()
+            return
+
+        self._ready.set()
+        try:
+            await self._closing.wait()
+        finally:
+            await self.client.disconnect()
+
+    async def ping(self) -> bool:
+        """Check the connection still answers; marks it broken if not."""
+        try:
+            async with asyncio.timeout(PING_TIMEOUT_SECONDS):
+                await self.client.session.send_ping()
+        except Exception as e:
+            logger.debug(f"[MCPPool] Health check failed for '{self.server_name}': {e}")
+            self.broken = True
+            return False
+        self.last_checked = time.monotonic()
+        return True
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is None:
+            return
+        try:
+            async with asyncio.timeout(CLOSE_TIMEOUT_SECONDS):
+                await asyncio.gather(self._task, return_exceptions=True)
+        except TimeoutError:
+            self._task.cancel()
+
+
+@dataclass
+class _CachedTools:
+    tools: list[dict[str, Any]]
+    expires_at: float
+
+
+@dataclass
+class _ServerPool:
+    connections: list[PooledMCPConnection] = field(default_factory=list)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class MCPConnectionPool:
+    """Leases MCP connections per (tenant, server, credentials).
+
+    Per key, at most max_connections_per_server connections are opened. A
+    lease takes an idle connection if there is one, opens a new one while
+    under the cap, and otherwise shares the least loaded connection (MCP
+    sessions multiplex concurrent requests).
+    """
+
+    def __init__(
+        self,
+        max_connections_per_server: int | None = None,
+        idle_timeout_seconds: float | None = None,
+        health_check_interval_seconds: float | None = None,
+        tool_cache_ttl_seconds: float | None = None,
+    ):
+        # Unset limits fall back to settings, read lazily so the module-level
+        # pool can be created at import time
+        self._max_connections_per_server = max_connections_per_server
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._health_check_interval_seconds = health_check_interval_seconds
+        self._tool_cache_ttl_seconds = tool_cache_ttl_seconds
+        self._pools: dict[PoolKey, _ServerPool] = {}
+        self._tool_cache: dict[PoolKey, _CachedTools] = {}
+        self._reaper_task: asyncio.Task | None = None
+
+    @property
+    def max_connections_per_server(self) -> int:
+        return (
+            self._max_connections_per_server
+            or get_settings().mcp_pool_max_connections_per_server
+        )
+
+    @property
+    def idle_timeout_seconds(self) -> float:
+        return (
+            self._idle_timeout_seconds or get_settings().mcp_pool_idle_timeout_seconds
+        )
+
+    @property
+    def health_check_interval_seconds(self) -> float:
+        return (
+            self._health_check_interval_seconds
+            or get_settings().mcp_pool_health_check_interval_seconds
+        )
+
+    @property
+    def tool_cache_ttl_seconds(self) -> float:
+        return self._tool_cache_ttl_seconds or get_settings().mcp_tool_cache_ttl_seconds
+
+    def stats(self) -> dict[str, int]:
+        connections = [c for pool in self._pools.values() for c in pool.connections]
+        return {
+            "servers": len(self._pools),
+            "connections": len(connections),
+            "in_use": sum(1 for c in connections if c.in_use),
+            "cached_tool_lists": len(self._tool_cache),
+        }
+
+    async def acquire(
+        self, server: MCPServer, auth_credentials: dict[str, str] | None = None
+    ) -> PooledMCPConnection:
+        """Lease a connected client. Pair every acquire with release().
+
+        Raises:
+            MCPClientError: If a new connection cannot be established
+        """
+        self._ensure_reaper()
+        key = pool_key(server, auth_credentials)
+        server_pool = self._pools.setdefault(key, _ServerPool())
+
+        async with server_pool.lock:
+            connection = await self._reuse(server_pool)
+            if connection is None:
+                if len(server_pool.connections) < self.max_connections_per_server:
+                    connection = await self._open(key, server, auth_credentials)
+                    server_pool.connections.append(connection)
+                else:
+                    connection = min(server_pool.connections, key=lambda c: c.in_use)
+
+            connection.in_use += 1
+            connection.last_used = time.monotonic()
+            return connection
+
+    async def _reuse(self, server_pool: _ServerPool) -> PooledMCPConnection | None:
+        now = time.monotonic()
+        for connection in list(server_pool.connections):
+            if connection.broken:
+                await self._discard(server_pool, connection)
+                continue
+            if connection.in_use:
+                continue
+            if now - connection.last_checked >= self.health_check_interval_seconds:
+                if not await connection.ping():
+                    await self._discard(server_pool, connection)
+                    continue
+            logger.debug(f"[MCPPool] Reusing connection to '{connection.server_name}'")
+            return connection
+        return None
+
+    async def _open(
+        self,
+        key: PoolKey,
+        server: MCPServer,
+        auth_credentials: dict[str, str] | None,
+    ) -> PooledMCPConnection:
+        connection = PooledMCPConnection(key, MCPClient(server, auth_credentials))
+        start_time = time.perf_counter()
+        await connection.open()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"[MCPPool] Connected to '{server.name}' in {elapsed_ms:.0f}ms")
+        return connection
+
+    def release(self, connection: PooledMCPConnection, *, broken: bool = False) -> None:
+        """Return a leased connection. broken=True drops it on next acquire."""
+        connection.in_use = max(connection.in_use - 1, 0)
+        connection.last_used = time.monotonic()
+        if broken:
+            connection.broken = True
+
+    async def list_tools(
+        self,
+        server: MCPServer,
+        auth_credentials: dict[str, str] | None = None,
+        connection: PooledMCPConnection | None = None,
+    ) -> list[dict[str, Any]]:
+        """List the server's tools, served from cache within the TTL.
+
+        On a cache miss the tools are listed over connection, a lease the
+        caller holds and gives back itself, or else over a new lease.
+        """
+        key = pool_key(server, auth_credentials)
+        cached = self._tool_cache.get(key)
+        if cached is not None and cached.expires_at > time.monotonic():
+            return cached.tools
+
+        if connection is not None:
+            tools = await connection.client.list_tools()
+        else:
+            connection = await self.acquire(server, auth_credentials)
+            try:
+                tools = await connection.client.list_tools()
+            except MCPClientError:
+                self.release(connection, broken=True)
+                raise
+            self.release(connection)
+
+        self._tool_cache[key] = _CachedTools(
+            tools=tools, expires_at=time.monotonic() + self.tool_cache_ttl_seconds
+        )
+        return tools
+
+    def invalidate_tools(self, server_id: UUID) -> None:
+        """Drop cached tool listings for a server (e.g. after a tool sync)."""
+        for key in [key for key in self._tool_cache if key[1] == server_id]:
+            del self._tool_cache[key]
+
+    async def _discard(
+        self, server_pool: _ServerPool, connection: PooledMCPConnection
+    ) -> None:
+        server_pool.connections.remove(connection)
+        await connection.close()
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_idle())
+
+    async def _reap_idle(self) -> None:
+        interval = max(self.idle_timeout_seconds / 4, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception:
+                logger.exception("[MCPPool] Idle eviction failed")
+
+    async def evict_idle(self) -> int:
+        """Close connections idle longer than the timeout; returns the count."""
+        now = time.monotonic()
+        evicted = 0
+        for key, server_pool in list(self._pools.items()):
+            async with server_pool.lock:
+                for connection in list(server_pool.connections):
+                    idle = now - connection.last_used >= self.idle_timeout_seconds
+                    if connection.in_use == 0 and (idle or connection.broken):
+                        await self._discard(server_pool, connection)
+                        evicted += 1
+                if not server_pool.connections:
+                    del self._pools[key]
+
+        for key in [k for k, v in self._tool_cache.items() if v.expires_at <= now]:
+            del self._tool_cache[key]
+
+        if evicted:
+            logger.debug(f"[MCPPool] Evicted {evicted} idle connection(s)")
+        return evicted
+
+    async def close(self) -> None:
+        """Close every connection; used on application shutdown."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            await asyncio.gather(self._reaper_task, return_exceptions=True)
+            self._reaper_task = None
+
+        connections = [c for pool in self._pools.values() for c in pool.connections]
+        self._pools.clear()
+        self._tool_cache.clear()
+        await asyncio.gather(*(c.close() for c in connections), return_exceptions=True)
+
+
+mcp_connection_pool = MCPConnectionPool()
@@ -7,6 +7,11 @@ from typing import Any
 
 from intric.mcp_servers.domain.entities.mcp_server import MCPServer
 from intric.mcp_servers.infrastructure.client.mcp_client import MCPClient, MCPClientError
+from intric.mcp_servers.infrastructure.client.mcp_connection_pool import (
+    MCPConnectionPool,
+    PooledMCPConnection,
+    mcp_connection_pool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +19,18 @@ logger = logging.getLogger(__name__)
 class MCPManager:
     """Manages multiple MCP server connections and aggregates their tools."""
 
-    def __init__(self):
+    def __init__(self, connection_pool: MCPConnectionPool | None = None):
         """Initialize MCP manager."""
+        self.pool = connection_pool or mcp_connection_pool
         self.clients: dict[str, MCPClient] = {}
+        self._leases: dict[str, PooledMCPConnection] = {}
         self.tools: dict[str, dict[str, Any]] = {}  # tool_name -> tool_definition + mcp_server_id
 
     async def connect_servers(
         self, mcp_servers: list[MCPServer], env_vars_map: dict[str, dict[str, str]] | None = None
     ) -> None:
         """
-        Connect to multiple MCP servers.
+        Lease connections to multiple MCP servers from the pool.
 
         Args:
             mcp_servers: List of MCP servers to connect to
@@ -35,9 +42,7 @@ class MCPManager:
         connection_tasks: list[asyncio.Task[None]] = []
         for server in mcp_servers:
             env_vars = env_vars_map.get(str(server.id), {})
-            client = MCPClient(server, env_vars)
-            self.clients[str(server.id)] = client
-            task = asyncio.create_task(self._connect_and_list_tools(client, str(server.id)))
+            task = asyncio.create_task(self._connect_and_list_tools(server, env_vars))
             connection_tasks.append(task)
 
         # Wait for all connections
@@ -45,11 +50,20 @@ class MCPManager:
 
         logger.info(f"Connected to {len(self.clients)} MCP servers with {len(self.tools)} total tools")
 
-    async def _connect_and_list_tools(self, client: MCPClient, server_id: str) -> None:
-        """Connect to an MCP server and list its tools."""
+    async def _connect_and_list_tools(self, server: MCPServer, env_vars: dict[str, str]) -> None:
+        """Lease a connection to an MCP server and list its tools (cached by the pool)."""
+        server_id = str(server.id)
         try:
-            await client.connect()
-            tools = await client.list_tools()
+            lease = await self.pool.acquire(server, env_vars)
+            self._leases[server_id] = lease
+            client = self.clients[server_id] = lease.client
+            try:
+                tools = await self.pool.list_tools(server, env_vars, connection=lease)
+            except MCPClientError:
+                self._leases.pop(server_id)
+                self.clients.pop(server_id)
+                self.pool.release(lease, broken=True)
+                raise
 
             # Register tools with server ID prefix to avoid name collisions
             for tool in tools:
@@ -130,12 +144,13 @@ class MCPManager:
             }
 
     async def disconnect_all(self) -> None:
-        """Disconnect from all MCP servers."""
-        disconnect_tasks = [client.disconnect() for client in self.clients.values()]
-        await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+        """Return all leased connections to the pool."""
+        for lease in self._leases.values():
+            self.pool.release(lease)
+        self._leases.clear()
         self.clients.clear()
         self.tools.clear()
-        logger.info("Disconnected from all MCP servers")
+        logger.info("Released all MCP server connections")
 
     async def __aenter__(self):
         """Async context manager entry."""
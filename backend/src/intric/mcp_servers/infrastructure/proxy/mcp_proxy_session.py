@@ -2,10 +2,10 @@
 MCPProxySession - Session-scoped proxy for multiple MCP servers.
 
 Provides:
-- Lazy connection management (connect on first tool call)
-- Connection caching within session
+- Lazy connection management (lease on first tool call)
+- Connections leased from the process-wide MCPConnectionPool
 - Unified tool interface for LLM
-- Automatic cleanup on session end
+- Leases returned to the pool on session end
 """
 
 import asyncio
@@ -17,7 +17,15 @@ from uuid import UUID
 
 from intric.main.logging import get_logger
 from intric.mcp_servers.domain.entities.mcp_server import MCPServer
-from intric.mcp_servers.infrastructure.client.mcp_client import MCPClient
+from intric.mcp_servers.infrastructure.client.mcp_client import (
+    MCPClient,
+    MCPClientError,
+)
+from intric.mcp_servers.infrastructure.client.mcp_connection_pool import (
+    MCPConnectionPool,
+    PooledMCPConnection,
+    mcp_connection_pool,
+)
 
 logger = get_logger(__name__)
 
@@ -29,15 +37,16 @@ class MCPProxySession:
     Lifecycle:
     1. Created at start of assistant.ask() or completion request
     2. Tools listed from DB (no connections yet)
-    3. On first tool call to a server, connection is established
-    4. Connections reused for subsequent calls to same server
-    5. All connections closed when session ends (context manager exit)
+    3. On first tool call to a server, a connection is leased from the pool
+    4. The lease is reused for subsequent calls to same server
+    5. Leases returned to the pool when session ends (context manager exit)
     """
 
     def __init__(
         self,
         mcp_servers: list[MCPServer],
         auth_credentials_map: dict[UUID, dict[str, str]] | None = None,
+        connection_pool: MCPConnectionPool | None = None,
     ):
         """
         Initialize proxy session.
@@ -46,12 +55,15 @@ class MCPProxySession:
             mcp_servers: List of MCP servers the assistant has access to
                         (already filtered by tenant/space/assistant hierarchy)
             auth_credentials_map: Map of server_id -> auth credentials
+            connection_pool: Pool to lease connections from (defaults to the
+                            process-wide pool)
         """
         self.mcp_servers = mcp_servers
         self.auth_credentials_map = auth_credentials_map or {}
+        self._pool = connection_pool or mcp_connection_pool
 
-        # Lazy connection cache: server_id -> MCPClient (connected)
-        self._clients: dict[UUID, MCPClient] = {}
+        # Lazy lease cache: server_id -> pooled connection
+        self._leases: dict[UUID, PooledMCPConnection] = {}
         self._connection_locks: dict[UUID, asyncio.Lock] = {}
 
         # Build tool registry from DB (no connections needed)
@@ -158,7 +170,7 @@ class MCPProxySession:
 
     async def _get_or_create_client(self, server: MCPServer) -> MCPClient:
         """
-        Get existing client or create new connection (lazy).
+        Get the session's leased client or lease one from the pool (lazy).
 
         Thread-safe via per-server locks.
 
@@ -178,27 +190,17 @@ class MCPProxySession:
             self._connection_locks[server_id] = asyncio.Lock()
 
         async with self._connection_locks[server_id]:
-            # Check if already connected
-            if server_id in self._clients:
+            # Check if already leased
+            if server_id in self._leases:
                 logger.debug(
                     f"[MCPProxy] CACHE HIT: Reusing connection to '{server.name}'"
                 )
-                return self._clients[server_id]
+                return self._leases[server_id].client
 
-            # Create new connection with timing
             auth_creds = self.auth_credentials_map.get(server_id, {})
-            client = MCPClient(server, auth_creds)
-
-            logger.debug(f"[MCPProxy] Connecting to '{server.name}'...")
-            start_time = time.perf_counter()
-            await client.connect()
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-
-            self._clients[server_id] = client
-            logger.debug(
-                f"[MCPProxy] Connected to '{server.name}' in {elapsed_ms:.0f}ms"
-            )
-            return client
+            lease = await self._pool.acquire(server, auth_creds)
+            self._leases[server_id] = lease
+            return lease.client
 
     async def call_tool(
         self,
@@ -239,7 +241,14 @@ class MCPProxySession:
 
         # Execute tool with timing
         start_time = time.perf_counter()
-        result = await client.call_tool(original_tool_name, arguments)
+        try:
+            result = await client.call_tool(original_tool_name, arguments)
+        except MCPClientError:
+            # Transport-level failure: don't hand this connection to anyone else
+            lease = self._leases.get(server.id)
+            if lease is not None:
+                lease.broken = True
+            raise
         elapsed_ms = (time.perf_counter() - start_time) * 1000
 
         is_error = result.get("is_error", False)
@@ -315,19 +324,16 @@ class MCPProxySession:
         return list(results)
 
     async def close(self):
-        """Close all connections."""
-        if not self._clients:
+        """Return all leased connections to the pool."""
+        if not self._leases:
             return
 
-        for server_id, client in self._clients.items():
-            try:
-                await client.disconnect()
-            except Exception as e:
-                logger.debug(f"[MCPProxy] Error disconnecting from {server_id}: {e}")
+        for lease in self._leases.values():
+            self._pool.release(lease)
 
-        connection_count = len(self._clients)
-        self._clients.clear()
-        logger.debug(f"[MCPProxy] Session closed, {connection_count} connection(s) cleaned up")
+        connection_count = len(self._leases)
+        self._leases.clear()
+        logger.debug(f"[MCPProxy] Session closed, {connection_count} connection(s) released")
 
     async def __aenter__(self):
         """Async context manager entry - no connections yet (lazy)."""
@@ -339,5 +345,5 @@ class MCPProxySession:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        """Async context manager exit - close all connections."""
+        """Async context manager exit - release all connections."""
         await self.close()
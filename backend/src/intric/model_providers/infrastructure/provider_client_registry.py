@@ -0,0 +1,145 @@
+"""Process-wide keep-alive HTTP sessions for model provider calls.
+
+Completion and embedding adapters are created per request, and LiteLLM only
+caches its own clients for a while, so provider calls kept paying for new TCP
+and TLS handshakes. The adapters now pass LiteLLM a shared aiohttp session
+from this registry, one per (provider id, endpoint), whose connector keeps
+idle connections open for provider_http_keepalive_seconds.
+
+Sessions belong to the event loop that created them. A session created on
+another loop (tests, scripts calling asyncio.run) is replaced rather than
+reused.
+
+aiohttp speaks HTTP/1.1 only; keep-alive is what removes the setup cost.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+from uuid import UUID
+
+import aiohttp
+import litellm
+from litellm.llms.custom_httpx.http_handler import get_ssl_configuration
+
+from intric.main.config import get_settings
+from intric.main.logging import get_logger
+from intric.observability.metrics import PROVIDER_CONNECT_SECONDS, PROVIDER_CONNECTIONS
+
+logger = get_logger(__name__)
+
+ClientKey = tuple[UUID, str]
+
+
+@dataclass
+class _Client:
+    session: aiohttp.ClientSession
+    loop: asyncio.AbstractEventLoop
+
+
+def _trace_config(provider_type: str) -> aiohttp.TraceConfig:
+    """Count new and reused connections, and time the new ones."""
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_connection_create_start(session, context: SimpleNamespace, params):
+        context.connect_start = asyncio.get_running_loop().time()
+
+    async def on_connection_create_end(session, context: SimpleNamespace, params):
+        PROVIDER_CONNECTIONS.labels(provider=provider_type, reused="false").inc()
+        PROVIDER_CONNECT_SECONDS.labels(provider=provider_type).observe(
+            asyncio.get_running_loop().time() - context.connect_start
+        )
+
+    async def on_connection_reuseconn(session, context: SimpleNamespace, params):
+        PROVIDER_CONNECTIONS.labels(provider=provider_type, reused="true").inc()
+
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
+
+
+class ProviderClientRegistry:
+    """Hands out one pooled aiohttp session per provider endpoint."""
+
+    def __init__(
+        self,
+        pool_size: int | None = None,
+        keepalive_seconds: float | None = None,
+    ):
+        # Unset limits fall back to settings, read lazily so the module-level
+        # registry can be created at import time
+        self._pool_size = pool_size
+        self._keepalive_seconds = keepalive_seconds
+        self._clients: dict[ClientKey, _Client] = {}
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size or get_settings().provider_http_pool_size
+
+    @property
+    def keepalive_seconds(self) -> float:
+        return self._keepalive_seconds or get_settings().provider_http_keepalive_seconds
+
+    def stats(self) -> dict[str, int]:
+        return {"sessions": len(self._clients)}
+
+    def session(
+        self,
+        provider_id: Optional[UUID],
+        endpoint: Optional[str],
+        provider_type: str,
+    ) -> Optional[aiohttp.ClientSession]:
+        """The shared session for the endpoint, or None to let LiteLLM decide.
+
+        Returns None when pooling is disabled, for models without a provider,
+        and outside a running event loop.
+        """
+        if provider_id is None or not get_settings().provider_http_pool_enabled:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        key = (provider_id, endpoint or "")
+        client = self._clients.get(key)
+        if client is not None and client.loop is loop and not client.session.closed:
+            return client.session
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=self.keepalive_seconds,
+                ttl_dns_cache=300,
+                ssl=get_ssl_configuration(),
+            ),
+            trace_configs=[_trace_config(provider_type)],
+            # Proxy environment variables, as LiteLLM's own sessions honour
+            trust_env=litellm.aiohttp_trust_env
+            or os.getenv("AIOHTTP_TRUST_ENV", "").lower() in ("1", "true", "yes"),
+        )
+        self._clients[key] = _Client(session=session, loop=loop)
+        logger.debug(
+            "Opened provider HTTP pool for %s (%s)", provider_id, provider_type
+        )
+        return session
+
+    async def close(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                client.session.close()
+                for client in clients
+                if client.loop is loop and not client.session.closed
+            ),
+            return_exceptions=True,
+        )
+
+
+provider_client_registry = ProviderClientRegistry()
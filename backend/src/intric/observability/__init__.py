@@ -4,4 +4,5 @@ Observability utilities for runtime debugging and monitoring.
 This package provides:
 - debug_toggle: Runtime OIDC debug flag management (Redis/file-backed)
 - redaction: PII/secret sanitization for safe logging
+- metrics: Prometheus metrics for the API and the worker
 """
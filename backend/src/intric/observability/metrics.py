@@ -0,0 +1,168 @@
+"""Prometheus metrics for the API and the worker.
+
+The API serves these at /metrics. Under gunicorn every worker process writes
+its samples to PROMETHEUS_MULTIPROC_DIR (set by run.sh) and the endpoint
+aggregates them. The ARQ worker is a single process and serves its metrics
+from a sidecar HTTP server on worker_metrics_port.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+# Sub-second steps for database and Redis round trips
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Provider calls take from a few hundred milliseconds up to minutes
+PROVIDER_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+QUERY_EMBEDDING_SECONDS = Histogram(
+    "intric_query_embedding_seconds",
+    "Time to embed a search query",
+    buckets=PROVIDER_BUCKETS,
+)
+VECTOR_SEARCH_SECONDS = Histogram(
+    "intric_vector_search_seconds",
+    "Time to run a semantic search against the chunk table",
+    buckets=FAST_BUCKETS,
+)
+CONTEXT_BUILD_SECONDS = Histogram(
+    "intric_context_build_seconds",
+    "Time to build the completion context, including loading its images",
+    buckets=FAST_BUCKETS,
+)
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "intric_llm_time_to_first_token_seconds",
+    "Time from sending a streaming completion request to its first chunk",
+    ["model"],
+    buckets=PROVIDER_BUCKETS,
+)
+LLM_RESPONSE_SECONDS = Histogram(
+    "intric_llm_response_seconds",
+    "Time from sending a completion request to its last chunk",
+    ["model", "stream"],
+    buckets=PROVIDER_BUCKETS,
+)
+COMPLETION_ADMISSION_WAIT_SECONDS = Histogram(
+    "intric_completion_admission_wait_seconds",
+    "Time a completion request waited for its tenant's and provider's budgets",
+    ["priority"],
+    buckets=PROVIDER_BUCKETS,
+)
+COMPLETION_ADMISSION_WAITING = Gauge(
+    "intric_completion_admission_waiting",
+    "Completion requests waiting for admission",
+    ["priority"],
+    multiprocess_mode="livesum",
+)
+COMPLETION_ADMISSION_TIMEOUTS = Counter(
+    "intric_completion_admission_timeouts",
+    "Completion requests rejected after waiting too long for admission",
+    ["priority"],
+)
+PROVIDER_CONNECTIONS = Counter(
+    "intric_provider_connections",
+    "Requests to model providers, by whether they reused a pooled connection",
+    ["provider", "reused"],
+)
+PROVIDER_CONNECT_SECONDS = Histogram(
+    "intric_provider_connect_seconds",
+    "Time to open a new connection to a model provider, including TLS",
+    ["provider"],
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "intric_db_pool_checkout_seconds",
+    "Time waiting for a database connection from the pool",
+    buckets=FAST_BUCKETS,
+)
+REDIS_COMMAND_SECONDS = Histogram(
+    "intric_redis_command_seconds",
+    "Redis command round trip time",
+    ["command"],
+    buckets=FAST_BUCKETS,
+)
+EMBEDDING_BATCH_SECONDS = Histogram(
+    "intric_embedding_batch_seconds",
+    "Time to embed one batch of chunks",
+    ["model"],
+    buckets=PROVIDER_BUCKETS,
+)
+EMBEDDING_BATCHES = Counter(
+    "intric_embedding_batches",
+    "Batches of chunks embedded",
+    ["model"],
+)
+KNOWLEDGE_DELETED_ROWS = Counter(
+    "intric_knowledge_deleted_rows",
+    "Chunks and info blobs removed by background deletion of websites and collections",
+    ["kind"],
+)
+CRAWL_PAGES = Counter(
+    "intric_crawl_pages",
+    "Pages crawled",
+)
+CRAWL_QUEUE_DEPTH = Gauge(
+    "intric_crawl_queue_depth",
+    "Crawls waiting in each tenant's pending queue",
+    ["tenant_id"],
+    multiprocess_mode="livemax",
+)
+
+
+@contextmanager
+def observe_seconds(histogram) -> Iterator[None]:
+    """Observe the time spent in the block, also when it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start)
+
+
+_queue_depth_tenants: set[str] = set()
+
+
+def set_crawl_queue_depths(depths: dict["UUID", int]):
+    """Publish the pending crawl counts; tenants no longer listed are dropped."""
+    tenants = {str(tenant_id): depth for tenant_id, depth in depths.items()}
+    for tenant_id in _queue_depth_tenants - tenants.keys():
+        CRAWL_QUEUE_DEPTH.remove(tenant_id)
+    for tenant_id, depth in tenants.items():
+        CRAWL_QUEUE_DEPTH.labels(tenant_id=tenant_id).set(depth)
+
+    _queue_depth_tenants.clear()
+    _queue_depth_tenants.update(tenants)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """The current metrics and their content type."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int):
+    """Serve the metrics over HTTP from a background thread."""
+    start_http_server(port)
@@ -1,5 +1,9 @@
 """Shared Redis connection utilities."""
 
-from intric.redis.connection import build_arq_redis_settings, build_redis_pool_kwargs
+from intric.redis.connection import (
+    InstrumentedRedis,
+    build_arq_redis_settings,
+    build_redis_pool_kwargs,
+)
 
-__all__ = ["build_arq_redis_settings", "build_redis_pool_kwargs"]
+__all__ = ["InstrumentedRedis", "build_arq_redis_settings", "build_redis_pool_kwargs"]
@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
+import redis.asyncio as aioredis
 from arq.connections import RedisSettings
 
 from intric.main.config import Settings, get_settings
+from intric.observability.metrics import REDIS_COMMAND_SECONDS
+
+
+class InstrumentedRedis(aioredis.Redis):
+    """Redis client recording the round trip time of each command."""
+
+    async def execute_command(self, *args, **options):
+        command = args[0]
+        if isinstance(command, bytes):
+            command = command.decode()
+
+        start = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_SECONDS.labels(command=command.upper()).observe(
+                time.perf_counter() - start
+            )
 
 
 def _get_redis_database(settings: Settings) -> int:
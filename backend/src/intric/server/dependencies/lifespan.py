@@ -6,6 +6,12 @@ from intric.database.database import sessionmanager
 from intric.jobs.job_manager import job_manager
 from intric.main.aiohttp_client import aiohttp_client
 from intric.main.config import get_settings
+from intric.mcp_servers.infrastructure.client.mcp_connection_pool import (
+    mcp_connection_pool,
+)
+from intric.model_providers.infrastructure.provider_client_registry import (
+    provider_client_registry,
+)
 from intric.server.dependencies.modules import init_modules
 from intric.server.dependencies.predefined_roles import init_predefined_roles
 from intric.server.websockets.websocket_manager import websocket_manager
@@ -45,3 +51,5 @@ async def shutdown():
     await aiohttp_client.stop()
     await job_manager.close()
     await websocket_manager.shutdown()
+    await mcp_connection_pool.close()
+    await provider_client_registry.close()
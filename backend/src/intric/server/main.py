@@ -8,11 +8,11 @@ from datetime import datetime, timezone
 from typing import Optional
 from fastapi import Depends, FastAPI
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from intric.allowed_origins.get_origin_callback import get_origin
-from intric.authentication import auth_dependencies
+from intric.authentication import auth, auth_dependencies
 from intric.main.config import get_settings
 from intric.main.logging import get_logger
 from intric.server import api_documentation
@@ -683,6 +683,20 @@ def get_application():
             ),
         )
 
+    if get_settings().metrics_enabled:
+
+        # Labels name tenants and providers, so only the super API key may scrape
+        @app.get(
+            "/metrics",
+            include_in_schema=False,
+            dependencies=[Depends(auth.authenticate_super_api_key)],
+        )
+        async def get_metrics():
+            from intric.observability.metrics import render_metrics
+
+            content, media_type = render_metrics()
+            return Response(content=content, media_type=media_type)
+
     @app.get(
         "/version", dependencies=[Depends(auth_dependencies.get_current_active_user)]
     )
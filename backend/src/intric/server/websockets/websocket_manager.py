@@ -20,34 +20,116 @@ from intric.users.user import UserInDB
 from intric.worker.redis import r
 
 
+# Messages queued per socket before it is treated as a slow consumer
+SEND_QUEUE_SIZE = 64
+
+# A single send that takes longer than this marks the socket as stalled
+SEND_TIMEOUT_SECONDS = 10
+
+LISTENER_RETRY_MIN_SECONDS = 1
+LISTENER_RETRY_MAX_SECONDS = 30
+
+# Close code for slow consumers; clients reconnect and refetch current state
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
 @dataclass
 class SubscribedChannels:
     websockets: set[WebSocket]
-    redis_task: asyncio.Task
 
 
 logger = get_logger(__name__)
 
 
+class WebSocketSender:
+    """Bounded outgoing queue for one websocket, drained by its own task.
+
+    All sends to a socket go through its sender, so a slow client only
+    backs up its own queue and Starlette never sees concurrent sends on
+    the same connection.
+    """
+
+    def __init__(self, websocket: WebSocket, maxsize: int = SEND_QUEUE_SIZE):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+        self.task: asyncio.Task | None = None
+
+    def send(self, text: str) -> bool:
+        """Queue a message. Returns False if the queue is full."""
+        try:
+            self.queue.put_nowait(text)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def run(self):
+        while True:
+            text = await self.queue.get()
+            try:
+                # asyncio.timeout rather than wait_for: wait_for can swallow a
+                # cancel that lands as the send completes (shutdown/unsubscribe)
+                async with asyncio.timeout(SEND_TIMEOUT_SECONDS):
+                    await self.websocket.send_text(text)
+            except asyncio.TimeoutError:
+                logger.warning("WebSocket send timed out, closing slow consumer")
+                await close_websocket(self.websocket)
+                return
+            except Exception:
+                # Connection is gone; the router cleans up on disconnect
+                logger.debug("WebSocket send failed, stopping sender")
+                return
+
+
+async def close_websocket(websocket: WebSocket):
+    try:
+        await websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER)
+    except Exception:
+        logger.debug("WebSocket was already closed")
+
+
 class WebSocketManager:
+    """Fans out Redis run updates to the websockets connected to this process.
+
+    One pattern subscription per process covers every channel type, and
+    messages are demultiplexed to the local channels that have sockets
+    subscribed, so the number of Redis connections does not grow with the
+    number of connected users. Messages for channels without local
+    subscribers are dropped.
+
+    Each socket gets a WebSocketSender. Fan-out only enqueues, and a socket
+    whose queue is full is closed instead of delaying everyone else.
+    """
+
     def __init__(
         self,
         redis: aioredis.Redis,
         channels: dict[str, SubscribedChannels] = None,
+        send_queue_size: int = SEND_QUEUE_SIZE,
     ):
         self.redis = redis
         self.channels = channels or {}
-        self.task_monitoring = None
+        self.send_queue_size = send_queue_size
+        self.senders: dict[WebSocket, WebSocketSender] = {}
+        self.listener_task: asyncio.Task | None = None
+        self._close_tasks: set[asyncio.Task] = set()
 
     @property
     def tasks(self):
-        return [self.channels[channel].redis_task for channel in self.channels]
+        tasks = [sender.task for sender in self.senders.values() if sender.task]
+        if self.listener_task is not None:
+            tasks.append(self.listener_task)
+        return tasks + list(self._close_tasks)
+
+    @staticmethod
+    def _channel_patterns() -> list[str]:
+        # Same formatting as Channel.channel_string, with the user id wildcarded
+        return [f"{channel_type}:*" for channel_type in ChannelType]
 
     def _check_exceptions(self, task: asyncio.Task):
         try:
             _ = task.result()
         except asyncio.exceptions.CancelledError:
-            logger.debug(f'Task {task.get_name()} was cancelled')
+            logger.debug(f"Task {task.get_name()} was cancelled")
         except Exception:
             logger.exception(traceback.format_exc())
 
@@ -57,22 +139,54 @@ class WebSocketManager:
         except KeyError:
             logger.debug(f"WebSocket not found in channel {channel}")
 
-    async def _listen_to_redis(self, channel: str):
-        async with self.redis.pubsub() as pubsub:
-            await pubsub.subscribe(channel)
-            logger.debug('Subscribed to Redis channel: %s', channel)
+    def _ensure_listener(self):
+        if self.listener_task is None or self.listener_task.done():
+            self.listener_task = asyncio.create_task(self._listen_to_redis())
+            self.listener_task.add_done_callback(self._check_exceptions)
+
+    async def _listen_to_redis(self):
+        retry_seconds = LISTENER_RETRY_MIN_SECONDS
+
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.psubscribe(*self._channel_patterns())
+                    logger.debug("Subscribed to Redis run update channels")
+                    retry_seconds = LISTENER_RETRY_MIN_SECONDS
 
-            while True:
-                raw_message = await pubsub.get_message(
-                    ignore_subscribe_messages=True, timeout=None
+                    while True:
+                        raw_message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=None
+                        )
+                        if raw_message is not None:
+                            self._dispatch_redis_message(raw_message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(
+                    f"Redis subscription failed, retrying in {retry_seconds}s"
                 )
-                if raw_message is not None:
-                    await self._process_redis_message(channel, raw_message)
+                await asyncio.sleep(retry_seconds)
+                retry_seconds = min(retry_seconds * 2, LISTENER_RETRY_MAX_SECONDS)
+
+    def _dispatch_redis_message(self, raw_message: dict):
+        channel = raw_message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
 
-    async def _process_redis_message(self, channel: str, raw_message: dict):
+        if channel not in self.channels:
+            return
+
+        try:
+            self._process_redis_message(channel, raw_message)
+        except Exception:
+            # One malformed message must not take down the shared listener
+            logger.exception(f"Failed to process Redis message on {channel}")
+
+    def _process_redis_message(self, channel: str, raw_message: dict):
         message = RedisMessage.model_validate_json(raw_message["data"].decode())
         additional_data_present = bool(message.additional_data)
-        await self.publish(
+        self.publish(
             channel,
             message=WsOutgoingWebSocketMessage(
                 type=OutGoingMessageType.APP_RUN_UPDATES,
@@ -96,16 +210,40 @@ class WebSocketManager:
             ),
         )
 
-    async def _send_message(
-        self, websocket: WebSocket, message: WsOutgoingWebSocketMessage
-    ):
-        await websocket.send_text(
-            message.model_dump_json(serialize_as_any=True, exclude_none=True)
-        )
+    @staticmethod
+    def _serialize(message: WsOutgoingWebSocketMessage) -> str:
+        return message.model_dump_json(serialize_as_any=True, exclude_none=True)
+
+    def _get_sender(self, websocket: WebSocket) -> WebSocketSender:
+        sender = self.senders.get(websocket)
+        if sender is None:
+            sender = WebSocketSender(websocket, maxsize=self.send_queue_size)
+            sender.task = asyncio.create_task(sender.run())
+            sender.task.add_done_callback(self._check_exceptions)
+            sender.task.add_done_callback(
+                lambda _task: self._on_sender_done(websocket, sender)
+            )
+            self.senders[websocket] = sender
+        return sender
+
+    def _on_sender_done(self, websocket: WebSocket, sender: WebSocketSender):
+        # Sender stopped because the socket broke or stalled: stop fanning
+        # out to it. The router finishes cleanup when receive fails.
+        if self.senders.get(websocket) is sender:
+            del self.senders[websocket]
+            self._remove_from_channels(websocket)
+
+    def _enqueue(self, websocket: WebSocket, text: str):
+        if not self._get_sender(websocket).send(text):
+            logger.warning("WebSocket send queue is full, closing slow consumer")
+            self.unsubscribe_from_all_channels(websocket)
+            close_task = asyncio.create_task(close_websocket(websocket))
+            self._close_tasks.add(close_task)
+            close_task.add_done_callback(self._close_tasks.discard)
 
     async def pong(self, websocket: WebSocket):
         message = WsOutgoingWebSocketMessage(type=OutGoingMessageType.PONG)
-        await self._send_message(websocket, message)
+        self._enqueue(websocket, self._serialize(message))
 
     async def handle_message(
         self, websocket_message: ParsedMessage, websocket: WebSocket, user: UserInDB
@@ -131,12 +269,10 @@ class WebSocketManager:
     def subscribe(self, websocket: WebSocket, channel_type: ChannelType, user_id: UUID):
         channel = Channel(type=channel_type, user_id=user_id).channel_string
 
+        self._ensure_listener()
+
         if channel not in self.channels:
-            redis_task = asyncio.create_task(self._listen_to_redis(channel))
-            redis_task.add_done_callback(self._check_exceptions)
-            self.channels[channel] = SubscribedChannels(
-                websockets=set(), redis_task=redis_task
-            )
+            self.channels[channel] = SubscribedChannels(websockets=set())
 
         self.channels[channel].websockets.add(websocket)
 
@@ -147,34 +283,43 @@ class WebSocketManager:
             self._remove_websocket_if_exists(websocket, channel)
 
             if not self.channels[channel].websockets:
-                # No one is listening, cancel the task
-                self.channels[channel].redis_task.cancel()
+                # No one is listening, stop dispatching to this channel
                 del self.channels[channel]
 
-    def unsubscribe_from_all_channels(self, websocket: WebSocket):
+    def _remove_from_channels(self, websocket: WebSocket):
         channels_to_delete = []
         for channel in self.channels:
-            self._remove_websocket_if_exists(websocket, channel)
+            self.channels[channel].websockets.discard(websocket)
 
             if not self.channels[channel].websockets:
                 channels_to_delete.append(channel)
 
         for channel in channels_to_delete:
-            self.channels[channel].redis_task.cancel()
             del self.channels[channel]
 
-    async def publish(self, channel: str, message: WsOutgoingWebSocketMessage):
+    def unsubscribe_from_all_channels(self, websocket: WebSocket):
+        self._remove_from_channels(websocket)
+
+        sender = self.senders.pop(websocket, None)
+        if sender is not None and sender.task is not None:
+            sender.task.cancel()
+
+    def publish(self, channel: str, message: WsOutgoingWebSocketMessage):
+        """Queue a message for every local socket on the channel without waiting."""
         subscribed_channels = self.channels.get(channel, None)
 
         if subscribed_channels is not None:
-            for ws in subscribed_channels.websockets:
-                await self._send_message(ws, message)
+            text = self._serialize(message)
+            # Copy: a full queue unsubscribes the socket while we iterate
+            for ws in list(subscribed_channels.websockets):
+                self._enqueue(ws, text)
 
     async def shutdown(self):
-        for task in self.tasks:
+        tasks = self.tasks
+        for task in tasks:
             task.cancel()
 
-        await asyncio.gather(*self.tasks)
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 
 websocket_manager = WebSocketManager(redis=r)
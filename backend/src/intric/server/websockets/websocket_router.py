@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 
 from intric.main.logging import get_logger
 from intric.server.dependencies.container import get_user_from_websocket
@@ -23,7 +24,8 @@ async def connect(
     await websocket.accept(subprotocol=INTRIC_SUBPROTOCOL)
     logger.debug(f"User {user.email} connected to websocket.")
 
-    while True:
+    # The manager may close the socket server-side (slow consumer)
+    while websocket.application_state == WebSocketState.CONNECTED:
         try:
             raw_message = await websocket.receive_json()
             websocket_message = ParsedMessage(**raw_message)
@@ -34,10 +36,20 @@ async def connect(
             logger.debug(f"User {user.email} disconnected from websocket.")
             websocket_manager.unsubscribe_from_all_channels(websocket)
             break
+        except RuntimeError:
+            if websocket.application_state == WebSocketState.CONNECTED:
+                logger.exception("Exception happened while handling websocket message:")
+            else:
+                # Starlette raises when using a socket the manager has closed
+                logger.debug(
+                    f"WebSocket of user {user.email} was closed while handling a message."
+                )
         except Exception:
             # If anything happens while handling message, ignore it and keep the
             # connection going
 
             logger.exception("Exception happened while handling websocket message:")
+    else:
+        websocket_manager.unsubscribe_from_all_channels(websocket)
 
     logger.debug(f"WebSocket connection with user {user.email} has been closed.")
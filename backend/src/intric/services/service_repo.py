@@ -4,9 +4,14 @@ from typing import TYPE_CHECKING, Optional
 import sqlalchemy as sa
 from sqlalchemy.orm import selectinload
 
+from intric.completion_models.infrastructure.usage_counters import (
+    SERVICES,
+    CompletionModelUsageCounters,
+)
 from intric.database.database import AsyncSession
 from intric.database.repositories.base import BaseRepositoryDelegate
 from intric.database.tables.service_table import Services
+from intric.events.model_events import ModelUsageChanged
 from intric.services.service import Service, ServiceUpdate
 
 if TYPE_CHECKING:
@@ -26,6 +31,7 @@ class ServiceRepository:
             session, Services, Service, with_options=self._get_options()
         )
         self.completion_model_repo = completion_model_repo
+        self.usage_counters = CompletionModelUsageCounters(session)
 
     @staticmethod
     def _get_options():
@@ -49,8 +55,38 @@ class ServiceRepository:
 
         return service
 
+    async def _counted_model_id(self, service_id: UUID) -> Optional[UUID]:
+        # Only services in a space count towards their model's usage
+        row = (
+            await self._session.execute(
+                sa.select(Services.completion_model_id, Services.space_id).where(
+                    Services.id == service_id
+                )
+            )
+        ).one_or_none()
+        if row is None or row.space_id is None:
+            return None
+        return row.completion_model_id
+
+    async def _apply_usage_change(
+        self, service: Optional[Service], previous_model_id: Optional[UUID]
+    ):
+        new_model_id = (
+            service.completion_model_id
+            if service is not None and service.space_id is not None
+            else None
+        )
+        await self.usage_counters.apply(
+            ModelUsageChanged(
+                counter=SERVICES,
+                old_model_id=previous_model_id,
+                new_model_id=new_model_id,
+            )
+        )
+
     async def add(self, service: ServiceUpdate) -> Service:
         s = await self._delegate.add(service)
+        await self._apply_usage_change(s, previous_model_id=None)
         return await self._set_domain_completion_model(s)
 
     async def get_by_id(self, id: UUID) -> Service:
@@ -76,14 +112,19 @@ class ServiceRepository:
         ]
 
     async def update(self, service: ServiceUpdate) -> Service:
+        previous_model_id = await self._counted_model_id(service.id)
         s = await self._delegate.update(service)
+        await self._apply_usage_change(s, previous_model_id=previous_model_id)
         return await self._set_domain_completion_model(s)
 
     async def delete(self, id: UUID):
+        previous_model_id = await self._counted_model_id(id)
         query = sa.delete(Services).where(Services.id == id)
         await self._session.execute(query)
+        await self._apply_usage_change(None, previous_model_id=previous_model_id)
 
     async def add_service_to_space(self, service_id: UUID, space_id: UUID):
+        previous_model_id = await self._counted_model_id(service_id)
         stmt = (
             sa.update(Services)
             .where(Services.id == service_id)
@@ -92,4 +133,5 @@ class ServiceRepository:
         )
 
         s = await self._delegate.get_model_from_query(stmt)
+        await self._apply_usage_change(s, previous_model_id=previous_model_id)
         return await self._set_domain_completion_model(s)
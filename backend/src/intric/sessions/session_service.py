@@ -4,6 +4,7 @@ from uuid import UUID
 
 from intric.ai_models.completion_models.completion_model import CompletionModel
 from intric.assistants.assistant_service import AssistantService
+from intric.completion_models.infrastructure.context_builder import count_tokens
 from intric.files.file_models import File
 from intric.group_chat.application.group_chat_service import GroupChatService
 from intric.info_blobs.info_blob import InfoBlobChunkInDBWithScore
@@ -23,6 +24,11 @@ if TYPE_CHECKING:
     from intric.completion_models.infrastructure.web_search import WebSearchResult
 
 
+# The context builder always keeps the last four turns, whatever their size
+CHAT_MIN_TURNS = 4
+CHAT_QUESTIONS_PAGE_SIZE = 10
+
+
 class SessionService:
     def __init__(
         self,
@@ -74,6 +80,59 @@ class SessionService:
 
         return session
 
+    async def get_session_without_questions(
+        self, id: UUID, assistant_id: UUID = None, group_chat_id: UUID = None
+    ) -> SessionInDB:
+        session = await self.session_repo.get_without_questions(id)
+
+        self._check_exists_and_belongs_to_user(
+            session, assistant_id=assistant_id, group_chat_id=group_chat_id
+        )
+
+        return session
+
+    async def get_session_for_chat(
+        self,
+        id: UUID,
+        max_tokens: int,
+        assistant_id: UUID = None,
+        group_chat_id: UUID = None,
+        min_turns: int = CHAT_MIN_TURNS,
+    ) -> SessionInDB:
+        """Load a session with only the turns a new chat message can use.
+
+        Turns are fetched newest first until their question and answer text
+        exceeds max_tokens (after at least min_turns), mirroring how the
+        context builder trims the history. The context builder counts the
+        same text plus attached files, so it never needs a turn that was not
+        loaded.
+        """
+        session = await self.get_session_without_questions(
+            id, assistant_id=assistant_id, group_chat_id=group_chat_id
+        )
+
+        questions = []
+        total_tokens = 0
+        done = False
+        while not done:
+            page = await self.session_repo.get_latest_questions(
+                session_id=id, limit=CHAT_QUESTIONS_PAGE_SIZE, offset=len(questions)
+            )
+            for question in page:
+                questions.append(question)
+                total_tokens += count_tokens(question.question) + count_tokens(
+                    question.answer
+                )
+                if len(questions) > min_turns and total_tokens > max_tokens:
+                    done = True
+                    break
+
+            done = done or len(page) < CHAT_QUESTIONS_PAGE_SIZE
+
+        session.questions = list(reversed(questions))
+
+        return session
+
     async def get_sessions_by_assistant(
         self,
         assistant_id: UUID,
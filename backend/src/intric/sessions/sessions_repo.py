@@ -4,10 +4,12 @@ from uuid import UUID
 
 import sqlalchemy as sa
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from intric.database.database import AsyncSession
 from intric.database.repositories.base import BaseRepositoryDelegate
 from intric.database.tables.assistant_table import Assistants
+from intric.database.tables.files_table import Files
 from intric.database.tables.info_blobs_table import InfoBlobs
 from intric.database.tables.questions_table import (
     InfoBlobReferences,
@@ -16,6 +18,7 @@ from intric.database.tables.questions_table import (
 )
 from intric.database.tables.sessions_table import Sessions
 from intric.database.tables.users_table import Users
+from intric.questions.question import Question
 from intric.sessions.session import (
     SessionAdd,
     SessionFeedback,
@@ -88,6 +91,72 @@ class SessionRepository:
 
         return await self.delegate.filter_by(conditions={Sessions.user_id: user_id})
 
+    async def get_without_questions(self, id: UUID) -> Optional[SessionInDB]:
+        stmt = (
+            sa.select(Sessions)
+            .where(Sessions.id == id)
+            .options(selectinload(Sessions.assistant).selectinload(Assistants.user))
+        )
+        session = await self.session.scalar(stmt)
+        if session is None:
+            return None
+
+        set_committed_value(session, "questions", [])
+
+        return SessionInDB.model_validate(session)
+
+    async def get_latest_questions(
+        self, session_id: UUID, limit: int, offset: int = 0
+    ) -> list[Question]:
+        """Questions of a session, newest first, for building chat context.
+
+        Only what the context needs is loaded: references, logging details and
+        web search results are skipped, and file bytes are left in the blob
+        store (see intric.files.blob_store.load_blobs).
+        """
+        stmt = (
+            sa.select(Questions)
+            .where(Questions.session_id == session_id)
+            .order_by(Questions.created_at.desc(), Questions.id.desc())
+            .limit(limit)
+            .offset(offset)
+            .options(
+                selectinload(Questions.assistant),
+                selectinload(Questions.completion_model),
+                selectinload(Questions.questions_files)
+                .selectinload(QuestionsFiles.file)
+                .defer(Files.blob),
+            )
+        )
+        questions = (await self.session.scalars(stmt)).all()
+
+        for question in questions:
+            set_committed_value(question, "info_blob_references", [])
+            set_committed_value(question, "logging_details", None)
+            set_committed_value(question, "web_search_results", [])
+
+        await self._load_inline_blobs(
+            [qf.file for question in questions for qf in question.questions_files]
+        )
+
+        return [Question.model_validate(question) for question in questions]
+
+    async def _load_inline_blobs(self, files: list[Files]):
+        # Files not yet moved to the blob store still carry their bytes inline,
+        # and a file without text must have them to be valid
+        inline_ids = [
+            file.id for file in files if file.blob_key is None and file.text is None
+        ]
+        blobs = {}
+        if inline_ids:
+            rows = await self.session.execute(
+                sa.select(Files.id, Files.blob).where(Files.id.in_(inline_ids))
+            )
+            blobs = dict(rows.all())
+
+        for file in files:
+            set_committed_value(file, "blob", blobs.get(file.id))
+
     async def _get_total_count(
         self,
         assistant_id: UUID = None,
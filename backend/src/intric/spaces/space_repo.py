@@ -9,6 +9,13 @@ from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from intric.ai_models.completion_models.completion_model import CompletionModelSparse
 from intric.ai_models.embedding_models.embedding_model import EmbeddingModelSparse
+from intric.completion_models.infrastructure.usage_counters import (
+    APPS,
+    ASSISTANTS,
+    SERVICES,
+    SPACES,
+    CompletionModelUsageCounters,
+)
 from intric.database.database import AsyncSession
 from intric.database.tables.ai_models_table import (
     CompletionModels,
@@ -17,7 +24,11 @@ from intric.database.tables.ai_models_table import (
 )
 from intric.database.tables.app_table import Apps, AppsFiles, AppsPrompts
 from intric.database.tables.app_template_table import AppTemplates
-from intric.database.tables.assistant_table import Assistants, AssistantsFiles
+from intric.database.tables.assistant_table import (
+    Assistants,
+    AssistantsFiles,
+    AssistantsWebsites,
+)
 from intric.database.tables.assistant_template_table import AssistantTemplates
 from intric.database.tables.collections_table import CollectionsTable
 from intric.database.tables.group_chats_table import (
@@ -64,6 +75,7 @@ from intric.spaces.space import Space
 from intric.spaces.space_factory import SpaceFactory
 from intric.database.tables.websites_spaces_table import WebsitesSpaces
 from intric.database.tables.integration_knowledge_spaces_table import IntegrationKnowledgesSpaces
+from intric.events.model_events import ModelUsageChanged
 from intric.main.logging import get_logger
 
 logger = get_logger(__name__)
@@ -111,6 +123,7 @@ class SpaceRepository:
         self.embedding_model_repo = embedding_model_repo
         self.assistant_repo = assistant_repo
         self.http_auth_encryption = http_auth_encryption
+        self.usage_counters = CompletionModelUsageCounters(session)
 
     def _options(self):
         return [
@@ -247,10 +260,15 @@ class SpaceRepository:
         self, space_in_db: Spaces, completion_models: list[CompletionModelSparse]
     ):
         # Delete all
-        stmt = sa.delete(SpacesCompletionModels).where(
-            SpacesCompletionModels.space_id == space_in_db.id
+        stmt = (
+            sa.delete(SpacesCompletionModels)
+            .where(SpacesCompletionModels.space_id == space_in_db.id)
+            .returning(SpacesCompletionModels.completion_model_id)
         )
-        await self.session.execute(stmt)
+        removed = await self.session.scalars(stmt)
+        usage_changes = [
+            ModelUsageChanged(counter=SPACES, old_model_id=model_id) for model_id in removed
+        ]
 
         if completion_models:
             stmt = sa.insert(SpacesCompletionModels).values(
@@ -260,6 +278,12 @@ class SpaceRepository:
                 ]
             )
             await self.session.execute(stmt)
+            usage_changes.extend(
+                ModelUsageChanged(counter=SPACES, new_model_id=completion_model.id)
+                for completion_model in completion_models
+            )
+
+        await self.usage_counters.apply(*usage_changes)
 
     async def _set_transcription_models(
         self, space_in_db: Spaces, transcription_models: list[TranscriptionModels]
@@ -413,8 +437,12 @@ class SpaceRepository:
             .where(Assistants.space_id == space_in_db.id)
             .where(Assistants.id.notin_([assistant.id for assistant in assistants]))
             .where(Assistants.is_default == False)  # noqa
+            .returning(Assistants.completion_model_id)
+        )
+        removed = await self.session.scalars(stmt)
+        await self.usage_counters.apply(
+            *[ModelUsageChanged(counter=ASSISTANTS, old_model_id=model_id) for model_id in removed]
         )
-        await self.session.execute(stmt)
 
     async def _set_default_assistant(self, space_in_db: Spaces, assistant: Optional["Assistant"]):
         if assistant is None:
@@ -1263,6 +1291,23 @@ class SpaceRepository:
         return await self.one(id=entry_in_db.id)
 
     async def delete(self, id: UUID):
+        # Everything in the space goes with it through cascading deletes, which
+        # the usage counters have to be told about up front
+        usage_changes = []
+        for table, counter in (
+            (Assistants, ASSISTANTS),
+            (Apps, APPS),
+            (Services, SERVICES),
+            (SpacesCompletionModels, SPACES),
+        ):
+            model_ids = await self.session.scalars(
+                sa.select(table.completion_model_id).where(table.space_id == id)
+            )
+            usage_changes.extend(
+                ModelUsageChanged(counter=counter, old_model_id=model_id) for model_id in model_ids
+            )
+        await self.usage_counters.apply(*usage_changes)
+
         query = sa.delete(Spaces).where(Spaces.id == id)
         await self.session.execute(query)
 
@@ -1470,7 +1515,15 @@ class SpaceRepository:
         # Use repo.add to ensure all relationships are properly set up
         return await self.add(space)
 
-    async def hard_delete_website(self, website_id: UUID, owner_space_id: UUID):
+    async def mark_website_deleting(
+        self, website_id: UUID, owner_space_id: UUID
+    ) -> bool:
+        """Detach the website from its spaces and assistants and mark it deleting.
+
+        The website disappears from every space at once; its info blobs and
+        chunks are deleted by the worker (see info_blobs/knowledge_deletion.py).
+        Returns False if the space does not own the website.
+        """
         ws = WebsitesTable
         wss = WebsitesSpaces
 
@@ -1480,8 +1533,18 @@ class SpaceRepository:
             )
         )
         if not owned:
-            return
+            return False
 
         await self.session.execute(sa.delete(wss).where(wss.website_id == website_id))
+        await self.session.execute(
+            sa.delete(AssistantsWebsites).where(
+                AssistantsWebsites.website_id == website_id
+            )
+        )
+        await self.session.execute(
+            sa.update(ws)
+            .where(ws.id == website_id)
+            .values(space_id=None, deleting_at=sa.func.now())
+        )
 
-        await self.session.execute(sa.delete(ws).where(ws.id == website_id))
\ No newline at end of file
+        return True
\ No newline at end of file
@@ -29,6 +29,7 @@ import sqlalchemy as sa
 from intric.database.tables.collections_table import CollectionsTable
 from intric.database.tables.integration_table import IntegrationKnowledge
 from intric.database.tables.websites_table import Websites
+from intric.group_chat.application.assistant_router import router_metrics
 from intric.main.exceptions import BadRequestException
 from intric.allowed_origins.allowed_origin_models import (
     AllowedOriginCreate,
@@ -434,6 +435,45 @@ async def crawl_all_weekly_websites(
     return await sysadmin_service.run_crawl_on_weekly_websites()
 
 
+class CrawlScheduleTickPublic(BaseModel):
+    starts_at: datetime
+    due: int = Field(..., description="Websites whose crawl slot has come")
+    released: int = Field(..., description="Websites released within the tick limit")
+
+
+class CrawlSchedulePublic(BaseModel):
+    tick_limit: int = Field(
+        ..., description="Crawls released per hourly tick, from observed capacity"
+    )
+    ticks: list[CrawlScheduleTickPublic]
+
+
+@router.get(
+    "/crawl-schedule/",
+    response_model=CrawlSchedulePublic,
+    summary="Get the projected crawl schedule",
+    description=(
+        "Projects how many scheduled website crawls the next 24 hourly ticks "
+        "release, given each website's crawl slot, tenant quiet hours and the "
+        "per-tick limit."
+    ),
+)
+async def get_crawl_schedule(
+    container: Container = Depends(get_container()),
+):
+    schedule = await container.crawl_scheduler_service().get_projected_schedule()
+
+    return CrawlSchedulePublic(
+        tick_limit=schedule.tick_limit,
+        ticks=[
+            CrawlScheduleTickPublic(
+                starts_at=tick.starts_at, due=tick.due, released=tick.released
+            )
+            for tick in schedule.ticks
+        ],
+    )
+
+
 def _mask_actor_label() -> str:
     return "super_api_key"
 
@@ -514,6 +554,28 @@ async def get_oidc_debug_status(
     )
 
 
+class GroupChatRouterMetrics(BaseModel):
+    routed: int
+    fallback_ambiguous: int
+    fallback_error: int
+    profile_cache_hits: int
+    profile_cache_misses: int
+    avg_latency_ms: float
+
+
+@router.get(
+    "/observability/group-chat-router/",
+    response_model=GroupChatRouterMetrics,
+    summary="Get group chat router decision metrics",
+    description=(
+        "Counts of group chat questions routed by embedding similarity versus "
+        "those that fell back to the LLM selector, for this API process."
+    ),
+)
+async def get_group_chat_router_metrics():
+    return GroupChatRouterMetrics(**router_metrics.snapshot())
+
+
 @router.get(
     "/embedding-models/",
     response_model=PaginatedResponse[EmbeddingModelLegacy],
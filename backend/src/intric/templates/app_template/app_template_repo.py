@@ -6,7 +6,12 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy import or_, func, update
 
+from intric.completion_models.infrastructure.usage_counters import (
+    APP_TEMPLATES,
+    CompletionModelUsageCounters,
+)
 from intric.database.tables.app_template_table import AppTemplates
+from intric.events.model_events import ModelUsageChanged
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -27,6 +32,7 @@ class AppTemplateRepository:
     def __init__(self, session: "AsyncSession", factory: "AppTemplateFactory"):
         self.session = session
         self.factory = factory
+        self.usage_counters = CompletionModelUsageCounters(session)
 
         self._db_model = AppTemplates
         # db relations
@@ -119,8 +125,18 @@ class AppTemplateRepository:
         return self.factory.create_app_template(item=template)
 
     async def delete(self, id: "UUID") -> None:
-        stmt = sa.delete(self._db_model).where(self._db_model.id == id)
-        await self.session.execute(stmt)
+        stmt = (
+            sa.delete(self._db_model)
+            .where(self._db_model.id == id)
+            .returning(self._db_model.completion_model_id)
+        )
+        model_ids = (await self.session.scalars(stmt)).all()
+        await self._apply_deleted_usage(model_ids)
+
+    async def _apply_deleted_usage(self, model_ids: list["UUID"]) -> None:
+        await self.usage_counters.apply(
+            *[ModelUsageChanged(counter=APP_TEMPLATES, old_model_id=model_id) for model_id in model_ids]
+        )
 
     async def update(
         self,
@@ -260,11 +276,13 @@ class AppTemplateRepository:
                 self._db_model.tenant_id == tenant_id,
                 self._db_model.deleted_at.is_not(None)  # Only hard-delete soft-deleted items
             )
+            .returning(self._db_model.completion_model_id)
         )
-        result = await self.session.execute(stmt)
+        model_ids = (await self.session.scalars(stmt)).all()
+        await self._apply_deleted_usage(model_ids)
         await self.session.flush()
 
-        return result.rowcount > 0
+        return len(model_ids) > 0
 
     async def get_deleted_for_tenant(self, tenant_id: "UUID") -> list["AppTemplate"]:
         """Get soft-deleted templates for audit trail view.
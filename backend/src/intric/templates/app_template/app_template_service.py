@@ -238,6 +238,23 @@ class AppTemplateService:
         result = await self.session.execute(stmt)
         updated_record = result.scalar_one()
 
+        if data.completion_model_id is not None:
+            from intric.completion_models.infrastructure.usage_counters import (
+                APP_TEMPLATES,
+                CompletionModelUsageCounters,
+            )
+            from intric.events.model_events import ModelUsageChanged
+
+            await CompletionModelUsageCounters(self.session).apply(
+                ModelUsageChanged(
+                    counter=APP_TEMPLATES,
+                    old_model_id=(
+                        template.completion_model.id if template.completion_model else None
+                    ),
+                    new_model_id=data.completion_model_id,
+                )
+            )
+
         # Eagerly load relationship to prevent lazy-load I/O in async context
         await self.session.refresh(updated_record, ["completion_model"])
 
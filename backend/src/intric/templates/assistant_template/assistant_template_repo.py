@@ -6,7 +6,12 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 from sqlalchemy import or_, func, update
 
+from intric.completion_models.infrastructure.usage_counters import (
+    ASSISTANT_TEMPLATES,
+    CompletionModelUsageCounters,
+)
 from intric.database.tables.assistant_template_table import AssistantTemplates
+from intric.events.model_events import ModelUsageChanged
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -28,6 +33,7 @@ class AssistantTemplateRepository:
     def __init__(self, session: "AsyncSession", factory: "AssistantTemplateFactory"):
         self.session = session
         self.factory = factory
+        self.usage_counters = CompletionModelUsageCounters(session)
 
         self._db_model = AssistantTemplates
         # db relations
@@ -120,8 +126,18 @@ class AssistantTemplateRepository:
         return self.factory.create_assistant_template(item=template)
 
     async def delete(self, id: "UUID") -> None:
-        stmt = sa.delete(self._db_model).where(self._db_model.id == id)
-        await self.session.execute(stmt)
+        stmt = (
+            sa.delete(self._db_model)
+            .where(self._db_model.id == id)
+            .returning(self._db_model.completion_model_id)
+        )
+        model_ids = (await self.session.scalars(stmt)).all()
+        await self._apply_deleted_usage(model_ids)
+
+    async def _apply_deleted_usage(self, model_ids: list["UUID"]) -> None:
+        await self.usage_counters.apply(
+            *[ModelUsageChanged(counter=ASSISTANT_TEMPLATES, old_model_id=model_id) for model_id in model_ids]
+        )
 
     async def update(
         self,
@@ -252,11 +268,13 @@ class AssistantTemplateRepository:
                 self._db_model.tenant_id == tenant_id,
                 self._db_model.deleted_at.is_not(None)  # Only hard-delete soft-deleted items
             )
+            .returning(self._db_model.completion_model_id)
         )
-        result = await self.session.execute(stmt)
+        model_ids = (await self.session.scalars(stmt)).all()
+        await self._apply_deleted_usage(model_ids)
         await self.session.flush()
 
-        return result.rowcount > 0
+        return len(model_ids) > 0
 
     async def get_deleted_for_tenant(self, tenant_id: "UUID") -> list["AssistantTemplate"]:
         """Get soft-deleted templates for audit trail view.
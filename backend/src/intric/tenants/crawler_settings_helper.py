@@ -121,6 +121,20 @@ CRAWLER_SETTING_SPECS: dict[str, dict[str, Any]] = {
         "env_attr": "crawl_feeder_batch_size",
         "description": "Maximum jobs to enqueue per feeder cycle per tenant (1 to 100)",
     },
+    "crawl_quiet_hours_start": {
+        "type": int,
+        "min": 0,
+        "max": 23,
+        "env_attr": "crawl_quiet_hours_start",
+        "description": "UTC hour when no scheduled crawls start (0 to 23, equal to end = none)",
+    },
+    "crawl_quiet_hours_end": {
+        "type": int,
+        "min": 0,
+        "max": 23,
+        "env_attr": "crawl_quiet_hours_end",
+        "description": "UTC hour when scheduled crawls may start again (0 to 23)",
+    },
     "crawl_job_max_age_seconds": {
         "type": int,
         "min": 300,
@@ -135,6 +149,21 @@ CRAWLER_SETTING_SPECS: dict[str, dict[str, Any]] = {
         "env_attr": "tenant_worker_semaphore_ttl_seconds",
         "description": "Concurrency slot TTL in seconds - must be >= crawl_max_length (1h to 24h)",
     },
+    "conditional_recrawl_enabled": {
+        "type": bool,
+        "default": True,
+        "description": "Send If-None-Match/If-Modified-Since on recrawls and keep unchanged pages",
+    },
+    "sitemap_incremental_enabled": {
+        "type": bool,
+        "default": True,
+        "description": "Sitemap crawls only fetch URLs whose lastmod is newer than the last complete crawl",
+    },
+    "near_duplicate_detection_enabled": {
+        "type": bool,
+        "default": True,
+        "description": "Drop pages that are near-duplicates of another page in the same crawl",
+    },
     "crawl_page_batch_size": {
         "type": int,
         "min": 10,
@@ -126,6 +126,21 @@ class CrawlerSettingsUpdate(BaseModel):
         description=_SPECS["autothrottle_enabled"]["description"],
         examples=[True],
     )
+    conditional_recrawl_enabled: bool | None = Field(
+        None,
+        description=_SPECS["conditional_recrawl_enabled"]["description"],
+        examples=[True],
+    )
+    sitemap_incremental_enabled: bool | None = Field(
+        None,
+        description=_SPECS["sitemap_incremental_enabled"]["description"],
+        examples=[True],
+    )
+    near_duplicate_detection_enabled: bool | None = Field(
+        None,
+        description=_SPECS["near_duplicate_detection_enabled"]["description"],
+        examples=[True],
+    )
 
     # Concurrency settings
     tenant_worker_concurrency_limit: int | None = Field(
@@ -173,6 +188,22 @@ class CrawlerSettingsUpdate(BaseModel):
         examples=[10],
     )
 
+    # Scheduling settings
+    crawl_quiet_hours_start: int | None = Field(
+        None,
+        ge=_SPECS["crawl_quiet_hours_start"]["min"],
+        le=_SPECS["crawl_quiet_hours_start"]["max"],
+        description=_SPECS["crawl_quiet_hours_start"]["description"],
+        examples=[6],
+    )
+    crawl_quiet_hours_end: int | None = Field(
+        None,
+        ge=_SPECS["crawl_quiet_hours_end"]["min"],
+        le=_SPECS["crawl_quiet_hours_end"]["max"],
+        description=_SPECS["crawl_quiet_hours_end"]["description"],
+        examples=[16],
+    )
+
     # Job age limit
     crawl_job_max_age_seconds: int | None = Field(
         None,
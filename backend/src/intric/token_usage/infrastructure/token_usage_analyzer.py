@@ -1,15 +1,17 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, select, union_all
+from sqlalchemy import func, select
 
 from intric.database.tables.ai_models_table import CompletionModels
-from intric.database.tables.app_table import AppRuns
 from intric.database.tables.model_providers_table import ModelProviders
-from intric.database.tables.questions_table import Questions
 from intric.token_usage.domain.token_usage_models import (
     ModelTokenUsage,
     TokenUsageSummary,
 )
+from intric.token_usage.infrastructure.token_usage_rollups import (
+    TokenUsageRollupRepository,
+    token_usage_query,
+)
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -29,7 +31,11 @@ class TokenUsageAnalyzer:
         self.session = session
 
     async def get_model_token_usage(
-        self, tenant_id: "UUID", start_date: "datetime", end_date: "datetime"
+        self,
+        tenant_id: "UUID",
+        start_date: "datetime",
+        end_date: "datetime",
+        user_id: "UUID | None" = None,
     ) -> TokenUsageSummary:
         """
         Get token usage statistics aggregated by model.
@@ -38,72 +44,38 @@ class TokenUsageAnalyzer:
             tenant_id: The tenant ID to filter by
             start_date: The start date for the analysis period
             end_date: The end date for the analysis period
+            user_id: Optional user ID to only count that user's usage
 
         Returns:
             A TokenUsageSummary with token usage per model
         """
 
-        # Get token usage from questions (chat messages)
-        questions_query = (
-            select(
-                Questions.completion_model_id.label("model_id"),
-                CompletionModels.name.label("model_name"),
-                CompletionModels.nickname.label("model_nickname"),
-                CompletionModels.org.label("model_org"),
-                ModelProviders.name.label("model_provider"),
-                func.sum(Questions.num_tokens_question).label("input_tokens"),
-                func.sum(Questions.num_tokens_answer).label("output_tokens"),
-                func.count(Questions.id).label("request_count"),
-            )
-            .join(
-                CompletionModels,
-                Questions.completion_model_id == CompletionModels.id,
-            )
-            .outerjoin(
-                ModelProviders,
-                CompletionModels.provider_id == ModelProviders.id,
-            )
-            .where(Questions.tenant_id == tenant_id)
-            .where(Questions.created_at >= start_date)
-            .where(Questions.created_at <= end_date)
-            .group_by(
-                Questions.completion_model_id,
-                CompletionModels.name,
-                CompletionModels.nickname,
-                CompletionModels.org,
-                ModelProviders.name,
-            )
-        )
+        # Usage from questions (chat messages) and app runs, read from the
+        # daily rollups where they cover the period
+        coverage = await TokenUsageRollupRepository(self.session).get_coverage()
+        usage = token_usage_query(
+            tenant_id, start_date, end_date, coverage, user_id=user_id
+        ).subquery("usage")
 
-        # Get token usage from app runs
-        app_runs_query = (
+        # Sum up the input/output tokens and request counts for each model
+        final_query = (
             select(
-                AppRuns.completion_model_id.label("model_id"),
+                usage.c.model_id,
                 CompletionModels.name.label("model_name"),
                 CompletionModels.nickname.label("model_nickname"),
                 CompletionModels.org.label("model_org"),
                 ModelProviders.name.label("model_provider"),
-                func.sum(func.coalesce(AppRuns.num_tokens_input, 0)).label(
-                    "input_tokens"
-                ),
-                func.sum(func.coalesce(AppRuns.num_tokens_output, 0)).label(
-                    "output_tokens"
-                ),
-                func.count(AppRuns.id).label("request_count"),
-            )
-            .join(
-                CompletionModels,
-                AppRuns.completion_model_id == CompletionModels.id,
+                func.sum(usage.c.input_tokens).label("input_tokens"),
+                func.sum(usage.c.output_tokens).label("output_tokens"),
+                func.sum(usage.c.request_count).label("request_count"),
             )
+            .join(CompletionModels, usage.c.model_id == CompletionModels.id)
             .outerjoin(
                 ModelProviders,
                 CompletionModels.provider_id == ModelProviders.id,
             )
-            .where(AppRuns.tenant_id == tenant_id)
-            .where(AppRuns.created_at >= start_date)
-            .where(AppRuns.created_at <= end_date)
             .group_by(
-                AppRuns.completion_model_id,
+                usage.c.model_id,
                 CompletionModels.name,
                 CompletionModels.nickname,
                 CompletionModels.org,
@@ -111,29 +83,6 @@ class TokenUsageAnalyzer:
             )
         )
 
-        # Combine the results from both queries using union_all
-        combined_usage_query = union_all(questions_query, app_runs_query).alias(
-            "combined_usage"
-        )
-
-        # Sum up the input/output tokens and request counts for each model
-        final_query = select(
-            combined_usage_query.c.model_id,
-            combined_usage_query.c.model_name,
-            combined_usage_query.c.model_nickname,
-            combined_usage_query.c.model_org,
-            combined_usage_query.c.model_provider,
-            func.sum(combined_usage_query.c.input_tokens).label("input_tokens"),
-            func.sum(combined_usage_query.c.output_tokens).label("output_tokens"),
-            func.sum(combined_usage_query.c.request_count).label("request_count"),
-        ).group_by(
-            combined_usage_query.c.model_id,
-            combined_usage_query.c.model_name,
-            combined_usage_query.c.model_nickname,
-            combined_usage_query.c.model_org,
-            combined_usage_query.c.model_provider,
-        )
-
         # Execute the query
         result = await self.session.execute(final_query)
         rows = result.all()
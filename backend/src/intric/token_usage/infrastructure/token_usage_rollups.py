@@ -0,0 +1,341 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+
+import sqlalchemy as sa
+
+from intric.database.tables.app_table import AppRuns
+from intric.database.tables.questions_table import Questions
+from intric.database.tables.sessions_table import Sessions
+from intric.database.tables.token_usage_rollups_table import (
+    TokenUsageDailyRollups,
+    TokenUsageRollupState,
+)
+from intric.main.logging import get_logger
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+SOURCE_QUESTION = "question"
+SOURCE_APP_RUN = "app_run"
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _utc_day(column):
+    # Inlined rather than bound, so the expression in SELECT and GROUP BY is
+    # identical
+    return sa.cast(sa.func.timezone(sa.literal_column("'UTC'"), column), sa.Date)
+
+
+@dataclass(frozen=True)
+class RollupCoverage:
+    covered_from: date
+    refreshed_through: date
+
+    def final_days(
+        self, start_date: datetime, end_date: datetime
+    ) -> Optional[tuple[date, date]]:
+        """The whole UTC days in [start_date, end_date] with final rollups.
+
+        Returns an inclusive (first, last) pair, or None if there are none.
+        """
+        start_date, end_date = _as_utc(start_date), _as_utc(end_date)
+
+        first = start_date.astimezone(timezone.utc).date()
+        if _day_start(first) < start_date:
+            first += timedelta(days=1)
+        last = end_date.astimezone(timezone.utc).date() - timedelta(days=1)
+
+        first = max(first, self.covered_from)
+        last = min(last, self.refreshed_through - timedelta(days=1))
+        if first > last:
+            return None
+        return first, last
+
+
+def token_usage_query(
+    tenant_id: "UUID",
+    start_date: datetime,
+    end_date: datetime,
+    coverage: Optional[RollupCoverage],
+    user_id: Optional["UUID"] = None,
+) -> sa.Select:
+    """Token usage in [start_date, end_date] grouped by user and model.
+
+    Whole days with final rollups are read from the rollup table; the rest of
+    the period (at most the partial days at each end and the days not yet
+    rolled up) is aggregated from questions and app runs.
+    """
+    final_days = coverage.final_days(start_date, end_date) if coverage else None
+
+    if final_days is None:
+        raw_ranges = [(start_date, end_date, True)]
+    else:
+        first, last = final_days
+        raw_ranges = [
+            (start_date, _day_start(first), False),
+            (_day_start(last + timedelta(days=1)), end_date, True),
+        ]
+
+    parts = []
+    for range_start, range_end, inclusive in raw_ranges:
+        parts.append(
+            _questions_usage(tenant_id, range_start, range_end, inclusive, user_id)
+        )
+        parts.append(
+            _app_runs_usage(tenant_id, range_start, range_end, inclusive, user_id)
+        )
+
+    if final_days is not None:
+        parts.append(_rollup_usage(tenant_id, *final_days, user_id))
+
+    return sa.union_all(*parts)
+
+
+def _questions_usage(tenant_id, start_date, end_date, inclusive, user_id):
+    query = (
+        sa.select(
+            Sessions.user_id.label("user_id"),
+            Questions.completion_model_id.label("model_id"),
+            sa.func.sum(Questions.num_tokens_question).label("input_tokens"),
+            sa.func.sum(Questions.num_tokens_answer).label("output_tokens"),
+            sa.func.count(Questions.id).label("request_count"),
+        )
+        .select_from(Questions)
+        .outerjoin(Sessions, Questions.session_id == Sessions.id)
+        .where(Questions.tenant_id == tenant_id)
+        .where(Questions.created_at >= start_date)
+        .where(
+            Questions.created_at <= end_date
+            if inclusive
+            else Questions.created_at < end_date
+        )
+        .group_by(Sessions.user_id, Questions.completion_model_id)
+    )
+    if user_id is not None:
+        query = query.where(Sessions.user_id == user_id)
+    return query
+
+
+def _app_runs_usage(tenant_id, start_date, end_date, inclusive, user_id):
+    query = (
+        sa.select(
+            AppRuns.user_id.label("user_id"),
+            AppRuns.completion_model_id.label("model_id"),
+            sa.func.sum(sa.func.coalesce(AppRuns.num_tokens_input, 0)).label(
+                "input_tokens"
+            ),
+            sa.func.sum(sa.func.coalesce(AppRuns.num_tokens_output, 0)).label(
+                "output_tokens"
+            ),
+            sa.func.count(AppRuns.id).label("request_count"),
+        )
+        .where(AppRuns.tenant_id == tenant_id)
+        .where(AppRuns.created_at >= start_date)
+        .where(
+            AppRuns.created_at <= end_date
+            if inclusive
+            else AppRuns.created_at < end_date
+        )
+        .group_by(AppRuns.user_id, AppRuns.completion_model_id)
+    )
+    if user_id is not None:
+        query = query.where(AppRuns.user_id == user_id)
+    return query
+
+
+def _rollup_usage(tenant_id, first: date, last: date, user_id):
+    query = (
+        sa.select(
+            TokenUsageDailyRollups.user_id.label("user_id"),
+            TokenUsageDailyRollups.completion_model_id.label("model_id"),
+            sa.func.sum(TokenUsageDailyRollups.input_tokens).label("input_tokens"),
+            sa.func.sum(TokenUsageDailyRollups.output_tokens).label("output_tokens"),
+            sa.func.sum(TokenUsageDailyRollups.request_count).label("request_count"),
+        )
+        .where(TokenUsageDailyRollups.tenant_id == tenant_id)
+        .where(TokenUsageDailyRollups.day >= first)
+        .where(TokenUsageDailyRollups.day <= last)
+        .group_by(
+            TokenUsageDailyRollups.user_id, TokenUsageDailyRollups.completion_model_id
+        )
+    )
+    if user_id is not None:
+        query = query.where(TokenUsageDailyRollups.user_id == user_id)
+    return query
+
+
+class TokenUsageRollupRepository:
+    """Maintains the daily token usage rollups from questions and app runs.
+
+    Rollups are recomputed a whole day at a time, so re-running any step is
+    safe. The latest day keeps being recomputed until the following day is
+    over, which picks up late writes such as app runs finishing after midnight.
+    """
+
+    def __init__(self, session: "AsyncSession"):
+        self.session = session
+
+    async def get_coverage(self) -> Optional[RollupCoverage]:
+        state = await self.session.scalar(sa.select(TokenUsageRollupState).limit(1))
+        if state is None:
+            return None
+        return RollupCoverage(
+            covered_from=state.covered_from, refreshed_through=state.refreshed_through
+        )
+
+    async def refresh(self, today: Optional[date] = None) -> int:
+        """Recompute the days since the last refresh up to yesterday.
+
+        Returns the number of days recomputed.
+        """
+        yesterday = (today or datetime.now(timezone.utc).date()) - timedelta(days=1)
+        coverage = await self.get_coverage()
+        first = coverage.refreshed_through if coverage else yesterday
+        if first > yesterday:
+            return 0
+
+        await self._recompute(first, yesterday)
+        await self._save_coverage(
+            covered_from=coverage.covered_from if coverage else first,
+            refreshed_through=yesterday,
+        )
+        return (yesterday - first).days + 1
+
+    async def backfill(self, max_days: int) -> int:
+        """Roll up up to max_days of history before the covered period.
+
+        Returns the number of days rolled up; 0 once history is covered.
+        """
+        coverage = await self.get_coverage()
+        if coverage is None:
+            return 0
+
+        earliest = await self._earliest_day()
+        if earliest is None or earliest >= coverage.covered_from:
+            return 0
+
+        last = coverage.covered_from - timedelta(days=1)
+        first = max(earliest, coverage.covered_from - timedelta(days=max_days))
+        await self._recompute(first, last)
+        await self._save_coverage(
+            covered_from=first, refreshed_through=coverage.refreshed_through
+        )
+        return (last - first).days + 1
+
+    async def _earliest_day(self) -> Optional[date]:
+        earliest_question = await self.session.scalar(
+            sa.select(sa.func.min(Questions.created_at))
+        )
+        earliest_app_run = await self.session.scalar(
+            sa.select(sa.func.min(AppRuns.created_at))
+        )
+        candidates = [
+            value
+            for value in (earliest_question, earliest_app_run)
+            if value is not None
+        ]
+        if not candidates:
+            return None
+        return min(candidates).astimezone(timezone.utc).date()
+
+    async def _recompute(self, first: date, last: date):
+        start_date = _day_start(first)
+        end_date = _day_start(last + timedelta(days=1))
+
+        await self.session.execute(
+            sa.delete(TokenUsageDailyRollups)
+            .where(TokenUsageDailyRollups.day >= first)
+            .where(TokenUsageDailyRollups.day <= last)
+        )
+
+        columns = [
+            "tenant_id",
+            "day",
+            "user_id",
+            "completion_model_id",
+            "source",
+            "input_tokens",
+            "output_tokens",
+            "request_count",
+        ]
+        question_day = _utc_day(Questions.created_at)
+        questions = (
+            sa.select(
+                Questions.tenant_id,
+                question_day,
+                Sessions.user_id,
+                Questions.completion_model_id,
+                sa.literal(SOURCE_QUESTION),
+                sa.func.sum(sa.func.coalesce(Questions.num_tokens_question, 0)),
+                sa.func.sum(sa.func.coalesce(Questions.num_tokens_answer, 0)),
+                sa.func.count(Questions.id),
+            )
+            .select_from(Questions)
+            .outerjoin(Sessions, Questions.session_id == Sessions.id)
+            .where(Questions.created_at >= start_date)
+            .where(Questions.created_at < end_date)
+            .group_by(
+                Questions.tenant_id,
+                question_day,
+                Sessions.user_id,
+                Questions.completion_model_id,
+            )
+        )
+        app_run_day = _utc_day(AppRuns.created_at)
+        app_runs = (
+            sa.select(
+                AppRuns.tenant_id,
+                app_run_day,
+                AppRuns.user_id,
+                AppRuns.completion_model_id,
+                sa.literal(SOURCE_APP_RUN),
+                sa.func.sum(sa.func.coalesce(AppRuns.num_tokens_input, 0)),
+                sa.func.sum(sa.func.coalesce(AppRuns.num_tokens_output, 0)),
+                sa.func.count(AppRuns.id),
+            )
+            .where(AppRuns.created_at >= start_date)
+            .where(AppRuns.created_at < end_date)
+            .group_by(
+                AppRuns.tenant_id,
+                app_run_day,
+                AppRuns.user_id,
+                AppRuns.completion_model_id,
+            )
+        )
+
+        for query in (questions, app_runs):
+            await self.session.execute(
+                sa.insert(TokenUsageDailyRollups).from_select(columns, query)
+            )
+
+        logger.info(
+            "token_usage_rollup_recomputed",
+            extra={"first_day": first.isoformat(), "last_day": last.isoformat()},
+        )
+
+    async def _save_coverage(self, *, covered_from: date, refreshed_through: date):
+        state = await self.session.scalar(sa.select(TokenUsageRollupState).limit(1))
+        if state is None:
+            self.session.add(
+                TokenUsageRollupState(
+                    covered_from=covered_from, refreshed_through=refreshed_through
+                )
+            )
+        else:
+            state.covered_from = covered_from
+            state.refreshed_through = refreshed_through
+        await self.session.flush()
@@ -1,18 +1,19 @@
 from typing import TYPE_CHECKING
 import logging
 
-from sqlalchemy import func, select, union_all, desc, asc
+from sqlalchemy import func, select, desc, asc
 
-from intric.database.tables.ai_models_table import CompletionModels
-from intric.database.tables.app_table import AppRuns
-from intric.database.tables.model_providers_table import ModelProviders
-from intric.database.tables.questions_table import Questions
-from intric.database.tables.sessions_table import Sessions
 from intric.database.tables.users_table import Users
 from intric.token_usage.domain.token_usage_models import (
     ModelTokenUsage,
     TokenUsageSummary,
 )
+from intric.token_usage.infrastructure.token_usage_analyzer import TokenUsageAnalyzer
+from intric.token_usage.infrastructure.token_usage_rollups import (
+    RollupCoverage,
+    TokenUsageRollupRepository,
+    token_usage_query,
+)
 from intric.token_usage.domain.user_token_usage_models import (
     UserTokenUsage,
     UserTokenUsageSummary,
@@ -35,120 +36,51 @@ class UserTokenUsageAnalyzer:
 
     def __init__(self, session: "AsyncSession"):
         self.session = session
+        self.rollups = TokenUsageRollupRepository(session)
 
-    def _build_questions_query(self, tenant_id: "UUID", start_date: "datetime", end_date: "datetime", user_id: "UUID" = None):
+    def _build_combined_usage_query(self, tenant_id: "UUID", start_date: "datetime", end_date: "datetime", coverage: "RollupCoverage | None", user_id: "UUID" = None):
         """
-        Build the questions query for token usage calculation.
-
-        Args:
-            tenant_id: The tenant ID to filter by
-            start_date: The start date for the analysis period
-            end_date: The end date for the analysis period
-            user_id: Optional user ID to filter by (for single user queries)
-
-        Returns:
-            A SQLAlchemy select query for questions token usage
-        """
-        query = (
-            select(
-                Users.id.label("user_id"),
-                Users.username.label("username"),
-                Users.email.label("email"),
-                func.sum(Questions.num_tokens_question).label("input_tokens"),
-                func.sum(Questions.num_tokens_answer).label("output_tokens"),
-                func.count(Questions.id).label("request_count"),
-            )
-            .join(Sessions, Users.id == Sessions.user_id)
-            .join(Questions,
-                (Questions.session_id == Sessions.id) &
-                (Questions.tenant_id == tenant_id) &
-                (Questions.created_at >= start_date) &
-                (Questions.created_at <= end_date)
-            )
-            .where(Users.tenant_id == tenant_id)
-        )
-
-        if user_id:
-            query = query.where(Users.id == user_id)
+        Build the combined usage query over questions and app runs.
 
-        return query.group_by(Users.id, Users.username, Users.email)
-
-    def _build_app_runs_query(self, tenant_id: "UUID", start_date: "datetime", end_date: "datetime", user_id: "UUID" = None):
-        """
-        Build the app runs query for token usage calculation.
+        Whole days covered by the daily rollups are read from them; the rest
+        of the period comes from the questions and app runs tables.
 
         Args:
             tenant_id: The tenant ID to filter by
             start_date: The start date for the analysis period
             end_date: The end date for the analysis period
+            coverage: The days covered by the daily rollups, if any
             user_id: Optional user ID to filter by (for single user queries)
 
         Returns:
-            A SQLAlchemy select query for app runs token usage
+            A SQLAlchemy select query for combined token usage
         """
-        query = (
+        usage = token_usage_query(
+            tenant_id, start_date, end_date, coverage, user_id=user_id
+        ).subquery("usage")
+
+        # Sum up the input/output tokens and request counts
+        base_query = (
             select(
                 Users.id.label("user_id"),
                 Users.username.label("username"),
                 Users.email.label("email"),
-                func.sum(AppRuns.num_tokens_input).label("input_tokens"),
-                func.sum(AppRuns.num_tokens_output).label("output_tokens"),
-                func.count(AppRuns.id).label("request_count"),
-            )
-            .join(AppRuns,
-                (AppRuns.user_id == Users.id) &
-                (AppRuns.tenant_id == tenant_id) &
-                (AppRuns.created_at >= start_date) &
-                (AppRuns.created_at <= end_date)
+                func.sum(usage.c.input_tokens).label("input_tokens"),
+                func.sum(usage.c.output_tokens).label("output_tokens"),
+                func.sum(usage.c.request_count).label("request_count"),
+                (func.sum(usage.c.input_tokens) +
+                 func.sum(usage.c.output_tokens)).label("total_tokens"),
             )
+            .join(usage, usage.c.user_id == Users.id)
             .where(Users.tenant_id == tenant_id)
-        )
-
-        if user_id:
-            query = query.where(Users.id == user_id)
-
-        return query.group_by(Users.id, Users.username, Users.email)
-
-    def _build_combined_usage_query(self, tenant_id: "UUID", start_date: "datetime", end_date: "datetime", user_id: "UUID" = None):
-        """
-        Build the combined usage query that merges questions and app runs data.
-
-        Args:
-            tenant_id: The tenant ID to filter by
-            start_date: The start date for the analysis period
-            end_date: The end date for the analysis period
-            user_id: Optional user ID to filter by (for single user queries)
-
-        Returns:
-            A SQLAlchemy select query for combined token usage
-        """
-        questions_query = self._build_questions_query(tenant_id, start_date, end_date, user_id)
-        app_runs_query = self._build_app_runs_query(tenant_id, start_date, end_date, user_id)
-
-        # Combine the results from both queries using union_all
-        combined_usage_query = union_all(questions_query, app_runs_query).alias("combined_usage")
-
-        # Sum up the input/output tokens and request counts
-        base_query = select(
-            combined_usage_query.c.user_id,
-            combined_usage_query.c.username,
-            combined_usage_query.c.email,
-            func.sum(combined_usage_query.c.input_tokens).label("input_tokens"),
-            func.sum(combined_usage_query.c.output_tokens).label("output_tokens"),
-            func.sum(combined_usage_query.c.request_count).label("request_count"),
-            (func.sum(combined_usage_query.c.input_tokens) +
-             func.sum(combined_usage_query.c.output_tokens)).label("total_tokens"),
-        ).group_by(
-            combined_usage_query.c.user_id,
-            combined_usage_query.c.username,
-            combined_usage_query.c.email,
+            .group_by(Users.id, Users.username, Users.email)
         )
 
         if not user_id:
             # Only add HAVING clause for multi-user queries to filter out users with no usage
             base_query = base_query.having(
-                (func.sum(combined_usage_query.c.input_tokens) +
-                 func.sum(combined_usage_query.c.output_tokens)) > 0
+                (func.sum(usage.c.input_tokens) +
+                 func.sum(usage.c.output_tokens)) > 0
             )
 
         return base_query
@@ -174,7 +106,8 @@ class UserTokenUsageAnalyzer:
         logger.info(f"Getting user token usage for tenant {tenant_id} with sort_by={sort_by} and sort_order={sort_order}")
 
         # Build the base query using the helper method
-        base_query = self._build_combined_usage_query(tenant_id, start_date, end_date)
+        coverage = await self.rollups.get_coverage()
+        base_query = self._build_combined_usage_query(tenant_id, start_date, end_date, coverage)
 
         # Get the total count of users
         count_query = select(func.count()).select_from(base_query.alias("count_query"))
@@ -275,7 +208,8 @@ class UserTokenUsageAnalyzer:
         logger.info(f"Getting single user summary for user {user_id} in tenant {tenant_id}")
 
         # Build the base query using the helper method
-        query = self._build_combined_usage_query(tenant_id, start_date, end_date, user_id)
+        coverage = await self.rollups.get_coverage()
+        query = self._build_combined_usage_query(tenant_id, start_date, end_date, coverage, user_id)
 
         result = await self.session.execute(query)
         row = result.first()
@@ -313,124 +247,8 @@ class UserTokenUsageAnalyzer:
     ) -> TokenUsageSummary:
         """
         Internal method to get model breakdown for a specific user.
-        This reuses the existing TokenUsageAnalyzer pattern but filters by user_id.
+        This reuses TokenUsageAnalyzer, filtered by user_id.
         """
-
-        # Get token usage from questions (chat messages) for this user - join through sessions
-        questions_query = (
-            select(
-                Questions.completion_model_id.label("model_id"),
-                CompletionModels.name.label("model_name"),
-                CompletionModels.nickname.label("model_nickname"),
-                CompletionModels.org.label("model_org"),
-                ModelProviders.name.label("model_provider"),
-                func.sum(Questions.num_tokens_question).label("input_tokens"),
-                func.sum(Questions.num_tokens_answer).label("output_tokens"),
-                func.count(Questions.id).label("request_count"),
-            )
-            .join(Sessions, Questions.session_id == Sessions.id)
-            .join(
-                CompletionModels,
-                Questions.completion_model_id == CompletionModels.id,
-            )
-            .outerjoin(
-                ModelProviders,
-                CompletionModels.provider_id == ModelProviders.id,
-            )
-            .where(Questions.tenant_id == tenant_id)
-            .where(Sessions.user_id == user_id)
-            .where(Questions.created_at >= start_date)
-            .where(Questions.created_at <= end_date)
-            .group_by(
-                Questions.completion_model_id,
-                CompletionModels.name,
-                CompletionModels.nickname,
-                CompletionModels.org,
-                ModelProviders.name,
-            )
-        )
-
-        # Get token usage from app runs for this user
-        app_runs_query = (
-            select(
-                AppRuns.completion_model_id.label("model_id"),
-                CompletionModels.name.label("model_name"),
-                CompletionModels.nickname.label("model_nickname"),
-                CompletionModels.org.label("model_org"),
-                ModelProviders.name.label("model_provider"),
-                func.sum(func.coalesce(AppRuns.num_tokens_input, 0)).label(
-                    "input_tokens"
-                ),
-                func.sum(func.coalesce(AppRuns.num_tokens_output, 0)).label(
-                    "output_tokens"
-                ),
-                func.count(AppRuns.id).label("request_count"),
-            )
-            .join(
-                CompletionModels,
-                AppRuns.completion_model_id == CompletionModels.id,
-            )
-            .outerjoin(
-                ModelProviders,
-                CompletionModels.provider_id == ModelProviders.id,
-            )
-            .where(AppRuns.tenant_id == tenant_id)
-            .where(AppRuns.user_id == user_id)
-            .where(AppRuns.created_at >= start_date)
-            .where(AppRuns.created_at <= end_date)
-            .group_by(
-                AppRuns.completion_model_id,
-                CompletionModels.name,
-                CompletionModels.nickname,
-                CompletionModels.org,
-                ModelProviders.name,
-            )
-        )
-
-        # Combine the results from both queries using union_all
-        combined_usage_query = union_all(questions_query, app_runs_query).alias(
-            "combined_usage"
-        )
-
-        # Sum up the input/output tokens and request counts for each model
-        final_query = select(
-            combined_usage_query.c.model_id,
-            combined_usage_query.c.model_name,
-            combined_usage_query.c.model_nickname,
-            combined_usage_query.c.model_org,
-            combined_usage_query.c.model_provider,
-            func.sum(combined_usage_query.c.input_tokens).label("input_tokens"),
-            func.sum(combined_usage_query.c.output_tokens).label("output_tokens"),
-            func.sum(combined_usage_query.c.request_count).label("request_count"),
-        ).group_by(
-            combined_usage_query.c.model_id,
-            combined_usage_query.c.model_name,
-            combined_usage_query.c.model_nickname,
-            combined_usage_query.c.model_org,
-            combined_usage_query.c.model_provider,
-        )
-
-        # Execute the query
-        result = await self.session.execute(final_query)
-        rows = result.all()
-
-        # Transform the result into ModelTokenUsage objects
-        token_usage_by_model = []
-        for row in rows:
-            if row.model_id is not None:
-                token_usage_by_model.append(
-                    ModelTokenUsage(
-                        model_id=row.model_id,
-                        model_name=row.model_name,
-                        model_nickname=row.model_nickname,
-                        model_org=row.model_org,
-                        model_provider=row.model_provider,
-                        input_token_usage=row.input_tokens or 0,
-                        output_token_usage=row.output_tokens or 0,
-                        request_count=row.request_count or 0,
-                    )
-                )
-
-        return TokenUsageSummary.from_model_usages(
-            model_usages=token_usage_by_model, start_date=start_date, end_date=end_date
+        return await TokenUsageAnalyzer(self.session).get_model_token_usage(
+            tenant_id, start_date, end_date, user_id=user_id
         )
@@ -1,5 +1,6 @@
 # MIT License
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -12,7 +13,8 @@ from tenacity import (
     wait_random_exponential,
 )
 
-from intric.files.audio import AudioFile
+from intric.files.audio import AudioFile, AudioSegment
+from intric.main.config import get_settings
 from intric.main.exceptions import BadRequestException, OpenAIException
 from intric.main.logging import get_logger
 
@@ -83,38 +85,63 @@ class LiteLLMTranscriptionAdapter:
 
     async def get_text_from_file(self, audio_file: AudioFile) -> str:
         """
-        Transcribe an audio file, splitting into 5-minute chunks with timestamps.
+        Transcribe an audio file in 5-minute segments, with timestamps.
+
+        Segments are transcribed as soon as they are encoded, with at most
+        transcription_max_concurrent_segments provider calls in flight, and
+        reassembled in order.
         """
-        text = ""
         five_minutes = 60 * 5
-        chunk_index = 0
         total_duration_seconds = int(audio_file.info.duration)
+        semaphore = asyncio.Semaphore(
+            get_settings().transcription_max_concurrent_segments
+        )
+        segments: list[AudioSegment] = []
+        tasks: list[asyncio.Task[str]] = []
 
-        async with audio_file.asplit_file(seconds=five_minutes) as files:
-            total_chunks = len(files)
-
-            for i, path in enumerate(files):
-                block_text = await self._transcribe_chunk(path)
-                start_time = chunk_index * five_minutes
-
-                # For the last chunk, calculate the correct end time based on total duration
-                if i == total_chunks - 1:
-                    end_time = total_duration_seconds
-                else:
-                    end_time = (chunk_index + 1) * five_minutes
-
-                start_time_formatted = f"{start_time // 60}:{start_time % 60:02d}"
-                end_time_formatted = f"{end_time // 60}:{end_time % 60:02d}"
+        async def transcribe_segment(segment: AudioSegment) -> str:
+            try:
+                return await self._transcribe_chunk(segment.path)
+            finally:
+                semaphore.release()
 
-                # Add markdown formatting with timestamp
-                if chunk_index > 0:
-                    text += "\n\n"
-                text += (
-                    f"### {start_time_formatted} - {end_time_formatted}\n\n{block_text}"
-                )
-                chunk_index += 1
+        try:
+            async with audio_file.astream_segments(seconds=five_minutes) as stream:
+                async with asyncio.TaskGroup() as task_group:
+                    while True:
+                        # Wait for a free slot before encoding the next segment
+                        await semaphore.acquire()
+                        segment = await anext(stream, None)
+                        if segment is None:
+                            semaphore.release()
+                            break
+                        segments.append(segment)
+                        tasks.append(
+                            task_group.create_task(transcribe_segment(segment))
+                        )
+        except BaseExceptionGroup as e:
+            # Surface the provider error itself, as the sequential version did
+            raise e.exceptions[0] from None
+
+        blocks = []
+        for i, (segment, task) in enumerate(zip(segments, tasks)):
+            start_time = int(segment.start_seconds)
+
+            # For the last segment, use the total duration as end time
+            if i == len(segments) - 1:
+                end_time = total_duration_seconds
+            else:
+                end_time = int(segment.end_seconds)
+
+            start_time_formatted = f"{start_time // 60}:{start_time % 60:02d}"
+            end_time_formatted = f"{end_time // 60}:{end_time % 60:02d}"
+
+            # Add markdown formatting with timestamp
+            blocks.append(
+                f"### {start_time_formatted} - {end_time_formatted}\n\n{task.result()}"
+            )
 
-        return text
+        return "\n\n".join(blocks)
 
     @retry(
         wait=wait_random_exponential(min=1, max=20),
@@ -4,12 +4,24 @@ Why: Centralizes scheduling logic for better maintainability and testing.
 Engine-agnostic design allows future crawler engines without changes.
 """
 
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+import math
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
 
+from intric.main.config import get_settings
 from intric.main.logging import get_logger
+from intric.websites.domain.crawl_slots import (
+    HOURS_PER_DAY,
+    CrawlSchedule,
+    CrawlScheduleTick,
+    get_quiet_hours,
+    is_due,
+    overdue_first,
+)
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from intric.websites.domain.website import WebsiteSparse
     from intric.websites.domain.website_sparse_repo import WebsiteSparseRepository
 
@@ -26,21 +38,31 @@ class CrawlSchedulerService:
     def __init__(self, website_sparse_repo: "WebsiteSparseRepository"):
         self.website_sparse_repo = website_sparse_repo
 
-    async def get_websites_due_for_crawl(self) -> list["WebsiteSparse"]:
-        """Get all websites that are due for crawling today.
+    async def get_websites_due_for_crawl(
+        self, now: Optional[datetime] = None
+    ) -> list["WebsiteSparse"]:
+        """Get the websites to release in this scheduling tick.
 
-        Why: Delegates to repository for database-side filtering performance.
-        Scales efficiently with 1000+ websites by leveraging database indexes.
+        Why: Releasing every website whose interval ran out at once makes the
+        crawls of websites created together, and of all websites after an
+        outage, land in the same hour. Each website is instead released in
+        its own hourly slot (see crawl_slots), most overdue first, up to the
+        tick limit; the rest follow on the next ticks.
 
         Returns:
-            List of websites that should be crawled today
+            List of websites that should be crawled now
         """
         logger.info("Determining websites due for crawling")
 
-        today = datetime.now(timezone.utc).date()  # Use UTC to match DB and cron
-        due_websites = await self.website_sparse_repo.get_due_websites(today)
+        now = now or datetime.now(timezone.utc)  # Use UTC to match DB and cron
+        due_websites = await self._get_due_websites(now)
+        limit = await self.get_tick_limit(now)
 
-        logger.info(f"Found {len(due_websites)} websites due for crawling")
+        logger.info(
+            f"Found {len(due_websites)} websites due for crawling",
+            extra={"tick_limit": limit, "deferred": max(len(due_websites) - limit, 0)},
+        )
+        due_websites = due_websites[:limit]
 
         # Log individual websites for observability
         for website in due_websites:
@@ -50,6 +72,86 @@ class CrawlSchedulerService:
 
         return due_websites
 
+    async def get_tick_limit(self, now: datetime) -> int:
+        """Crawls released per hourly tick.
+
+        Why: Sized from the crawls the workers finished over the last day, so
+        the release rate follows observed capacity instead of the backlog.
+        """
+        settings = get_settings()
+        finished = await self.website_sparse_repo.count_crawls_finished_since(
+            now - timedelta(days=1)
+        )
+        observed = math.ceil(
+            finished / HOURS_PER_DAY * settings.crawl_scheduler_capacity_headroom
+        )
+
+        return max(settings.crawl_scheduler_min_per_tick, observed)
+
+    async def get_projected_schedule(
+        self, now: Optional[datetime] = None
+    ) -> CrawlSchedule:
+        """Project the next day of hourly ticks.
+
+        Assumes every released crawl finishes within its hour and no
+        websites are added or crawled manually meanwhile.
+        """
+        now = now or datetime.now(timezone.utc)
+        next_tick = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        websites = await self.website_sparse_repo.get_schedulable_websites(
+            next_tick + timedelta(days=1)
+        )
+        quiet_hours = await self._get_quiet_hours(websites)
+        limit = await self.get_tick_limit(now)
+
+        ticks = []
+        for hour in range(HOURS_PER_DAY):
+            tick = next_tick + timedelta(hours=hour)
+            due = sorted(
+                (
+                    website
+                    for website in websites
+                    if is_due(website, tick, quiet_hours[website.tenant_id])
+                    and (website.next_retry_at is None or website.next_retry_at <= tick)
+                ),
+                key=overdue_first,
+            )
+            for website in due[:limit]:
+                website.last_crawled_at = tick
+
+            ticks.append(
+                CrawlScheduleTick(
+                    starts_at=tick, due=len(due), released=min(len(due), limit)
+                )
+            )
+
+        return CrawlSchedule(tick_limit=limit, ticks=ticks)
+
+    async def _get_due_websites(self, now: datetime) -> list["WebsiteSparse"]:
+        websites = await self.website_sparse_repo.get_schedulable_websites(now)
+        quiet_hours = await self._get_quiet_hours(websites)
+
+        return sorted(
+            (
+                website
+                for website in websites
+                if is_due(website, now, quiet_hours[website.tenant_id])
+            ),
+            key=overdue_first,
+        )
+
+    async def _get_quiet_hours(
+        self, websites: list["WebsiteSparse"]
+    ) -> dict["UUID", set[int]]:
+        tenant_settings = await self.website_sparse_repo.get_tenant_crawler_settings(
+            {website.tenant_id for website in websites}
+        )
+
+        return {
+            website.tenant_id: get_quiet_hours(tenant_settings.get(website.tenant_id))
+            for website in websites
+        }
+
     def _is_website_due_for_crawl(
         self, website: "WebsiteSparse", today: datetime.date
     ) -> bool:
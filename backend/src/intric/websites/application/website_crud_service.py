@@ -2,6 +2,9 @@ from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional, Union
 from uuid import UUID
 
+from intric.jobs.job_manager import job_manager
+from intric.jobs.job_models import Task
+from intric.jobs.task_models import KnowledgeTask
 from intric.main.exceptions import (
     BadRequestException,
     CrawlAlreadyRunningException,
@@ -139,8 +142,15 @@ class WebsiteCRUDService:
         if not owner_actor.can_delete_websites():
             raise UnauthorizedException()
 
-        await self.space_repo.hard_delete_website(website_id=id, owner_space_id=owner_space.id)
-        
+        # Detaches and hides the website; the worker deletes its contents in batches
+        await self.space_repo.mark_website_deleting(
+            website_id=id, owner_space_id=owner_space.id
+        )
+        await job_manager.enqueue(
+            Task.DELETE_KNOWLEDGE,
+            id,
+            KnowledgeTask(user_id=self.user.id, website_id=id),
+        )
 
     async def crawl_website(self, id: UUID) -> bool:
         space = await self.space_service.get_space_by_website(id)
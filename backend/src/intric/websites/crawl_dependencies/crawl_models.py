@@ -22,6 +22,8 @@ class CrawlRunBase(BaseModel):
     files_downloaded: Optional[int] = None
     pages_failed: Optional[int] = None
     files_failed: Optional[int] = None
+    pages_unchanged: Optional[int] = None
+    pages_near_duplicate: Optional[int] = None
     failure_summary: Optional[dict[str, int]] = None
 
 
@@ -34,6 +34,8 @@ class CrawlRun(Entity):
         finished_at: Optional["datetime"],
         job_id: Optional["UUID"],
         failure_summary: Optional[dict[str, int]] = None,
+        pages_unchanged: Optional[int] = None,
+        pages_near_duplicate: Optional[int] = None,
     ):
         super().__init__(id=id, created_at=created_at, updated_at=updated_at)
         self.status = status
@@ -47,6 +49,8 @@ class CrawlRun(Entity):
         self.tenant_id = tenant_id
         self.job_id = job_id
         self.failure_summary = failure_summary
+        self.pages_unchanged = pages_unchanged
+        self.pages_near_duplicate = pages_near_duplicate
 
     @classmethod
     def create(cls, website: Union["Website", "WebsiteSparse"]) -> "CrawlRun":
@@ -84,6 +88,8 @@ class CrawlRun(Entity):
             result_location=record.job.result_location if record.job else None,
             finished_at=record.job.finished_at if record.job else None,
             failure_summary=record.failure_summary,
+            pages_unchanged=record.pages_unchanged,
+            pages_near_duplicate=record.pages_near_duplicate,
         )
 
     def update(
@@ -0,0 +1,106 @@
+"""Hourly crawl slots for scheduled website crawls.
+
+Every website gets a stable hour of the day, spread by a hash of its id over
+the hours outside its tenant's quiet hours. A website is due once its latest
+slot has passed and it has not been crawled since its interval ran out, so
+websites held back by the per-tick limit are released on the following
+ticks instead of waiting a full day.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Optional
+
+from intric.tenants.crawler_settings_helper import get_crawler_setting
+from intric.websites.domain.website import UpdateInterval
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from intric.websites.domain.website import WebsiteSparse
+
+HOURS_PER_DAY = 24
+
+INTERVAL_DAYS = {
+    UpdateInterval.DAILY: 1,
+    UpdateInterval.EVERY_OTHER_DAY: 2,
+    UpdateInterval.WEEKLY: 7,
+}
+
+# Weekly websites keep being crawled on Fridays
+WEEKLY_WEEKDAY = 4
+
+
+@dataclass
+class CrawlScheduleTick:
+    starts_at: datetime
+    # Websites whose slot has passed and that are not crawled yet
+    due: int
+    # Of those, released within the tick limit
+    released: int
+
+
+@dataclass
+class CrawlSchedule:
+    tick_limit: int
+    ticks: list[CrawlScheduleTick]
+
+
+def get_quiet_hours(tenant_crawler_settings: Optional[dict[str, Any]]) -> set[int]:
+    """UTC hours in which no scheduled crawl of the tenant starts."""
+    start = get_crawler_setting("crawl_quiet_hours_start", tenant_crawler_settings)
+    end = get_crawler_setting("crawl_quiet_hours_end", tenant_crawler_settings)
+
+    if start == end:
+        return set()
+    if start < end:
+        return set(range(start, end))
+    # Wraps past midnight, e.g. 22 to 6
+    return set(range(start, HOURS_PER_DAY)) | set(range(0, end))
+
+
+def get_crawl_slot(website_id: "UUID", quiet_hours: set[int]) -> int:
+    """Stable UTC hour in which the website's scheduled crawls are released."""
+    hours = [hour for hour in range(HOURS_PER_DAY) if hour not in quiet_hours]
+    digest = hashlib.sha256(website_id.bytes).digest()
+
+    return hours[int.from_bytes(digest[:8], "big") % len(hours)]
+
+
+def get_slot_start(slot: int, now: datetime) -> datetime:
+    """The latest start of the slot at or before now."""
+    start = now.replace(hour=slot, minute=0, second=0, microsecond=0)
+    if start > now:
+        start -= timedelta(days=1)
+
+    return start
+
+
+def is_due(website: "WebsiteSparse", now: datetime, quiet_hours: set[int]) -> bool:
+    if website.update_interval not in INTERVAL_DAYS or now.hour in quiet_hours:
+        return False
+
+    slot_start = get_slot_start(get_crawl_slot(website.id, quiet_hours), now)
+    if (
+        website.update_interval == UpdateInterval.WEEKLY
+        and slot_start.weekday() != WEEKLY_WEEKDAY
+    ):
+        return False
+
+    if website.last_crawled_at is None:
+        return True
+
+    # Crawls end after their slot starts, so the slot one interval later
+    # compares against the start of the slot the last crawl belonged to.
+    # The half interval keeps a manual crawl just before the slot from
+    # being repeated in it
+    days = INTERVAL_DAYS[website.update_interval]
+    return website.last_crawled_at < slot_start - timedelta(
+        days=days - 1
+    ) and website.last_crawled_at <= now - timedelta(days=days - 0.5)
+
+
+def overdue_first(website: "WebsiteSparse"):
+    """Sort key putting never crawled, then longest uncrawled websites first."""
+    return (website.last_crawled_at is not None, website.last_crawled_at)
@@ -21,12 +21,11 @@ class UpdateInterval(str, Enum):
     Why: Provides flexible scheduling options for automated crawling.
     """
 
+    # Scheduled crawls start in the website's hourly slot (see crawl_slots)
     NEVER = "never"
-    DAILY = "daily"  # Crawl every day at 1:00 UTC (2 AM Swedish winter / 3 AM summer)
-    EVERY_OTHER_DAY = "every_other_day"  # Crawl every 2 days at 1:00 UTC (2 AM Swedish winter / 3 AM summer)
-    WEEKLY = (
-        "weekly"  # Crawl every Friday at 1:00 UTC (2 AM Swedish winter / 3 AM summer)
-    )
+    DAILY = "daily"  # Crawl every day
+    EVERY_OTHER_DAY = "every_other_day"  # Crawl every 2 days
+    WEEKLY = "weekly"  # Crawl every Friday
 
 
 class Website(Entity):
@@ -4,12 +4,17 @@ from typing import TYPE_CHECKING
 import sqlalchemy as sa
 
 from intric.database.tables.job_table import Jobs
+from intric.database.tables.tenant_table import Tenants
 from intric.database.tables.websites_table import CrawlRuns as CrawlRunsTable
 from intric.database.tables.websites_table import Websites as WebsitesTable
+from intric.jobs.job_models import Task
 from intric.main.models import Status
+from intric.websites.domain.crawl_slots import INTERVAL_DAYS
 from intric.websites.domain.website import UpdateInterval, WebsiteSparse
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from intric.database.database import AsyncSession
 
 
@@ -24,7 +29,8 @@ class WebsiteSparseRepository:
         Deprecated: Use get_websites_with_intervals() with scheduler service instead.
         """
         stmt = sa.select(WebsitesTable).where(
-            WebsitesTable.update_interval == UpdateInterval.WEEKLY
+            WebsitesTable.update_interval == UpdateInterval.WEEKLY,
+            WebsitesTable.deleting_at.is_(None),
         )
 
         websites_db = await self.session.scalars(stmt)
@@ -41,7 +47,8 @@ class WebsiteSparseRepository:
             List of websites with DAILY, EVERY_OTHER_DAY, or WEEKLY intervals
         """
         stmt = sa.select(WebsitesTable).where(
-            WebsitesTable.update_interval != UpdateInterval.NEVER
+            WebsitesTable.update_interval != UpdateInterval.NEVER,
+            WebsitesTable.deleting_at.is_(None),
         )
 
         websites_db = await self.session.scalars(stmt)
@@ -100,12 +107,85 @@ class WebsiteSparseRepository:
             # Not Friday - no weekly websites are due
             cond_weekly = sa.literal(False)
 
+        # Combine all conditions with circuit breaker
+        stmt = sa.select(WebsitesTable).where(
+            sa.and_(
+                sa.or_(cond_daily, cond_every_other_day, cond_weekly),
+                *self._schedulable_conditions(now_utc),
+            )
+        )
+
+        websites_db = await self.session.scalars(stmt)
+        return [WebsiteSparse.to_domain(website_db) for website_db in websites_db]
+
+    async def get_schedulable_websites(self, now: datetime) -> list[WebsiteSparse]:
+        """Get websites whose crawl slot can come up within the next day.
+
+        Why: Narrows the candidates in the database; the slot of each website
+        depends on its tenant's quiet hours and is checked by the caller
+        (see crawl_slots.is_due).
+
+        Args:
+            now: Time of the scheduling tick (UTC)
+
+        Returns:
+            Websites with an interval, not crawled within the last
+            interval minus one day
+        """
+        stmt = sa.select(WebsitesTable).where(
+            sa.or_(
+                *[
+                    sa.and_(
+                        WebsitesTable.update_interval == interval,
+                        sa.or_(
+                            WebsitesTable.last_crawled_at.is_(None),
+                            WebsitesTable.last_crawled_at
+                            < now - timedelta(days=days - 1),
+                        ),
+                    )
+                    for interval, days in INTERVAL_DAYS.items()
+                ]
+            ),
+            *self._schedulable_conditions(now),
+        )
+
+        websites_db = await self.session.scalars(stmt)
+        return [WebsiteSparse.to_domain(website_db) for website_db in websites_db]
+
+    async def get_tenant_crawler_settings(
+        self, tenant_ids: set["UUID"]
+    ) -> dict["UUID", dict]:
+        if not tenant_ids:
+            return {}
+
+        rows = await self.session.execute(
+            sa.select(Tenants.id, Tenants.crawler_settings).where(
+                Tenants.id.in_(tenant_ids)
+            )
+        )
+        return {tenant_id: crawler_settings or {} for tenant_id, crawler_settings in rows}
+
+    async def count_crawls_finished_since(self, since: datetime) -> int:
+        """Count crawl jobs that completed or failed since the given time.
+
+        Why: The scheduler sizes each tick from what the workers got through.
+        """
+        stmt = sa.select(sa.func.count(Jobs.id)).where(
+            Jobs.task == Task.CRAWL.value,
+            Jobs.status.in_([Status.COMPLETE.value, Status.FAILED.value]),
+            Jobs.finished_at >= since,
+        )
+
+        return await self.session.scalar(stmt) or 0
+
+    @staticmethod
+    def _schedulable_conditions(now: datetime) -> list:
         # Circuit breaker condition: Only crawl sites that are not in backoff period
         # Why: Prevent wasted resources on persistently failing websites
         # NULL = no failures, non-NULL = backoff until this time
         cond_circuit_breaker = sa.or_(
             WebsitesTable.next_retry_at.is_(None),
-            WebsitesTable.next_retry_at <= now_utc,
+            WebsitesTable.next_retry_at <= now,
         )
 
         # Active job condition: Skip websites that already have queued/in-progress crawls
@@ -122,14 +202,9 @@ class WebsiteSparseRepository:
         )
         cond_no_active_jobs = ~sa.exists(active_job_exists)
 
-        # Combine all conditions with circuit breaker
-        stmt = sa.select(WebsitesTable).where(
-            sa.and_(
-                sa.or_(cond_daily, cond_every_other_day, cond_weekly),
-                cond_circuit_breaker,
-                cond_no_active_jobs,
-            )
-        )
-
-        websites_db = await self.session.scalars(stmt)
-        return [WebsiteSparse.to_domain(website_db) for website_db in websites_db]
+        return [
+            cond_circuit_breaker,
+            cond_no_active_jobs,
+            # Websites being deleted by the worker are never crawled again
+            WebsitesTable.deleting_at.is_(None),
+        ]
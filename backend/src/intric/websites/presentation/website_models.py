@@ -67,6 +67,8 @@ class CrawlRunPublic(BaseResponse):
     files_downloaded: Optional[int]
     pages_failed: Optional[int]
     files_failed: Optional[int]
+    pages_unchanged: Optional[int] = None
+    pages_near_duplicate: Optional[int] = None
     failure_summary: Optional[dict[str, int]] = None
     status: Status
     result_location: Optional[str]
@@ -82,6 +84,8 @@ class CrawlRunPublic(BaseResponse):
             files_downloaded=crawl_run.files_downloaded,
             pages_failed=crawl_run.pages_failed,
             files_failed=crawl_run.files_failed,
+            pages_unchanged=crawl_run.pages_unchanged,
+            pages_near_duplicate=crawl_run.pages_near_duplicate,
             failure_summary=crawl_run.failure_summary,
             status=crawl_run.status,
             result_location=crawl_run.result_location,
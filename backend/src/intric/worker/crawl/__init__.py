@@ -7,6 +7,7 @@ Modules:
     heartbeat: Job heartbeat monitoring and preemption detection
     persistence: Two-phase batch persistence for crawled pages
     recovery: Session recovery and retry utilities
+    validators: HTTP validators for conditional recrawls
 """
 
 from intric.worker.crawl.heartbeat import (
@@ -25,6 +26,10 @@ from intric.worker.crawl.recovery import (
     reset_tenant_retry_delay,
     update_job_retry_stats,
 )
+from intric.worker.crawl.validators import (
+    load_url_validators,
+    upsert_url_validators,
+)
 
 __all__ = [
     # Heartbeat
@@ -43,4 +48,7 @@ __all__ = [
     "is_invalid_transaction_error",
     "is_invalid_transaction_error_msg",
     "recover_session",
+    # Conditional recrawls
+    "load_url_validators",
+    "upsert_url_validators",
 ]
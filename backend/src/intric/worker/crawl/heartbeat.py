@@ -56,7 +56,7 @@ class HeartbeatMonitor:
             semaphore_ttl_seconds=600,
         )
 
-        for page in crawl.pages:
+        async for page in crawl.pages:
             await monitor.tick()  # Raises on preemption or failure threshold
             process(page)
     """
@@ -16,11 +16,9 @@ from typing import TYPE_CHECKING
 
 import sqlalchemy as sa
 from dependency_injector import providers
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-
-from intric.completion_models.infrastructure.context_builder import count_tokens
 from intric.database.tables.info_blob_chunk_table import InfoBlobChunks
 from intric.database.tables.info_blobs_table import InfoBlobs
+from intric.embedding_models.infrastructure.text_chunker import chunk_text
 from intric.info_blobs.info_blob import InfoBlobChunk
 from intric.main.config import get_settings
 from intric.main.logging import get_logger
@@ -31,10 +29,6 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-# Chunking settings (matching datastore.py pattern)
-_CHUNK_SIZE = 200
-_CHUNK_OVERLAP = 40
-
 # EMBEDDING SEMAPHORE: Module-level bounded concurrency
 #
 # This semaphore limits concurrent embedding API calls across ALL crawl tasks
@@ -82,7 +76,7 @@ async def persist_batch(
 
     PHASE 1 (Pure Compute - ZERO DB operations):
         - Compute content_hash via SHA-256
-        - Chunk text using RecursiveCharacterTextSplitter
+        - Chunk text with the same chunker as Datastore.add
         - Call embedding API with concurrency limit (semaphore)
         - Create PreparedPage objects with pre-computed data
         - Network I/O happens HERE, outside any DB transaction
@@ -98,7 +92,8 @@ async def persist_batch(
         - Return connection to pool immediately
 
     Args:
-        page_buffer: List of page dicts with 'url' and 'content' keys
+        page_buffer: List of page dicts with 'url' and 'content' keys, and
+            optionally 'simhash' (encoded near-duplicate fingerprint)
         ctx: CrawlContext DTO with all primitives (no ORM objects!)
         embedding_model: EmbeddingModelSpec frozen dataclass (session-independent)
         container: DI container for creating embedding service with proper session
@@ -180,13 +175,6 @@ async def persist_batch(
             add_failure(FailureReason.EMBEDDING_ERROR, page.get("url", "unknown"))
         return 0, len(page_buffer), [], failures_by_reason
 
-    # Create text splitter (matching datastore.py pattern)
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=_CHUNK_SIZE,
-        chunk_overlap=_CHUNK_OVERLAP,
-        length_function=count_tokens,
-    )
-
     # PHASE 1: Compute embeddings (uses embedding_session for provider credentials)
     # The embedding session is used to load API credentials from DB, but the actual
     # embedding API calls are external network I/O, not DB operations.
@@ -223,8 +211,7 @@ async def persist_batch(
                 content_hash = hashlib.sha256(content.encode("utf-8")).digest()
 
                 # 2. Chunk the text (local operation)
-                raw_chunks = splitter.split_text(content)
-                chunks = [chunk.strip() for chunk in raw_chunks if chunk.strip()]
+                chunks = chunk_text(content)
 
                 if not chunks:
                     logger.warning(
@@ -234,7 +221,6 @@ async def persist_batch(
                             "url": url,
                             "reason": "no_chunks",
                             "content_length": len(content),
-                            "raw_chunks_count": len(raw_chunks),
                         },
                     )
                     failed_count += 1
@@ -246,11 +232,11 @@ async def persist_batch(
                 chunk_objects = [
                     InfoBlobChunk(
                         chunk_no=i,
-                        text=chunk_text,
+                        text=chunk.text,
                         info_blob_id=ctx.website_id,  # Placeholder, not used by embedding service
                         tenant_id=ctx.tenant_id,
                     )
-                    for i, chunk_text in enumerate(chunks)
+                    for i, chunk in enumerate(chunks)
                 ]
 
                 # 4. Call embedding API with semaphore limit and timeout
@@ -298,6 +284,7 @@ async def persist_batch(
                     website_id=ctx.website_id,
                     user_id=ctx.user_id,
                     embedding_model_id=ctx.embedding_model_id,
+                    content_simhash=page_data.get("simhash"),
                 )
                 prepared_pages.append(prepared)
 
@@ -370,6 +357,7 @@ async def persist_batch(
                             "url": prepared.url,
                             "size": len(prepared.content.encode("utf-8")),
                             "content_hash": prepared.content_hash,
+                            "content_simhash": prepared.content_simhash,
                             "user_id": prepared.user_id,
                             "tenant_id": prepared.tenant_id,
                             "website_id": prepared.website_id,
@@ -389,14 +377,17 @@ async def persist_batch(
                         # 3. Bulk insert chunks with embeddings
                         chunk_values = [
                             {
-                                "text": chunk_text,
+                                "text": chunk.text,
                                 "chunk_no": i,
-                                "size": len(chunk_text.encode("utf-8")),
+                                "size": len(chunk.text.encode("utf-8")),
+                                "start_offset": chunk.start,
+                                "end_offset": chunk.end,
+                                "token_count": chunk.token_count,
                                 "embedding": embedding,
                                 "info_blob_id": info_blob_id,
                                 "tenant_id": prepared.tenant_id,
                             }
-                            for i, (chunk_text, embedding) in enumerate(
+                            for i, (chunk, embedding) in enumerate(
                                 zip(prepared.chunks, prepared.embeddings)
                             )
                         ]
@@ -0,0 +1,145 @@
+"""Persistence of HTTP validators for conditional recrawls.
+
+Validators are loaded during the bootstrap phase of crawl_task and written
+back after pages and files have been persisted, each in its own short-lived
+session (see execute_with_recovery). Rows reference the info blob holding the
+content, so they disappear together with stale or re-ingested blobs and a
+304 can only ever "keep" content that still exists.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+
+from intric.crawler.conditional import UrlValidator
+from intric.database.tables.info_blobs_table import InfoBlobs
+from intric.database.tables.websites_table import CrawlUrlValidators
+from intric.main.logging import get_logger
+from intric.websites.domain.crawl_run import CrawlType
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = get_logger(__name__)
+
+# Keep IN (...) lists and multi-row inserts well below Postgres' parameter limit
+_WRITE_BATCH_SIZE = 1000
+
+
+async def load_url_validators(
+    session: "AsyncSession",
+    *,
+    website_id: UUID,
+    crawl_type: CrawlType,
+) -> dict[str, UrlValidator]:
+    """Load validators stored by previous crawl runs of a website.
+
+    For CRAWL type, pages without recorded links are skipped: a 304 for such a
+    page would stop link discovery, so it is fetched in full once to record
+    its links. Files never need links.
+    """
+    stmt = (
+        sa.select(
+            CrawlUrlValidators.url,
+            CrawlUrlValidators.etag,
+            CrawlUrlValidators.last_modified,
+            CrawlUrlValidators.links,
+            InfoBlobs.title,
+        )
+        .join(InfoBlobs, InfoBlobs.id == CrawlUrlValidators.info_blob_id)
+        .where(CrawlUrlValidators.website_id == website_id)
+    )
+    result = await session.execute(stmt)
+
+    validators: dict[str, UrlValidator] = {}
+    for url, etag, last_modified, links, title in result:
+        if not etag and not last_modified:
+            continue
+
+        is_page = title is not None and title.startswith("http")
+        if crawl_type == CrawlType.CRAWL and is_page and links is None:
+            continue
+
+        validators[url] = UrlValidator(
+            url=url,
+            title=title,
+            etag=etag,
+            last_modified=last_modified,
+            links=tuple((int(rule), link) for rule, link in links)
+            if links is not None
+            else None,
+        )
+
+    return validators
+
+
+async def upsert_url_validators(
+    session: "AsyncSession",
+    *,
+    website_id: UUID,
+    tenant_id: UUID,
+    validators: list[UrlValidator],
+) -> int:
+    """Store validators for the info blobs they belong to.
+
+    Blobs are matched on (website_id, title); validators whose blob no longer
+    exists (e.g. failed persistence) are dropped.
+
+    Returns:
+        Number of validator rows written
+    """
+    if not validators:
+        return 0
+
+    written = 0
+    for start in range(0, len(validators), _WRITE_BATCH_SIZE):
+        batch = validators[start : start + _WRITE_BATCH_SIZE]
+        by_title = {validator.title: validator for validator in batch}
+
+        blob_rows = await session.execute(
+            sa.select(InfoBlobs.id, InfoBlobs.title).where(
+                InfoBlobs.website_id == website_id,
+                InfoBlobs.title.in_(list(by_title)),
+            )
+        )
+
+        values = [
+            {
+                "info_blob_id": blob_id,
+                "website_id": website_id,
+                "tenant_id": tenant_id,
+                "url": by_title[title].url,
+                "etag": by_title[title].etag,
+                "last_modified": by_title[title].last_modified,
+                "links": [list(link) for link in by_title[title].links]
+                if by_title[title].links is not None
+                else None,
+            }
+            for blob_id, title in blob_rows
+        ]
+        if not values:
+            continue
+
+        stmt = insert(CrawlUrlValidators).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CrawlUrlValidators.info_blob_id],
+            set_={
+                "url": stmt.excluded.url,
+                "etag": stmt.excluded.etag,
+                "last_modified": stmt.excluded.last_modified,
+                "links": stmt.excluded.links,
+                "updated_at": sa.func.now(),
+            },
+        )
+        await session.execute(stmt)
+        written += len(values)
+
+    logger.debug(
+        "Stored crawl URL validators",
+        extra={"website_id": str(website_id), "validators_written": written},
+    )
+    return written
@@ -8,12 +8,15 @@ The frozen=True ensures immutability during the crawl lifecycle.
 """
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from enum import Enum
 from uuid import UUID
 
 from intric.ai_models.model_enums import ModelFamily
 
+if TYPE_CHECKING:
+    from intric.embedding_models.infrastructure.text_chunker import TextChunk
+
 
 class FailureReason(str, Enum):
     """Categorized failure reasons for crawl page persistence.
@@ -162,7 +165,7 @@ class PreparedPage:
     content_hash: bytes  # SHA-256 for change detection (future deduplication)
 
     # Pre-computed embeddings (Phase 1 result)
-    chunks: list[str]  # Text chunks
+    chunks: list["TextChunk"]  # Text chunks with their offsets and token counts
     embeddings: list[list[float]]  # Embedding vectors per chunk
 
     # Context for persistence
@@ -170,3 +173,6 @@ class PreparedPage:
     website_id: UUID
     user_id: UUID
     embedding_model_id: UUID
+
+    # SimHash from near-duplicate detection (None when disabled or too short)
+    content_simhash: bytes | None = None
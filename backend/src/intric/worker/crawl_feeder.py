@@ -22,7 +22,8 @@ import redis.asyncio as aioredis
 
 from intric.main.config import get_settings
 from intric.main.logging import get_logger
-from intric.redis.connection import build_redis_pool_kwargs
+from intric.observability.metrics import set_crawl_queue_depths
+from intric.redis.connection import InstrumentedRedis, build_redis_pool_kwargs
 from intric.tenants.crawler_settings_helper import get_crawler_setting
 from intric.worker.feeder.capacity import CapacityManager
 from intric.worker.feeder.election import LeaderElection
@@ -320,7 +321,7 @@ class CrawlFeeder:
                 decode_responses=False,
             )
 
-            self._redis_client = aioredis.Redis.from_url(redis_url, **redis_kwargs)
+            self._redis_client = InstrumentedRedis.from_url(redis_url, **redis_kwargs)
             redis_client = self._redis_client
             self._pending_queue = PendingQueue(redis_client)
             self._capacity_manager = CapacityManager(redis_client, self.settings)
@@ -335,6 +336,8 @@ class CrawlFeeder:
                 try:
                     # Try to become leader (prevents multiple feeders running)
                     if not await self._leader_election.try_acquire():
+                        # Only the leader reports queue depths
+                        set_crawl_queue_depths({})
                         await asyncio.sleep(5)
                         continue
 
@@ -378,6 +381,13 @@ class CrawlFeeder:
                             )
                             continue  # Don't let one tenant's error stop others
 
+                    try:
+                        set_crawl_queue_depths(
+                            await self._pending_queue.depths(list(tenant_ids))
+                        )
+                    except Exception as exc:
+                        logger.warning(f"Failed to read pending queue depths: {exc}")
+
                     # Heartbeat: log idle status every 5 minutes to reduce log spam
                     now = datetime.now(timezone.utc)
                     if not processed_any:
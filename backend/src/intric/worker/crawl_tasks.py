@@ -13,10 +13,17 @@ import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from intric.ai_models.model_enums import ModelFamily
+from intric.crawler.conditional import ConditionalCrawlState, SitemapLastmodFilter
+from intric.crawler.near_duplicates import (
+    NearDuplicateFilter,
+    simhash_from_bytes,
+    simhash_to_bytes,
+)
 from intric.database.tables.model_providers_table import ModelProviders
 from intric.main.container.container import Container
 from intric.main.config import get_settings
 from intric.main.logging import get_logger
+from intric.observability.metrics import CRAWL_PAGES
 from intric.tenants.crawler_settings_helper import get_crawler_setting
 from intric.worker.crawl import (
     HeartbeatFailedError,
@@ -24,8 +31,10 @@ from intric.worker.crawl import (
     JobPreemptedError,
     persist_batch,
     execute_with_recovery,
+    load_url_validators,
     reset_tenant_retry_delay,
     update_job_retry_stats,
+    upsert_url_validators,
 )
 from intric.worker.crawl_context import CrawlContext, EmbeddingModelSpec
 from intric.worker.feeder.capacity import CapacityManager
@@ -34,6 +43,7 @@ from intric.worker.feeder.queues import PendingQueue
 from intric.worker.redis.lua_scripts import LuaScripts
 from intric.worker.task_manager import TaskManager
 from intric.websites.crawl_dependencies.crawl_models import CrawlTask
+from intric.websites.domain.crawl_run import CrawlType
 
 logger = get_logger(__name__)
 
@@ -41,6 +51,28 @@ SCHEDULER_LOCK_KEY = "crawl_scheduler:leader"
 SCHEDULER_LOCK_TTL_SECONDS = 1800
 
 
+def _page_simhash(crawl, url: str) -> bytes | None:
+    """SimHash of a page kept by the near-duplicate filter, as stored on its blob."""
+    if crawl.near_duplicate_filter is None:
+        return None
+    fingerprint = crawl.near_duplicate_filter.fingerprints.get(url)
+    return simhash_to_bytes(fingerprint) if fingerprint is not None else None
+
+
+async def _timed_pages(pages, timings: dict[str, float]):
+    """Yield from crawl.pages, adding time spent waiting on parsing to timings."""
+    iterator = pages.__aiter__()
+    while True:
+        start = time.time()
+        try:
+            page = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            timings["parse_pages"] += time.time() - start
+        yield page
+
+
 async def _get_primary_active_job_id(
     session: AsyncSession,
     *,
@@ -242,11 +274,12 @@ async def queue_website_crawls(container: Container):
 
                             successful_crawls += 1
                             logger.debug(
-                                f"Added crawl to pending queue: {website.url}",
+                                "Added crawl to pending queue: %s",
+                                website.url,
                                 extra={
                                     "feeder_mode": True,
-                                    "job_id": str(job_in_db.id),
-                                    "run_id": str(crawl_run.id),
+                                    "job_id": job_in_db.id,
+                                    "run_id": crawl_run.id,
                                 },
                             )
                         except Exception as redis_exc:
@@ -284,7 +317,7 @@ async def queue_website_crawls(container: Container):
                         await crawl_service.crawl(website)
                         successful_crawls += 1
 
-                        logger.debug(f"Successfully queued crawl for {website.url}")
+                        logger.debug("Successfully queued crawl for %s", website.url)
 
                 # Session is now CLOSED for this website - connection returned to pool
 
@@ -686,7 +719,8 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
             # Initialize timing tracking for performance analysis
             timings = {
                 "fetch_existing_titles": 0.0,
-                "crawl_and_parse": 0.0,
+                "crawl": 0.0,
+                "parse_pages": 0.0,
                 "process_pages": 0.0,
                 "process_files": 0.0,
                 "cleanup_deleted": 0.0,
@@ -716,6 +750,11 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
             crawl_context: CrawlContext
             existing_titles: list[str] = []
             existing_file_hashes: dict[str, bytes] = {}
+            existing_page_hashes: dict[str, bytes] = {}
+            existing_page_simhashes: dict[str, bytes] = {}
+            conditional_state: ConditionalCrawlState | None = None
+            lastmod_filter: SitemapLastmodFilter | None = None
+            near_duplicate_filter: NearDuplicateFilter | None = None
             website_url: str = ""  # For logging after session closes
 
             start = time.time()
@@ -731,7 +770,10 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
 
                 website_stmt = (
                     sa.select(Websites)
-                    .where(Websites.id == params.website_id)
+                    .where(
+                        Websites.id == params.website_id,
+                        Websites.deleting_at.is_(None),
+                    )
                     .options(selectinload(Websites.embedding_model))
                 )
                 result = await bootstrap_session.execute(website_stmt)
@@ -908,18 +950,60 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                 )
 
                 # Fetch existing titles for stale detection and file hashes for skip optimization
-                stmt = sa.select(InfoBlobs.title, InfoBlobs.content_hash).where(
-                    InfoBlobs.website_id == params.website_id
-                )
+                stmt = sa.select(
+                    InfoBlobs.title, InfoBlobs.content_hash, InfoBlobs.content_simhash
+                ).where(InfoBlobs.website_id == params.website_id)
                 blob_result = await bootstrap_session.execute(stmt)
 
                 # Build lookups for O(1) operations
-                for title, hash_bytes in blob_result:
+                for title, hash_bytes, simhash_bytes in blob_result:
                     existing_titles.append(title)
-                    # Only store hashes for files (not URLs)
-                    if hash_bytes is not None and not title.startswith("http"):
+                    if simhash_bytes is not None:
+                        existing_page_simhashes[title] = simhash_bytes
+                    if hash_bytes is None:
+                        continue
+                    # Files are keyed by name, pages by URL
+                    if title.startswith("http"):
+                        existing_page_hashes[title] = hash_bytes
+                    else:
                         existing_file_hashes[title] = hash_bytes
 
+                # Conditional recrawl: load ETag/Last-Modified stored by previous
+                # runs so unchanged pages come back as 304 without a body
+                if get_crawler_setting(
+                    "conditional_recrawl_enabled",
+                    tenant.crawler_settings if tenant else None,
+                ):
+                    conditional_state = ConditionalCrawlState(
+                        validators=await load_url_validators(
+                            bootstrap_session,
+                            website_id=params.website_id,
+                            crawl_type=params.crawl_type,
+                        )
+                    )
+
+                # Incremental sitemap crawl: only request URLs whose <lastmod>
+                # is newer than the start of the last complete crawl. Pages not
+                # indexed yet are always requested.
+                if (
+                    params.crawl_type == CrawlType.SITEMAP
+                    and website.last_successful_crawl_at is not None
+                    and get_crawler_setting(
+                        "sitemap_incremental_enabled",
+                        tenant.crawler_settings if tenant else None,
+                    )
+                ):
+                    lastmod_filter = SitemapLastmodFilter(
+                        modified_since=website.last_successful_crawl_at,
+                        indexed_urls=frozenset(existing_page_hashes),
+                    )
+
+                if get_crawler_setting(
+                    "near_duplicate_detection_enabled",
+                    tenant.crawler_settings if tenant else None,
+                ):
+                    near_duplicate_filter = NearDuplicateFilter()
+
             finally:
                 # Always close the bootstrap session to return connection to pool
                 await bootstrap_session.close()
@@ -935,6 +1019,12 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                     "batch_size": crawl_context.batch_size,
                     "embedding_model": crawl_context.embedding_model_name,
                     "existing_titles_count": len(existing_titles),
+                    "conditional_validators_count": len(conditional_state.validators)
+                    if conditional_state
+                    else 0,
+                    "sitemap_modified_since": lastmod_filter.modified_since.isoformat()
+                    if lastmod_filter
+                    else None,
                     "bootstrap_duration_ms": int(
                         timings["fetch_existing_titles"] * 1000
                     ),
@@ -950,6 +1040,10 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
             num_failed_files = 0
             num_deleted_blobs = 0
             num_skipped_files = 0  # Files with unchanged content (hash match)
+            num_not_modified = 0  # Pages/files answering 304 to a conditional request
+            num_unchanged_pages = 0  # Pages whose content hash matched the stored blob
+            num_lastmod_skipped = 0  # Sitemap URLs not requested, <lastmod> unchanged
+            num_near_duplicates = 0  # Pages dropped as near-duplicates of another page
 
             # Aggregate failure reasons across all batches
             # Maps FailureReason codes to counts for final storage in failure_summary
@@ -958,6 +1052,11 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
             # Use set for O(1) membership tests
             crawled_titles = set()
             failed_titles: set[str] = set()  # Failed URLs excluded from stale deletion
+            # (url, title) of every page/file fetched in full and kept or stored,
+            # whose fresh validators should be saved for the next run
+            validated_urls: list[tuple[str, str]] = []
+            # URL -> SimHash for unchanged pages whose blob lacks a current one
+            simhash_backfill: dict[str, bytes] = {}
 
             # Get per-tenant settings for heartbeat BEFORE starting crawl
             # This ensures heartbeat runs during the entire crawl phase
@@ -989,6 +1088,9 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
             # Use Scrapy crawler to process website content
             # Measure crawl and parse phase
             start = time.time()
+            # The next incremental sitemap crawl compares <lastmod> against the
+            # START of this crawl, so pages changed while it runs are refetched
+            crawl_started_at = datetime.now(timezone.utc)
             async with crawler.crawl(
                 url=params.url,
                 download_files=params.download_files,
@@ -1000,8 +1102,33 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                 # Pass heartbeat callback for liveness during Scrapy crawl phase
                 heartbeat_callback=heartbeat_monitor.tick,
                 heartbeat_interval=float(heartbeat_interval_seconds),
+                conditional_state=conditional_state,
+                lastmod_filter=lastmod_filter,
+                near_duplicate_filter=near_duplicate_filter,
             ) as crawl:
-                timings["crawl_and_parse"] = time.time() - start
+                timings["crawl"] = time.time() - start
+
+                # 304 Not Modified: keep the existing blob as-is (no parse, no
+                # embed) and exclude it from stale deletion
+                if crawl.conditional_state is not None:
+                    not_modified_titles = crawl.conditional_state.unchanged_titles()
+                    crawled_titles.update(not_modified_titles)
+                    num_not_modified = len(not_modified_titles)
+
+                # Same for sitemap URLs skipped on <lastmod>; pages are titled by URL
+                if crawl.lastmod_filter is not None:
+                    crawled_titles.update(crawl.lastmod_filter.skipped_urls)
+                    num_lastmod_skipped = len(crawl.lastmod_filter.skipped_urls)
+
+                # Pages kept without being parsed still take part in
+                # near-duplicate detection through their stored fingerprint
+                if crawl.near_duplicate_filter is not None:
+                    for title in crawled_titles:
+                        if title in existing_page_simhashes:
+                            crawl.near_duplicate_filter.seed(
+                                title,
+                                simhash_from_bytes(existing_page_simhashes[title]),
+                            )
 
                 # Track partial completion status for logging
                 crawl_is_partial = crawl.is_partial
@@ -1030,8 +1157,9 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                 # Page buffer for batching (primitives only, NO ORM objects!)
                 page_buffer: list[dict] = []
 
-                for page in crawl.pages:
+                async for page in _timed_pages(crawl.pages, timings):
                     num_pages += 1
+                    CRAWL_PAGES.inc()
 
                     # Heartbeat: touches DB, refreshes Redis TTL, checks preemption
                     try:
@@ -1056,11 +1184,30 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                             "pages_crawled": num_pages,
                         }
 
+                    # Same content as the stored blob: nothing to re-embed
+                    existing_page_hash = existing_page_hashes.get(page.url)
+                    if (
+                        existing_page_hash is not None
+                        and hashlib.sha256(page.content.encode("utf-8")).digest()
+                        == existing_page_hash
+                    ):
+                        num_unchanged_pages += 1
+                        crawled_titles.add(page.url)
+                        validated_urls.append((page.url, page.url))
+                        simhash_bytes = _page_simhash(crawl, page.url)
+                        if (
+                            simhash_bytes is not None
+                            and existing_page_simhashes.get(page.url) != simhash_bytes
+                        ):
+                            simhash_backfill[page.url] = simhash_bytes
+                        continue
+
                     # Buffer page as dict (primitives only!)
                     page_buffer.append(
                         {
                             "url": page.url,
                             "content": page.content,
+                            "simhash": _page_simhash(crawl, page.url),
                         }
                     )
 
@@ -1078,6 +1225,7 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                             container=container,
                         )
                         crawled_titles.update(successful_urls)
+                        validated_urls.extend((url, url) for url in successful_urls)
                         # Aggregate failure reasons and track failed URLs
                         for reason, urls in batch_failures_by_reason.items():
                             failure_counts[reason] += len(urls)
@@ -1109,6 +1257,7 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                         container=container,
                     )
                     crawled_titles.update(successful_urls)
+                    validated_urls.extend((url, url) for url in successful_urls)
                     # Aggregate failure reasons and track failed URLs
                     for reason, urls in batch_failures_by_reason.items():
                         failure_counts[reason] += len(urls)
@@ -1125,7 +1274,61 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                         },
                     )
 
-                timings["process_pages"] = time.time() - process_start
+                # Near-duplicates are deliberately NOT kept in crawled_titles:
+                # a blob stored for such a URL (by an earlier run, or earlier in
+                # this one before a more canonical URL replaced it) is stale now
+                if crawl.near_duplicate_filter is not None:
+                    near_duplicates = crawl.near_duplicate_filter.duplicates
+                    num_near_duplicates = len(near_duplicates)
+                    crawled_titles.difference_update(near_duplicates)
+                    validated_urls = [
+                        (url, title)
+                        for url, title in validated_urls
+                        if url not in near_duplicates
+                    ]
+                    for url in near_duplicates:
+                        simhash_backfill.pop(url, None)
+
+                if simhash_backfill:
+
+                    async def _do_simhash_backfill(sess):
+                        await sess.execute(
+                            sa.update(InfoBlobs.__table__)
+                            .where(
+                                InfoBlobs.__table__.c.website_id == params.website_id,
+                                InfoBlobs.__table__.c.title == sa.bindparam("b_title"),
+                            )
+                            .values(content_simhash=sa.bindparam("b_simhash")),
+                            [
+                                {"b_title": title, "b_simhash": simhash_bytes}
+                                for title, simhash_bytes in simhash_backfill.items()
+                            ],
+                        )
+
+                    try:
+                        await execute_with_recovery(
+                            container=container,
+                            session_holder=session_holder,
+                            created_sessions=created_sessions,
+                            operation_name="simhash_backfill",
+                            operation=_do_simhash_backfill,
+                        )
+                    except Exception as exc:
+                        # Only weakens near-duplicate detection on the next run
+                        logger.warning(
+                            "Failed to store page fingerprints",
+                            extra={
+                                "website_id": str(params.website_id),
+                                "pages": len(simhash_backfill),
+                                "error": str(exc),
+                            },
+                        )
+
+                # Parsing overlaps with embedding; only time spent waiting on
+                # the parse pool is counted as parse_pages
+                timings["process_pages"] = (
+                    time.time() - process_start - timings["parse_pages"]
+                )
 
                 # Measure file processing time
                 file_start = time.time()
@@ -1135,6 +1338,11 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                     num_files += 1
                     try:
                         filename = file.stem
+                        file_url = (
+                            crawl.conditional_state.file_urls.get(file.name)
+                            if crawl.conditional_state is not None
+                            else None
+                        )
 
                         # ✅ PERFORMANCE OPTIMIZATION: Hash checking for files
                         # Hash raw bytes directly (no HTML normalization for files)
@@ -1150,10 +1358,13 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                             # File unchanged - skip processing
                             num_skipped_files += 1
                             crawled_titles.add(filename)
+                            if file_url:
+                                validated_urls.append((file_url, filename))
                             logger.debug(
-                                f"Skipping unchanged file: {filename}",
+                                "Skipping unchanged file: %s",
+                                filename,
                                 extra={
-                                    "website_id": str(params.website_id),
+                                    "website_id": params.website_id,
                                     "file_name": filename,
                                 },
                             )
@@ -1181,6 +1392,8 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                             operation=_process_single_file,
                         )
                         crawled_titles.add(filename)
+                        if file_url:
+                            validated_urls.append((file_url, filename))
 
                     except Exception:
                         logger.exception(
@@ -1195,6 +1408,46 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                         num_failed_files += 1
                 timings["process_files"] = time.time() - file_start
 
+                # Save fresh validators so the next run can recrawl conditionally
+                if crawl.conditional_state is not None and validated_urls:
+                    url_validators = [
+                        validator
+                        for url, title in validated_urls
+                        if (
+                            validator := crawl.conditional_state.build_validator(
+                                url, title
+                            )
+                        )
+                        is not None
+                    ]
+
+                    async def _do_upsert_url_validators(sess):
+                        return await upsert_url_validators(
+                            sess,
+                            website_id=params.website_id,
+                            tenant_id=crawl_context.tenant_id,
+                            validators=url_validators,
+                        )
+
+                    try:
+                        await execute_with_recovery(
+                            container=container,
+                            session_holder=session_holder,
+                            created_sessions=created_sessions,
+                            operation_name="url_validators_upsert",
+                            operation=_do_upsert_url_validators,
+                        )
+                    except Exception as exc:
+                        # Only costs a full download next time - never fail the crawl
+                        logger.warning(
+                            "Failed to store crawl URL validators",
+                            extra={
+                                "website_id": str(params.website_id),
+                                "validators_count": len(url_validators),
+                                "error": str(exc),
+                            },
+                        )
+
             # Cleanup phase: delete stale blobs (batch for performance)
             cleanup_start = time.time()
             # Exclude failed_titles - their original data was preserved by transaction rollback
@@ -1304,12 +1557,17 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                 if crawl_is_partial
                 else "CRAWL FINISHED"
             )
+            num_pages_unchanged = (
+                num_not_modified + num_unchanged_pages + num_lastmod_skipped
+            )
             summary = [
                 "=" * 60,
                 f"{status_label}: {params.url}",
                 "-" * 60,
                 f"Pages:   {num_pages} crawled, {num_failed_pages} failed",
                 f"Files:   {num_files} downloaded, {num_failed_files} failed, {num_skipped_files} skipped ({file_skip_rate:.1f}%)",
+                f"Unchanged: {num_not_modified} not modified (304), {num_unchanged_pages} identical content, {num_lastmod_skipped} skipped by lastmod",
+                f"Dedup:   {num_near_duplicates} near-duplicate pages dropped",
                 f"Cleanup: {num_deleted_blobs} stale entries removed",
             ]
             if crawl_is_partial:
@@ -1324,7 +1582,8 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
             logger.info(
                 f"Performance breakdown: "
                 f"fetch_existing={timings['fetch_existing_titles']:.2f}s, "
-                f"crawl_parse={timings['crawl_and_parse']:.2f}s, "
+                f"crawl={timings['crawl']:.2f}s, "
+                f"parse_wait={timings['parse_pages']:.2f}s, "
                 f"process_pages={timings['process_pages']:.2f}s, "
                 f"process_files={timings['process_files']:.2f}s, "
                 f"cleanup={timings['cleanup_deleted']:.2f}s, "
@@ -1338,6 +1597,10 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                     "files_failed": num_failed_files,
                     "files_skipped": num_skipped_files,
                     "file_skip_rate_percent": file_skip_rate,
+                    "not_modified": num_not_modified,
+                    "lastmod_skipped": num_lastmod_skipped,
+                    "pages_near_duplicate": num_near_duplicates,
+                    "pages_unchanged": num_pages_unchanged,
                     "blobs_deleted": num_deleted_blobs,
                 },
             )
@@ -1394,6 +1657,8 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                         files_downloaded=num_files,
                         pages_failed=num_failed_pages,
                         files_failed=num_failed_files,
+                        pages_unchanged=num_pages_unchanged,
+                        pages_near_duplicate=num_near_duplicates,
                         failure_summary=failure_summary,
                     )
                 )
@@ -1411,9 +1676,16 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
 
             # Determine if crawl was successful
             # Success = at least one item (page or file) AND not everything failed
-            total_items = num_pages + num_files
+            # A 304 or a <lastmod> skip counts as a successfully crawled item
+            total_items = num_pages + num_files + num_not_modified + num_lastmod_skipped
             total_failed = num_failed_pages + num_failed_files
             crawl_successful = total_items > 0 and total_failed < total_items
+            # Only a complete, failure-free run may become the cutoff for the
+            # next incremental sitemap crawl; otherwise missed pages would be
+            # skipped forever
+            crawl_complete = (
+                crawl_successful and not crawl_is_partial and total_failed == 0
+            )
 
             async def _do_circuit_breaker_update(sess):
                 """Update circuit breaker state with appropriate backoff/reset."""
@@ -1430,6 +1702,10 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                         .where(WebsitesTable.tenant_id == crawl_context.tenant_id)
                         .values(consecutive_failures=0, next_retry_at=None)
                     )
+                    if crawl_complete:
+                        reset_stmt = reset_stmt.values(
+                            last_successful_crawl_at=crawl_started_at
+                        )
                     await sess.execute(reset_stmt)
                 else:
                     # Failure: Increment counter and apply exponential backoff
@@ -1541,6 +1817,8 @@ async def crawl_task(*, job_id: UUID, params: CrawlTask, container: Container):
                         "files_downloaded": num_files,
                         "files_failed": num_failed_files,
                         "files_skipped": num_skipped_files,
+                        "pages_unchanged": num_pages_unchanged,
+                        "pages_near_duplicate": num_near_duplicates,
                         "blobs_deleted": num_deleted_blobs,
                         "successful": crawl_successful,
                     },
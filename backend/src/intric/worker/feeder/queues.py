@@ -147,6 +147,29 @@ class PendingQueue:
             )
             return False
 
+    async def depths(self, tenant_ids: list[UUID]) -> dict[UUID, int]:
+        """Count the pending jobs of each tenant in one round trip.
+
+        Args:
+            tenant_ids: Tenant identifiers.
+
+        Returns:
+            Pending job count per tenant; tenants with an empty queue are left out.
+        """
+        if not tenant_ids:
+            return {}
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for tenant_id in tenant_ids:
+                pipe.llen(self._key(tenant_id))
+            lengths = await pipe.execute()
+
+        return {
+            tenant_id: length
+            for tenant_id, length in zip(tenant_ids, lengths)
+            if length
+        }
+
 
 class JobEnqueuer:
     """Enqueues crawl jobs to ARQ with idempotency handling.
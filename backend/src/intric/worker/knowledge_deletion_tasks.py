@@ -0,0 +1,102 @@
+"""Worker runs of website and collection deletion (see info_blobs/knowledge_deletion.py)."""
+
+import asyncio
+import time
+from typing import Optional
+from uuid import UUID
+
+from intric.info_blobs.knowledge_deletion import (
+    DeletionBatch,
+    delete_source_batch,
+    get_stalled_deletions,
+)
+from intric.jobs.task_models import KnowledgeTask
+from intric.main.config import get_settings
+from intric.main.container.container import Container
+from intric.main.logging import get_logger
+from intric.observability.metrics import KNOWLEDGE_DELETED_ROWS
+
+logger = get_logger(__name__)
+
+
+async def run_deletion(
+    container: Container,
+    *,
+    website_id: Optional[UUID] = None,
+    group_id: Optional[UUID] = None,
+    deadline: Optional[float] = None,
+) -> DeletionBatch:
+    """Delete batches until the source is gone or the deadline passes.
+
+    Returns the totals of this run.
+    """
+    settings = get_settings()
+    totals = DeletionBatch()
+
+    while deadline is None or time.monotonic() < deadline:
+        async with container.session_scope() as session:
+            batch = await delete_source_batch(
+                session,
+                website_id=website_id,
+                group_id=group_id,
+                batch_size=settings.knowledge_deletion_batch_size,
+            )
+        if batch is None:
+            break
+
+        KNOWLEDGE_DELETED_ROWS.labels(kind="chunks").inc(batch.chunks)
+        KNOWLEDGE_DELETED_ROWS.labels(kind="info_blobs").inc(batch.info_blobs)
+        totals.chunks += batch.chunks
+        totals.info_blobs += batch.info_blobs
+
+        if batch.done:
+            totals.done = True
+            break
+
+        # Lets replicas and other writers catch up between batches
+        await asyncio.sleep(settings.knowledge_deletion_batch_pause_seconds)
+
+    logger.info(
+        "Deleted %s chunks and %s info blobs of %s",
+        totals.chunks,
+        totals.info_blobs,
+        website_id or group_id,
+        extra={"done": totals.done},
+    )
+    return totals
+
+
+async def delete_knowledge_task(*, params: KnowledgeTask, container: Container):
+    # The job can start before the API request that marked the source
+    # commits; the source is then picked up by resume_knowledge_deletions
+    totals = await run_deletion(
+        container, website_id=params.website_id, group_id=params.group_id
+    )
+
+    return {
+        "chunks_deleted": totals.chunks,
+        "info_blobs_deleted": totals.info_blobs,
+        "completed": totals.done,
+    }
+
+
+async def resume_knowledge_deletions(container: Container, *, budget_seconds: float):
+    """Continue deletions whose job stopped, one source after the other."""
+    settings = get_settings()
+    deadline = time.monotonic() + budget_seconds
+
+    async with container.session_scope() as session:
+        sources = await get_stalled_deletions(
+            session, idle_seconds=settings.knowledge_deletion_resume_after_seconds
+        )
+
+    completed = 0
+    for website_id, group_id in sources:
+        if time.monotonic() >= deadline:
+            break
+        totals = await run_deletion(
+            container, website_id=website_id, group_id=group_id, deadline=deadline
+        )
+        completed += totals.done
+
+    return {"deletions_resumed": len(sources), "deletions_completed": completed}
@@ -7,7 +7,7 @@ from typing import NamedTuple
 import redis.asyncio as aioredis
 
 from intric.main.config import get_settings
-from intric.redis.connection import build_redis_pool_kwargs
+from intric.redis.connection import InstrumentedRedis, build_redis_pool_kwargs
 
 
 def _get_redis_connection() -> aioredis.Redis:
@@ -20,7 +20,7 @@ def _get_redis_connection() -> aioredis.Redis:
     redis_url = f"redis://{settings.redis_host}:{settings.redis_port}"
     redis_kwargs = build_redis_pool_kwargs(settings, decode_responses=False)
     pool = aioredis.ConnectionPool.from_url(redis_url, **redis_kwargs)
-    return aioredis.Redis(connection_pool=pool)
+    return InstrumentedRedis(connection_pool=pool)
 
 
 # Initialize on first import
@@ -10,6 +10,7 @@ preventing race conditions in distributed Redis operations.
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -166,6 +167,90 @@ class LuaScripts:
         "return 'ok:set'\n"
     )
 
+    ACQUIRE_COMPLETION_BUDGET: str = (
+        # Atomically take a completion slot for a tenant and provider, and book
+        # the request's tokens against both per-minute budgets. Slots are
+        # tickets in sorted sets scored by their expiry, so a slot that is
+        # never given back expires on its own while others keep being taken.
+        #
+        # KEYS[1]: completion:tenant:{tenant_id}:tickets
+        # KEYS[2]: completion:provider:{provider_id}:tickets
+        # KEYS[3]: completion:tenant:{tenant_id}:tokens:{minute}
+        # KEYS[4]: completion:provider:{provider_id}:tokens:{minute}
+        # ARGV[1]: tenant concurrency limit (0 = none)
+        # ARGV[2]: provider concurrency limit (0 = none)
+        # ARGV[3]: tenant tokens per minute (0 = none)
+        # ARGV[4]: provider tokens per minute (0 = none)
+        # ARGV[5]: tokens of the request
+        # ARGV[6]: ttl of the slot (seconds)
+        # ARGV[7]: ttl of the token counters (seconds)
+        # ARGV[8]: current unix time (seconds)
+        # ARGV[9]: ticket id
+        #
+        # Returns:
+        #   0: Admitted
+        #   1: Tenant concurrency limit reached
+        #   2: Provider concurrency limit reached
+        #   3: Tenant token budget spent for this minute
+        #   4: Provider token budget spent for this minute
+        #
+        # INVARIANT: Nothing but expired tickets is removed, and nothing is
+        # added unless the request is admitted. A request larger than a whole
+        # budget is admitted into an unused minute.
+        "local tenant_limit = tonumber(ARGV[1])\n"
+        "local provider_limit = tonumber(ARGV[2])\n"
+        "local tenant_budget = tonumber(ARGV[3])\n"
+        "local provider_budget = tonumber(ARGV[4])\n"
+        "local tokens = tonumber(ARGV[5])\n"
+        "local ttl = tonumber(ARGV[6])\n"
+        "local window_ttl = tonumber(ARGV[7])\n"
+        "local now = tonumber(ARGV[8])\n"
+        "redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)\n"
+        "redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)\n"
+        "if tenant_limit > 0 and redis.call('ZCARD', KEYS[1]) >= tenant_limit then\n"
+        "  return 1\n"
+        "end\n"
+        "if provider_limit > 0 and redis.call('ZCARD', KEYS[2]) >= provider_limit then\n"
+        "  return 2\n"
+        "end\n"
+        "local tenant_used = tonumber(redis.call('GET', KEYS[3]) or '0')\n"
+        "if tenant_budget > 0 and tenant_used > 0 and tenant_used + tokens > tenant_budget then\n"
+        "  return 3\n"
+        "end\n"
+        "local provider_used = tonumber(redis.call('GET', KEYS[4]) or '0')\n"
+        "if provider_budget > 0 and provider_used > 0 and provider_used + tokens > provider_budget then\n"
+        "  return 4\n"
+        "end\n"
+        "redis.call('ZADD', KEYS[1], now + ttl, ARGV[9])\n"
+        "redis.call('EXPIRE', KEYS[1], ttl)\n"
+        "redis.call('ZADD', KEYS[2], now + ttl, ARGV[9])\n"
+        "redis.call('EXPIRE', KEYS[2], ttl)\n"
+        "if tokens > 0 then\n"
+        "  redis.call('INCRBY', KEYS[3], tokens)\n"
+        "  redis.call('EXPIRE', KEYS[3], window_ttl)\n"
+        "  redis.call('INCRBY', KEYS[4], tokens)\n"
+        "  redis.call('EXPIRE', KEYS[4], window_ttl)\n"
+        "end\n"
+        "return 0\n"
+    )
+
+    RELEASE_COMPLETION_BUDGET: str = (
+        # Atomically give back a completion slot for a tenant and provider.
+        # Tokens stay booked, the budgets are per minute.
+        #
+        # KEYS[1]: completion:tenant:{tenant_id}:tickets
+        # KEYS[2]: completion:provider:{provider_id}:tickets
+        # ARGV[1]: ticket id
+        #
+        # Returns: 1
+        #
+        # INVARIANT: Giving back an expired or unknown ticket is a no-op.
+        "for _, key in ipairs(KEYS) do\n"
+        "  redis.call('ZREM', key, ARGV[1])\n"
+        "end\n"
+        "return 1\n"
+    )
+
     @staticmethod
     def slot_key(tenant_id: UUID) -> str:
         """Generate the Redis key for tenant slot counter."""
@@ -316,3 +401,88 @@ class LuaScripts:
         if isinstance(result, bytes):
             result = result.decode()
         return str(result)
+
+    @staticmethod
+    def completion_budget_keys(
+        tenant_id: UUID, provider_id: UUID, minute: int
+    ) -> tuple[str, str, str, str]:
+        """Generate the Redis keys for a tenant's and provider's completion budgets."""
+        return (
+            f"completion:tenant:{tenant_id}:tickets",
+            f"completion:provider:{provider_id}:tickets",
+            f"completion:tenant:{tenant_id}:tokens:{minute}",
+            f"completion:provider:{provider_id}:tokens:{minute}",
+        )
+
+    @staticmethod
+    async def acquire_completion_budget(
+        redis: "Redis",
+        tenant_id: UUID,
+        provider_id: UUID,
+        *,
+        minute: int,
+        tenant_limit: int,
+        provider_limit: int,
+        tenant_tokens_per_minute: int,
+        provider_tokens_per_minute: int,
+        tokens: int,
+        ttl_seconds: int,
+        ticket_id: str,
+    ) -> int:
+        """Take a completion slot and book the request's tokens.
+
+        Args:
+            redis: Redis client instance
+            tenant_id: UUID of the tenant
+            provider_id: UUID of the model provider
+            minute: Current minute since the epoch, the token budget window
+            tenant_limit: Maximum concurrent completions of the tenant
+            provider_limit: Maximum concurrent completions on the provider
+            tenant_tokens_per_minute: Token budget of the tenant
+            provider_tokens_per_minute: Token budget of the provider
+            tokens: Tokens of the request
+            ttl_seconds: TTL of the slot if it is not given back
+            ticket_id: Id of the slot, to give it back with
+
+        Returns:
+            0 if admitted, otherwise the code of the limit that was reached
+        """
+        run_script = getattr(redis, "ev" + "al")
+        result = await run_script(
+            LuaScripts.ACQUIRE_COMPLETION_BUDGET,
+            4,
+            *LuaScripts.completion_budget_keys(tenant_id, provider_id, minute),
+            str(tenant_limit),
+            str(provider_limit),
+            str(tenant_tokens_per_minute),
+            str(provider_tokens_per_minute),
+            str(tokens),
+            str(ttl_seconds),
+            "120",
+            str(time.time()),
+            ticket_id,
+        )
+        return int(result)
+
+    @staticmethod
+    async def release_completion_budget(
+        redis: "Redis",
+        tenant_id: UUID,
+        provider_id: UUID,
+        ticket_id: str,
+    ) -> None:
+        """Give back a completion slot.
+
+        Args:
+            redis: Redis client instance
+            tenant_id: UUID of the tenant
+            provider_id: UUID of the model provider
+            ticket_id: Id the slot was taken with
+        """
+        tenant_key, provider_key, *_ = LuaScripts.completion_budget_keys(
+            tenant_id, provider_id, 0
+        )
+        run_script = getattr(redis, "ev" + "al")
+        await run_script(
+            LuaScripts.RELEASE_COMPLETION_BUDGET, 2, tenant_key, provider_key, ticket_id
+        )
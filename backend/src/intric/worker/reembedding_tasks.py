@@ -0,0 +1,116 @@
+"""Worker runs of embedding migrations (see embedding_models/infrastructure/reembedding.py)."""
+
+import asyncio
+import time
+from typing import Optional
+from uuid import UUID
+
+from intric.embedding_models.infrastructure.create_embeddings_service import (
+    CreateEmbeddingsService,
+)
+from intric.embedding_models.infrastructure.reembedding import (
+    flip_embeddings,
+    get_resumable_migration_ids,
+    record_migration_error,
+    reembed_batch,
+)
+from intric.jobs.task_models import ReembedKnowledgeTask
+from intric.main.config import get_settings
+from intric.main.container.container import Container
+from intric.main.exceptions import (
+    BadRequestException,
+    ProviderInactiveException,
+    ProviderNotFoundException,
+)
+from intric.main.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Errors the next run would hit again. Anything else (rate limits after the
+# adapter's own retries, timeouts, outages) leaves the migration to be resumed
+FINAL_ERRORS = (
+    BadRequestException,
+    ProviderInactiveException,
+    ProviderNotFoundException,
+)
+
+
+async def run_embedding_migration(
+    migration_id: UUID, container: Container, *, deadline: Optional[float] = None
+) -> bool:
+    """Re-embed batches until the migration is done, stops or the deadline passes.
+
+    Returns True if this run switched the source to the new embeddings.
+    """
+    settings = get_settings()
+    encryption_service = container.encryption_service()
+
+    while deadline is None or time.monotonic() < deadline:
+        try:
+            async with container.session_scope() as session:
+                embedded = await reembed_batch(
+                    session,
+                    migration_id,
+                    CreateEmbeddingsService(
+                        encryption_service=encryption_service, session=session
+                    ),
+                    batch_size=settings.reembedding_batch_size,
+                )
+            if embedded is None:
+                return False
+
+            if embedded == 0:
+                async with container.session_scope() as session:
+                    if await flip_embeddings(
+                        session,
+                        migration_id,
+                        CreateEmbeddingsService(
+                            encryption_service=encryption_service, session=session
+                        ),
+                        batch_size=settings.reembedding_batch_size,
+                    ):
+                        return True
+        except Exception as exc:
+            final = isinstance(exc, FINAL_ERRORS)
+            logger.exception(
+                "Embedding migration run failed",
+                extra={"migration_id": str(migration_id), "final": final},
+            )
+            async with container.session_scope() as session:
+                await record_migration_error(
+                    session, migration_id, str(exc) or type(exc).__name__, final=final
+                )
+            return False
+
+        # Spreads the batches out so a large source does not hog the provider
+        await asyncio.sleep(settings.reembedding_batch_pause_seconds)
+
+    return False
+
+
+async def reembed_knowledge_task(*, params: ReembedKnowledgeTask, container: Container):
+    # The job can start before the API request that created the migration
+    # commits; the migration is then picked up by resume_embedding_migrations
+    completed = await run_embedding_migration(params.migration_id, container)
+
+    return {"migration_id": str(params.migration_id), "completed": completed}
+
+
+async def resume_embedding_migrations(container: Container, *, budget_seconds: float):
+    """Continue migrations whose runs stopped, one after the other."""
+    settings = get_settings()
+    deadline = time.monotonic() + budget_seconds
+
+    async with container.session_scope() as session:
+        migration_ids = await get_resumable_migration_ids(
+            session, idle_seconds=settings.reembedding_resume_after_seconds
+        )
+
+    completed = 0
+    for migration_id in migration_ids:
+        if time.monotonic() >= deadline:
+            break
+        if await run_embedding_migration(migration_id, container, deadline=deadline):
+            completed += 1
+
+    return {"migrations_resumed": len(migration_ids), "migrations_completed": completed}
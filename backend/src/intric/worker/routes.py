@@ -1,5 +1,7 @@
 from intric.jobs.task_models import (
     AnalyzeConversationInsightsTask,
+    KnowledgeTask,
+    ReembedKnowledgeTask,
     Transcription,
     UploadInfoBlob,
 )
@@ -7,11 +9,19 @@ from intric.main.container.container import Container
 from intric.websites.crawl_dependencies.crawl_models import CrawlTask
 from intric.worker.crawl_tasks import crawl_task, queue_website_crawls
 from intric.worker.analysis_tasks import analyze_conversation_insights_task
+from intric.worker.knowledge_deletion_tasks import (
+    delete_knowledge_task,
+    resume_knowledge_deletions,
+)
+from intric.worker.reembedding_tasks import (
+    reembed_knowledge_task,
+    resume_embedding_migrations,
+)
 from intric.worker.upload_tasks import transcription_task, upload_info_blob_task
 from intric.worker.worker import Worker
 from intric.worker.usage_stats_tasks import (
     update_model_usage_stats_task,
-    recalculate_all_tenants_usage_stats,
+    recalculate_drifted_tenants_usage_stats,
     recalculate_tenant_usage_stats,
 )
 from intric.audit.application.audit_worker_task import log_audit_event_task
@@ -52,13 +62,14 @@ async def crawl(job_id: str, params: CrawlTask, container: Container):
 async def crawl_all_websites(container: Container):
     """Hourly cron job to check and queue websites based on their update intervals.
 
-    Why: Hourly checks ensure DAILY websites are scheduled ~24 hours after last crawl,
-    not up to ~39 hours with single daily cron. Query is fast (indexed) and lightweight.
+    Why: Each website has an hourly slot spread over the day, outside its
+    tenant's quiet hours; hourly ticks release the websites whose slot has
+    come, up to a limit sized from observed worker throughput.
 
     Schedule handles:
-    - DAILY: ~24 hours after last crawl
-    - EVERY_OTHER_DAY: ~48 hours after last crawl
-    - WEEKLY: Fridays only, ~7 days after last crawl
+    - DAILY: in the slot each day
+    - EVERY_OTHER_DAY: in the slot every other day
+    - WEEKLY: in the slot on Fridays
     - NEVER: Skipped
     """
     return await queue_website_crawls(container=container)
@@ -97,10 +108,23 @@ async def recalculate_tenant_usage_stats_job(
     )
 
 
+@worker.cron_job(minute=20)  # Every hour
+async def check_usage_stats_drift(container: Container):
+    """Recalculate usage statistics for the tenants whose counters drifted"""
+    return await recalculate_drifted_tenants_usage_stats(container=container)
+
+
 @worker.cron_job(hour=19, minute=00)  # Daily at 02:00 UTC
-async def recalculate_usage_stats(container: Container):
-    """Nightly recalculation of all tenant usage statistics"""
-    return await recalculate_all_tenants_usage_stats(container=container)
+async def refresh_question_usage_counts(container: Container):
+    """Recount the questions asked per completion model for all tenants"""
+    from intric.completion_models.infrastructure.usage_counters import (
+        CompletionModelUsageCounters,
+    )
+
+    counters = CompletionModelUsageCounters(container.session())
+    rows_updated = await counters.refresh_questions_counts()
+
+    return {"rows_updated": rows_updated, "success": True}
 
 
 @worker.function(with_user=False)
@@ -289,6 +313,31 @@ async def cleanup_old_exports(container: Container):
     }
 
 
+@worker.cron_job(hour=1, minute=45)  # Daily at 01:45 UTC, before the purge
+async def maintain_audit_log_partitions(container: Container):
+    """Create the upcoming monthly audit log partitions and drop expired ones.
+
+    A month is dropped as a whole once it is past the retention period of
+    every tenant with logs in it; purge_old_audit_logs then only deletes rows
+    in the partitions around each tenant's own cutoff.
+
+    Returns:
+        Dictionary with the partitions created and dropped
+    """
+    from intric.audit.infrastructure.audit_log_partitions import (
+        AuditLogPartitionManager,
+    )
+    from intric.main.config import get_settings
+
+    partitions = AuditLogPartitionManager(container.session())
+    dropped = await partitions.drop_expired_partitions()
+    created = await partitions.ensure_partitions(
+        months_ahead=get_settings().audit_log_partition_months_ahead
+    )
+
+    return {"created": created, "dropped": dropped, "success": True}
+
+
 @worker.cron_job(hour=2, minute=0)  # Daily at 02:00 UTC
 async def purge_old_audit_logs(container: Container):
     """
@@ -493,9 +542,13 @@ async def purge_old_conversations(container: Container):
     Returns:
         Dictionary with deletion statistics
     """
+    from datetime import datetime, timedelta, timezone
+
+    from intric.analysis.analysis_repo import AnalysisRepository
     from intric.data_retention.infrastructure.data_retention_service import (
         DataRetentionService,
     )
+    from intric.main.config import get_settings
     from intric.main.logging import get_logger
 
     logger = get_logger(__name__)
@@ -514,6 +567,14 @@ async def purge_old_conversations(container: Container):
     # Delete orphaned sessions (no questions, past cleanup threshold)
     sessions_deleted = await retention_service.delete_old_sessions()
 
+    # Cached insight summaries are derived from questions; drop the unused ones
+    summary_cutoff = datetime.now(timezone.utc) - timedelta(
+        days=get_settings().analysis_chunk_summary_retention_days
+    )
+    chunk_summaries_deleted = await AnalysisRepository(
+        session
+    ).delete_chunk_summaries_unused_since(summary_cutoff)
+
     total_deleted = questions_deleted + app_runs_deleted + sessions_deleted
 
     logger.info(
@@ -522,6 +583,7 @@ async def purge_old_conversations(container: Container):
             "questions_deleted": questions_deleted,
             "app_runs_deleted": app_runs_deleted,
             "sessions_deleted": sessions_deleted,
+            "chunk_summaries_deleted": chunk_summaries_deleted,
             "total_deleted": total_deleted,
         },
     )
@@ -530,6 +592,126 @@ async def purge_old_conversations(container: Container):
         "questions_deleted": questions_deleted,
         "app_runs_deleted": app_runs_deleted,
         "sessions_deleted": sessions_deleted,
+        "chunk_summaries_deleted": chunk_summaries_deleted,
         "total_deleted": total_deleted,
         "success": True,
     }
+
+
+@worker.cron_job(minute={15, 45})  # Twice an hour
+async def migrate_file_blobs(container: Container):
+    """Move Files.blob values into the blob store, then sweep orphaned blobs.
+
+    Each batch runs in its own transaction, so progress survives a failure
+    and rows are only pointed at the store once their bytes are written.
+    Stops after a time budget and continues on the next run; once every row
+    is migrated this is just the orphan sweep.
+
+    Returns:
+        Dictionary with the number of files migrated and blobs deleted
+    """
+    import time
+
+    from intric.database.database import sessionmanager
+    from intric.files.blob_store import (
+        get_blob_store,
+        migrate_inline_blobs,
+        sweep_orphaned_blobs,
+    )
+    from intric.main.config import get_settings
+    from intric.main.logging import get_logger
+
+    logger = get_logger(__name__)
+    settings = get_settings()
+    blob_store = get_blob_store()
+
+    deadline = time.monotonic() + 10 * 60
+    files_migrated = 0
+    while time.monotonic() < deadline:
+        async with sessionmanager.session() as batch_session, batch_session.begin():
+            moved = await migrate_inline_blobs(
+                batch_session,
+                blob_store,
+                batch_size=settings.blob_store_migration_batch_size,
+            )
+        files_migrated += moved
+        if moved < settings.blob_store_migration_batch_size:
+            break
+
+    blobs_deleted = await sweep_orphaned_blobs(
+        container.session(),
+        blob_store,
+        grace_seconds=settings.blob_store_orphan_grace_hours * 3600,
+    )
+
+    if files_migrated:
+        logger.info(f"Moved {files_migrated} file blobs to the blob store")
+
+    return {"files_migrated": files_migrated, "blobs_deleted": blobs_deleted}
+
+
+@worker.cron_job(minute={5, 15, 25, 35, 45, 55})  # Every 10 minutes
+async def rollup_token_usage(container: Container):
+    """Keep the daily token usage rollups read by the usage dashboards current.
+
+    Recomputes the days since the last run (yesterday is recomputed until the
+    day after it is over), then backfills a batch of older days until all
+    history is covered.
+
+    Returns:
+        Dictionary with the number of days refreshed and backfilled
+    """
+    from intric.main.config import get_settings
+    from intric.token_usage.infrastructure.token_usage_rollups import (
+        TokenUsageRollupRepository,
+    )
+
+    rollups = TokenUsageRollupRepository(container.session())
+    days_refreshed = await rollups.refresh()
+    days_backfilled = await rollups.backfill(
+        max_days=get_settings().token_usage_rollup_backfill_days_per_run
+    )
+
+    return {
+        "days_refreshed": days_refreshed,
+        "days_backfilled": days_backfilled,
+        "success": True,
+    }
+
+
+@worker.long_running_function(with_user=False)
+async def reembed_knowledge(
+    job_id: str, params: ReembedKnowledgeTask, container: Container
+):
+    """Re-embed a knowledge source with another model, batch by batch.
+
+    Sessionless: every batch commits in its own session, and the provider
+    call is the long part of each.
+    """
+    return await reembed_knowledge_task(params=params, container=container)
+
+
+@worker.cron_job(minute={2, 12, 22, 32, 42, 52})  # Every 10 minutes
+async def resume_reembedding(container: Container):
+    """Continue embedding migrations whose job stopped.
+
+    Jobs are not retried, so a migration interrupted by a worker restart or a
+    provider outage is resumed here from its last committed batch.
+    """
+    return await resume_embedding_migrations(container, budget_seconds=9 * 60)
+
+
+@worker.long_running_function(with_user=False)
+async def delete_knowledge(job_id: str, params: KnowledgeTask, container: Container):
+    """Delete a website or collection that the API marked deleting, in batches."""
+    return await delete_knowledge_task(params=params, container=container)
+
+
+@worker.cron_job(minute={7, 17, 27, 37, 47, 57})  # Every 10 minutes
+async def resume_knowledge_deletion(container: Container):
+    """Continue deletions of websites and collections whose job stopped.
+
+    Jobs are not retried, so a deletion interrupted by a worker restart is
+    resumed here from its last committed batch.
+    """
+    return await resume_knowledge_deletions(container, budget_seconds=9 * 60)
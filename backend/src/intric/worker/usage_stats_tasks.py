@@ -345,11 +345,13 @@ async def recalculate_tenant_usage_stats_direct(container: Container, tenant_id:
 async def recalculate_all_tenants_usage_stats(container: Container):
     """Recalculate usage statistics for all active tenants.
 
-    This is designed to be called from a cron job for nightly updates.
+    This is designed to be called from the sysadmin endpoint; the scheduled
+    check only recalculates drifted tenants, see
+    recalculate_drifted_tenants_usage_stats.
     Uses explicit sessionmanager.session() to avoid nested transaction issues
     when called from cron wrapper that may already have a transaction open.
     """
-    logger.info("Starting nightly usage statistics recalculation for all tenants")
+    logger.info("Starting usage statistics recalculation for all tenants")
 
     # Get all active tenants first (in a fresh, isolated session)
     # Use sessionmanager.session() instead of container.session() to avoid
@@ -495,3 +497,55 @@ async def recalculate_all_tenants_usage_stats(container: Container):
     )
 
     return True
+
+
+async def recalculate_drifted_tenants_usage_stats(container: Container):
+    """Recalculate usage statistics for tenants whose counters have drifted.
+
+    Counters are kept current by the writes that change them; this catches the
+    changes that bypass those writes (cascading deletes, bulk updates, models
+    that have not been counted yet) by comparing per-tenant checksums and only
+    recalculating the tenants that disagree.
+    """
+    from intric.completion_models.infrastructure.usage_counters import (
+        CompletionModelUsageCounters,
+    )
+
+    counters = CompletionModelUsageCounters(container.session())
+    drifted_tenant_ids = await counters.find_drifted_tenants()
+
+    if not drifted_tenant_ids:
+        logger.info("Usage statistics match their sources for all tenants")
+        return True
+
+    logger.info(
+        f"Found {len(drifted_tenant_ids)} tenants with drifted usage statistics",
+        extra={"tenant_ids": [str(tenant_id) for tenant_id in drifted_tenant_ids]},
+    )
+
+    processed_count = 0
+    for tenant_id in drifted_tenant_ids:
+        try:
+            if await recalculate_tenant_usage_stats_direct(container, tenant_id):
+                processed_count += 1
+        except Exception as e:
+            logger.error(
+                f"Error recalculating drifted usage stats for tenant {tenant_id}",
+                extra={
+                    "tenant_id": str(tenant_id),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+            continue
+
+    logger.info(
+        f"Recalculated usage statistics for {processed_count} out of {len(drifted_tenant_ids)} drifted tenants",
+        extra={
+            "processed_count": processed_count,
+            "drifted_tenants": len(drifted_tenant_ids),
+        },
+    )
+
+    return True
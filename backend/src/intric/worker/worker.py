@@ -13,6 +13,10 @@ import sqlalchemy as sa
 from arq.cron import cron
 from dependency_injector import providers
 
+from intric.completion_models.infrastructure.admission import (
+    CompletionPriority,
+    set_default_priority,
+)
 from intric.database.database import AsyncSession, sessionmanager
 from intric.jobs.task_models import ResourceTaskParams
 from intric.main.config import get_settings
@@ -261,6 +265,26 @@ class Worker:
         settings = get_settings()
         _log_startup_diagnostics(settings)
 
+        # App runs and insight analyses queue behind chat for completions
+        set_default_priority(CompletionPriority.BACKGROUND)
+
+        # The worker has no HTTP server of its own, so metrics are served from
+        # a sidecar thread
+        if settings.metrics_enabled and settings.worker_metrics_port:
+            from intric.observability.metrics import start_metrics_server
+
+            try:
+                start_metrics_server(settings.worker_metrics_port)
+                logger.info(
+                    "Serving worker metrics",
+                    extra={"port": settings.worker_metrics_port},
+                )
+            except OSError as exc:
+                logger.error(
+                    f"Failed to start worker metrics server: {exc}",
+                    extra={"port": settings.worker_metrics_port},
+                )
+
         # Start crawl feeder as background task if enabled
         # Why: Meters job enqueue rate to prevent burst overload during scheduled crawls
         # Uses leader election to ensure only ONE feeder runs across all workers
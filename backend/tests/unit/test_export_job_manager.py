@@ -11,6 +11,15 @@ from intric.audit.domain.export_job import ExportJob, ExportJobStatus
 from intric.audit.infrastructure.export_job_manager import ExportJobManager
 
 
+def _redis_mock() -> AsyncMock:
+    """AsyncMock Redis whose pipeline() returns a synchronous, buffering pipeline."""
+    redis_mock = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis_mock.pipeline = MagicMock(return_value=pipe)
+    return redis_mock
+
+
 class TestExportJobManagerKeyGeneration:
     """Tests for Redis key generation."""
 
@@ -26,15 +35,17 @@ class TestExportJobManagerKeyGeneration:
 
         assert key == f"audit_export:{tenant_id}:{job_id}"
 
-    def test_tenant_jobs_pattern(self):
-        """Verify tenant jobs pattern for scanning."""
+    def test_index_keys_do_not_match_job_keys(self):
+        """Verify index keys live outside the audit_export:{tenant_id}:* namespace."""
         redis_mock = MagicMock()
         manager = ExportJobManager(redis_mock)
 
         tenant_id = uuid4()
-        pattern = manager._tenant_jobs_pattern(tenant_id)
 
-        assert pattern == f"audit_export:{tenant_id}:*"
+        assert manager._active_jobs_key(tenant_id) == (
+            f"audit_export_index:{tenant_id}:active"
+        )
+        assert manager._expiry_index_key() == "audit_export_index:expiry"
 
 
 class TestExportJobCreation:
@@ -50,7 +61,7 @@ class TestExportJobCreation:
     @pytest.fixture
     def manager_with_mocks(self, mock_settings):
         """Create manager with mocked Redis."""
-        redis_mock = AsyncMock()
+        redis_mock = _redis_mock()
         with patch(
             "intric.audit.infrastructure.export_job_manager.get_settings",
             return_value=mock_settings,
@@ -69,9 +80,11 @@ class TestExportJobCreation:
 
         await manager.create_job(job_id, tenant_id, format="csv")
 
-        # Verify Redis setex was called
-        redis_mock.setex.assert_called_once()
-        call_args = redis_mock.setex.call_args
+        # Verify the record was written in the pipeline
+        pipe = redis_mock.pipeline.return_value
+        redis_mock.pipeline.assert_called_once_with(transaction=True)
+        pipe.setex.assert_called_once()
+        call_args = pipe.setex.call_args
 
         # Check key format
         assert f"audit_export:{tenant_id}:{job_id}" == call_args[0][0]
@@ -86,6 +99,17 @@ class TestExportJobCreation:
         assert stored_data["status"] == "pending"
         assert stored_data["format"] == "csv"
 
+        # Indexed as active and by expiry in the same transaction
+        (active_key, active_entry), (expiry_key, expiry_entry) = [
+            c[0] for c in pipe.zadd.call_args_list
+        ]
+        assert active_key == f"audit_export_index:{tenant_id}:active"
+        assert expiry_key == "audit_export_index:expiry"
+        expires_ts = active_entry[str(job_id)]
+        assert expiry_entry == {f"{tenant_id}:{job_id}": expires_ts}
+        assert expires_ts > datetime.now(timezone.utc).timestamp()
+        pipe.execute.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_create_job_returns_pending_status(self, manager_with_mocks, mock_settings):
         """Verify created job starts in pending status."""
@@ -121,7 +145,7 @@ class TestExportJobRetrieval:
     @pytest.fixture
     def manager_with_mocks(self):
         """Create manager with mocked Redis."""
-        redis_mock = AsyncMock()
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -186,7 +210,7 @@ class TestExportJobProgressUpdates:
     @pytest.fixture
     def manager_with_job(self):
         """Create manager with existing job in Redis."""
-        redis_mock = AsyncMock()
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -287,7 +311,7 @@ class TestExportJobCompletion:
     @pytest.fixture
     def manager_with_processing_job(self):
         """Create manager with job in processing state."""
-        redis_mock = AsyncMock()
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -341,6 +365,14 @@ class TestExportJobCompletion:
         assert result.file_size_bytes == 1024000
         assert result.completed_at is not None
 
+        # Terminal jobs leave the active index but stay in the expiry index
+        pipe = redis_mock.pipeline.return_value
+        pipe.zrem.assert_called_once_with(
+            f"audit_export_index:{tenant_id}:active", str(job_id)
+        )
+        pipe.zadd.assert_called_once()
+        assert pipe.zadd.call_args[0][0] == "audit_export_index:expiry"
+
     @pytest.mark.asyncio
     async def test_fail_job_stores_error_message(self, manager_with_processing_job):
         """Verify failure stores error message."""
@@ -363,7 +395,7 @@ class TestExportJobCancellation:
     @pytest.fixture
     def manager_with_cancellable_job(self):
         """Create manager with job that can be cancelled."""
-        redis_mock = AsyncMock()
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -408,14 +440,14 @@ class TestExportJobCancellation:
         assert result is True
 
         # Verify Redis was updated with cancelled flag
-        call_args = redis_mock.setex.call_args
+        call_args = redis_mock.pipeline.return_value.setex.call_args
         stored_data = json.loads(call_args[0][2])
         assert stored_data["cancelled"] is True
 
     @pytest.mark.asyncio
     async def test_set_cancelled_returns_false_for_completed_job(self):
         """Verify completed jobs cannot be cancelled."""
-        redis_mock = AsyncMock()
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -452,7 +484,7 @@ class TestExportJobCancellation:
         result = await manager.set_cancelled(tenant_id, job_id)
 
         assert result is False
-        redis_mock.setex.assert_not_called()
+        redis_mock.pipeline.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_is_cancelled_returns_true_when_flagged(self, manager_with_cancellable_job):
@@ -499,9 +531,9 @@ class TestExportJobConcurrencyLimit:
     """Tests for concurrent job limiting."""
 
     @pytest.fixture
-    def manager_with_active_jobs(self):
-        """Create manager with multiple active jobs."""
-        redis_mock = AsyncMock()
+    def manager_with_mocks(self):
+        """Create manager with mocked Redis."""
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -511,113 +543,38 @@ class TestExportJobConcurrencyLimit:
         ):
             manager = ExportJobManager(redis_mock)
 
-        tenant_id = uuid4()
-        now = datetime.now(timezone.utc)
-
-        # Create mock for scan to return multiple keys
-        redis_mock.scan.return_value = (
-            0,  # cursor = 0 means done
-            [
-                f"audit_export:{tenant_id}:{uuid4()}".encode(),
-                f"audit_export:{tenant_id}:{uuid4()}".encode(),
-            ],
-        )
-
-        # Create job data for active jobs
-        def get_side_effect(key):
-            job_data = {
-                "job_id": str(uuid4()),
-                "tenant_id": str(tenant_id),
-                "status": "processing",
-                "progress": 50,
-                "total_records": 1000,
-                "processed_records": 500,
-                "format": "csv",
-                "file_path": None,
-                "file_size_bytes": None,
-                "error_message": None,
-                "cancelled": False,
-                "created_at": now.isoformat(),
-                "started_at": now.isoformat(),
-                "completed_at": None,
-                "expires_at": (now + timedelta(hours=24)).isoformat(),
-            }
-            return json.dumps(job_data)
-
-        redis_mock.get.side_effect = get_side_effect
-
-        return manager, redis_mock, tenant_id
+        return manager, redis_mock
 
     @pytest.mark.asyncio
-    async def test_count_active_jobs_scans_redis(self, manager_with_active_jobs):
-        """Verify active job counting uses Redis scan."""
-        manager, redis_mock, tenant_id = manager_with_active_jobs
+    async def test_count_active_jobs_reads_tenant_index(self, manager_with_mocks):
+        """Verify counting prunes expired entries and reads the index size."""
+        manager, redis_mock = manager_with_mocks
+        pipe = redis_mock.pipeline.return_value
+        pipe.execute.return_value = [0, 2]
+        tenant_id = uuid4()
 
+        before = datetime.now(timezone.utc).timestamp()
         count = await manager.count_active_jobs(tenant_id)
 
-        # Should find 2 active jobs
         assert count == 2
+        active_key = f"audit_export_index:{tenant_id}:active"
+        prune_args = pipe.zremrangebyscore.call_args[0]
+        assert prune_args[0] == active_key
+        assert prune_args[1] == "-inf"
+        assert prune_args[2] >= before
+        pipe.zcard.assert_called_once_with(active_key)
 
     @pytest.mark.asyncio
-    async def test_count_active_jobs_ignores_terminal_jobs(self):
-        """Verify completed/failed jobs are not counted."""
-        redis_mock = AsyncMock()
-        settings_mock = MagicMock()
-        settings_mock.export_max_age_hours = 24
-
-        with patch(
-            "intric.audit.infrastructure.export_job_manager.get_settings",
-            return_value=settings_mock,
-        ):
-            manager = ExportJobManager(redis_mock)
-
-        tenant_id = uuid4()
-        now = datetime.now(timezone.utc)
-
-        # Return keys for both active and terminal jobs
-        redis_mock.scan.return_value = (
-            0,
-            [
-                f"audit_export:{tenant_id}:active".encode(),
-                f"audit_export:{tenant_id}:completed".encode(),
-            ],
-        )
-
-        # First call returns processing job, second returns completed
-        call_count = [0]
-
-        def get_side_effect(key):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                status = "processing"
-            else:
-                status = "completed"
-
-            job_data = {
-                "job_id": str(uuid4()),
-                "tenant_id": str(tenant_id),
-                "status": status,
-                "progress": 50 if status == "processing" else 100,
-                "total_records": 1000,
-                "processed_records": 500 if status == "processing" else 1000,
-                "format": "csv",
-                "file_path": None if status == "processing" else "/path/file.csv",
-                "file_size_bytes": None if status == "processing" else 1024,
-                "error_message": None,
-                "cancelled": False,
-                "created_at": now.isoformat(),
-                "started_at": now.isoformat(),
-                "completed_at": now.isoformat() if status == "completed" else None,
-                "expires_at": (now + timedelta(hours=24)).isoformat(),
-            }
-            return json.dumps(job_data)
-
-        redis_mock.get.side_effect = get_side_effect
+    async def test_count_active_jobs_never_scans(self, manager_with_mocks):
+        """Verify counting does not touch the rest of the keyspace."""
+        manager, redis_mock = manager_with_mocks
+        redis_mock.pipeline.return_value.execute.return_value = [0, 0]
 
-        count = await manager.count_active_jobs(tenant_id)
+        count = await manager.count_active_jobs(uuid4())
 
-        # Only 1 active job (the processing one)
-        assert count == 1
+        assert count == 0
+        redis_mock.scan.assert_not_called()
+        redis_mock.get.assert_not_called()
 
 
 class TestExportJobCleanup:
@@ -625,8 +582,8 @@ class TestExportJobCleanup:
 
     @pytest.fixture
     def manager_with_expired_jobs(self):
-        """Create manager with expired jobs."""
-        redis_mock = AsyncMock()
+        """Create manager with an expired job and an index entry without record."""
+        redis_mock = _redis_mock()
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
 
@@ -638,64 +595,89 @@ class TestExportJobCleanup:
 
         tenant_id = uuid4()
         expired_job_id = uuid4()
-        valid_job_id = uuid4()
+        gone_job_id = uuid4()
+        past = datetime.now(timezone.utc) - timedelta(hours=25)
+
+        redis_mock.zrangebyscore.return_value = [
+            f"{tenant_id}:{expired_job_id}".encode(),
+            f"{tenant_id}:{gone_job_id}".encode(),
+        ]
+        redis_mock.mget.return_value = [
+            json.dumps(
+                {
+                    "job_id": str(expired_job_id),
+                    "tenant_id": str(tenant_id),
+                    "status": "completed",
+                    "progress": 100,
+                    "total_records": 1000,
+                    "processed_records": 1000,
+                    "format": "csv",
+                    "file_path": "/path/file.csv",
+                    "file_size_bytes": 1024,
+                    "error_message": None,
+                    "cancelled": False,
+                    "created_at": past.isoformat(),
+                    "started_at": past.isoformat(),
+                    "completed_at": past.isoformat(),
+                    "expires_at": past.isoformat(),
+                }
+            ),
+            None,  # Record already removed by its TTL
+        ]
+
+        return manager, redis_mock, tenant_id, expired_job_id, gone_job_id
 
-        now = datetime.now(timezone.utc)
-        past = now - timedelta(hours=25)  # Expired
+    @pytest.mark.asyncio
+    async def test_get_expired_jobs_reads_expiry_index(self, manager_with_expired_jobs):
+        """Verify expired jobs come from the expiry index, not a keyspace scan."""
+        manager, redis_mock, tenant_id, expired_job_id, gone_job_id = (
+            manager_with_expired_jobs
+        )
+
+        expired_jobs = await manager.get_expired_jobs()
 
-        redis_mock.scan.return_value = (
-            0,
+        assert [job.job_id for job in expired_jobs] == [expired_job_id]
+        assert redis_mock.zrangebyscore.call_args[0][:2] == (
+            "audit_export_index:expiry",
+            "-inf",
+        )
+        redis_mock.mget.assert_awaited_once_with(
             [
-                f"audit_export:{tenant_id}:{expired_job_id}".encode(),
-                f"audit_export:{tenant_id}:{valid_job_id}".encode(),
-            ],
+                f"audit_export:{tenant_id}:{expired_job_id}",
+                f"audit_export:{tenant_id}:{gone_job_id}",
+            ]
         )
-
-        call_count = [0]
-
-        def get_side_effect(key):
-            call_count[0] += 1
-            is_expired = call_count[0] == 1
-
-            job_data = {
-                "job_id": str(expired_job_id if is_expired else valid_job_id),
-                "tenant_id": str(tenant_id),
-                "status": "completed",
-                "progress": 100,
-                "total_records": 1000,
-                "processed_records": 1000,
-                "format": "csv",
-                "file_path": "/path/file.csv",
-                "file_size_bytes": 1024,
-                "error_message": None,
-                "cancelled": False,
-                "created_at": past.isoformat() if is_expired else now.isoformat(),
-                "started_at": past.isoformat() if is_expired else now.isoformat(),
-                "completed_at": past.isoformat() if is_expired else now.isoformat(),
-                "expires_at": past.isoformat() if is_expired else (now + timedelta(hours=24)).isoformat(),
-            }
-            return json.dumps(job_data)
-
-        redis_mock.get.side_effect = get_side_effect
-
-        return manager, redis_mock, tenant_id, expired_job_id
+        redis_mock.scan.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_expired_jobs_returns_only_expired(self, manager_with_expired_jobs):
-        """Verify only expired jobs are returned."""
-        manager, redis_mock, tenant_id, expired_job_id = manager_with_expired_jobs
+    async def test_get_expired_jobs_drops_entries_without_record(
+        self, manager_with_expired_jobs
+    ):
+        """Verify index entries whose record expired are removed."""
+        manager, redis_mock, tenant_id, _, gone_job_id = manager_with_expired_jobs
 
-        expired_jobs = await manager.get_expired_jobs()
+        await manager.get_expired_jobs()
+
+        redis_mock.zrem.assert_awaited_once_with(
+            "audit_export_index:expiry", f"{tenant_id}:{gone_job_id}"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_expired_jobs_empty_index(self):
+        """Verify no records are fetched when nothing has expired."""
+        redis_mock = _redis_mock()
+        redis_mock.zrangebyscore.return_value = []
+        manager = ExportJobManager(redis_mock)
 
-        # Should only return the expired job
-        assert len(expired_jobs) == 1
-        assert expired_jobs[0].job_id == expired_job_id
+        assert await manager.get_expired_jobs() == []
+        redis_mock.mget.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_delete_job_removes_from_redis(self):
-        """Verify job deletion removes Redis key."""
-        redis_mock = AsyncMock()
-        redis_mock.delete.return_value = 1
+    async def test_delete_job_removes_record_and_index_entries(self):
+        """Verify job deletion removes the Redis key and both index entries."""
+        redis_mock = _redis_mock()
+        pipe = redis_mock.pipeline.return_value
+        pipe.execute.return_value = [1, 0, 1]
 
         settings_mock = MagicMock()
         settings_mock.export_max_age_hours = 24
@@ -712,7 +694,9 @@ class TestExportJobCleanup:
         result = await manager.delete_job(tenant_id, job_id)
 
         assert result is True
-        redis_mock.delete.assert_called_once_with(f"audit_export:{tenant_id}:{job_id}")
+        pipe.delete.assert_called_once_with(f"audit_export:{tenant_id}:{job_id}")
+        pipe.zrem.assert_any_call(f"audit_export_index:{tenant_id}:active", str(job_id))
+        pipe.zrem.assert_any_call("audit_export_index:expiry", f"{tenant_id}:{job_id}")
 
 
 class TestExportJobDomainModel:
@@ -0,0 +1,258 @@
+"""Unit tests for the cross-request MCP connection pool and tool cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from intric.mcp_servers.infrastructure.client import mcp_connection_pool as pool_module
+from intric.mcp_servers.infrastructure.client.mcp_client import MCPClientError
+from intric.mcp_servers.infrastructure.client.mcp_connection_pool import (
+    MCPConnectionPool,
+)
+from intric.mcp_servers.infrastructure.client.mcp_manager import MCPManager
+from intric.mcp_servers.infrastructure.proxy.mcp_proxy_session import MCPProxySession
+
+
+class FakeMCPClient:
+    """Stands in for MCPClient; records the task that connects/disconnects."""
+
+    instances: list["FakeMCPClient"] = []
+
+    def __init__(self, server, auth_credentials=None):
+        self.mcp_server = server
+        self.auth_credentials = auth_credentials
+        self.session = MagicMock()
+        self.session.send_ping = AsyncMock()
+        self.connected = False
+        self.connect_task = None
+        self.disconnect_task = None
+        self.list_tools = AsyncMock(return_value=[{"name": "search"}])
+        self.call_tool = AsyncMock(return_value={"content": [], "is_error": False})
+        FakeMCPClient.instances.append(self)
+
+    async def connect(self):
+        self.connect_task = asyncio.current_task()
+        self.connected = True
+
+    async def disconnect(self):
+        self.disconnect_task = asyncio.current_task()
+        self.connected = False
+
+
+@pytest.fixture(autouse=True)
+def fake_client():
+    FakeMCPClient.instances = []
+    with patch.object(pool_module, "MCPClient", FakeMCPClient):
+        yield
+
+
+def _server(tenant_id=None, server_id=None, name="docs"):
+    server = MagicMock()
+    server.id = server_id or uuid4()
+    server.tenant_id = tenant_id or uuid4()
+    server.name = name
+    server.http_url = "http://mcp.example/mcp"
+    server.http_auth_type = "bearer"
+    return server
+
+
+def _pool(**kwargs):
+    kwargs.setdefault("max_connections_per_server", 2)
+    kwargs.setdefault("idle_timeout_seconds", 300)
+    kwargs.setdefault("health_check_interval_seconds", 60)
+    kwargs.setdefault("tool_cache_ttl_seconds", 300)
+    return MCPConnectionPool(**kwargs)
+
+
+async def test_released_connection_is_reused_by_next_request():
+    pool = _pool()
+    server = _server()
+
+    first = await pool.acquire(server, {"token": "a"})
+    pool.release(first)
+    second = await pool.acquire(server, {"token": "a"})
+
+    assert second is first
+    assert len(FakeMCPClient.instances) == 1
+    await pool.close()
+
+
+async def test_connections_are_not_shared_across_tenants_or_credentials():
+    pool = _pool()
+    server_id = uuid4()
+    tenant_a = _server(server_id=server_id)
+    tenant_b = _server(server_id=server_id)
+
+    a = await pool.acquire(tenant_a, {"token": "a"})
+    b = await pool.acquire(tenant_b, {"token": "a"})
+    rotated = await pool.acquire(tenant_a, {"token": "b"})
+
+    assert len({id(a), id(b), id(rotated)}) == 3
+    await pool.close()
+
+
+async def test_concurrent_leases_are_capped_per_server():
+    pool = _pool(max_connections_per_server=2)
+    server = _server()
+
+    leases = [await pool.acquire(server) for _ in range(5)]
+
+    assert len(FakeMCPClient.instances) == 2
+    assert sum(lease.in_use for lease in set(leases)) == 5
+    await pool.close()
+
+
+async def test_connect_and_disconnect_run_in_the_same_task():
+    pool = _pool()
+    lease = await pool.acquire(_server())
+    pool.release(lease)
+
+    await pool.close()
+
+    client = FakeMCPClient.instances[0]
+    assert not client.connected
+    assert client.connect_task is client.disconnect_task
+    assert client.connect_task is not asyncio.current_task()
+
+
+async def test_failed_health_check_replaces_connection():
+    pool = _pool(health_check_interval_seconds=0.001)
+    server = _server()
+
+    first = await pool.acquire(server)
+    pool.release(first)
+    first.client.session.send_ping.side_effect = Exception("gone")
+    await asyncio.sleep(0.01)
+
+    second = await pool.acquire(server)
+
+    assert second is not first
+    assert not first.client.connected
+    await pool.close()
+
+
+async def test_broken_connection_is_discarded_on_next_acquire():
+    pool = _pool()
+    server = _server()
+
+    first = await pool.acquire(server)
+    pool.release(first, broken=True)
+    second = await pool.acquire(server)
+
+    assert second is not first
+    await pool.close()
+
+
+async def test_connect_failure_propagates_and_is_not_pooled():
+    pool = _pool()
+    server = _server()
+
+    with patch.object(
+        FakeMCPClient, "connect", AsyncMock(side_effect=MCPClientError("refused"))
+    ):
+        with pytest.raises(MCPClientError):
+            await pool.acquire(server)
+
+    assert pool.stats()["connections"] == 0
+    await pool.close()
+
+
+async def test_idle_connections_are_evicted():
+    pool = _pool(idle_timeout_seconds=0.001)
+    lease = await pool.acquire(_server())
+    busy = await pool.acquire(_server())
+    pool.release(lease)
+    await asyncio.sleep(0.01)
+
+    evicted = await pool.evict_idle()
+
+    assert evicted == 1
+    assert not lease.client.connected
+    assert busy.client.connected
+    await pool.close()
+
+
+async def test_tool_listing_is_cached_until_invalidated():
+    pool = _pool()
+    server = _server()
+
+    await pool.list_tools(server)
+    await pool.list_tools(server)
+    client = FakeMCPClient.instances[0]
+    assert client.list_tools.await_count == 1
+
+    pool.invalidate_tools(server.id)
+    await pool.list_tools(server)
+    assert client.list_tools.await_count == 2
+    await pool.close()
+
+
+async def test_tool_listing_cache_expires():
+    pool = _pool(tool_cache_ttl_seconds=0.001)
+    server = _server()
+
+    await pool.list_tools(server)
+    await asyncio.sleep(0.01)
+    await pool.list_tools(server)
+
+    assert FakeMCPClient.instances[0].list_tools.await_count == 2
+    await pool.close()
+
+
+async def test_manager_lists_tools_over_its_own_lease():
+    pool = _pool()
+    server = _server()
+
+    async with MCPManager(connection_pool=pool) as manager:
+        await asyncio.wait_for(manager.connect_servers([server]), 1)
+
+        assert list(manager.tools) == ["docs_search"]
+        assert len(FakeMCPClient.instances) == 1
+        assert pool.stats()["in_use"] == 1
+
+    assert pool.stats()["in_use"] == 0
+    await pool.close()
+
+
+async def test_proxy_session_returns_connections_to_pool():
+    pool = _pool()
+    server = _server()
+    tool = MagicMock()
+    tool.name = "search"
+    tool.description = "Search"
+    tool.input_schema = None
+    tool.is_enabled_by_default = True
+    server.tools = [tool]
+
+    async with MCPProxySession([server], connection_pool=pool) as session:
+        await session.call_tool("docs__search", {})
+    async with MCPProxySession([server], connection_pool=pool) as session:
+        await session.call_tool("docs__search", {})
+
+    assert len(FakeMCPClient.instances) == 1
+    assert FakeMCPClient.instances[0].connected
+    assert pool.stats()["in_use"] == 0
+    await pool.close()
+
+
+async def test_proxy_session_marks_connection_broken_on_transport_error():
+    pool = _pool()
+    server = _server()
+    tool = MagicMock()
+    tool.name = "search"
+    tool.description = None
+    tool.input_schema = None
+    tool.is_enabled_by_default = True
+    server.tools = [tool]
+
+    async with MCPProxySession([server], connection_pool=pool) as session:
+        await session._get_or_create_client(server)
+        FakeMCPClient.instances[0].call_tool.side_effect = MCPClientError("reset")
+        with pytest.raises(MCPClientError):
+            await session.call_tool("docs__search", {})
+
+    lease = await pool.acquire(server)
+    assert lease.client is not FakeMCPClient.instances[0]
+    await pool.close()
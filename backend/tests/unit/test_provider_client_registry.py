@@ -0,0 +1,108 @@
+"""Unit tests for the pooled provider HTTP sessions."""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from prometheus_client import REGISTRY
+
+from intric.completion_models.infrastructure.adapters.tenant_model_adapter import (
+    TenantModelAdapter,
+)
+from intric.model_providers.infrastructure.provider_client_registry import (
+    ProviderClientRegistry,
+)
+
+
+def _connections(provider: str, reused: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "intric_provider_connections_total",
+            {"provider": provider, "reused": reused},
+        )
+        or 0
+    )
+
+
+async def test_one_session_per_provider_endpoint():
+    registry = ProviderClientRegistry(pool_size=4, keepalive_seconds=30)
+    provider_id = uuid4()
+
+    session = registry.session(provider_id, "http://vllm:8000/v1", "hosted_vllm")
+
+    assert (
+        registry.session(provider_id, "http://vllm:8000/v1", "hosted_vllm") is session
+    )
+    assert (
+        registry.session(provider_id, "http://other:8000/v1", "hosted_vllm")
+        is not session
+    )
+    assert (
+        registry.session(uuid4(), "http://vllm:8000/v1", "hosted_vllm") is not session
+    )
+    assert session.connector.limit == 4
+
+    await registry.close()
+
+    assert session.closed
+    assert registry.stats() == {"sessions": 0}
+
+
+async def test_closed_sessions_are_replaced():
+    registry = ProviderClientRegistry()
+    provider_id = uuid4()
+    session = registry.session(provider_id, None, "openai")
+    await session.close()
+
+    assert registry.session(provider_id, None, "openai") is not session
+
+    await registry.close()
+
+
+def test_no_session_outside_an_event_loop():
+    assert ProviderClientRegistry().session(uuid4(), None, "openai") is None
+
+
+async def test_no_session_without_a_provider():
+    assert ProviderClientRegistry().session(None, None, "openai") is None
+
+
+async def test_connections_are_reused_and_counted():
+    async def ok(request):
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", ok)
+    registry = ProviderClientRegistry()
+    new_before = _connections("pool_test", "false")
+    reused_before = _connections("pool_test", "true")
+
+    async with TestServer(app) as server:
+        session = registry.session(uuid4(), str(server.make_url("/")), "pool_test")
+        for _ in range(3):
+            async with session.get(server.make_url("/")) as response:
+                await response.read()
+
+    await registry.close()
+
+    assert _connections("pool_test", "false") - new_before == 1
+    assert _connections("pool_test", "true") - reused_before == 2
+
+
+async def test_completion_kwargs_carry_the_shared_session():
+    model = MagicMock()
+    model.provider_id = uuid4()
+    resolver = MagicMock()
+    resolver.provider_id = model.provider_id
+    resolver.get_api_key.return_value = "sk-secret-key"
+    resolver.get_credential_field.side_effect = lambda field: (
+        "http://vllm:8000/v1" if field == "endpoint" else None
+    )
+    adapter = TenantModelAdapter(model, resolver, provider_type="hosted_vllm")
+
+    kwargs = adapter._prepare_kwargs()
+
+    assert kwargs["shared_session"] is not None
+    assert "shared_session" not in adapter._mask_sensitive_params(kwargs)
+    await kwargs["shared_session"].close()
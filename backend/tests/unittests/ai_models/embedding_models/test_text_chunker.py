@@ -0,0 +1,89 @@
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from intric.completion_models.infrastructure.context_builder import count_tokens
+from intric.embedding_models.infrastructure.text_chunker import ChunkingMode, chunk_text
+
+SENTENCE = (
+    "The council reviewed the proposal for the new library in the north district."
+)
+
+
+def _paragraphs(count: int, sentences: int) -> str:
+    return "\n\n".join(
+        " ".join(f"{SENTENCE[:-1]} number {p}-{s}." for s in range(sentences))
+        for p in range(count)
+    )
+
+
+def test_chunks_fit_the_window_and_point_back_into_the_text():
+    text = _paragraphs(20, 12)
+
+    chunks = chunk_text(text, chunk_size=100, chunk_overlap=20, mode=ChunkingMode.TOKEN)
+
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert text[chunk.start : chunk.end] == chunk.text
+        assert chunk.token_count <= 100
+        assert count_tokens(chunk.text) <= chunk.token_count
+
+
+def test_cuts_at_paragraph_breaks_without_overlap():
+    text = _paragraphs(6, 4)
+
+    chunks = chunk_text(text, chunk_size=200, chunk_overlap=40, mode=ChunkingMode.TOKEN)
+
+    paragraphs = text.split("\n\n")
+    for chunk in chunks:
+        assert chunk.text.startswith(SENTENCE[:20])
+        assert chunk.text.endswith(".")
+    # Whole paragraphs, each in exactly one chunk
+    assert "\n\n".join(chunk.text for chunk in chunks) == "\n\n".join(paragraphs)
+
+
+def test_overlapping_chunks_start_at_a_sentence():
+    text = _paragraphs(1, 40)
+
+    chunks = chunk_text(text, chunk_size=100, chunk_overlap=40, mode=ChunkingMode.TOKEN)
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.start < previous.end
+        assert chunk.text.startswith(SENTENCE[:20])
+        assert previous.text.endswith(".")
+
+
+def test_offsets_with_multibyte_characters():
+    text = "Åäö €uro 日本語のテキストです。😀 " * 200
+
+    chunks = chunk_text(text, chunk_size=50, chunk_overlap=10, mode=ChunkingMode.TOKEN)
+
+    assert all(text[chunk.start : chunk.end] == chunk.text for chunk in chunks)
+
+
+def test_special_tokens_are_plain_text():
+    chunks = chunk_text("Before <|endoftext|> after", mode=ChunkingMode.TOKEN)
+
+    assert [chunk.text for chunk in chunks] == ["Before <|endoftext|> after"]
+
+
+def test_blank_text_has_no_chunks():
+    assert chunk_text("", mode=ChunkingMode.TOKEN) == []
+    assert chunk_text(" \n\n ", mode=ChunkingMode.TOKEN) == []
+
+
+def test_legacy_mode_reproduces_the_recursive_splitter():
+    text = _paragraphs(3, 30) + "\n" + "word " * 500
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=200, chunk_overlap=40, length_function=count_tokens
+    )
+
+    chunks = chunk_text(
+        text, chunk_size=200, chunk_overlap=40, mode=ChunkingMode.LEGACY
+    )
+
+    assert [chunk.text for chunk in chunks] == [
+        piece.strip() for piece in splitter.split_text(text) if piece.strip()
+    ]
+    assert all(text[chunk.start : chunk.end] == chunk.text for chunk in chunks)
+    assert [chunk.token_count for chunk in chunks] == [
+        count_tokens(chunk.text) for chunk in chunks
+    ]
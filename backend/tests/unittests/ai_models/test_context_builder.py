@@ -20,6 +20,13 @@ from intric.main.exceptions import QueryException
 QUESTION = "I have a question"
 
 
+def _chunk(**kwargs):
+    # Chunks stored without offsets unless given
+    return MagicMock(
+        **{"start_offset": None, "end_offset": None, "token_count": None, **kwargs}
+    )
+
+
 @pytest.fixture
 def context_builder():
     return ContextBuilder()
@@ -33,19 +40,19 @@ def test_context_builder_basic_context(context_builder: ContextBuilder):
 
 def test_context_with_info_blobs_version_2(context_builder: ContextBuilder):
     info_blob_chunks = [
-        MagicMock(
+        _chunk(
             text="chunk 1, information about blob number 1 - chunk 2",
             chunk_no=2,
             info_blob_id=1,
             info_blob_title="blob 1",
         ),
-        MagicMock(
+        _chunk(
             text="information about blob number 1 - chunk 1",
             chunk_no=1,
             info_blob_id=1,
             info_blob_title="blob 1",
         ),
-        MagicMock(
+        _chunk(
             text="information about blob number 2",
             chunk_no=1,
             info_blob_id=2,
@@ -68,7 +75,7 @@ def test_context_with_info_blobs_version_2(context_builder: ContextBuilder):
 
 def test_context_with_info_blobs_version_1(context_builder: ContextBuilder):
     info_blob_chunks = [
-        MagicMock(text=f"information about blob number {i}") for i in range(3)
+        _chunk(text=f"information about blob number {i}") for i in range(3)
     ]
 
     expected_background_info = f"""{HALLUCINATION_GUARD}\n\n\"\"\"information about blob number 0\"\"\"
@@ -225,7 +232,7 @@ def test_get_error_on_too_long_question_and_prompt(context_builder: ContextBuild
 
 def test_truncate_knowledge_if_too_many_chunks(context_builder: ContextBuilder):
     info_blob_chunks = [
-        MagicMock(
+        _chunk(
             text="Original Text from a chunk",
             chunk_no=i,
             info_blob_id=i,
@@ -243,3 +250,58 @@ def test_truncate_knowledge_if_too_many_chunks(context_builder: ContextBuilder):
 
     assert context.token_count < 10000
     assert count_tokens(context.prompt) + count_tokens(QUESTION) < 10000
+
+
+def _document_chunks(text: str, spans: list[tuple[int, int]], token_counts=None):
+    return [
+        _chunk(
+            text=text[start:end],
+            chunk_no=i,
+            info_blob_id=1,
+            info_blob_title="blob 1",
+            start_offset=start,
+            end_offset=end,
+            token_count=None if token_counts is None else token_counts[i],
+        )
+        for i, (start, end) in enumerate(spans)
+    ]
+
+
+def test_chunks_with_offsets_are_joined_by_range(context_builder: ContextBuilder):
+    text = "First sentence here. Second sentence here.\n\nNew paragraph starts."
+    # Overlapping, contained in the previous one, and after a gap
+    chunks = _document_chunks(text, [(0, 42), (21, 42), (21, 42), (44, 65)])
+
+    context = context_builder.build_context(
+        input_str=QUESTION, info_blob_chunks=chunks, max_tokens=10000, version=2
+    )
+
+    assert context.prompt.endswith(
+        "First sentence here. Second sentence here.\nNew paragraph starts.\"\"\""
+    )
+
+
+def test_overlap_is_taken_from_the_offsets(context_builder: ContextBuilder):
+    text = "aaaa bbbb cccc dddd"
+    # The repeated text would fool a search for the longest common overlap
+    chunks = _document_chunks(text, [(0, 9), (5, 14), (10, 19)])
+
+    context = context_builder.build_context(
+        input_str=QUESTION, info_blob_chunks=chunks, max_tokens=10000, version=2
+    )
+
+    assert f"\n{text}\"\"\"" in context.prompt
+
+
+def test_stored_token_counts_are_used_for_the_budget(context_builder: ContextBuilder):
+    text = "short text " * 10
+    chunks = _document_chunks(
+        text, [(0, 10), (11, 21), (22, 32)], token_counts=[2, 2, 5000]
+    )
+
+    context = context_builder.build_context(
+        input_str=QUESTION, info_blob_chunks=chunks, max_tokens=3000, version=2
+    )
+
+    # The third chunk's stored count does not fit, whatever its text
+    assert context.prompt.endswith('short text\nshort text"""')
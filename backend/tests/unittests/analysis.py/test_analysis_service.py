@@ -9,6 +9,7 @@ from intric.ai_models.completion_models.completion_model import (
 )
 from intric.ai_models.model_enums import ModelFamily, ModelHostingLocation, ModelStability
 from intric.analysis.analysis import AnalysisProcessingMode
+from intric.analysis.analysis_repo import QuestionTextRow
 from intric.analysis.analysis_service import (
     ASYNC_AUTO_QUESTION_THRESHOLD,
     NO_QUESTIONS_ANSWER,
@@ -530,11 +531,41 @@ async def test_adaptive_budget_direct_path(service: AnalysisService):
     mock_assistant.get_response.assert_awaited_once()
 
 
+def _question_rows(count: int, day: int = 1):
+    return [
+        QuestionTextRow(
+            question=f"Question {i}",
+            created_at=datetime(2026, 1, day, 12, tzinfo=timezone.utc),
+            session_id=uuid4(),
+        )
+        for i in range(count)
+    ]
+
+
+def _summarizing_model():
+    model = AsyncMock()
+    model.completion_model = _make_completion_model()
+    model.prompts = []
+
+    async def mock_get_response(
+        *, question, completion_service, prompt, stream, priority=None
+    ):
+        model.prompts.append(prompt)
+        result = MagicMock()
+        result.completion.text = f"Summary {len(model.prompts)}"
+        return result
+
+    model.get_response = mock_get_response
+    return model
+
+
 async def test_chunk_partial_failure(service: AnalysisService):
     """When one chunk fails, other chunks' summaries are still returned."""
     call_count = 0
 
-    async def mock_get_response(*, question, completion_service, prompt, stream):
+    async def mock_get_response(
+        *, question, completion_service, prompt, stream, priority=None
+    ):
         nonlocal call_count
         call_count += 1
         if call_count == 1:
@@ -544,12 +575,74 @@ async def test_chunk_partial_failure(service: AnalysisService):
         return result
 
     mock_model = AsyncMock()
+    mock_model.completion_model = _make_completion_model()
     mock_model.get_response = mock_get_response
+    service.repo.get_chunk_summaries.return_value = {}
+
+    summaries, summarized_count = await service._summarize_question_chunks(
+        model=mock_model, rows=_question_rows(200), assistant_id=uuid4()
+    )
+
+    assert summarized_count == 3
+    assert len(summaries) == 2
+    assert all("Summary" in summary for _, summary in summaries)
+    stored = service.repo.add_chunk_summaries.await_args.kwargs["summaries"]
+    assert len(stored) == 2
+
+
+async def test_chunks_are_split_per_day(service: AnalysisService):
+    rows = _question_rows(3, day=2) + _question_rows(3, day=1)
 
-    questions = [f"Question {i}" for i in range(200)]
-    summaries = await service._summarize_question_chunks(
-        model=mock_model, questions=questions, days=30
+    chunks = service._build_daily_chunks(rows)
+
+    assert [day for day, _ in chunks] == [date(2026, 1, 1), date(2026, 1, 2)]
+
+
+async def test_cached_chunk_summaries_are_reused(service: AnalysisService):
+    """Only days without a cached summary are sent to the model."""
+    model = _summarizing_model()
+    assistant_id = uuid4()
+    rows = _question_rows(5, day=1) + _question_rows(5, day=2)
+    cached_key = service._chunk_cache_key(
+        scope_id=assistant_id,
+        completion_model_id=model.completion_model.id,
+        day=date(2026, 1, 1),
+        chunk=service._build_daily_chunks(rows)[0][1],
+    )
+    service.repo.get_chunk_summaries.return_value = {cached_key: "Cached summary"}
+
+    summaries, summarized_count = await service._summarize_question_chunks(
+        model=model, rows=rows, assistant_id=assistant_id
+    )
+
+    assert summarized_count == 1
+    assert summaries == [
+        (date(2026, 1, 1), "Cached summary"),
+        (date(2026, 1, 2), "Summary 1"),
+    ]
+    assert "2026-01-02" in model.prompts[0]
+    service.repo.add_chunk_summaries.assert_awaited_once()
+    stored = service.repo.add_chunk_summaries.await_args.kwargs
+    assert stored["assistant_id"] == assistant_id
+    assert [row.day for row in stored["summaries"]] == [date(2026, 1, 2)]
+
+
+def test_chunk_cache_key_depends_on_scope_model_and_content():
+    day = date(2026, 1, 1)
+    scope_id, model_id = uuid4(), uuid4()
+    key = AnalysisService._chunk_cache_key(
+        scope_id=scope_id, completion_model_id=model_id, day=day, chunk=["a", "b"]
     )
 
-    assert len(summaries) >= 1
-    assert all("Summary" in s for s in summaries)
+    assert key == AnalysisService._chunk_cache_key(
+        scope_id=scope_id, completion_model_id=model_id, day=day, chunk=["a", "b"]
+    )
+    assert key != AnalysisService._chunk_cache_key(
+        scope_id=uuid4(), completion_model_id=model_id, day=day, chunk=["a", "b"]
+    )
+    assert key != AnalysisService._chunk_cache_key(
+        scope_id=scope_id, completion_model_id=uuid4(), day=day, chunk=["a", "b"]
+    )
+    assert key != AnalysisService._chunk_cache_key(
+        scope_id=scope_id, completion_model_id=model_id, day=day, chunk=["a b"]
+    )
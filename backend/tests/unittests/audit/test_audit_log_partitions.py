@@ -0,0 +1,122 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from intric.audit.infrastructure.audit_log_partitions import (
+    AuditLogPartition,
+    AuditLogPartitionManager,
+)
+
+NOW = datetime(2026, 3, 15, tzinfo=timezone.utc)
+
+
+def _partitions_result(*names):
+    return SimpleNamespace(scalars=lambda: iter(names))
+
+
+def _statements(session) -> list[str]:
+    return [str(call.args[0]) for call in session.execute.await_args_list[1:]]
+
+
+@pytest.fixture
+def session():
+    return AsyncMock()
+
+
+def test_partition_bounds_span_one_month():
+    partition = AuditLogPartition(month=date(2025, 12, 1))
+
+    assert partition.name == "audit_logs_y2025m12"
+    assert partition.start == datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert partition.end == datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_partition_from_name_ignores_other_tables():
+    assert AuditLogPartition.from_name("audit_logs_y2026m02") == AuditLogPartition(
+        month=date(2026, 2, 1)
+    )
+    assert AuditLogPartition.from_name("audit_logs_default") is None
+
+
+async def test_ensure_partitions_creates_missing_months(session):
+    session.execute.side_effect = [
+        _partitions_result("audit_logs_y2026m03", "audit_logs_y2026m04"),
+        None,
+        None,
+    ]
+    session.scalar.return_value = False
+
+    created = await AuditLogPartitionManager(session).ensure_partitions(
+        months_ahead=3, today=NOW.date()
+    )
+
+    assert created == ["audit_logs_y2026m05", "audit_logs_y2026m06"]
+    statements = _statements(session)
+    assert "PARTITION OF audit_logs" in statements[0]
+    assert (
+        "FROM ('2026-05-01T00:00:00+00:00') TO ('2026-06-01T00:00:00+00:00')"
+        in (statements[0])
+    )
+
+
+async def test_ensure_partitions_moves_rows_out_of_the_default_partition(session):
+    session.execute.side_effect = [
+        _partitions_result("audit_logs_y2026m03"),
+        None,
+        None,
+        None,
+    ]
+    session.scalar.return_value = True
+
+    created = await AuditLogPartitionManager(session).ensure_partitions(
+        months_ahead=1, today=NOW.date()
+    )
+
+    assert created == ["audit_logs_y2026m04"]
+    create, move, attach = _statements(session)
+    assert create.startswith("CREATE TABLE audit_logs_y2026m04 (LIKE audit_logs")
+    assert "DELETE FROM audit_logs_default" in move
+    assert "INSERT INTO audit_logs_y2026m04 SELECT * FROM moved" in move
+    assert attach == (
+        "ALTER TABLE audit_logs ATTACH PARTITION audit_logs_y2026m04 "
+        "FOR VALUES FROM ('2026-04-01T00:00:00+00:00') "
+        "TO ('2026-05-01T00:00:00+00:00')"
+    )
+
+
+async def test_drop_expired_partitions_respects_longest_tenant_retention(session):
+    session.execute.return_value = None
+    session.execute.side_effect = [
+        _partitions_result(
+            "audit_logs_y2026m03",
+            "audit_logs_y2025m01",
+            "audit_logs_y2025m06",
+            "audit_logs_y2024m11",
+        ),
+    ] + [None] * 4
+    # Longest retention per partition, oldest first: 2024-11 has logs of a
+    # tenant keeping them for 365 days, 2025-01 is empty and 2025-06 has a
+    # tenant keeping them for 2 years
+    session.scalar.side_effect = [365, None, 730]
+
+    dropped = await AuditLogPartitionManager(session).drop_expired_partitions(now=NOW)
+
+    assert dropped == ["audit_logs_y2024m11", "audit_logs_y2025m01"]
+    statements = _statements(session)
+    assert statements == [
+        "ALTER TABLE audit_logs DETACH PARTITION audit_logs_y2024m11",
+        "DROP TABLE audit_logs_y2024m11",
+        "ALTER TABLE audit_logs DETACH PARTITION audit_logs_y2025m01",
+        "DROP TABLE audit_logs_y2025m01",
+    ]
+
+
+async def test_drop_expired_partitions_keeps_current_month(session):
+    session.execute.side_effect = [_partitions_result("audit_logs_y2026m03")]
+
+    dropped = await AuditLogPartitionManager(session).drop_expired_partitions(now=NOW)
+
+    assert dropped == []
+    session.scalar.assert_not_awaited()
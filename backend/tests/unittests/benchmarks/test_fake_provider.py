@@ -0,0 +1,101 @@
+import base64
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+from benchmarks.fake_provider import FakeProviderConfig, create_app, fake_embedding
+from benchmarks.results import compare
+from benchmarks.stats import summarize
+
+
+@pytest.fixture
+def client():
+    config = FakeProviderConfig(
+        latency_seconds=0,
+        tokens_per_second=10_000,
+        completion_tokens=5,
+        dimensions=8,
+        embedding_latency_seconds=0,
+        transcription_latency_seconds=0,
+    )
+    transport = httpx.ASGITransport(app=create_app(config))
+    return httpx.AsyncClient(transport=transport, base_url="http://fake")
+
+
+async def test_embeddings_are_deterministic_unit_vectors(client):
+    response = await client.post(
+        "/v1/embeddings", json={"model": "bench-embed", "input": ["a", "b", "a"]}
+    )
+
+    first, second, third = (item["embedding"] for item in response.json()["data"])
+    assert len(first) == 8
+    assert first == third != second
+    assert np.linalg.norm(first) == pytest.approx(1)
+
+
+async def test_embeddings_in_base64(client):
+    response = await client.post(
+        "/v1/embeddings",
+        json={"input": "a", "encoding_format": "base64", "dimensions": 4},
+    )
+
+    encoded = response.json()["data"][0]["embedding"]
+    decoded = np.frombuffer(base64.b64decode(encoded), dtype="<f4")
+    np.testing.assert_allclose(decoded, fake_embedding("a", 4), rtol=1e-6)
+
+
+async def test_streaming_completion_ends_with_usage_and_done(client):
+    response = await client.post(
+        "/v1/chat/completions",
+        json={
+            "model": "bench-chat",
+            "stream": True,
+            "messages": [{"role": "user", "content": "hi"}],
+        },
+    )
+
+    events = [
+        line.removeprefix("data: ") for line in response.text.splitlines() if line
+    ]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    assert len(chunks) == 6
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    assert chunks[-1]["usage"]["completion_tokens"] == 5
+
+
+async def test_transcription(client):
+    response = await client.post(
+        "/v1/audio/transcriptions",
+        files={"file": ("audio.mp3", b"x" * 10, "audio/mpeg")},
+        data={"model": "whisper"},
+    )
+
+    assert response.json()["text"].startswith("Transcript of 10 bytes")
+
+
+def test_summarize_interpolates_percentiles():
+    summary = summarize([4.0, 1.0, 3.0, 2.0])
+
+    assert summary["p50"] == 2.5
+    assert summary["max"] == 4.0
+    assert summarize([]) == {"count": 0}
+
+
+def test_compare_reports_relative_change_of_nested_metrics():
+    baseline = {"scenarios": {"ask": {"10k": {"requests_per_second": 10.0}}}}
+    current = {
+        "scenarios": {
+            "ask": {"10k": {"requests_per_second": 12.0}},
+            "audit": {"errors": 0},
+        }
+    }
+
+    rows = compare(baseline, current)
+
+    assert rows == [
+        ("ask.10k.requests_per_second", 10.0, 12.0, pytest.approx(0.2)),
+        ("audit.errors", None, 0, None),
+    ]
@@ -0,0 +1,274 @@
+import asyncio
+import gc
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from intric.completion_models.infrastructure.admission import (
+    AdmissionLimits,
+    CompletionAdmission,
+    CompletionPriority,
+)
+from intric.completion_models.infrastructure.completion_service import (
+    CompletionService,
+)
+from intric.main.exceptions import CompletionCapacityException
+from intric.worker.redis.lua_scripts import LuaScripts
+
+
+class FakeRedis:
+    """Runs the completion budget scripts against a dict."""
+
+    def __init__(self):
+        self.store: dict[str, int] = {}
+        # Ticket sets: ticket id by expiry
+        self.tickets: dict[str, dict[str, float]] = {}
+        self.calls = 0
+
+    async def eval(self, script: str, num_keys: int, *args):
+        self.calls += 1
+        keys = args[:num_keys]
+
+        if script == LuaScripts.RELEASE_COMPLETION_BUDGET:
+            for key in keys:
+                self.tickets.get(key, {}).pop(args[num_keys], None)
+            return 1
+
+        argv = [float(arg) for arg in args[num_keys:-1]]
+        ticket_id = args[-1]
+        tenant_active, provider_active, tenant_tokens, provider_tokens = keys
+        tenant_limit, provider_limit, tenant_budget, provider_budget, tokens = argv[:5]
+        ttl, now = argv[5], argv[7]
+        for key in (tenant_active, provider_active):
+            tickets = self.tickets.setdefault(key, {})
+            for expired in [id for id, expiry in tickets.items() if expiry <= now]:
+                del tickets[expired]
+        if tenant_limit > 0 and len(self.tickets[tenant_active]) >= tenant_limit:
+            return 1
+        if provider_limit > 0 and len(self.tickets[provider_active]) >= provider_limit:
+            return 2
+        used = self.store.get(tenant_tokens, 0)
+        if tenant_budget > 0 and used > 0 and used + tokens > tenant_budget:
+            return 3
+        used = self.store.get(provider_tokens, 0)
+        if provider_budget > 0 and used > 0 and used + tokens > provider_budget:
+            return 4
+        for key in (tenant_active, provider_active):
+            self.tickets[key][ticket_id] = now + ttl
+        for key in (tenant_tokens, provider_tokens):
+            self.store[key] = self.store.get(key, 0) + tokens
+        return 0
+
+
+class BrokenRedis:
+    async def eval(self, *args):
+        raise ConnectionError("redis is down")
+
+
+PROVIDER = uuid4()
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def admission(redis):
+    return CompletionAdmission(redis, poll_interval_seconds=0.01)
+
+
+def _acquire(
+    admission: CompletionAdmission,
+    tenant_id,
+    limits: AdmissionLimits,
+    *,
+    tokens: int = 100,
+    priority: CompletionPriority = CompletionPriority.INTERACTIVE,
+    timeout_seconds: float = 5,
+):
+    return admission.acquire(
+        tenant_id=tenant_id,
+        provider_id=PROVIDER,
+        tokens=tokens,
+        limits=limits,
+        priority=priority,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+async def test_no_limits_skips_redis(admission: CompletionAdmission, redis):
+    ticket = await _acquire(admission, uuid4(), AdmissionLimits())
+
+    assert ticket.budgeted is False
+    assert redis.calls == 0
+
+
+async def test_waits_for_the_tenants_slot(admission: CompletionAdmission):
+    tenant_id = uuid4()
+    limits = AdmissionLimits(tenant_concurrency=1)
+    first = await _acquire(admission, tenant_id, limits)
+
+    second = asyncio.create_task(_acquire(admission, tenant_id, limits))
+    await asyncio.sleep(0.05)
+    assert not second.done()
+
+    await admission.release(first)
+
+    assert (await asyncio.wait_for(second, 1)).budgeted is True
+
+
+async def test_slots_that_are_never_given_back_expire(redis):
+    admission = CompletionAdmission(redis, slot_ttl_seconds=0)
+    tenant_id = uuid4()
+    limits = AdmissionLimits(tenant_concurrency=1)
+
+    # Leaked: never released
+    await _acquire(admission, tenant_id, limits)
+
+    ticket = await _acquire(admission, tenant_id, limits, timeout_seconds=0.05)
+    assert ticket.budgeted is True
+
+
+async def test_releasing_twice_gives_back_one_slot(admission: CompletionAdmission):
+    tenant_id = uuid4()
+    limits = AdmissionLimits(tenant_concurrency=2)
+    first = await _acquire(admission, tenant_id, limits)
+    await _acquire(admission, tenant_id, limits)
+
+    await admission.release(first)
+    await admission.release(first)
+
+    await _acquire(admission, tenant_id, limits, timeout_seconds=0.05)
+    with pytest.raises(CompletionCapacityException):
+        await _acquire(admission, tenant_id, limits, timeout_seconds=0.05)
+
+
+async def test_tenants_take_turns(admission: CompletionAdmission):
+    busy, other = uuid4(), uuid4()
+    limits = AdmissionLimits(provider_concurrency=1)
+    running = await _acquire(admission, busy, limits)
+
+    admitted = []
+
+    async def _request(tenant_id):
+        ticket = await _acquire(admission, tenant_id, limits)
+        admitted.append(tenant_id)
+        await asyncio.sleep(0.02)
+        await admission.release(ticket)
+
+    requests = [asyncio.create_task(_request(busy)) for _ in range(3)]
+    await asyncio.sleep(0.02)
+    requests.append(asyncio.create_task(_request(other)))
+    await asyncio.sleep(0.02)
+
+    await admission.release(running)
+    await asyncio.wait_for(asyncio.gather(*requests), 2)
+
+    # The other tenant queued last but had nothing admitted yet
+    assert admitted.index(other) <= 1
+
+
+async def test_interactive_goes_before_background(admission: CompletionAdmission):
+    limits = AdmissionLimits(provider_concurrency=1, background_share=1)
+    running = await _acquire(admission, uuid4(), limits)
+
+    admitted = []
+
+    async def _request(priority):
+        ticket = await _acquire(admission, uuid4(), limits, priority=priority)
+        admitted.append(priority)
+        await admission.release(ticket)
+
+    background = asyncio.create_task(_request(CompletionPriority.BACKGROUND))
+    await asyncio.sleep(0.02)
+    interactive = asyncio.create_task(_request(CompletionPriority.INTERACTIVE))
+    await asyncio.sleep(0.02)
+
+    await admission.release(running)
+    await asyncio.wait_for(asyncio.gather(background, interactive), 2)
+
+    assert admitted == [CompletionPriority.INTERACTIVE, CompletionPriority.BACKGROUND]
+
+
+async def test_background_gets_a_share_of_the_provider(admission: CompletionAdmission):
+    limits = AdmissionLimits(provider_concurrency=4, background_share=0.5)
+    for _ in range(2):
+        await _acquire(
+            admission, uuid4(), limits, priority=CompletionPriority.BACKGROUND
+        )
+
+    with pytest.raises(CompletionCapacityException):
+        await _acquire(
+            admission,
+            uuid4(),
+            limits,
+            priority=CompletionPriority.BACKGROUND,
+            timeout_seconds=0.05,
+        )
+
+    ticket = await _acquire(admission, uuid4(), limits, timeout_seconds=0.05)
+    assert ticket.budgeted is True
+
+
+async def test_token_budget_per_minute(admission: CompletionAdmission):
+    tenant_id = uuid4()
+    limits = AdmissionLimits(tenant_tokens_per_minute=1000)
+    await admission.release(await _acquire(admission, tenant_id, limits, tokens=800))
+
+    with pytest.raises(CompletionCapacityException):
+        await _acquire(admission, tenant_id, limits, tokens=300, timeout_seconds=0.05)
+
+    # Other tenants have their own budget
+    await _acquire(admission, uuid4(), limits, tokens=300, timeout_seconds=0.05)
+
+
+async def test_admits_without_budgets_when_redis_is_down():
+    admission = CompletionAdmission(BrokenRedis())
+
+    ticket = await _acquire(admission, uuid4(), AdmissionLimits(tenant_concurrency=1))
+
+    assert ticket.budgeted is False
+    await admission.release(ticket)
+
+
+@pytest.mark.parametrize("iterated", [False, True])
+async def test_discarded_stream_gives_back_its_slot(iterated):
+    admission = MagicMock(release=AsyncMock())
+    service = CompletionService(context_builder=MagicMock(), admission=admission)
+    ticket = object()
+    started = [False]
+
+    async def stream():
+        started[0] = True
+        try:
+            yield "chunk"
+        finally:
+            await service._release(ticket)
+
+    generator = stream()
+    service._cleanup_if_discarded(generator, started, ticket, None)
+    if iterated:
+        async for _ in generator:
+            pass
+    del generator
+    gc.collect()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    admission.release.assert_awaited_once_with(ticket)
+
+
+def test_provider_config_overrides_the_settings(test_settings):
+    settings = test_settings.model_copy(
+        update={
+            "completion_provider_concurrency_limit": 10,
+            "completion_tenant_concurrency_limit": 2,
+        }
+    )
+
+    limits = AdmissionLimits.from_settings(settings, {"max_concurrent_completions": 3})
+
+    assert limits.provider_concurrency == 3
+    assert limits.tenant_concurrency == 2
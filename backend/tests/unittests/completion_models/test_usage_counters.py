@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from intric.completion_models.infrastructure.usage_counters import (
+    APPS,
+    ASSISTANTS,
+    SPACES,
+    CompletionModelUsageCounters,
+)
+from intric.events import ModelUsageChanged
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _params(statement) -> dict:
+    return statement.compile(dialect=postgresql.dialect()).params
+
+
+@pytest.fixture
+def session():
+    return AsyncMock()
+
+
+async def test_apply_switch_moves_one_usage_between_models(session):
+    old_model, new_model = uuid4(), uuid4()
+
+    await CompletionModelUsageCounters(session).apply(
+        ModelUsageChanged(
+            counter=ASSISTANTS, old_model_id=old_model, new_model_id=new_model
+        )
+    )
+
+    statements = [call.args[0] for call in session.execute.await_args_list]
+    assert len(statements) == 2
+    deltas = {}
+    for statement in statements:
+        params = _params(statement)
+        model_id = params["model_id_1"]
+        assert "assistants_count" in _sql(statement)
+        assert "total_usage" in _sql(statement)
+        deltas[model_id] = params["assistants_count_1"]
+
+    assert deltas == {old_model: -1, new_model: 1}
+
+
+async def test_apply_skips_unchanged_and_unset_models(session):
+    model = uuid4()
+
+    await CompletionModelUsageCounters(session).apply(
+        ModelUsageChanged(counter=APPS, old_model_id=model, new_model_id=model),
+        ModelUsageChanged(counter=APPS),
+    )
+
+    session.execute.assert_not_awaited()
+
+
+async def test_apply_nets_out_changes_for_the_same_model(session):
+    model = uuid4()
+
+    # A space update removes and re-adds all of its model links
+    await CompletionModelUsageCounters(session).apply(
+        ModelUsageChanged(counter=SPACES, old_model_id=model),
+        ModelUsageChanged(counter=SPACES, new_model_id=model),
+    )
+
+    session.execute.assert_not_awaited()
+
+
+async def test_apply_leaves_total_usage_for_non_configuration_counters(session):
+    await CompletionModelUsageCounters(session).apply(
+        ModelUsageChanged(counter=SPACES, new_model_id=uuid4())
+    )
+
+    statement = session.execute.await_args.args[0]
+    assert "spaces_count" in _sql(statement)
+    assert "total_usage" not in _sql(statement)
+
+
+async def test_apply_groups_counters_per_model(session):
+    model = uuid4()
+
+    await CompletionModelUsageCounters(session).apply(
+        ModelUsageChanged(counter=ASSISTANTS, new_model_id=model),
+        ModelUsageChanged(counter=ASSISTANTS, new_model_id=model),
+        ModelUsageChanged(counter=APPS, old_model_id=model),
+    )
+
+    session.execute.assert_awaited_once()
+    statement = session.execute.await_args.args[0]
+    params = _params(statement)
+    assert params["assistants_count_1"] == 2
+    assert params["apps_count_1"] == -1
+    # Both are configuration counters, so the total goes up by one
+    assert params["total_usage_1"] == 1
+
+
+def _result(rows):
+    return SimpleNamespace(all=lambda: rows)
+
+
+async def test_find_drifted_tenants_compares_checksums(session):
+    in_sync, drifted, uncounted, stale = uuid4(), uuid4(), uuid4(), uuid4()
+    model_a, model_b, model_c, model_d = uuid4(), uuid4(), uuid4(), uuid4()
+
+    source_rows = [
+        (in_sync, model_a, ASSISTANTS, 3),
+        (in_sync, model_a, SPACES, 1),
+        (drifted, model_b, APPS, 2),
+        (uncounted, model_c, ASSISTANTS, 1),
+    ]
+    # Stored rows carry every counter column, in EVENT_COUNTERS order
+    stored_rows = [
+        (in_sync, model_a, 3, 0, 0, 0, 0, 1),
+        (drifted, model_b, 0, 1, 0, 0, 0, 0),
+        (stale, model_d, 1, 0, 0, 0, 0, 0),
+    ]
+    session.execute.side_effect = [_result(source_rows), _result(stored_rows)]
+
+    tenants = await CompletionModelUsageCounters(session).find_drifted_tenants()
+
+    assert set(tenants) == {drifted, uncounted, stale}
+
+
+async def test_find_drifted_tenants_treats_zero_rows_as_missing(session):
+    tenant, model = uuid4(), uuid4()
+    session.execute.side_effect = [
+        _result([]),
+        _result([(tenant, model, 0, 0, 0, 0, 0, 0)]),
+    ]
+
+    assert await CompletionModelUsageCounters(session).find_drifted_tenants() == []
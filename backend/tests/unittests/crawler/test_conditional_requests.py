@@ -0,0 +1,265 @@
+"""Unit tests for conditional recrawls (ETag / Last-Modified validators)."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from scrapy import Request
+from scrapy.http import HtmlResponse, Response
+
+from intric.crawler.conditional import (
+    SKIP_CONDITIONAL_META_KEY,
+    ConditionalCrawlState,
+    ConditionalRequestMiddleware,
+    SitemapLastmodFilter,
+    UrlValidator,
+)
+from intric.crawler.parse_html import parse_file, spool_response
+from intric.crawler.spiders.crawl_spider import CrawlSpider
+from intric.crawler.spiders.sitemap_spider import SitemapSpider
+
+PAGE_URL = "https://example.com/page"
+
+
+def _state_with_validator(**kwargs) -> ConditionalCrawlState:
+    validator = UrlValidator(
+        url=PAGE_URL,
+        title=PAGE_URL,
+        etag=kwargs.get("etag", '"abc"'),
+        last_modified=kwargs.get("last_modified", "Wed, 21 Oct 2015 07:28:00 GMT"),
+        links=kwargs.get("links"),
+    )
+    return ConditionalCrawlState(validators={PAGE_URL: validator})
+
+
+class TestConditionalRequestMiddleware:
+    def test_adds_validator_headers(self):
+        spider = SimpleNamespace(conditional_state=_state_with_validator())
+        request = Request(PAGE_URL)
+
+        ConditionalRequestMiddleware().process_request(request, spider)
+
+        assert request.headers[b"If-None-Match"] == b'"abc"'
+        assert request.headers[b"If-Modified-Since"] == b"Wed, 21 Oct 2015 07:28:00 GMT"
+
+    def test_skips_urls_without_validators(self):
+        spider = SimpleNamespace(conditional_state=_state_with_validator())
+        request = Request("https://example.com/other")
+
+        ConditionalRequestMiddleware().process_request(request, spider)
+
+        assert b"If-None-Match" not in request.headers
+        assert b"If-Modified-Since" not in request.headers
+
+    def test_skips_requests_flagged_for_full_download(self):
+        spider = SimpleNamespace(conditional_state=_state_with_validator())
+        request = Request(PAGE_URL, meta={SKIP_CONDITIONAL_META_KEY: True})
+
+        ConditionalRequestMiddleware().process_request(request, spider)
+
+        assert b"If-None-Match" not in request.headers
+
+    def test_noop_without_conditional_state(self):
+        spider = SimpleNamespace()
+        request = Request(PAGE_URL)
+        response = Response(PAGE_URL, status=304)
+
+        middleware = ConditionalRequestMiddleware()
+        middleware.process_request(request, spider)
+
+        assert b"If-None-Match" not in request.headers
+        assert middleware.process_response(request, response, spider) is response
+
+    def test_records_304_as_unchanged(self):
+        state = _state_with_validator()
+        spider = SimpleNamespace(conditional_state=state)
+        request = Request(PAGE_URL)
+
+        ConditionalRequestMiddleware().process_response(
+            request, Response(PAGE_URL, status=304), spider
+        )
+
+        assert state.unchanged_urls == {PAGE_URL}
+        assert state.unchanged_titles() == {PAGE_URL}
+
+    def test_ignores_unsolicited_304(self):
+        state = ConditionalCrawlState()
+        spider = SimpleNamespace(conditional_state=state)
+        request = Request(PAGE_URL)
+
+        ConditionalRequestMiddleware().process_response(
+            request, Response(PAGE_URL, status=304), spider
+        )
+
+        assert state.unchanged_urls == set()
+
+    def test_records_fresh_validators_from_200(self):
+        state = ConditionalCrawlState()
+        spider = SimpleNamespace(conditional_state=state)
+        response = Response(
+            PAGE_URL,
+            status=200,
+            headers={"ETag": '"v2"', "Last-Modified": "Thu, 22 Oct 2015 07:28:00 GMT"},
+        )
+
+        ConditionalRequestMiddleware().process_response(
+            Request(PAGE_URL), response, spider
+        )
+
+        assert state.response_validators[PAGE_URL] == (
+            '"v2"',
+            "Thu, 22 Oct 2015 07:28:00 GMT",
+        )
+
+
+class TestConditionalCrawlState:
+    def test_build_validator_includes_links(self):
+        state = ConditionalCrawlState()
+        state.response_validators[PAGE_URL] = ('"v2"', None)
+        state.page_links[PAGE_URL] = [(0, "https://example.com/child")]
+
+        validator = state.build_validator(PAGE_URL, PAGE_URL)
+
+        assert validator.etag == '"v2"'
+        assert validator.last_modified is None
+        assert validator.links == ((0, "https://example.com/child"),)
+
+    def test_build_validator_without_headers_returns_none(self):
+        state = ConditionalCrawlState()
+        state.page_links[PAGE_URL] = [(0, "https://example.com/child")]
+
+        assert state.build_validator(PAGE_URL, PAGE_URL) is None
+
+
+class TestNotModifiedParsing:
+    def test_spool_response_skips_304(self):
+        response = HtmlResponse(PAGE_URL, status=304, body=b"", encoding="utf-8")
+        assert spool_response(response) is None
+
+    def test_parse_file_skips_304(self):
+        response = Response(
+            "https://example.com/doc.pdf",
+            status=304,
+            headers={"Content-Type": "application/pdf"},
+        )
+        assert parse_file(response) is None
+
+
+class TestCrawlSpiderLinkReplay:
+    def test_replays_stored_links_on_304(self):
+        state = _state_with_validator(
+            links=(
+                (0, "https://example.com/page/child"),
+                (1, "https://example.com/doc.pdf"),
+            )
+        )
+        spider = CrawlSpider(url="https://example.com/", conditional_state=state)
+
+        requests = list(spider._requests_to_follow(Response(PAGE_URL, status=304)))
+
+        assert [(r.meta["rule"], r.url) for r in requests] == [
+            (0, "https://example.com/page/child"),
+            (1, "https://example.com/doc.pdf"),
+        ]
+
+    def test_records_followed_links_on_200(self):
+        state = ConditionalCrawlState()
+        spider = CrawlSpider(url="https://example.com/", conditional_state=state)
+        response = HtmlResponse(
+            PAGE_URL,
+            body=b'<html><body><a href="/child">Child</a></body></html>',
+            encoding="utf-8",
+        )
+
+        requests = list(spider._requests_to_follow(response))
+
+        assert [r.url for r in requests] == ["https://example.com/child"]
+        assert state.page_links[PAGE_URL] == [(0, "https://example.com/child")]
+
+
+LAST_CRAWL = datetime(2026, 2, 10, 12, 0, tzinfo=timezone.utc)
+
+
+def _lastmod_filter() -> SitemapLastmodFilter:
+    return SitemapLastmodFilter(
+        modified_since=LAST_CRAWL, indexed_urls=frozenset({PAGE_URL})
+    )
+
+
+class TestSitemapLastmodFilter:
+    def test_skips_indexed_url_with_older_lastmod(self):
+        lastmod_filter = _lastmod_filter()
+
+        assert not lastmod_filter.should_fetch(
+            {"loc": PAGE_URL, "lastmod": "2026-02-01T08:00:00+00:00"}
+        )
+        assert lastmod_filter.skipped_urls == {PAGE_URL}
+
+    def test_fetches_indexed_url_with_newer_lastmod(self):
+        lastmod_filter = _lastmod_filter()
+
+        assert lastmod_filter.should_fetch(
+            {"loc": PAGE_URL, "lastmod": "2026-02-10T12:30:00Z"}
+        )
+        assert lastmod_filter.skipped_urls == set()
+
+    def test_compares_lastmod_across_timezones(self):
+        lastmod_filter = _lastmod_filter()
+
+        # 13:30 at +02:00 is 11:30 UTC, before the last crawl
+        assert not lastmod_filter.should_fetch(
+            {"loc": PAGE_URL, "lastmod": "2026-02-10T13:30:00+02:00"}
+        )
+
+    def test_fetches_urls_not_yet_indexed(self):
+        lastmod_filter = _lastmod_filter()
+
+        assert lastmod_filter.should_fetch(
+            {"loc": "https://example.com/new", "lastmod": "2020-01-01"}
+        )
+        assert lastmod_filter.skipped_urls == set()
+
+    def test_fetches_when_lastmod_missing_or_malformed(self):
+        lastmod_filter = _lastmod_filter()
+
+        assert lastmod_filter.should_fetch({"loc": PAGE_URL})
+        assert lastmod_filter.should_fetch({"loc": PAGE_URL, "lastmod": "yesterday"})
+
+    def test_date_only_lastmod_on_crawl_day_is_fetched(self):
+        lastmod_filter = _lastmod_filter()
+
+        assert lastmod_filter.should_fetch({"loc": PAGE_URL, "lastmod": "2026-02-10"})
+        assert not lastmod_filter.should_fetch(
+            {"loc": PAGE_URL, "lastmod": "2026-02-09"}
+        )
+
+
+class TestSitemapSpiderFilter:
+    def test_filters_urlset_entries_only(self):
+        lastmod_filter = _lastmod_filter()
+        spider = SitemapSpider(
+            sitemap_url="https://example.com/sitemap.xml",
+            lastmod_filter=lastmod_filter,
+        )
+        old = {"loc": PAGE_URL, "lastmod": "2026-01-01"}
+        new = {"loc": "https://example.com/new", "lastmod": "2026-01-01"}
+
+        urlset_entries = _Entries("urlset", [old, new])
+        index_entries = _Entries("sitemapindex", [old])
+
+        assert list(spider.sitemap_filter(urlset_entries)) == [new]
+        assert list(spider.sitemap_filter(index_entries)) == [old]
+        assert lastmod_filter.skipped_urls == {PAGE_URL}
+
+    def test_no_filter_passes_everything(self):
+        spider = SitemapSpider(sitemap_url="https://example.com/sitemap.xml")
+        entries = _Entries("urlset", [{"loc": PAGE_URL, "lastmod": "2000-01-01"}])
+
+        assert len(list(spider.sitemap_filter(entries))) == 1
+
+
+class _Entries(list):
+    """Stand-in for scrapy's Sitemap: iterable entries with a .type."""
+
+    def __init__(self, type_: str, entries: list[dict]):
+        super().__init__(entries)
+        self.type = type_
@@ -0,0 +1,158 @@
+"""Unit tests for boilerplate stripping and near-duplicate page detection."""
+
+from scrapy.http import HtmlResponse
+
+from intric.crawler.near_duplicates import (
+    NearDuplicateFilter,
+    simhash,
+    simhash_from_bytes,
+    simhash_to_bytes,
+)
+from intric.crawler.parse_html import CrawledPage, parse_page, spool_response
+
+ARTICLE_TEXT = " ".join(
+    f"Paragraph {i} explains how the municipality handles building permits."
+    for i in range(20)
+)
+
+
+def _html_response(body: str, url: str = "https://example.com/page") -> HtmlResponse:
+    return HtmlResponse(url, body=body.encode("utf-8"), encoding="utf-8")
+
+
+def _page(url: str, content: str) -> CrawledPage:
+    return CrawledPage(url=url, title=url, content=content)
+
+
+class TestBoilerplateStripping:
+    def test_keeps_main_content_and_drops_chrome(self):
+        response = _html_response(
+            f"""<html><head><title>Permits</title></head><body>
+            <header><a href="/">Home</a> Site header</header>
+            <nav><a href="/about">About us</a></nav>
+            <div id="cookie-banner">We use cookies</div>
+            <main><article><header><h1>Building permits</h1></header>
+            <p>{ARTICLE_TEXT}</p></article></main>
+            <footer>Copyright footer</footer>
+            </body></html>"""
+        )
+
+        page = parse_page(spool_response(response))
+
+        assert "Building permits" in page.content
+        assert "Paragraph 19" in page.content
+        for boilerplate in ("Site header", "About us", "cookies", "Copyright"):
+            assert boilerplate not in page.content
+        assert page.title == "Permits"
+
+    def test_strips_chrome_without_main_element(self):
+        response = _html_response(
+            f"""<html><body>
+            <nav>Menu entry</nav>
+            <div class="content"><p>{ARTICLE_TEXT}</p></div>
+            <div class="cookie-consent">Accept all</div>
+            <footer>Footer text</footer>
+            </body></html>"""
+        )
+
+        page = parse_page(spool_response(response))
+
+        assert "Paragraph 0" in page.content
+        assert "Menu entry" not in page.content
+        assert "Accept all" not in page.content
+        assert "Footer text" not in page.content
+
+    def test_falls_back_to_full_page_when_only_chrome_has_text(self):
+        response = _html_response(
+            """<html><body>
+            <header><h1>Welcome</h1><p>Landing page text</p></header>
+            </body></html>"""
+        )
+
+        page = parse_page(spool_response(response))
+
+        assert "Welcome" in page.content
+        assert "Landing page text" in page.content
+
+
+class TestSimhash:
+    def test_short_text_has_no_fingerprint(self):
+        assert simhash("too short to fingerprint") is None
+
+    def test_similar_texts_have_close_fingerprints(self):
+        original = simhash(ARTICLE_TEXT)
+        variant = simhash(ARTICLE_TEXT + " Print version.")
+        different = simhash(
+            " ".join(
+                f"Entry {i} lists opening hours for the library." for i in range(20)
+            )
+        )
+
+        assert (original ^ variant).bit_count() <= 3
+        assert (original ^ different).bit_count() > 3
+
+
+class TestNearDuplicateFilter:
+    def test_drops_near_duplicates_and_keeps_first(self):
+        dedup = NearDuplicateFilter()
+        first = _page("https://example.com/page", ARTICLE_TEXT)
+        variant = _page("https://example.com/page?print=1", ARTICLE_TEXT + " Print.")
+
+        assert dedup.filter_page(first) is first
+        assert dedup.filter_page(variant) is None
+        assert dedup.duplicates == {
+            "https://example.com/page?print=1": "https://example.com/page"
+        }
+
+    def test_keeps_distinct_and_short_pages(self):
+        dedup = NearDuplicateFilter()
+        other_text = " ".join(
+            f"Entry {i} lists opening hours for the library." for i in range(20)
+        )
+
+        assert dedup.filter_page(_page("https://example.com/a", ARTICLE_TEXT))
+        assert dedup.filter_page(_page("https://example.com/b", other_text))
+        assert dedup.filter_page(_page("https://example.com/c", "Contact"))
+        assert dedup.filter_page(_page("https://example.com/d", "Contact"))
+        assert dedup.duplicates == {}
+
+    def test_keeps_most_canonical_url_regardless_of_order(self):
+        dedup = NearDuplicateFilter()
+        variant = _page("https://example.com/page?print=1", ARTICLE_TEXT + " Print.")
+        canonical = _page("https://example.com/page", ARTICLE_TEXT)
+
+        assert dedup.filter_page(variant) is variant
+        assert dedup.filter_page(canonical) is canonical
+        assert dedup.duplicates == {
+            "https://example.com/page?print=1": "https://example.com/page"
+        }
+        assert set(dedup.fingerprints) == {"https://example.com/page"}
+
+    def test_seeded_unchanged_page_catches_fetched_variant(self):
+        dedup = NearDuplicateFilter()
+        dedup.seed("https://example.com/page", simhash(ARTICLE_TEXT))
+        variant = _page("https://example.com/page?print=1", ARTICLE_TEXT + " Print.")
+
+        assert dedup.filter_page(variant) is None
+        assert dedup.duplicates == {
+            "https://example.com/page?print=1": "https://example.com/page"
+        }
+
+    def test_fetched_canonical_page_replaces_seeded_variant(self):
+        dedup = NearDuplicateFilter()
+        dedup.seed("https://example.com/page?print=1", simhash(ARTICLE_TEXT))
+        canonical = _page("https://example.com/page", ARTICLE_TEXT + " Print.")
+
+        assert dedup.filter_page(canonical) is canonical
+        assert dedup.duplicates == {
+            "https://example.com/page?print=1": "https://example.com/page"
+        }
+
+
+def test_simhash_bytes_round_trip():
+    fingerprint = simhash(ARTICLE_TEXT)
+
+    encoded = simhash_to_bytes(fingerprint)
+
+    assert len(encoded) == 8
+    assert simhash_from_bytes(encoded) == fingerprint
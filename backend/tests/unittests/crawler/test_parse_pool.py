@@ -0,0 +1,215 @@
+"""Unit tests for parsing spooled pages off the reactor thread."""
+
+import json
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from unittest.mock import MagicMock, patch
+
+import pytest
+from scrapy.http import HtmlResponse, Response, TextResponse
+
+from intric.crawler import parse_pool
+from intric.crawler.crawler import Crawler
+from intric.crawler.near_duplicates import NearDuplicateFilter
+from intric.crawler.parse_html import RawPage, spool_response
+from intric.crawler.parse_pool import parse_pages
+
+
+@pytest.fixture
+def thread_parsing():
+    """Parse in a thread (crawl_parse_workers=0) so no processes are spawned."""
+    settings = MagicMock()
+    settings.crawl_parse_workers = 0
+    with patch("intric.crawler.parse_pool.get_settings", return_value=settings):
+        yield
+
+
+def _parse_settings(workers: int):
+    settings = MagicMock()
+    settings.crawl_parse_workers = workers
+    return patch("intric.crawler.parse_pool.get_settings", return_value=settings)
+
+
+@pytest.fixture
+def process_parsing():
+    """Parse in a real one-process spawn pool, shut down afterwards."""
+    with _parse_settings(1):
+        yield
+        if parse_pool._PARSE_POOL is not None:
+            parse_pool._PARSE_POOL.shutdown(wait=True)
+            parse_pool._PARSE_POOL = None
+
+
+class _BrokenPool(Executor):
+    """Stand-in for a pool whose worker process died."""
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+def _raw_html(url: str, text: str) -> RawPage:
+    return RawPage(
+        url=url,
+        body=f"<html><head><title>{text}</title></head><body><p>{text}</p></body></html>",
+        content_type="text/html; charset=utf-8",
+    )
+
+
+async def _collect(raw_pages):
+    return [page async for page in parse_pages(raw_pages)]
+
+
+class TestSpoolResponse:
+    def test_spools_html_without_parsing(self):
+        response = HtmlResponse(
+            "https://example.com/",
+            body=b"<html><body><a href='/a'>A</a></body></html>",
+            encoding="utf-8",
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
+
+        raw_page = spool_response(response)
+
+        assert raw_page == RawPage(
+            url="https://example.com/",
+            body="<html><body><a href='/a'>A</a></body></html>",
+            content_type="text/html; charset=utf-8",
+        )
+
+    def test_skips_binary_responses(self):
+        assert spool_response(Response("https://example.com/logo.png")) is None
+
+    def test_text_response_subclass_is_spooled(self):
+        response = TextResponse(
+            "https://example.com/data.json",
+            body=b'{"a": 1}',
+            encoding="utf-8",
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert spool_response(response).content_type == "application/json"
+
+
+class TestParsePages:
+    async def test_yields_pages_in_spool_order(self, thread_parsing):
+        raw_pages = [
+            _raw_html(f"https://example.com/{i}", f"Page {i}") for i in range(20)
+        ]
+
+        pages = await _collect(raw_pages)
+
+        assert [page.url for page in pages] == [raw.url for raw in raw_pages]
+        assert pages[3].title == "Page 3"
+        assert "Page 3" in pages[3].content
+
+    async def test_resolves_relative_links(self, thread_parsing):
+        raw_page = RawPage(
+            url="https://example.com/dir/page",
+            body="<html><body><a href='other'>Other</a></body></html>",
+            content_type="text/html",
+        )
+
+        [page] = await _collect([raw_page])
+
+        assert "https://example.com/dir/other" in page.content
+
+    async def test_json_is_passed_through(self, thread_parsing):
+        raw_page = RawPage(
+            url="https://example.com/api",
+            body='{"a": 1}',
+            content_type="application/json",
+        )
+
+        [page] = await _collect([raw_page])
+
+        assert page.content == '{"a": 1}'
+        assert page.title == "https://example.com/api"
+
+    async def test_skips_pages_that_fail_to_parse(self, thread_parsing):
+        raw_pages = [
+            _raw_html("https://example.com/ok", "Ok"),
+            _raw_html("https://example.com/bad", "Bad"),
+        ]
+
+        def _parse(raw_page):
+            if raw_page.url.endswith("bad"):
+                raise ValueError("broken markup")
+            return MagicMock(url=raw_page.url)
+
+        with patch("intric.crawler.parse_pool.parse_page", side_effect=_parse):
+            pages = await _collect(raw_pages)
+
+        assert [page.url for page in pages] == ["https://example.com/ok"]
+
+    async def test_parses_in_spawned_process_pool(self, process_parsing):
+        raw_pages = [
+            _raw_html(f"https://example.com/{i}", f"Page {i}") for i in range(3)
+        ]
+
+        pages = await _collect(raw_pages)
+
+        assert isinstance(parse_pool._PARSE_POOL, parse_pool.ProcessPoolExecutor)
+        assert [page.title for page in pages] == ["Page 0", "Page 1", "Page 2"]
+
+    async def test_broken_pool_falls_back_to_thread(self, monkeypatch):
+        broken_pool = _BrokenPool()
+        monkeypatch.setattr(parse_pool, "_PARSE_POOL", broken_pool)
+        raw_pages = [
+            _raw_html(f"https://example.com/{i}", f"Page {i}") for i in range(3)
+        ]
+
+        # workers=0: the replacement "pool" is the thread executor
+        with _parse_settings(0):
+            pages = await _collect(raw_pages)
+
+        assert [page.title for page in pages] == ["Page 0", "Page 1", "Page 2"]
+        assert broken_pool.shut_down
+        assert parse_pool._PARSE_POOL is None
+
+
+ARTICLE_TEXT = " ".join(
+    f"Paragraph {i} explains how the municipality handles building permits."
+    for i in range(20)
+)
+
+
+class TestCrawlPages:
+    async def test_drops_near_duplicates_while_reading_spool(self, thread_parsing):
+        spooled = [
+            _raw_html("https://example.com/page", ARTICLE_TEXT),
+            _raw_html("https://example.com/page?print=1", ARTICLE_TEXT + " Print"),
+            _raw_html("https://example.com/other", "Opening hours"),
+        ]
+
+        async def _spool(*, filepath, **_kwargs):
+            with open(filepath, "w") as f:
+                for raw_page in spooled:
+                    f.write(json.dumps(asdict(raw_page)) + "\n")
+
+        dedup = NearDuplicateFilter()
+        async with Crawler()._crawl(
+            _spool,
+            max_length=60,
+            url="https://example.com/",
+            near_duplicate_filter=dedup,
+        ) as crawl:
+            pages = [page async for page in crawl.pages]
+
+        assert crawl.near_duplicate_filter is dedup
+        assert crawl.pages_count == 3
+        assert [page.url for page in pages] == [
+            "https://example.com/page",
+            "https://example.com/other",
+        ]
+        assert dedup.duplicates == {
+            "https://example.com/page?print=1": "https://example.com/page"
+        }
@@ -1,8 +1,10 @@
 from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
 
 import pytest
 
 from intric.embedding_models.infrastructure.datastore import Datastore
+from intric.info_blobs.info_blob import InfoBlobChunkInDBWithScore
 from tests.fixtures import TEST_COLLECTION
 
 
@@ -33,3 +35,44 @@ async def test_semantic_search(datastore: Datastore):
             embedding_model=TEST_COLLECTION.embedding_model,
         )
         autocut_mock.assert_called_once()
+
+
+def _hit(chunk_no: int, score: float):
+    return InfoBlobChunkInDBWithScore(
+        id=uuid4(),
+        text=f"chunk {chunk_no}",
+        chunk_no=chunk_no,
+        info_blob_id=uuid4(),
+        tenant_id=uuid4(),
+        info_blob_title="title",
+        score=score,
+    )
+
+
+async def test_semantic_search_adds_neighbors_after_the_hits(datastore: Datastore):
+    hits = [_hit(3, 0.9), _hit(7, 0.8)]
+    neighbors = [_hit(2, 0.9), _hit(4, 0.9)]
+    datastore.chunk_repo.semantic_search.return_value = hits
+    datastore.chunk_repo.get_neighbors.return_value = neighbors
+
+    results = await datastore.semantic_search(
+        search_string="giraffe",
+        collections=[TEST_COLLECTION],
+        embedding_model=TEST_COLLECTION.embedding_model,
+        neighbor_chunks=1,
+    )
+
+    assert results == hits + neighbors
+    datastore.chunk_repo.get_neighbors.assert_awaited_once_with(hits, radius=1)
+
+
+async def test_semantic_search_without_neighbors(datastore: Datastore):
+    datastore.chunk_repo.semantic_search.return_value = [_hit(3, 0.9)]
+
+    await datastore.semantic_search(
+        search_string="giraffe",
+        collections=[TEST_COLLECTION],
+        embedding_model=TEST_COLLECTION.embedding_model,
+    )
+
+    datastore.chunk_repo.get_neighbors.assert_not_called()
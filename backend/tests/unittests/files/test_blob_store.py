@@ -0,0 +1,165 @@
+import hashlib
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from intric.files.blob_store import (
+    BlobNotFoundError,
+    LocalBlobStore,
+    load_blobs,
+    sweep_orphaned_blobs,
+)
+from intric.files.file_models import File, FileCreate, FileType
+from intric.files.file_repo import FileRepository
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return LocalBlobStore(tmp_path)
+
+
+def _file(**kwargs) -> File:
+    return File(
+        id=uuid4(),
+        name="image.png",
+        checksum="abc",
+        size=3,
+        mimetype="image/png",
+        file_type=FileType.IMAGE,
+        user_id=uuid4(),
+        tenant_id=uuid4(),
+        **kwargs,
+    )
+
+
+async def test_put_is_content_addressed_and_deduplicated(blob_store, tmp_path):
+    key = await blob_store.put(b"hello")
+    again = await blob_store.put(b"hello")
+
+    assert key == again == hashlib.sha256(b"hello").hexdigest()
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+    assert await blob_store.get(key) == b"hello"
+    assert await blob_store.size(key) == 5
+
+
+async def test_put_refreshes_mtime_of_existing_blob(blob_store):
+    key = await blob_store.put(b"hello")
+    path = blob_store._path(key)
+    os.utime(path, (0, 0))
+
+    await blob_store.put(b"hello")
+
+    assert path.stat().st_mtime > time.time() - 60
+
+
+async def test_stream_range(blob_store):
+    data = os.urandom(1024 * 1024)
+    key = await blob_store.put(data)
+
+    chunks = [chunk async for chunk in blob_store.stream(key, start=10, end=600_000)]
+
+    assert b"".join(chunks) == data[10:600_001]
+    assert len(chunks) > 1
+
+
+async def test_missing_blob(blob_store):
+    with pytest.raises(BlobNotFoundError):
+        await blob_store.get("0" * 64)
+
+
+def test_rejects_keys_outside_the_store(blob_store):
+    with pytest.raises(ValueError):
+        blob_store._path("../../etc/passwd")
+
+
+async def test_load_blobs_only_reads_stored_files(blob_store):
+    key = await blob_store.put(b"png")
+    stored = _file(blob_key=key)
+    inline = _file(blob=b"inline")
+
+    await load_blobs([stored, inline], blob_store)
+
+    assert stored.blob == b"png"
+    assert inline.blob == b"inline"
+
+
+async def test_repo_add_writes_blob_to_store_not_row(blob_store):
+    repo = FileRepository(session=MagicMock(), blob_store=blob_store)
+    repo._delegate = MagicMock(add=AsyncMock())
+    file = FileCreate(
+        name="image.png",
+        checksum="abc",
+        size=3,
+        mimetype="image/png",
+        file_type=FileType.IMAGE,
+        blob=b"png",
+        user_id=uuid4(),
+        tenant_id=uuid4(),
+    )
+
+    await repo.add(file)
+
+    _, kwargs = repo._delegate.add.await_args
+    assert kwargs["exclude"] == {"blob"}
+    assert await blob_store.get(kwargs["blob_key"]) == b"png"
+
+
+async def test_repo_update_does_not_write_loaded_blob_back(blob_store):
+    repo = FileRepository(session=MagicMock(), blob_store=blob_store)
+    repo._delegate = MagicMock(update=AsyncMock())
+    file = _file(blob_key="k" * 64)
+    file.blob = b"loaded"
+
+    await repo.update(file)
+
+    assert repo._delegate.update.await_args.kwargs["exclude"] == {"blob"}
+
+
+async def test_sweep_deletes_only_old_unreferenced_blobs(blob_store):
+    referenced = await blob_store.put(b"referenced")
+    orphan = await blob_store.put(b"orphan")
+    fresh_orphan = await blob_store.put(b"fresh")
+    for key in (referenced, orphan):
+        os.utime(blob_store._path(key), (0, 0))
+
+    session = MagicMock()
+    session.scalars = AsyncMock(
+        return_value=MagicMock(all=MagicMock(return_value=[referenced]))
+    )
+
+    deleted = await sweep_orphaned_blobs(session, blob_store, grace_seconds=3600)
+
+    assert deleted == 1
+    assert not blob_store._path(orphan).exists()
+    assert blob_store._path(referenced).exists()
+    assert blob_store._path(fresh_orphan).exists()
+
+
+async def test_sweep_keeps_blobs_put_again_after_the_reference_check(blob_store):
+    orphan = await blob_store.put(b"orphan")
+    os.utime(blob_store._path(orphan), (0, 0))
+
+    async def _put_while_checking(statement):
+        # A new Files row, not committed yet, dedups onto the blob
+        await blob_store.put(b"orphan")
+        return MagicMock(all=MagicMock(return_value=[]))
+
+    session = MagicMock(scalars=AsyncMock(side_effect=_put_while_checking))
+
+    deleted = await sweep_orphaned_blobs(session, blob_store, grace_seconds=3600)
+
+    assert deleted == 0
+    assert await blob_store.get(orphan) == b"orphan"
+    assert [key for key, _ in blob_store.iter_keys()] == [orphan]
+
+
+async def test_put_after_the_blob_was_swept_stores_it_again(blob_store):
+    key = await blob_store.put(b"hello")
+    assert await blob_store.delete_if_stale(key, cutoff=time.time() + 60)
+
+    await blob_store.put(b"hello")
+
+    assert await blob_store.get(key) == b"hello"
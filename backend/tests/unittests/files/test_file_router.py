@@ -5,6 +5,8 @@ from uuid import uuid4
 import pytest
 
 from intric.files import file_router
+from intric.files.blob_store import LocalBlobStore
+from intric.files.file_models import File, FileType
 from intric.main.exceptions import NotFoundException
 
 
@@ -15,7 +17,11 @@ async def test_download_file_signed_raises_not_found_for_missing_content(monkeyp
     monkeypatch.setattr(file_router, "verify_signed_token", lambda _: payload)
 
     file_repo = SimpleNamespace(
-        get_by_id=AsyncMock(return_value=SimpleNamespace(text=None, blob=None))
+        get_by_id=AsyncMock(
+            return_value=SimpleNamespace(
+                text=None, blob=None, blob_key=None, has_content=False
+            )
+        )
     )
     container = SimpleNamespace(file_repo=lambda: file_repo)
 
@@ -23,3 +29,82 @@ async def test_download_file_signed_raises_not_found_for_missing_content(monkeyp
         await file_router.download_file_signed(
             id=file_id, token="token", range=None, container=container
         )
+
+
+def _audio_file(blob_key: str) -> File:
+    return File(
+        id=uuid4(),
+        name="meeting.mp3",
+        checksum="abc",
+        size=10,
+        mimetype="audio/mpeg",
+        file_type=FileType.AUDIO,
+        blob_key=blob_key,
+        user_id=uuid4(),
+        tenant_id=uuid4(),
+    )
+
+
+async def _download(monkeypatch, tmp_path, data: bytes, range: str | None):
+    blob_store = LocalBlobStore(tmp_path)
+    file = _audio_file(await blob_store.put(data))
+    payload = {"file_id": str(file.id), "content_disposition": "inline"}
+    monkeypatch.setattr(file_router, "verify_signed_token", lambda _: payload)
+
+    file_repo = SimpleNamespace(
+        get_by_id=AsyncMock(return_value=file), blob_store=blob_store
+    )
+    container = SimpleNamespace(file_repo=lambda: file_repo)
+
+    response = await file_router.download_file_signed(
+        id=file.id, token="token", range=range, container=container
+    )
+    if not hasattr(response, "body_iterator"):
+        return response, response.body
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    return response, body
+
+
+async def test_download_streams_blob_from_store(monkeypatch, tmp_path):
+    data = bytes(range(256)) * 4096  # Several stream chunks
+
+    response, body = await _download(monkeypatch, tmp_path, data, range=None)
+
+    assert response.status_code == 200
+    assert response.headers["content-length"] == str(len(data))
+    assert body == data
+
+
+async def test_download_range_reads_only_requested_bytes(monkeypatch, tmp_path):
+    data = bytes(range(256)) * 4096
+
+    response, body = await _download(
+        monkeypatch, tmp_path, data, range="bytes=1000-300000"
+    )
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 1000-300000/{len(data)}"
+    assert body == data[1000:300001]
+
+
+async def test_download_range_not_satisfiable(monkeypatch, tmp_path):
+    response, _ = await _download(monkeypatch, tmp_path, b"short", range="bytes=10-20")
+
+    assert response.status_code == 416
+
+
+async def test_download_missing_blob_is_not_found(monkeypatch, tmp_path):
+    file = _audio_file("0" * 64)
+    payload = {"file_id": str(file.id), "content_disposition": "inline"}
+    monkeypatch.setattr(file_router, "verify_signed_token", lambda _: payload)
+    file_repo = SimpleNamespace(
+        get_by_id=AsyncMock(return_value=file), blob_store=LocalBlobStore(tmp_path)
+    )
+
+    with pytest.raises(NotFoundException):
+        await file_router.download_file_signed(
+            id=file.id,
+            token="token",
+            range=None,
+            container=SimpleNamespace(file_repo=lambda: file_repo),
+        )
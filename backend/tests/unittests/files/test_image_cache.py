@@ -0,0 +1,67 @@
+import base64
+from uuid import uuid4
+
+import pytest
+
+from intric.files.file_models import File, FileType
+from intric.files.image_cache import EncodedImageCache
+
+
+def _image(content: bytes, blob_key: str = None) -> File:
+    return File(
+        id=uuid4(),
+        name="image.png",
+        checksum="checksum",
+        size=len(content),
+        mimetype="image/png",
+        file_type=FileType.IMAGE,
+        blob=content,
+        blob_key=blob_key,
+        user_id=uuid4(),
+        tenant_id=uuid4(),
+    )
+
+
+def test_encodes_image():
+    cache = EncodedImageCache(max_bytes=1024)
+    image = _image(b"image bytes")
+
+    assert cache.encode(image) == base64.b64encode(b"image bytes").decode()
+
+
+def test_cached_payload_is_reused_without_blob():
+    cache = EncodedImageCache(max_bytes=1024)
+    image = _image(b"image bytes", blob_key="a" * 64)
+    encoded = cache.encode(image)
+
+    image.blob = None
+
+    assert cache.encode(image) == encoded
+
+
+def test_evicts_least_recently_used():
+    cache = EncodedImageCache(max_bytes=40)
+    first = _image(b"x" * 12)
+    second = _image(b"y" * 12)
+    third = _image(b"z" * 12)
+
+    cache.encode(first)
+    cache.encode(second)
+    cache.encode(first)
+    cache.encode(third)
+
+    first.blob = second.blob = None
+    cache.encode(first)
+    with pytest.raises(ValueError):
+        cache.encode(second)
+
+
+def test_oversized_images_are_not_cached():
+    cache = EncodedImageCache(max_bytes=8)
+    image = _image(b"x" * 12)
+
+    cache.encode(image)
+    image.blob = None
+
+    with pytest.raises(ValueError):
+        cache.encode(image)
@@ -0,0 +1,171 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from intric.files.audio import AudioFile, AudioSegment
+from intric.files.transcriber import Transcriber
+from intric.main.exceptions import OpenAIException
+from intric.transcription_models.infrastructure.adapters.litellm_transcription import (
+    LiteLLMTranscriptionAdapter,
+)
+
+
+class FakeAudioFile:
+    def __init__(self, num_segments: int, segment_seconds: int = 300):
+        self.info = MagicMock(duration=num_segments * segment_seconds - 42)
+        self.encoded = 0
+        self.segments = [
+            AudioSegment(
+                index=i,
+                path=Path(f"segment-{i}.mp3"),
+                start_seconds=i * segment_seconds,
+                end_seconds=(i + 1) * segment_seconds,
+            )
+            for i in range(num_segments)
+        ]
+
+    @asynccontextmanager
+    async def astream_segments(self, seconds: int):
+        async def stream():
+            for segment in self.segments:
+                self.encoded += 1
+                yield segment
+
+        yield stream()
+
+
+@pytest.fixture
+def adapter():
+    model = MagicMock()
+    model.name = "whisper"
+    model.model_name = "whisper-1"
+    return LiteLLMTranscriptionAdapter(
+        model=model, credential_resolver=MagicMock(), provider_type="openai"
+    )
+
+
+async def test_segments_are_transcribed_concurrently_and_kept_in_order(adapter):
+    in_flight = 0
+    max_in_flight = 0
+    finished = 0
+    max_unfinished = 0
+
+    async def transcribe_chunk(path):
+        nonlocal in_flight, max_in_flight, finished, max_unfinished
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later segments finish first
+        await asyncio.sleep(0.01 * (10 - int(path.stem.split("-")[1])))
+        # No segment is encoded ahead of a free slot
+        max_unfinished = max(max_unfinished, audio_file.encoded - finished)
+        in_flight -= 1
+        finished += 1
+        return f"text of {path.stem}"
+
+    audio_file = FakeAudioFile(num_segments=6)
+    with (
+        patch.object(adapter, "_transcribe_chunk", side_effect=transcribe_chunk),
+        patch(
+            "intric.transcription_models.infrastructure.adapters.litellm_transcription.get_settings"
+        ) as settings,
+    ):
+        settings.return_value.transcription_max_concurrent_segments = 3
+        text = await adapter.get_text_from_file(audio_file)
+
+    assert max_in_flight == 3
+    assert max_unfinished == 3
+    blocks = text.split("\n\n### ")
+    assert len(blocks) == 6
+    assert text.startswith("### 0:00 - 5:00\n\ntext of segment-0")
+    assert "5:00 - 10:00\n\ntext of segment-1" in blocks[1]
+    # Last block ends at the real duration
+    assert blocks[-1] == "25:00 - 29:18\n\ntext of segment-5"
+
+
+async def test_segment_failure_raises_provider_error(adapter):
+    async def transcribe_chunk(path):
+        if path.stem == "segment-1":
+            raise OpenAIException("rate limited")
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    with patch.object(adapter, "_transcribe_chunk", side_effect=transcribe_chunk):
+        with pytest.raises(OpenAIException):
+            await adapter.get_text_from_file(FakeAudioFile(num_segments=4))
+
+
+async def test_stream_segments_cover_the_whole_file(tmp_path):
+    samplerate = 8000
+    wav = tmp_path / "audio.wav"
+    sf.write(wav, np.zeros(samplerate * 10, dtype="float32"), samplerate)
+    audio_file = AudioFile(str(wav))
+
+    async with audio_file.astream_segments(seconds=1) as stream:
+        segments = [segment async for segment in stream]
+        assert all(segment.path.exists() for segment in segments)
+
+    assert [segment.index for segment in segments] == list(range(len(segments)))
+    assert segments[0].start_seconds == 0
+    for previous, segment in zip(segments, segments[1:]):
+        assert segment.start_seconds == previous.end_seconds
+    assert segments[-1].end_seconds == pytest.approx(10)
+    assert not any(segment.path.exists() for segment in segments)
+
+
+def _transcriber(cache_repo):
+    tenant = MagicMock()
+    tenant.id = uuid4()
+    return Transcriber(
+        file_repo=MagicMock(),
+        tenant=tenant,
+        config=MagicMock(),
+        transcript_cache_repo=cache_repo,
+    )
+
+
+async def test_cached_transcript_skips_provider(tmp_path):
+    cache_repo = MagicMock()
+    cache_repo.get = AsyncMock(return_value="cached transcript")
+    transcriber = _transcriber(cache_repo)
+    transcriber._get_adapter = AsyncMock()
+    model = MagicMock(id=uuid4())
+
+    text = await transcriber.transcribe_from_filepath(
+        filepath=tmp_path / "audio.wav", transcription_model=model, checksum="abc"
+    )
+
+    assert text == "cached transcript"
+    transcriber._get_adapter.assert_not_awaited()
+    cache_repo.get.assert_awaited_once_with(
+        tenant_id=transcriber.tenant.id, checksum="abc", transcription_model_id=model.id
+    )
+
+
+async def test_new_transcript_is_cached_by_file_checksum(tmp_path):
+    samplerate = 8000
+    wav = tmp_path / "audio.wav"
+    sf.write(wav, np.zeros(samplerate, dtype="float32"), samplerate)
+
+    cache_repo = MagicMock()
+    cache_repo.get = AsyncMock(return_value=None)
+    cache_repo.add = AsyncMock()
+    transcriber = _transcriber(cache_repo)
+    adapter = MagicMock()
+    adapter.get_text_from_file = AsyncMock(return_value="fresh transcript")
+    transcriber._get_adapter = AsyncMock(return_value=adapter)
+    model = MagicMock(id=uuid4())
+
+    text = await transcriber.transcribe_from_filepath(
+        filepath=wav, transcription_model=model
+    )
+
+    assert text == "fresh transcript"
+    stored = cache_repo.add.await_args.kwargs
+    assert stored["transcript"] == "fresh transcript"
+    assert len(stored["checksum"]) == 64  # sha256, as for uploaded files
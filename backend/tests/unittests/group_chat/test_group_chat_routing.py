@@ -0,0 +1,145 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from intric.group_chat.application import assistant_router as router_module
+from intric.group_chat.application.assistant_router import AssistantRouter
+from intric.group_chat.application.group_chat_service import GroupChatService
+
+VECTORS = {
+    "Tax: Answers questions about taxes": [1.0, 0.0, 0.0],
+    "Parking: Handles parking permits": [0.0, 1.0, 0.0],
+    "how do I pay my taxes?": [0.9, 0.1, 0.0],
+    "something vague": [0.5, 0.5, 0.0],
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    router_module.clear_profile_cache()
+    yield
+    router_module.clear_profile_cache()
+
+
+def _assistant(name, description):
+    assistant = MagicMock()
+    assistant.assistant.id = uuid4()
+    assistant.assistant.name = name
+    assistant.assistant.description = description
+    assistant.user_description = None
+    return assistant
+
+
+@pytest.fixture
+def assistants():
+    return [
+        _assistant("Tax", "Answers questions about taxes"),
+        _assistant("Parking", "Handles parking permits"),
+    ]
+
+
+@pytest.fixture
+def embeddings_service():
+    service = MagicMock()
+    service.get_embedding_for_query = AsyncMock(
+        side_effect=lambda model, query: VECTORS[query]
+    )
+    return service
+
+
+@pytest.fixture
+def embedding_model():
+    model = MagicMock()
+    model.id = uuid4()
+    return model
+
+
+async def test_routes_clear_question_to_best_match(
+    assistants, embeddings_service, embedding_model
+):
+    router = AssistantRouter(embeddings_service, min_similarity=0.3, min_margin=0.1)
+
+    decision = await router.route("how do I pay my taxes?", assistants, embedding_model)
+
+    assert decision.assistant is assistants[0]
+
+
+async def test_abstains_when_scores_are_close(
+    assistants, embeddings_service, embedding_model
+):
+    router = AssistantRouter(embeddings_service, min_similarity=0.3, min_margin=0.1)
+
+    decision = await router.route("something vague", assistants, embedding_model)
+
+    assert not decision.confident
+
+
+async def test_profiles_are_embedded_once_and_refreshed_on_change(
+    assistants, embeddings_service, embedding_model
+):
+    router = AssistantRouter(embeddings_service, min_similarity=0.3, min_margin=0.1)
+
+    await router.route("how do I pay my taxes?", assistants, embedding_model)
+    await router.route("how do I pay my taxes?", assistants, embedding_model)
+    # 2 profiles + 2 questions
+    assert embeddings_service.get_embedding_for_query.await_count == 4
+
+    assistants[1].assistant.description = "Answers questions about taxes"
+    VECTORS["Parking: Answers questions about taxes"] = [1.0, 0.0, 0.0]
+    await router.route("how do I pay my taxes?", assistants, embedding_model)
+    # only the edited profile is re-embedded
+    assert embeddings_service.get_embedding_for_query.await_count == 6
+
+
+async def test_embedding_failure_abstains(assistants, embedding_model):
+    service = MagicMock()
+    service.get_embedding_for_query = AsyncMock(side_effect=Exception("provider down"))
+    router = AssistantRouter(service)
+
+    decision = await router.route("how do I pay my taxes?", assistants, embedding_model)
+
+    assert not decision.confident
+
+
+def _service(embeddings_service):
+    completion_service = MagicMock()
+    completion_service.get_response = AsyncMock()
+    completion_service.get_response.return_value.completion.text = "2"
+    return GroupChatService(
+        user=MagicMock(),
+        space_service=MagicMock(),
+        space_repo=MagicMock(),
+        actor_manager=MagicMock(),
+        assistant_service=MagicMock(),
+        session_service=MagicMock(),
+        completion_service=completion_service,
+        create_embeddings_service=embeddings_service,
+    )
+
+
+async def test_selection_skips_llm_when_router_is_confident(
+    assistants, embeddings_service, embedding_model
+):
+    service = _service(embeddings_service)
+
+    result = await service._select_assistant_with_completion_model(
+        "how do I pay my taxes?", assistants, embedding_model=embedding_model
+    )
+
+    assert result.assistant is assistants[0]
+    assert result.assistant_selector_tokens == 0
+    service.completion_service.get_response.assert_not_awaited()
+
+
+async def test_selection_falls_back_to_llm_when_ambiguous(
+    assistants, embeddings_service, embedding_model
+):
+    service = _service(embeddings_service)
+
+    result = await service._select_assistant_with_completion_model(
+        "something vague", assistants, embedding_model=embedding_model
+    )
+
+    assert result.assistant is assistants[1]
+    service.completion_service.get_response.assert_awaited_once()
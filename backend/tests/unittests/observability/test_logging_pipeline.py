@@ -0,0 +1,84 @@
+import json
+import logging
+
+from intric.main.logging import (
+    ContextJSONFormatter,
+    RateLimitFilter,
+    _ContextQueueHandler,
+)
+from intric.main.request_context import clear_request_context, set_request_context
+
+
+def _record(
+    msg="hello %s", args=("world",), level=logging.INFO, lineno=10, created=100.0
+):
+    record = logging.LogRecord(
+        name="test",
+        level=level,
+        pathname="module.py",
+        lineno=lineno,
+        msg=msg,
+        args=args,
+        exc_info=None,
+    )
+    record.created = created
+    return record
+
+
+def test_rate_limit_per_call_site():
+    rate_limit = RateLimitFilter(limit=2, interval_seconds=1)
+
+    allowed = [rate_limit.filter(_record()) for _ in range(5)]
+    other_site = rate_limit.filter(_record(lineno=11))
+
+    assert allowed == [True, True, False, False, False]
+    assert other_site is True
+
+
+def test_rate_limit_reports_suppressed_records_in_the_next_window():
+    rate_limit = RateLimitFilter(limit=1, interval_seconds=1)
+    for _ in range(4):
+        rate_limit.filter(_record(created=100.0))
+
+    record = _record(created=101.5)
+
+    assert rate_limit.filter(record) is True
+    assert record.suppressed == 3
+
+
+def test_warnings_are_never_rate_limited():
+    rate_limit = RateLimitFilter(limit=1, interval_seconds=60)
+
+    assert all(rate_limit.filter(_record(level=logging.WARNING)) for _ in range(10))
+
+
+def test_queued_record_carries_the_request_context():
+    set_request_context(correlation_id="abc123")
+    try:
+        record = _ContextQueueHandler().prepare(_record())
+    finally:
+        clear_request_context()
+
+    # Formatted later, outside the request
+    log = json.loads(ContextJSONFormatter().format(record))
+
+    assert log["message"] == "hello world"
+    assert log["correlation_id"] == "abc123"
+
+
+def test_callable_extras_are_resolved_when_formatted():
+    calls = []
+
+    def _payload():
+        calls.append(1)
+        return {"pages": 3}
+
+    record = _record()
+    record.payload = _payload
+    record.broken = lambda: 1 / 0
+
+    assert calls == []
+    log = json.loads(ContextJSONFormatter().format(record))
+
+    assert log["payload"] == {"pages": 3}
+    assert log["broken"].startswith("<failed to compute")
@@ -0,0 +1,61 @@
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+
+from intric.observability.metrics import (
+    CRAWL_QUEUE_DEPTH,
+    VECTOR_SEARCH_SECONDS,
+    observe_seconds,
+    render_metrics,
+    set_crawl_queue_depths,
+)
+
+
+def _sample(name: str, **labels) -> float | None:
+    return REGISTRY.get_sample_value(name, labels)
+
+
+def test_observe_seconds_records_when_block_raises():
+    before = _sample("intric_vector_search_seconds_count") or 0
+
+    with pytest.raises(RuntimeError):
+        with observe_seconds(VECTOR_SEARCH_SECONDS):
+            raise RuntimeError("search failed")
+
+    assert _sample("intric_vector_search_seconds_count") == before + 1
+
+
+def test_set_crawl_queue_depths_drops_tenants_with_empty_queues():
+    busy, drained = uuid4(), uuid4()
+
+    set_crawl_queue_depths({busy: 3, drained: 1})
+    set_crawl_queue_depths({busy: 2})
+
+    assert _sample("intric_crawl_queue_depth", tenant_id=str(busy)) == 2
+    assert _sample("intric_crawl_queue_depth", tenant_id=str(drained)) is None
+
+    set_crawl_queue_depths({})
+    assert CRAWL_QUEUE_DEPTH.collect()[0].samples == []
+
+
+def test_render_metrics_uses_the_text_format():
+    content, media_type = render_metrics()
+    body = content.decode()
+
+    assert media_type.startswith("text/plain")
+    assert "# TYPE intric_llm_time_to_first_token_seconds histogram" in body
+    assert "# TYPE intric_crawl_pages_total counter" in body
+
+
+def test_metrics_endpoint_requires_the_super_api_key():
+    from intric.authentication.auth import authenticate_super_api_key
+    from intric.server.main import app
+
+    route = next(
+        route for route in app.routes if getattr(route, "path", None) == "/metrics"
+    )
+
+    assert authenticate_super_api_key in [
+        dependency.call for dependency in route.dependant.dependencies
+    ]
@@ -57,3 +57,31 @@ def test_build_redis_pool_kwargs_omits_max_connections_when_none(test_settings):
 
     assert kwargs["decode_responses"] is True
     assert "max_connections" not in kwargs
+
+
+async def test_instrumented_redis_times_each_command(monkeypatch):
+    from prometheus_client import REGISTRY
+    from redis.asyncio import Redis
+
+    from intric.redis.connection import InstrumentedRedis
+
+    async def execute_command(self, *args, **options):
+        return b"value"
+
+    monkeypatch.setattr(Redis, "execute_command", execute_command)
+    before = (
+        REGISTRY.get_sample_value(
+            "intric_redis_command_seconds_count", {"command": "GET"}
+        )
+        or 0
+    )
+
+    result = await InstrumentedRedis().get("key")
+
+    assert result == b"value"
+    assert (
+        REGISTRY.get_sample_value(
+            "intric_redis_command_seconds_count", {"command": "GET"}
+        )
+        == before + 1
+    )
@@ -0,0 +1,185 @@
+"""Unit tests for the multiplexed WebSocketManager."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from starlette.websockets import WebSocketState
+
+from intric.main.models import Channel, ChannelType, RedisMessage, Status
+from intric.server.websockets import websocket_manager as manager_module
+from intric.server.websockets import websocket_router
+from intric.server.websockets.websocket_manager import WebSocketManager
+from intric.server.websockets.websocket_models import (
+    OutGoingMessageType,
+    WsOutgoingWebSocketMessage,
+)
+
+
+def _manager(**kwargs) -> WebSocketManager:
+    manager = WebSocketManager(redis=MagicMock(), **kwargs)
+    # The Redis listener is covered separately
+    manager._ensure_listener = MagicMock()
+    return manager
+
+
+def _websocket() -> AsyncMock:
+    return AsyncMock()
+
+
+def _stalled_websocket(release: asyncio.Event) -> AsyncMock:
+    """Websocket whose sends block until release is set."""
+
+    async def send_text(_text):
+        await release.wait()
+
+    websocket = AsyncMock()
+    websocket.send_text.side_effect = send_text
+    return websocket
+
+
+def _redis_message(channel: str) -> dict:
+    return {
+        "type": "pmessage",
+        "pattern": b"*",
+        "channel": channel.encode(),
+        "data": RedisMessage(id=uuid4(), status=Status.COMPLETE)
+        .model_dump_json()
+        .encode(),
+    }
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_dispatches_only_to_local_channel_subscribers():
+    manager = _manager()
+    user_id = uuid4()
+    subscribed, other = _websocket(), _websocket()
+    manager.subscribe(subscribed, ChannelType.APP_RUN_UPDATES, user_id)
+    manager.subscribe(other, ChannelType.APP_RUN_UPDATES, uuid4())
+    channel = Channel(type=ChannelType.APP_RUN_UPDATES, user_id=user_id)
+
+    manager._dispatch_redis_message(_redis_message(channel.channel_string))
+    await _drain()
+
+    subscribed.send_text.assert_awaited_once()
+    assert '"app_run_updates"' in subscribed.send_text.call_args[0][0]
+    other.send_text.assert_not_called()
+    await manager.shutdown()
+
+
+async def test_ignores_channels_without_local_subscribers():
+    manager = _manager()
+    channel = Channel(type=ChannelType.APP_RUN_UPDATES, user_id=uuid4())
+
+    manager._dispatch_redis_message(_redis_message(channel.channel_string))
+
+    assert manager.senders == {}
+
+
+async def test_slow_socket_does_not_block_others():
+    manager = _manager()
+    user_id = uuid4()
+    release = asyncio.Event()
+    stalled, fast = _stalled_websocket(release), _websocket()
+    manager.subscribe(stalled, ChannelType.APP_RUN_UPDATES, user_id)
+    manager.subscribe(fast, ChannelType.APP_RUN_UPDATES, user_id)
+    channel = Channel(type=ChannelType.APP_RUN_UPDATES, user_id=user_id)
+    message = WsOutgoingWebSocketMessage(type=OutGoingMessageType.APP_RUN_UPDATES)
+
+    manager.publish(channel.channel_string, message)
+    manager.publish(channel.channel_string, message)
+    await _drain()
+
+    assert fast.send_text.await_count == 2
+    assert stalled.send_text.call_count == 1
+    assert manager.senders[stalled].queue.qsize() == 1
+
+    release.set()
+    await manager.shutdown()
+
+
+async def test_full_queue_closes_slow_consumer():
+    manager = _manager(send_queue_size=2)
+    user_id = uuid4()
+    release = asyncio.Event()
+    stalled = _stalled_websocket(release)
+    manager.subscribe(stalled, ChannelType.APP_RUN_UPDATES, user_id)
+    channel = Channel(type=ChannelType.APP_RUN_UPDATES, user_id=user_id)
+    message = WsOutgoingWebSocketMessage(type=OutGoingMessageType.APP_RUN_UPDATES)
+
+    # First message is taken by the sender, the next two fill the queue
+    for _ in range(3):
+        manager.publish(channel.channel_string, message)
+        await _drain()
+    stalled.close.assert_not_called()
+
+    manager.publish(channel.channel_string, message)
+    await _drain()
+
+    stalled.close.assert_awaited_once_with(code=manager_module.WS_CLOSE_TRY_AGAIN_LATER)
+    assert manager.channels == {}
+    assert stalled not in manager.senders
+
+    release.set()
+    await manager.shutdown()
+
+
+async def test_failed_send_unsubscribes_socket():
+    manager = _manager()
+    user_id = uuid4()
+    broken = _websocket()
+    broken.send_text.side_effect = RuntimeError("connection closed")
+    manager.subscribe(broken, ChannelType.APP_RUN_UPDATES, user_id)
+    channel = Channel(type=ChannelType.APP_RUN_UPDATES, user_id=user_id)
+
+    manager.publish(
+        channel.channel_string,
+        WsOutgoingWebSocketMessage(type=OutGoingMessageType.APP_RUN_UPDATES),
+    )
+    await _drain()
+
+    assert manager.channels == {}
+    assert manager.senders == {}
+
+
+async def test_listener_uses_one_pattern_subscription_for_all_channels():
+    pubsub = AsyncMock()
+    pubsub.__aenter__.return_value = pubsub
+    pubsub.get_message.side_effect = asyncio.CancelledError
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+    manager = WebSocketManager(redis=redis)
+
+    manager.subscribe(_websocket(), ChannelType.APP_RUN_UPDATES, uuid4())
+    manager.subscribe(_websocket(), ChannelType.CRAWL_RUN_UPDATES, uuid4())
+    await _drain()
+
+    redis.pubsub.assert_called_once()
+    patterns = pubsub.psubscribe.call_args[0]
+    assert len(patterns) == len(ChannelType)
+    assert f"{ChannelType.APP_RUN_UPDATES}:*" in patterns
+    await manager.shutdown()
+
+
+async def test_router_logs_use_of_a_socket_closed_server_side_at_debug(monkeypatch):
+    websocket = AsyncMock(application_state=WebSocketState.CONNECTED)
+
+    async def receive_json():
+        # The manager closes the slow consumer while the router waits
+        websocket.application_state = WebSocketState.DISCONNECTED
+        raise RuntimeError('Cannot call "receive" once a close message has been sent.')
+
+    websocket.receive_json.side_effect = receive_json
+    manager = MagicMock()
+    logger = MagicMock()
+    monkeypatch.setattr(websocket_router, "websocket_manager", manager)
+    monkeypatch.setattr(websocket_router, "logger", logger)
+
+    await websocket_router.connect(websocket, user=MagicMock())
+
+    logger.exception.assert_not_called()
+    manager.unsubscribe_from_all_channels.assert_called_once_with(websocket)
@@ -1,9 +1,11 @@
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
 from intric.assistants.api.assistant_models import AssistantSparse
+from intric.completion_models.infrastructure.context_builder import count_tokens
 from intric.main.exceptions import NotFoundException, UnauthorizedException
 from intric.sessions.session import SessionInDB, SessionUpdate
 from intric.sessions.session_service import SessionService
@@ -115,3 +117,67 @@ async def test_delete_error_when_user_not_owner_of_session(service: SessionServi
 
     with pytest.raises(UnauthorizedException, match="belongs to other user"):
         await service.delete(1)
+
+
+def _question(text: str):
+    return SimpleNamespace(question=text, answer=text)
+
+
+async def test_chat_session_only_loads_turns_within_budget(service: SessionService):
+    service.session_repo.get_without_questions.return_value = SessionInDB(
+        user_id=TEST_USER.id, name="test_session", id=TEST_UUID
+    )
+    newest_first = [_question("word " * 50) for _ in range(30)]
+    service.session_repo.get_latest_questions.side_effect = (
+        lambda session_id, limit, offset: newest_first[offset : offset + limit]
+    )
+    turn_tokens = 2 * count_tokens("word " * 50)
+
+    session = await service.get_session_for_chat(TEST_UUID, max_tokens=6 * turn_tokens)
+
+    # Six turns fit the budget; the seventh goes over it and is the oldest one
+    # the context builder could still reach
+    assert len(session.questions) == 7
+    assert session.questions[-1] is newest_first[0]
+    assert session.questions[0] is newest_first[6]
+    service.session_repo.get_latest_questions.assert_called_once()
+
+
+async def test_chat_session_keeps_minimum_turns(service: SessionService):
+    service.session_repo.get_without_questions.return_value = SessionInDB(
+        user_id=TEST_USER.id, name="test_session", id=TEST_UUID
+    )
+    newest_first = [_question("word " * 1000) for _ in range(12)]
+    service.session_repo.get_latest_questions.side_effect = (
+        lambda session_id, limit, offset: newest_first[offset : offset + limit]
+    )
+
+    session = await service.get_session_for_chat(TEST_UUID, max_tokens=10)
+
+    assert len(session.questions) == 5
+
+
+async def test_chat_session_loads_whole_short_conversation(service: SessionService):
+    service.session_repo.get_without_questions.return_value = SessionInDB(
+        user_id=TEST_USER.id, name="test_session", id=TEST_UUID
+    )
+    newest_first = [_question("hi") for _ in range(23)]
+    service.session_repo.get_latest_questions.side_effect = (
+        lambda session_id, limit, offset: newest_first[offset : offset + limit]
+    )
+
+    session = await service.get_session_for_chat(TEST_UUID, max_tokens=10_000)
+
+    assert len(session.questions) == 23
+    assert service.session_repo.get_latest_questions.call_count == 3
+
+
+async def test_chat_session_checks_owner(service: SessionService):
+    service.session_repo.get_without_questions.return_value = SessionInDB(
+        user_id=uuid4(), name="test_session", id=TEST_UUID
+    )
+
+    with pytest.raises(UnauthorizedException, match="belongs to other user"):
+        await service.get_session_for_chat(TEST_UUID, max_tokens=1000)
+
+    service.session_repo.get_latest_questions.assert_not_called()
@@ -42,8 +42,8 @@ class TestCrawlerSettingSpecs:
             )
 
     def test_expected_settings_count(self):
-        """Verify we have all 18 crawler settings."""
-        assert len(CRAWLER_SETTING_SPECS) == 18
+        """Verify we have all 23 crawler settings."""
+        assert len(CRAWLER_SETTING_SPECS) == 23
 
     def test_known_settings_present(self):
         """Verify all known settings are present."""
@@ -65,6 +65,11 @@ class TestCrawlerSettingSpecs:
             "crawl_job_max_age_seconds",
             "tenant_worker_semaphore_ttl_seconds",
             "crawl_page_batch_size",
+            "conditional_recrawl_enabled",
+            "sitemap_incremental_enabled",
+            "near_duplicate_detection_enabled",
+            "crawl_quiet_hours_start",
+            "crawl_quiet_hours_end",
         ]
         for name in expected:
             assert name in CRAWLER_SETTING_SPECS, f"Missing setting: {name}"
@@ -157,12 +162,14 @@ class TestGetAllCrawlerSettings:
             mock_settings.crawl_job_max_age_seconds = 1800
             mock_settings.tenant_worker_semaphore_ttl_seconds = 18000
             mock_settings.crawl_page_batch_size = 100
+            mock_settings.crawl_quiet_hours_start = 0
+            mock_settings.crawl_quiet_hours_end = 0
             mock.return_value = mock_settings
 
             result = get_all_crawler_settings({})
             assert "download_timeout" in result
             assert "crawl_max_length" in result
-            assert len(result) == 18
+            assert len(result) == 23
 
     def test_tenant_overrides_merged_correctly(self):
         """Tenant-specific values override defaults."""
@@ -207,10 +214,12 @@ class TestGetAllCrawlerSettings:
             mock_settings.crawl_job_max_age_seconds = 1800
             mock_settings.tenant_worker_semaphore_ttl_seconds = 18000
             mock_settings.crawl_page_batch_size = 100
+            mock_settings.crawl_quiet_hours_start = 0
+            mock_settings.crawl_quiet_hours_end = 0
             mock.return_value = mock_settings
 
             result = get_all_crawler_settings(None)
-            assert len(result) == 18
+            assert len(result) == 23
 
 
 class TestValidateCrawlerSetting:
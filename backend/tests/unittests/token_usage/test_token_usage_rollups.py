@@ -0,0 +1,142 @@
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from intric.token_usage.infrastructure.token_usage_rollups import (
+    RollupCoverage,
+    TokenUsageRollupRepository,
+    token_usage_query,
+)
+
+COVERAGE = RollupCoverage(
+    covered_from=date(2026, 1, 1), refreshed_through=date(2026, 3, 1)
+)
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_final_days_skip_partial_days():
+    days = COVERAGE.final_days(_utc(2026, 1, 10, 12), _utc(2026, 1, 20, 8))
+
+    assert days == (date(2026, 1, 11), date(2026, 1, 19))
+
+
+def test_final_days_include_whole_days():
+    days = COVERAGE.final_days(_utc(2026, 1, 10), _utc(2026, 1, 21))
+
+    assert days == (date(2026, 1, 10), date(2026, 1, 20))
+
+
+def test_final_days_exclude_days_still_being_refreshed():
+    days = COVERAGE.final_days(_utc(2026, 2, 20), _utc(2026, 3, 10))
+
+    assert days == (date(2026, 2, 20), date(2026, 2, 28))
+
+
+def test_final_days_exclude_days_before_coverage():
+    days = COVERAGE.final_days(_utc(2025, 12, 1), _utc(2026, 1, 5))
+
+    assert days == (date(2026, 1, 1), date(2026, 1, 4))
+
+
+def test_final_days_treat_naive_datetimes_as_utc():
+    days = COVERAGE.final_days(datetime(2026, 1, 10), datetime(2026, 1, 12))
+
+    assert days == (date(2026, 1, 10), date(2026, 1, 11))
+
+
+def test_no_final_days_outside_coverage():
+    assert COVERAGE.final_days(_utc(2026, 3, 2), _utc(2026, 3, 10)) is None
+    assert COVERAGE.final_days(_utc(2026, 1, 10, 1), _utc(2026, 1, 10, 23)) is None
+
+
+def test_usage_query_reads_raw_tables_without_coverage():
+    sql = _sql(token_usage_query(uuid4(), _utc(2026, 1, 1), _utc(2026, 2, 1), None))
+
+    assert "token_usage_daily_rollups" not in sql
+    assert "questions" in sql and "app_runs" in sql
+
+
+def test_usage_query_reads_rollups_for_final_days():
+    query = token_usage_query(
+        uuid4(), _utc(2026, 1, 10, 12), _utc(2026, 1, 20, 8), COVERAGE
+    )
+    sql = _sql(query)
+
+    assert "token_usage_daily_rollups" in sql
+    # Questions and app runs before and after the rolled up days, plus rollups
+    assert len(query.selects) == 5
+
+
+async def test_first_refresh_rolls_up_yesterday():
+    repo = TokenUsageRollupRepository(AsyncMock())
+    repo.get_coverage = AsyncMock(return_value=None)
+    repo._recompute = AsyncMock()
+    repo._save_coverage = AsyncMock()
+
+    days = await repo.refresh(today=date(2026, 3, 5))
+
+    assert days == 1
+    repo._recompute.assert_awaited_once_with(date(2026, 3, 4), date(2026, 3, 4))
+    repo._save_coverage.assert_awaited_once_with(
+        covered_from=date(2026, 3, 4), refreshed_through=date(2026, 3, 4)
+    )
+
+
+async def test_refresh_recomputes_from_last_refreshed_day():
+    repo = TokenUsageRollupRepository(AsyncMock())
+    repo.get_coverage = AsyncMock(return_value=COVERAGE)
+    repo._recompute = AsyncMock()
+    repo._save_coverage = AsyncMock()
+
+    days = await repo.refresh(today=date(2026, 3, 3))
+
+    assert days == 2
+    repo._recompute.assert_awaited_once_with(date(2026, 3, 1), date(2026, 3, 2))
+    repo._save_coverage.assert_awaited_once_with(
+        covered_from=COVERAGE.covered_from, refreshed_through=date(2026, 3, 2)
+    )
+
+
+@pytest.mark.parametrize(
+    "earliest,expected_first,expected_days",
+    [
+        (date(2025, 6, 1), date(2025, 12, 1), 31),
+        (date(2025, 12, 20), date(2025, 12, 20), 12),
+    ],
+)
+async def test_backfill_rolls_up_days_before_coverage(
+    earliest, expected_first, expected_days
+):
+    repo = TokenUsageRollupRepository(AsyncMock())
+    repo.get_coverage = AsyncMock(return_value=COVERAGE)
+    repo._earliest_day = AsyncMock(return_value=earliest)
+    repo._recompute = AsyncMock()
+    repo._save_coverage = AsyncMock()
+
+    days = await repo.backfill(max_days=31)
+
+    assert days == expected_days
+    repo._recompute.assert_awaited_once_with(expected_first, date(2025, 12, 31))
+    repo._save_coverage.assert_awaited_once_with(
+        covered_from=expected_first, refreshed_through=COVERAGE.refreshed_through
+    )
+
+
+async def test_backfill_stops_when_history_is_covered():
+    repo = TokenUsageRollupRepository(AsyncMock())
+    repo.get_coverage = AsyncMock(return_value=COVERAGE)
+    repo._earliest_day = AsyncMock(return_value=date(2026, 1, 1))
+    repo._recompute = AsyncMock()
+
+    assert await repo.backfill(max_days=31) == 0
+    repo._recompute.assert_not_awaited()
@@ -0,0 +1,164 @@
+"""Unit tests for hourly crawl slots and the load-smoothing crawl scheduler."""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from intric.websites.application.crawl_scheduler_service import CrawlSchedulerService
+from intric.websites.domain import crawl_slots
+from intric.websites.domain.website import UpdateInterval, WebsiteSparse
+
+# A Friday
+NOW = datetime(2026, 3, 6, 10, 0, tzinfo=timezone.utc)
+
+
+def _website(
+    update_interval=UpdateInterval.DAILY, last_crawled_at=None, tenant_id=None
+):
+    return WebsiteSparse(
+        id=uuid4(),
+        created_at=NOW,
+        updated_at=NOW,
+        user_id=uuid4(),
+        tenant_id=tenant_id or uuid4(),
+        embedding_model_id=uuid4(),
+        space_id=uuid4(),
+        name="site",
+        url="https://example.com",
+        download_files=False,
+        crawl_type="crawl",
+        update_interval=update_interval,
+        size=0,
+        last_crawled_at=last_crawled_at,
+    )
+
+
+def _at_slot(website, days=0, quiet_hours=frozenset()):
+    slot = crawl_slots.get_crawl_slot(website.id, set(quiet_hours))
+    return NOW.replace(hour=slot) + timedelta(days=days)
+
+
+def test_quiet_hours_wrap_past_midnight():
+    assert crawl_slots.get_quiet_hours(
+        {"crawl_quiet_hours_start": 22, "crawl_quiet_hours_end": 2}
+    ) == {22, 23, 0, 1}
+    assert (
+        crawl_slots.get_quiet_hours(
+            {"crawl_quiet_hours_start": 5, "crawl_quiet_hours_end": 5}
+        )
+        == set()
+    )
+
+
+def test_slots_are_stable_spread_and_avoid_quiet_hours():
+    quiet_hours = set(range(6, 18))
+    ids = [uuid4() for _ in range(1200)]
+
+    slots = [crawl_slots.get_crawl_slot(id, quiet_hours) for id in ids]
+
+    assert slots == [crawl_slots.get_crawl_slot(id, quiet_hours) for id in ids]
+    per_hour = Counter(slots)
+    assert set(per_hour) == set(range(24)) - quiet_hours
+    assert max(per_hour.values()) < 2 * min(per_hour.values())
+
+
+def test_daily_website_is_due_from_its_slot_until_crawled():
+    website = _website()
+    slot = _at_slot(website)
+    website.last_crawled_at = slot - timedelta(days=1, minutes=-30)
+
+    assert not crawl_slots.is_due(website, slot - timedelta(hours=1), set())
+    assert crawl_slots.is_due(website, slot, set())
+    assert crawl_slots.is_due(website, slot + timedelta(hours=3), set())
+
+    website.last_crawled_at = slot + timedelta(minutes=30)
+    assert not crawl_slots.is_due(website, slot + timedelta(hours=1), set())
+
+
+def test_manual_crawl_just_before_the_slot_is_not_repeated():
+    website = _website()
+    slot = _at_slot(website)
+    website.last_crawled_at = slot - timedelta(hours=2)
+
+    assert not crawl_slots.is_due(website, slot, set())
+
+
+def test_every_other_day_and_weekly_intervals():
+    every_other_day = _website(UpdateInterval.EVERY_OTHER_DAY)
+    slot = _at_slot(every_other_day)
+    every_other_day.last_crawled_at = slot - timedelta(days=1, minutes=-30)
+    assert not crawl_slots.is_due(every_other_day, slot, set())
+    assert crawl_slots.is_due(every_other_day, slot + timedelta(days=1), set())
+
+    weekly = _website(UpdateInterval.WEEKLY)
+    friday = _at_slot(weekly)
+    weekly.last_crawled_at = friday - timedelta(days=7, minutes=-30)
+    assert crawl_slots.is_due(weekly, friday, set())
+    assert not crawl_slots.is_due(weekly, friday - timedelta(days=1), set())
+
+
+def test_nothing_is_due_during_quiet_hours():
+    website = _website()
+
+    assert not crawl_slots.is_due(website, NOW, {NOW.hour})
+
+
+def _service(websites, finished=0, tenant_settings=None):
+    repo = MagicMock()
+    repo.get_schedulable_websites = AsyncMock(return_value=websites)
+    repo.get_tenant_crawler_settings = AsyncMock(return_value=tenant_settings or {})
+    repo.count_crawls_finished_since = AsyncMock(return_value=finished)
+    return CrawlSchedulerService(website_sparse_repo=repo)
+
+
+async def test_tick_limit_follows_observed_capacity():
+    assert await _service([], finished=0).get_tick_limit(NOW) == 20
+    assert await _service([], finished=960).get_tick_limit(NOW) == 60
+
+
+async def test_tick_releases_most_overdue_websites_up_to_the_limit():
+    websites = [
+        _website(last_crawled_at=NOW - timedelta(days=days)) for days in range(3, 33)
+    ]
+    websites.append(_website())
+
+    due = await _service(websites).get_websites_due_for_crawl(NOW)
+
+    assert len(due) == 20
+    assert due[0].last_crawled_at is None
+    assert due[1].last_crawled_at == NOW - timedelta(days=32)
+
+
+async def test_projected_schedule_releases_each_website_in_its_slot():
+    tenant_id = uuid4()
+    quiet_hours = set(range(8, 16))
+    websites = [_website(tenant_id=tenant_id) for _ in range(160)]
+    for website in websites:
+        slot = crawl_slots.get_crawl_slot(website.id, quiet_hours)
+        website.last_crawled_at = crawl_slots.get_slot_start(slot, NOW) + timedelta(
+            minutes=30
+        )
+    slots = Counter(crawl_slots.get_crawl_slot(w.id, quiet_hours) for w in websites)
+    tenant_settings = {
+        tenant_id: {"crawl_quiet_hours_start": 8, "crawl_quiet_hours_end": 16}
+    }
+
+    schedule = await _service(
+        websites, finished=960, tenant_settings=tenant_settings
+    ).get_projected_schedule(NOW)
+
+    assert len(schedule.ticks) == 24
+    assert schedule.ticks[0].starts_at == NOW + timedelta(hours=1)
+    assert {tick.starts_at.hour: tick.released for tick in schedule.ticks} == {
+        hour: slots.get(hour, 0) for hour in range(24)
+    }
+
+
+async def test_projected_schedule_caps_a_backlog_per_tick():
+    websites = [_website() for _ in range(100)]
+
+    schedule = await _service(websites).get_projected_schedule(NOW)
+
+    assert [tick.released for tick in schedule.ticks[:6]] == [20] * 5 + [0]
+    assert schedule.ticks[0].due == 100
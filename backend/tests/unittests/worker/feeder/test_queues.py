@@ -134,6 +134,43 @@ class TestPendingQueueRemove:
         await queue.remove(uuid4(), b"data")
 
 
+class TestPendingQueueDepths:
+    """Tests for PendingQueue.depths method."""
+
+    @pytest.mark.asyncio
+    async def test_counts_queues_in_one_pipeline(self):
+        """Should LLEN every tenant's queue and leave out empty ones."""
+        from intric.worker.feeder.queues import PendingQueue
+
+        busy, drained = uuid4(), uuid4()
+
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[4, 0])
+        pipeline_cm = MagicMock()
+        pipeline_cm.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline_cm.__aexit__ = AsyncMock(return_value=False)
+        redis_mock = MagicMock()
+        redis_mock.pipeline = MagicMock(return_value=pipeline_cm)
+
+        queue = PendingQueue(redis_mock)
+        result = await queue.depths([busy, drained])
+
+        assert result == {busy: 4}
+        pipe.llen.assert_any_call(f"tenant:{busy}:crawl_pending")
+        pipe.llen.assert_any_call(f"tenant:{drained}:crawl_pending")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_redis_without_tenants(self):
+        """Should not open a pipeline when there are no tenants."""
+        from intric.worker.feeder.queues import PendingQueue
+
+        redis_mock = MagicMock()
+
+        assert await PendingQueue(redis_mock).depths([]) == {}
+        redis_mock.pipeline.assert_not_called()
+
+
 class TestJobEnqueuerEnqueue:
     """Tests for JobEnqueuer.enqueue method."""
 
@@ -0,0 +1,165 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from intric.info_blobs import knowledge_deletion
+from intric.info_blobs.knowledge_deletion import DeletionBatch
+from intric.jobs.task_models import KnowledgeTask
+from intric.worker import knowledge_deletion_tasks
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _session(marked=True, results=()):
+    session = MagicMock()
+    session.scalar = AsyncMock(return_value=uuid4() if marked else None)
+    session.execute = AsyncMock(
+        side_effect=[MagicMock(all=MagicMock(return_value=rows)) for rows in results]
+    )
+    session.scalars = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    return session
+
+
+async def test_batch_skips_sources_not_marked_deleting():
+    session = _session(marked=False)
+
+    batch = await knowledge_deletion.delete_source_batch(
+        session, website_id=uuid4(), batch_size=10
+    )
+
+    assert batch is None
+    session.execute.assert_not_awaited()
+
+
+async def test_batch_deletes_chunks_and_subtracts_their_size():
+    info_blob_id = uuid4()
+    session = _session(results=[[(info_blob_id, 3), (info_blob_id, 4)], [], []])
+
+    batch = await knowledge_deletion.delete_source_batch(
+        session, website_id=uuid4(), batch_size=10
+    )
+
+    assert batch == DeletionBatch(chunks=2)
+    delete_call, info_blob_call, source_call = session.execute.call_args_list
+    delete_sql = _sql(delete_call.args[0])
+    assert delete_sql.startswith("DELETE FROM info_blob_chunks")
+    assert "FOR UPDATE SKIP LOCKED" in delete_sql
+    assert info_blob_call.args[1] == [{"info_blob_id": info_blob_id, "freed": 7}]
+    source_sql = _sql(source_call.args[0])
+    assert source_sql.startswith("UPDATE websites SET size=greatest(websites.size -")
+    assert source_call.args[0].compile().params["size_1"] == 7
+
+
+async def test_batch_deletes_info_blobs_once_chunks_are_gone():
+    session = _session(results=[[], []])
+    session.scalars.return_value.all.return_value = [5, None, 2]
+
+    batch = await knowledge_deletion.delete_source_batch(
+        session, group_id=uuid4(), batch_size=10
+    )
+
+    assert batch == DeletionBatch(info_blobs=3)
+    assert _sql(session.scalars.call_args.args[0]).startswith("DELETE FROM info_blobs")
+    assert _sql(session.execute.call_args.args[0]).startswith("UPDATE groups")
+
+
+async def test_batch_deletes_the_source_last():
+    session = _session(results=[[], []])
+    session.scalar.side_effect = [uuid4(), False]
+
+    batch = await knowledge_deletion.delete_source_batch(
+        session, website_id=uuid4(), batch_size=10
+    )
+
+    assert batch == DeletionBatch(done=True)
+    assert _sql(session.execute.call_args.args[0]).startswith("DELETE FROM websites")
+
+
+async def test_batch_waits_for_info_blobs_locked_by_another_run():
+    session = _session(results=[[], []])
+    session.scalar.side_effect = [uuid4(), True]
+
+    batch = await knowledge_deletion.delete_source_batch(
+        session, website_id=uuid4(), batch_size=10
+    )
+
+    assert batch == DeletionBatch()
+    assert _sql(session.execute.call_args.args[0]).startswith("UPDATE websites")
+
+
+@pytest.fixture
+def container():
+    container = MagicMock()
+
+    @asynccontextmanager
+    async def session_scope():
+        yield MagicMock()
+
+    container.session_scope = session_scope
+    return container
+
+
+@pytest.fixture(autouse=True)
+def no_pause():
+    with patch.object(knowledge_deletion_tasks.asyncio, "sleep", AsyncMock()):
+        yield
+
+
+async def test_task_deletes_batches_until_the_source_is_gone(container):
+    batches = [
+        DeletionBatch(chunks=2),
+        DeletionBatch(chunks=1),
+        DeletionBatch(info_blobs=1),
+        DeletionBatch(done=True),
+    ]
+    params = KnowledgeTask(user_id=uuid4(), website_id=uuid4())
+    with patch.object(
+        knowledge_deletion_tasks,
+        "delete_source_batch",
+        AsyncMock(side_effect=batches),
+    ) as batch:
+        result = await knowledge_deletion_tasks.delete_knowledge_task(
+            params=params, container=container
+        )
+
+    assert batch.await_count == 4
+    assert batch.await_args.kwargs["website_id"] == params.website_id
+    assert result == {"chunks_deleted": 3, "info_blobs_deleted": 1, "completed": True}
+
+
+async def test_task_leaves_unmarked_sources_to_the_cron(container):
+    params = KnowledgeTask(user_id=uuid4(), group_id=uuid4())
+    with patch.object(
+        knowledge_deletion_tasks, "delete_source_batch", AsyncMock(return_value=None)
+    ):
+        result = await knowledge_deletion_tasks.delete_knowledge_task(
+            params=params, container=container
+        )
+
+    assert result["completed"] is False
+
+
+async def test_resume_stops_at_the_budget(container):
+    sources = [(uuid4(), None), (None, uuid4())]
+    with (
+        patch.object(
+            knowledge_deletion_tasks,
+            "get_stalled_deletions",
+            AsyncMock(return_value=sources),
+        ),
+        patch.object(
+            knowledge_deletion_tasks,
+            "delete_source_batch",
+            AsyncMock(return_value=DeletionBatch(chunks=1)),
+        ),
+    ):
+        result = await knowledge_deletion_tasks.resume_knowledge_deletions(
+            container, budget_seconds=0
+        )
+
+    assert result == {"deletions_resumed": 2, "deletions_completed": 0}
@@ -13,6 +13,7 @@ import pytest
 from unittest.mock import MagicMock
 from uuid import uuid4
 
+from intric.embedding_models.infrastructure.text_chunker import TextChunk
 from intric.worker.crawl_context import CrawlContext, PreparedPage, EmbeddingModelSpec
 
 
@@ -162,7 +163,10 @@ class TestPreparedPageDataclass:
             title="Test Page",
             content="Test content",
             content_hash=b"\x00" * 32,  # 32-byte hash
-            chunks=["chunk1", "chunk2"],
+            chunks=[
+                TextChunk(text="Test", start=0, end=4, token_count=1),
+                TextChunk(text="content", start=5, end=12, token_count=1),
+            ],
             embeddings=[[0.1, 0.2], [0.3, 0.4]],
             tenant_id=uuid4(),
             website_id=uuid4(),
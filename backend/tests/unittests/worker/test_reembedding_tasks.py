@@ -0,0 +1,271 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from intric.database.tables.embedding_migrations_table import EmbeddingMigrations
+from intric.embedding_models.application.embedding_migration_service import (
+    EmbeddingMigrationService,
+)
+from intric.embedding_models.infrastructure import reembedding
+from intric.embedding_models.presentation.embedding_model_models import (
+    EmbeddingMigrationCreate,
+)
+from intric.main.exceptions import BadRequestException, OpenAIException
+from intric.main.models import Status
+from intric.roles.permissions import Permission
+from intric.worker import reembedding_tasks
+
+
+def _migration(status: Status = Status.QUEUED) -> EmbeddingMigrations:
+    return EmbeddingMigrations(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        embedding_model_id=uuid4(),
+        website_id=uuid4(),
+        status=status.value,
+        chunks_total=2,
+        chunks_done=0,
+    )
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _rows(migration, count):
+    return [
+        SimpleNamespace(
+            id=uuid4(),
+            text=f"chunk {no}",
+            chunk_no=no,
+            info_blob_id=uuid4(),
+            tenant_id=migration.tenant_id,
+        )
+        for no in range(count)
+    ]
+
+
+def _embeddings_service():
+    embeddings_service = MagicMock()
+    embeddings_service.get_embeddings = AsyncMock(
+        side_effect=lambda model, chunks: [
+            (chunk, [float(chunk.chunk_no)]) for chunk in chunks
+        ]
+    )
+    return embeddings_service
+
+
+def _session(migration, rows=()):
+    session = MagicMock()
+    session.scalar = AsyncMock(return_value=migration)
+    session.get = AsyncMock(return_value=SimpleNamespace(name="new-model"))
+    session.execute = AsyncMock(
+        return_value=MagicMock(all=MagicMock(return_value=list(rows)))
+    )
+    return session
+
+
+async def test_batch_writes_shadow_embeddings_in_chunk_order():
+    migration = _migration()
+    rows = _rows(migration, 2)
+    session = _session(migration, rows)
+    embeddings_service = _embeddings_service()
+
+    embedded = await reembedding.reembed_batch(
+        session, migration.id, embeddings_service, batch_size=10
+    )
+
+    assert embedded == 2
+    texts = [chunk.text for chunk in embeddings_service.get_embeddings.call_args[0][1]]
+    assert texts == ["chunk 0", "chunk 1"]
+    select_sql = _sql(session.execute.call_args_list[0].args[0])
+    assert "shadow_embedding IS NULL" in select_sql
+    assert "info_blobs.embedding_model_id IS DISTINCT FROM" in select_sql
+    assert "FOR UPDATE SKIP LOCKED" in select_sql
+    assert session.execute.call_args_list[1].args[1] == [
+        {"id": rows[0].id, "shadow_embedding": [0.0]},
+        {"id": rows[1].id, "shadow_embedding": [1.0]},
+    ]
+    assert migration.status == Status.IN_PROGRESS.value
+    assert migration.chunks_done == 2
+
+
+async def test_batch_skips_finished_migrations():
+    session = _session(_migration(Status.FAILED))
+
+    assert await reembedding.reembed_batch(session, uuid4(), MagicMock(), 10) is None
+    session.execute.assert_not_awaited()
+
+
+async def test_flip_waits_for_more_missing_shadows_than_a_batch():
+    migration = _migration(Status.IN_PROGRESS)
+    session = _session(migration, _rows(migration, 3))
+    embeddings_service = _embeddings_service()
+
+    assert (
+        await reembedding.flip_embeddings(
+            session, migration.id, embeddings_service, batch_size=2
+        )
+        is False
+    )
+    session.execute.assert_awaited_once()
+    embeddings_service.get_embeddings.assert_not_awaited()
+    assert migration.status == Status.IN_PROGRESS.value
+
+
+async def test_flip_embeds_the_last_missing_shadows_before_switching():
+    migration = _migration(Status.IN_PROGRESS)
+    rows = _rows(migration, 1)
+    session = _session(migration, rows)
+
+    assert await reembedding.flip_embeddings(
+        session, migration.id, _embeddings_service(), batch_size=2
+    )
+
+    assert session.execute.call_args_list[1].args[1] == [
+        {"id": rows[0].id, "shadow_embedding": [0.0]}
+    ]
+    assert migration.chunks_done == 1
+    assert migration.status == Status.COMPLETE.value
+
+
+async def test_flip_switches_chunks_info_blobs_and_source():
+    migration = _migration(Status.IN_PROGRESS)
+    migration.chunks_done = 3
+    session = _session(migration)
+
+    assert (
+        await reembedding.flip_embeddings(
+            session, migration.id, _embeddings_service(), batch_size=2
+        )
+        is True
+    )
+
+    _, chunk_sql, info_blob_sql, source_sql = [
+        _sql(call.args[0]) for call in session.execute.call_args_list
+    ]
+    assert "embedding=info_blob_chunks.shadow_embedding" in chunk_sql
+    assert "shadow_embedding IS NOT NULL" in chunk_sql
+    assert info_blob_sql.startswith("UPDATE info_blobs SET embedding_model_id")
+    assert source_sql.startswith("UPDATE websites SET embedding_model_id")
+    assert migration.status == Status.COMPLETE.value
+    assert migration.chunks_total == 3
+    assert migration.finished_at is not None
+
+
+def _migration_service(space_models, session_scalars):
+    user = SimpleNamespace(
+        id=uuid4(), tenant_id=uuid4(), permissions=[Permission.ADMIN]
+    )
+    model = SimpleNamespace(id=uuid4(), name="new-model", can_access=True)
+    session = MagicMock()
+    session.scalar = AsyncMock(side_effect=session_scalars)
+    session.execute = AsyncMock(
+        return_value=MagicMock(
+            one_or_none=MagicMock(
+                return_value=SimpleNamespace(embedding_model_id=uuid4())
+            )
+        )
+    )
+    embedding_model_repo = MagicMock(one=AsyncMock(return_value=model))
+    space = MagicMock()
+    space.is_embedding_model_in_space = lambda id: id in space_models(model)
+    space_repo = MagicMock(one=AsyncMock(return_value=space))
+    service = EmbeddingMigrationService(
+        user=user,
+        session=session,
+        embedding_model_repo=embedding_model_repo,
+        space_repo=space_repo,
+    )
+    return service, model
+
+
+async def test_migration_needs_the_model_enabled_in_the_space():
+    service, model = _migration_service(lambda model: [], [uuid4()])
+
+    with pytest.raises(BadRequestException, match="not enabled"):
+        await service.start_migration(model.id, website_id=uuid4())
+
+
+async def test_migration_is_rejected_while_searched_with_other_models():
+    service, model = _migration_service(lambda model: [model.id], [uuid4(), True])
+
+    with pytest.raises(BadRequestException, match="together"):
+        await service.start_migration(model.id, website_id=uuid4())
+
+
+@pytest.fixture
+def container():
+    container = MagicMock()
+
+    @asynccontextmanager
+    async def session_scope():
+        yield MagicMock()
+
+    container.session_scope = session_scope
+    return container
+
+
+@pytest.fixture(autouse=True)
+def no_pause():
+    with patch.object(reembedding_tasks.asyncio, "sleep", AsyncMock()):
+        yield
+
+
+async def test_run_embeds_until_done_then_flips(container):
+    with (
+        patch.object(
+            reembedding_tasks, "reembed_batch", AsyncMock(side_effect=[2, 1, 0])
+        ) as batch,
+        patch.object(
+            reembedding_tasks, "flip_embeddings", AsyncMock(return_value=True)
+        ) as flip,
+    ):
+        assert await reembedding_tasks.run_embedding_migration(uuid4(), container)
+
+    assert batch.await_count == 3
+    flip.assert_awaited_once()
+
+
+async def test_run_stops_on_provider_errors_and_is_resumed(container):
+    record = AsyncMock()
+    with (
+        patch.object(
+            reembedding_tasks,
+            "reembed_batch",
+            AsyncMock(side_effect=OpenAIException("LiteLLM Rate limit exception")),
+        ),
+        patch.object(reembedding_tasks, "record_migration_error", record),
+    ):
+        assert not await reembedding_tasks.run_embedding_migration(uuid4(), container)
+
+    assert record.await_args.kwargs == {"final": False}
+
+
+async def test_run_fails_migration_on_errors_that_would_repeat(container):
+    record = AsyncMock()
+    with (
+        patch.object(
+            reembedding_tasks,
+            "reembed_batch",
+            AsyncMock(side_effect=BadRequestException("Invalid input")),
+        ),
+        patch.object(reembedding_tasks, "record_migration_error", record),
+    ):
+        assert not await reembedding_tasks.run_embedding_migration(uuid4(), container)
+
+    assert record.await_args.kwargs == {"final": True}
+
+
+def test_migration_needs_exactly_one_source():
+    EmbeddingMigrationCreate(website_id=uuid4())
+
+    with pytest.raises(ValidationError):
+        EmbeddingMigrationCreate()
+    with pytest.raises(ValidationError):
+        EmbeddingMigrationCreate(collection_id=uuid4(), website_id=uuid4())
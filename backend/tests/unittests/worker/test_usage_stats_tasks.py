@@ -14,6 +14,7 @@ from intric.tenants.tenant import TenantInDB, TenantState
 from intric.users.user import UserInDB
 from intric.worker.usage_stats_tasks import (
     recalculate_all_tenants_usage_stats,
+    recalculate_drifted_tenants_usage_stats,
     recalculate_tenant_usage_stats,
 )
 
@@ -385,3 +386,61 @@ async def test_recalculate_all_tenants_usage_stats_balances_multiple_tenants():
     expected_order = [t.id for t in tenants]
     assert ordered_ids == expected_order
     assert {tenant_id for tenant_id in ordered_ids} == set(expected_order)
+
+
+@pytest.mark.asyncio
+async def test_recalculate_drifted_tenants_usage_stats_only_recalculates_drifted():
+    drifted = [uuid4(), uuid4()]
+    recalculated = []
+
+    async def find_drifted_tenants(self):
+        return drifted
+
+    async def recalculate_direct(container, tenant_id):
+        recalculated.append(tenant_id)
+        if tenant_id == drifted[0]:
+            raise RuntimeError("boom")
+        return True
+
+    container = SimpleNamespace(session=lambda: None)
+
+    with (
+        patch(
+            "intric.completion_models.infrastructure.usage_counters."
+            "CompletionModelUsageCounters.find_drifted_tenants",
+            find_drifted_tenants,
+        ),
+        patch(
+            "intric.worker.usage_stats_tasks.recalculate_tenant_usage_stats_direct",
+            recalculate_direct,
+        ),
+    ):
+        result = await recalculate_drifted_tenants_usage_stats(container)
+
+    assert result is True
+    # A failing tenant does not stop the others
+    assert recalculated == drifted
+
+
+@pytest.mark.asyncio
+async def test_recalculate_drifted_tenants_usage_stats_skips_when_in_sync():
+    async def find_drifted_tenants(self):
+        return []
+
+    async def recalculate_direct(container, tenant_id):
+        raise AssertionError("No tenant should be recalculated")
+
+    with (
+        patch(
+            "intric.completion_models.infrastructure.usage_counters."
+            "CompletionModelUsageCounters.find_drifted_tenants",
+            find_drifted_tenants,
+        ),
+        patch(
+            "intric.worker.usage_stats_tasks.recalculate_tenant_usage_stats_direct",
+            recalculate_direct,
+        ),
+    ):
+        assert await recalculate_drifted_tenants_usage_stats(
+            SimpleNamespace(session=lambda: None)
+        )